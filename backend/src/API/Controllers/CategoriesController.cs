@@ -112,6 +112,28 @@ public class CategoriesController : ControllerBase
         }
     }
 
+    /// <summary>
+    /// Get the category hierarchy as a nested tree
+    /// </summary>
+    /// <param name="rootId">Optional category to start the tree from; defaults to all root categories</param>
+    /// <param name="cancellationToken">Cancellation token</param>
+    [HttpGet("tree")]
+    public async Task<ActionResult<IEnumerable<CategoryTreeNode>>> GetCategoryTree(
+        [FromQuery] Guid? rootId = null,
+        CancellationToken cancellationToken = default)
+    {
+        try
+        {
+            var tree = await _productCatalogService.GetCategoryTreeAsync(rootId, cancellationToken);
+            return Ok(tree);
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Error retrieving category tree");
+            return StatusCode(500, new ErrorResponse { Message = "An error occurred while retrieving the category tree" });
+        }
+    }
+
     /// <summary>
     /// Get child categories of a parent category
     /// </summary>
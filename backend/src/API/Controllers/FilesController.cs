@@ -82,7 +82,7 @@ public class FilesController : ControllerBase
                 return BadRequest("File path is required");
             }
 
-            var deleted = await _fileUploadService.DeleteFileAsync(request.FilePath, cancellationToken);
+            var deleted = await _fileUploadService.DeleteFileAsync(request.FilePath, request.Folder, cancellationToken);
             if (!deleted)
             {
                 return NotFound("File not found");
@@ -164,4 +164,9 @@ public class FilesController : ControllerBase
 public class DeleteFileRequest
 {
     public string FilePath { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Folder the file was uploaded to; the file itself is deleted once no folder uses it
+    /// </summary>
+    public string Folder { get; set; } = "uploads";
 }
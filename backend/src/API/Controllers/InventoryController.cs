@@ -3,6 +3,7 @@ using NationalClothingStore.Application.Common;
 using NationalClothingStore.Application.Interfaces;
 using NationalClothingStore.Application.Services;
 using NationalClothingStore.Domain.Entities;
+using NationalClothingStore.Infrastructure.Filters;
 using InventoryReport = NationalClothingStore.Application.Services.InventoryReport;
 
 namespace NationalClothingStore.API.Controllers;
@@ -200,6 +201,11 @@ public class InventoryController : ControllerBase
             _logger.LogWarning(ex, "Invalid request for updating inventory: {InventoryId}", id);
             return BadRequest(ex.Message);
         }
+        catch (InvalidOperationException ex)
+        {
+            _logger.LogWarning(ex, "Cannot update inventory: {InventoryId}", id);
+            return Conflict(ex.Message);
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error updating inventory: {InventoryId}", id);
@@ -246,6 +252,11 @@ public class InventoryController : ControllerBase
             _logger.LogWarning(ex, "Inventory not found for reservation: {InventoryId}", id);
             return NotFound(ex.Message);
         }
+        catch (ArgumentException ex)
+        {
+            _logger.LogWarning(ex, "Invalid request for reserving inventory: {InventoryId}", id);
+            return BadRequest(ex.Message);
+        }
         catch (InvalidOperationException ex)
         {
             _logger.LogWarning(ex, "Cannot reserve inventory: {InventoryId}", id);
@@ -274,6 +285,11 @@ public class InventoryController : ControllerBase
             _logger.LogWarning(ex, "Inventory not found for release: {InventoryId}", id);
             return NotFound(ex.Message);
         }
+        catch (ArgumentException ex)
+        {
+            _logger.LogWarning(ex, "Invalid request for releasing inventory: {InventoryId}", id);
+            return BadRequest(ex.Message);
+        }
         catch (InvalidOperationException ex)
         {
             _logger.LogWarning(ex, "Cannot release inventory: {InventoryId}", id);
@@ -311,6 +327,11 @@ public class InventoryController : ControllerBase
             _logger.LogWarning(ex, "Inventory not found for stock update: {InventoryId}", id);
             return NotFound(ex.Message);
         }
+        catch (InvalidOperationException ex)
+        {
+            _logger.LogWarning(ex, "Cannot update stock: {InventoryId}", id);
+            return Conflict(ex.Message);
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error updating stock: {InventoryId}", id);
@@ -390,6 +411,11 @@ public class InventoryController : ControllerBase
             _logger.LogWarning(ex, "Invalid request for adjusting inventory: {InventoryId}", id);
             return BadRequest(ex.Message);
         }
+        catch (InvalidOperationException ex)
+        {
+            _logger.LogWarning(ex, "Cannot adjust inventory: {InventoryId}", id);
+            return Conflict(ex.Message);
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error adjusting inventory: {InventoryId}", id);
@@ -401,7 +427,7 @@ public class InventoryController : ControllerBase
     /// Bulk adjust inventory
     /// </summary>
     [HttpPut("bulk-adjust")]
-    public async Task<ActionResult<IEnumerable<Inventory>>> BulkAdjustInventory(
+    public async Task<ActionResult<BulkInventoryAdjustmentResult>> BulkAdjustInventory(
         BulkInventoryUpdateRequest request, 
         CancellationToken cancellationToken = default)
     {
@@ -666,6 +692,7 @@ public class InventoryController : ControllerBase
     /// Send low stock alerts
     /// </summary>
     [HttpPost("alerts/low-stock/send")]
+    [SensitiveOperationRateLimit]
     public async Task<ActionResult> SendLowStockAlerts(CancellationToken cancellationToken = default)
     {
         try
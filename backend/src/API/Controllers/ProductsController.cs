@@ -54,6 +54,9 @@ public class ProductsController : ControllerBase
     /// <param name="isActive">Filter by active status</param>
     /// <param name="brand">Filter by brand</param>
     /// <param name="season">Filter by season</param>
+    /// <param name="cursor">Opaque cursor from pagination.nextCursor; takes precedence over pageNumber</param>
+    /// <param name="includeTotalCount">Set to false to skip counting matching products</param>
+    /// <param name="expand">Comma-separated related data to load (category, variations, images or all); none or no value returns lean summaries</param>
     /// <param name="cancellationToken">Cancellation token</param>
     [HttpGet]
     public async Task<ActionResult<(IEnumerable<Product> products, PaginationMetadata pagination)>> GetProducts(
@@ -64,10 +67,14 @@ public class ProductsController : ControllerBase
         [FromQuery] bool? isActive = null,
         [FromQuery] string? brand = null,
         [FromQuery] string? season = null,
+        [FromQuery] string? cursor = null,
+        [FromQuery] bool includeTotalCount = true,
+        [FromQuery] string? expand = null,
         CancellationToken cancellationToken = default)
     {
         try
         {
+            var expansion = ProductExpansion.Parse(expand);
             var request = new GetProductsRequest
             {
                 PageNumber = pageNumber,
@@ -76,12 +83,26 @@ public class ProductsController : ControllerBase
                 Search = search,
                 IsActive = isActive,
                 Brand = brand,
-                Season = season
+                Season = season,
+                Cursor = cursor,
+                IncludeTotalCount = includeTotalCount,
+                Expand = expansion
             };
 
+            if (expansion == ProductExpand.None)
+            {
+                var (summaries, summaryPagination) = await _productCatalogService.GetProductSummariesAsync(request, cancellationToken);
+                return Ok(new { products = summaries, pagination = summaryPagination });
+            }
+
             var (products, pagination) = await _productCatalogService.GetProductsAsync(request, cancellationToken);
             return Ok(new { products, pagination });
         }
+        catch (ArgumentException ex)
+        {
+            _logger.LogWarning(ex, "Invalid product listing request");
+            return BadRequest(new ErrorResponse { Message = ex.Message });
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error retrieving products");
@@ -96,6 +117,7 @@ public class ProductsController : ControllerBase
     /// <param name="pageNumber">Page number</param>
     /// <param name="pageSize">Page size</param>
     /// <param name="includeInactive">Include inactive products</param>
+    /// <param name="expand">Comma-separated related data to load (category, variations, images or all); none or no value returns lean summaries</param>
     /// <param name="cancellationToken">Cancellation token</param>
     [HttpGet("search")]
     public async Task<ActionResult<(IEnumerable<Product> products, PaginationMetadata pagination)>> SearchProducts(
@@ -103,21 +125,35 @@ public class ProductsController : ControllerBase
         [FromQuery] int pageNumber = 1,
         [FromQuery] int pageSize = 20,
         [FromQuery] bool includeInactive = false,
+        [FromQuery] string? expand = null,
         CancellationToken cancellationToken = default)
     {
         try
         {
+            var expansion = ProductExpansion.Parse(expand);
             var request = new SearchProductsRequest
             {
                 SearchTerm = searchTerm,
                 PageNumber = pageNumber,
                 PageSize = pageSize,
-                IncludeInactive = includeInactive
+                IncludeInactive = includeInactive,
+                Expand = expansion
             };
 
+            if (expansion == ProductExpand.None)
+            {
+                var (summaries, summaryPagination) = await _productCatalogService.SearchProductSummariesAsync(request, cancellationToken);
+                return Ok(new { products = summaries, pagination = summaryPagination });
+            }
+
             var (products, pagination) = await _productCatalogService.SearchProductsAsync(request, cancellationToken);
             return Ok(new { products, pagination });
         }
+        catch (ArgumentException ex)
+        {
+            _logger.LogWarning(ex, "Invalid product search request");
+            return BadRequest(new ErrorResponse { Message = ex.Message });
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error searching products with term: {SearchTerm}", searchTerm);
@@ -281,6 +317,8 @@ public class ProductsController : ControllerBase
     /// <param name="size">Filter by size</param>
     /// <param name="color">Filter by color</param>
     /// <param name="isActive">Filter by active status</param>
+    /// <param name="cursor">Opaque cursor from pagination.nextCursor; takes precedence over pageNumber</param>
+    /// <param name="includeTotalCount">Set to false to skip counting matching variations</param>
     /// <param name="cancellationToken">Cancellation token</param>
     [HttpGet("{productId}/variations")]
     public async Task<ActionResult<(IEnumerable<ProductVariation> variations, PaginationMetadata pagination)>> GetProductVariations(
@@ -290,6 +328,8 @@ public class ProductsController : ControllerBase
         [FromQuery] string? size = null,
         [FromQuery] string? color = null,
         [FromQuery] bool? isActive = null,
+        [FromQuery] string? cursor = null,
+        [FromQuery] bool includeTotalCount = true,
         CancellationToken cancellationToken = default)
     {
         try
@@ -300,12 +340,19 @@ public class ProductsController : ControllerBase
                 PageSize = pageSize,
                 Size = size,
                 Color = color,
-                IsActive = isActive
+                IsActive = isActive,
+                Cursor = cursor,
+                IncludeTotalCount = includeTotalCount
             };
 
             var (variations, pagination) = await _productCatalogService.GetProductVariationsAsync(productId, request, cancellationToken);
             return Ok(new { variations, pagination });
         }
+        catch (ArgumentException ex)
+        {
+            _logger.LogWarning(ex, "Invalid variation listing request for product {ProductId}", productId);
+            return BadRequest(new ErrorResponse { Message = ex.Message });
+        }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Error retrieving variations for product {ProductId}", productId);
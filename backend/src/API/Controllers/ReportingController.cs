@@ -1,11 +1,14 @@
 using Microsoft.AspNetCore.Authorization;
+using Microsoft.AspNetCore.Http.Features;
 using Microsoft.AspNetCore.Mvc;
-using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.Options;
 using NationalClothingStore.Application.Services;
 using NationalClothingStore.Application.Interfaces;
 using NationalClothingStore.Application.Validation;
 using System.ComponentModel.DataAnnotations;
 using System.Collections.Concurrent;
+using System.Globalization;
+using System.Text.Json;
 
 namespace NationalClothingStore.API.Controllers;
 
@@ -40,19 +43,29 @@ public class ReportingController : ControllerBase
     private readonly IReportingService _reportingService;
     private readonly IAnalyticsService _analyticsService;
     private readonly ILogger<ReportingController> _logger;
-    private readonly IMemoryCache _cache;
+    private readonly IReportCache _reportCache;
+    private readonly IRealTimeDashboardService _realTimeDashboard;
+    private readonly RealTimeDashboardOptions _dashboardOptions;
+    private readonly IReportExportService _reportExports;
     private static readonly ConcurrentDictionary<string, ReportingMetrics> _metrics = new();
+    private static readonly JsonSerializerOptions StreamJsonOptions = new(JsonSerializerDefaults.Web);
 
     public ReportingController(
         IReportingService reportingService,
         IAnalyticsService analyticsService,
         ILogger<ReportingController> logger,
-        IMemoryCache cache)
+        IReportCache reportCache,
+        IRealTimeDashboardService realTimeDashboard,
+        IOptions<RealTimeDashboardOptions> dashboardOptions,
+        IReportExportService reportExports)
     {
         _reportingService = reportingService;
         _analyticsService = analyticsService;
         _logger = logger;
-        _cache = cache;
+        _reportCache = reportCache;
+        _realTimeDashboard = realTimeDashboard;
+        _dashboardOptions = dashboardOptions.Value;
+        _reportExports = reportExports;
     }
 
     private IActionResult ValidationError(string message) => 
@@ -92,18 +105,22 @@ public class ReportingController : ControllerBase
             });
     }
 
-    private string CacheKey(string prefix, params object?[] args) =>
-        $"{prefix}:{string.Join(":", args.Select(a => a?.ToString() ?? "null"))}";
-
-    private async Task<T?> GetOrSetCachedAsync<T>(string key, Func<Task<T?>> factory)
-    {
-        if (_cache.TryGetValue(key, out var cached))
-            return (T?)cached;
-
-        var result = await factory();
-        _cache.Set(key, result, TimeSpan.FromMinutes(5));
-        return result;
-    }
+    private static string CacheKey(string prefix, params object?[] args) =>
+        $"{prefix}:{string.Join(":", args.Select(a => a switch
+        {
+            null => "null",
+            DateTime date => date.ToString("O", CultureInfo.InvariantCulture),
+            IFormattable formattable => formattable.ToString(null, CultureInfo.InvariantCulture),
+            _ => a.ToString()
+        }))}";
+
+    // Shared across replicas and coalesced per key; invalidated when the data sets it reads are written
+    private Task<T> GetOrSetCachedAsync<T>(
+        string key,
+        string[] dataSets,
+        Func<CancellationToken, Task<T>> factory,
+        CancellationToken cancellationToken) where T : class =>
+        _reportCache.GetOrCreateAsync(key, dataSets, factory, cancellationToken);
 
     #region Standard Reports
 
@@ -119,16 +136,6 @@ public class ReportingController : ControllerBase
         CancellationToken cancellationToken = default)
     {
         RequirePolicy(ReportingPolicies.ViewReports);
-        var cacheKey = CacheKey("sales", startDate, endDate, branchId, warehouseId);
-        var cached = await GetOrSetCachedAsync<SalesReport>(cacheKey, () => _reportingService.GenerateSalesReportAsync(startDate, endDate, branchId, warehouseId, cancellationToken));
-        if (cached is not null)
-        {
-            _logger.LogInformation("Sales report served from cache: StartDate={StartDate}, EndDate={EndDate}, BranchId={BranchId}, WarehouseId={WarehouseId}",
-                startDate, endDate, branchId, warehouseId);
-            RecordMetric("GET /api/reporting/sales", 0, isError: false);
-            return Ok(cached);
-        }
-
         var sw = System.Diagnostics.Stopwatch.StartNew();
         _logger.LogInformation("Sales report requested: StartDate={StartDate}, EndDate={EndDate}, BranchId={BranchId}, WarehouseId={WarehouseId}",
             startDate, endDate, branchId, warehouseId);
@@ -137,9 +144,13 @@ public class ReportingController : ControllerBase
         {
             ValidateDateRange(startDate, endDate);
 
-            var report = await _reportingService.GenerateSalesReportAsync(startDate, endDate, branchId, warehouseId, cancellationToken);
+            var report = await GetOrSetCachedAsync(
+                CacheKey("sales", startDate, endDate, branchId, warehouseId),
+                [ReportDataSets.Sales],
+                token => _reportingService.GenerateSalesReportAsync(startDate, endDate, branchId, warehouseId, token),
+                cancellationToken);
             sw.Stop();
-            _logger.LogInformation("Sales report generated successfully in {ElapsedMs}ms", sw.ElapsedMilliseconds);
+            _logger.LogInformation("Sales report served successfully in {ElapsedMs}ms", sw.ElapsedMilliseconds);
             RecordMetric("GET /api/reporting/sales", sw.ElapsedMilliseconds, isError: false);
             return Ok(report);
         }
@@ -173,9 +184,13 @@ public class ReportingController : ControllerBase
 
         try
         {
-            var report = await _reportingService.GenerateInventoryReportAsync(branchId, warehouseId, cancellationToken);
+            var report = await GetOrSetCachedAsync(
+                CacheKey("inventory", branchId, warehouseId),
+                [ReportDataSets.Inventory],
+                token => _reportingService.GenerateInventoryReportAsync(branchId, warehouseId, token),
+                cancellationToken);
             sw.Stop();
-            _logger.LogInformation("Inventory report generated successfully in {ElapsedMs}ms", sw.ElapsedMilliseconds);
+            _logger.LogInformation("Inventory report served successfully in {ElapsedMs}ms", sw.ElapsedMilliseconds);
             return Ok(report);
         }
         catch (Exception ex)
@@ -202,9 +217,13 @@ public class ReportingController : ControllerBase
         {
             ValidateDateRange(startDate, endDate);
 
-            var report = await _reportingService.GenerateCustomerReportAsync(startDate, endDate, cancellationToken);
+            var report = await GetOrSetCachedAsync(
+                CacheKey("customers", startDate, endDate),
+                [ReportDataSets.Sales],
+                token => _reportingService.GenerateCustomerReportAsync(startDate, endDate, token),
+                cancellationToken);
             sw.Stop();
-            _logger.LogInformation("Customer report generated successfully in {ElapsedMs}ms", sw.ElapsedMilliseconds);
+            _logger.LogInformation("Customer report served successfully in {ElapsedMs}ms", sw.ElapsedMilliseconds);
             return Ok(report);
         }
         catch (InvalidOperationException ex)
@@ -237,9 +256,13 @@ public class ReportingController : ControllerBase
         {
             ValidateDateRange(startDate, endDate);
 
-            var report = await _reportingService.GenerateProcurementReportAsync(startDate, endDate, cancellationToken);
+            var report = await GetOrSetCachedAsync(
+                CacheKey("procurement", startDate, endDate),
+                [ReportDataSets.Procurement],
+                token => _reportingService.GenerateProcurementReportAsync(startDate, endDate, token),
+                cancellationToken);
             sw.Stop();
-            _logger.LogInformation("Procurement report generated successfully in {ElapsedMs}ms", sw.ElapsedMilliseconds);
+            _logger.LogInformation("Procurement report served successfully in {ElapsedMs}ms", sw.ElapsedMilliseconds);
             return Ok(report);
         }
         catch (InvalidOperationException ex)
@@ -272,9 +295,13 @@ public class ReportingController : ControllerBase
         {
             ValidateDateRange(startDate, endDate);
 
-            var report = await _reportingService.GenerateFinancialReportAsync(startDate, endDate, cancellationToken);
+            var report = await GetOrSetCachedAsync(
+                CacheKey("financial", startDate, endDate),
+                [ReportDataSets.Sales, ReportDataSets.Inventory, ReportDataSets.Procurement],
+                token => _reportingService.GenerateFinancialReportAsync(startDate, endDate, token),
+                cancellationToken);
             sw.Stop();
-            _logger.LogInformation("Financial report generated successfully in {ElapsedMs}ms", sw.ElapsedMilliseconds);
+            _logger.LogInformation("Financial report served successfully in {ElapsedMs}ms", sw.ElapsedMilliseconds);
             return Ok(report);
         }
         catch (InvalidOperationException ex)
@@ -517,20 +544,31 @@ public class ReportingController : ControllerBase
                 return BadRequest(ModelState);
             }
 
-            await Task.CompletedTask;
+            // Exports write every row of the dataset in range; shaping the rows is what custom/run is for
+            if (request.Filters.Count > 0 || request.GroupBy.Count > 0 || request.Metrics.Count > 0)
+            {
+                sw.Stop();
+                return BadRequest(new { error = "Filters, GroupBy and Metrics are not applied to exports; use custom/run for shaped results", code = "validation_error" });
+            }
 
-            var exportResult = new ExportResult
+            if (!TryBuildExport(request.Dataset, request.Format, request.StartDate, request.EndDate, request.BranchId, request.WarehouseId,
+                    out var query, out var format, out var error))
             {
-                FileId = Guid.NewGuid(),
-                FileName = $"custom_report_{DateTime.UtcNow:yyyyMMddHHmmss}.{request.Format}",
-                Format = request.Format,
-                Status = "Processing",
-                EstimatedCompletion = DateTime.UtcNow.AddMinutes(5)
-            };
+                sw.Stop();
+                _logger.LogWarning("Custom report export rejected: {Error} (ElapsedMs={ElapsedMs})", error, sw.ElapsedMilliseconds);
+                return BadRequest(new { error, code = "validation_error" });
+            }
+
+            var job = await _reportExports.StartAsync(query, format, User.Identity?.Name, cancellationToken);
 
             sw.Stop();
-            _logger.LogInformation("Custom report export queued successfully in {ElapsedMs}ms: FileId={FileId}", sw.ElapsedMilliseconds, exportResult.FileId);
-            return Ok(exportResult);
+            _logger.LogInformation("Custom report export queued successfully in {ElapsedMs}ms: FileId={FileId}", sw.ElapsedMilliseconds, job.Id);
+            return Accepted(StatusUrl(job.Id), ToExportResult(job));
+        }
+        catch (ArgumentException ex)
+        {
+            sw.Stop();
+            return BadRequest(new { error = ex.Message, code = "validation_error" });
         }
         catch (Exception ex)
         {
@@ -569,15 +607,12 @@ public class ReportingController : ControllerBase
     /// Get real-time metrics for dashboard
     /// </summary>
     [HttpGet("dashboard/realtime")]
-    public async Task<ActionResult<RealTimeMetrics>> GetRealTimeMetrics(
-        [FromQuery] Guid? locationId = null,
-        CancellationToken cancellationToken = default)
+    public ActionResult<RealTimeMetrics> GetRealTimeMetrics(
+        [FromQuery] Guid? locationId = null)
     {
         try
         {
-            // var metrics = await _reportingService.GetRealTimeMetricsAsync(locationId, cancellationToken);
-            // return Ok(metrics);
-            return Ok(new { message = "Real-time metrics not yet implemented" });
+            return Ok(GetRealTimeSnapshot(locationId));
         }
         catch (Exception ex)
         {
@@ -586,15 +621,108 @@ public class ReportingController : ControllerBase
         }
     }
 
+    /// <summary>
+    /// Stream real-time metrics as Server-Sent Events: a "snapshot" event with the current totals, then a
+    /// "delta" event for every sale, return or low-stock change at the location (or any location when omitted).
+    /// Each delta carries its branch's new totals; deltas whose sequence is not above the branch's last seen
+    /// sequence are already counted and can be ignored.
+    /// </summary>
+    [HttpGet("dashboard/realtime/stream")]
+    [Produces("text/event-stream")]
+    public async Task StreamRealTimeMetrics(
+        [FromQuery] Guid? locationId = null,
+        CancellationToken cancellationToken = default)
+    {
+        Response.ContentType = "text/event-stream";
+        Response.Headers.CacheControl = "no-cache";
+        // Keep reverse proxies from buffering the stream
+        Response.Headers["X-Accel-Buffering"] = "no";
+        HttpContext.Features.Get<IHttpResponseBodyFeature>()?.DisableBuffering();
+
+        // Subscribing before taking the snapshot means no event can fall between the two
+        using var subscription = _realTimeDashboard.Subscribe(locationId);
+        var reader = subscription.Reader;
+
+        try
+        {
+            var snapshot = GetRealTimeSnapshot(locationId);
+            await WriteServerSentEventAsync("snapshot", snapshot.Sequence, snapshot, cancellationToken);
+            await Response.Body.FlushAsync(cancellationToken);
+
+            while (true)
+            {
+                bool open;
+                using (var heartbeat = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken))
+                {
+                    heartbeat.CancelAfter(_dashboardOptions.HeartbeatInterval);
+                    try
+                    {
+                        open = await reader.WaitToReadAsync(heartbeat.Token);
+                    }
+                    catch (OperationCanceledException) when (!cancellationToken.IsCancellationRequested)
+                    {
+                        // Nothing happened for a while; a comment line keeps idle connections from being reaped
+                        await Response.WriteAsync(": keep-alive\n\n", cancellationToken);
+                        await Response.Body.FlushAsync(cancellationToken);
+                        continue;
+                    }
+                }
+
+                if (!open)
+                {
+                    break;
+                }
+
+                // Write everything queued, then flush once
+                while (reader.TryRead(out var delta))
+                {
+                    await WriteServerSentEventAsync("delta", delta.Sequence, delta, cancellationToken);
+                }
+
+                await Response.Body.FlushAsync(cancellationToken);
+            }
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            // Client disconnected
+        }
+    }
+
+    private RealTimeMetrics GetRealTimeSnapshot(Guid? locationId)
+    {
+        var branches = _realTimeDashboard.GetSnapshot(locationId);
+        return new RealTimeMetrics
+        {
+            LocationId = locationId,
+            TodaySales = branches.Sum(b => b.TodaySales),
+            CurrentHourSales = branches.Sum(b => b.CurrentHourSales),
+            Transactions = branches.Sum(b => b.Transactions),
+            Returns = branches.Sum(b => b.Returns),
+            Refunds = branches.Sum(b => b.Refunds),
+            ItemsSold = branches.Sum(b => b.ItemsSold),
+            LowStockItems = branches.Sum(b => b.LowStockItems),
+            ConnectedDashboards = _realTimeDashboard.SubscriberCount,
+            Sequence = branches.Count > 0 ? branches.Max(b => b.Sequence) : 0,
+            Branches = branches.ToList(),
+            LastUpdated = DateTime.UtcNow
+        };
+    }
+
+    private async Task WriteServerSentEventAsync<T>(string eventName, long id, T payload, CancellationToken cancellationToken)
+    {
+        var data = JsonSerializer.Serialize(payload, StreamJsonOptions);
+        await Response.WriteAsync($"id: {id}\nevent: {eventName}\ndata: {data}\n\n", cancellationToken);
+    }
+
     #endregion
 
     #region Export and Scheduling
 
     /// <summary>
-    /// Export any report in specified format
+    /// Start an export job for a report's dataset; poll its status and download the file when it completes
     /// </summary>
     [HttpPost("export")]
-    public async Task<ActionResult> ExportReport(
+    public async Task<ActionResult<ExportResult>> ExportReport(
         [FromBody] ExportRequest request,
         CancellationToken cancellationToken = default)
     {
@@ -605,18 +733,18 @@ public class ReportingController : ControllerBase
                 return BadRequest(ModelState);
             }
 
-            await Task.CompletedTask;
-
-            var exportResult = new ExportResult
+            if (!TryBuildExport(request.ReportType, request.Format, request.StartDate, request.EndDate, request.BranchId, request.WarehouseId,
+                    out var query, out var format, out var error))
             {
-                FileId = Guid.NewGuid(),
-                FileName = $"report_{DateTime.UtcNow:yyyyMMddHHmmss}.{request.Format}",
-                Format = request.Format,
-                Status = "Processing",
-                EstimatedCompletion = DateTime.UtcNow.AddMinutes(5)
-            };
+                return BadRequest(new { error, code = "validation_error" });
+            }
 
-            return Ok(exportResult);
+            var job = await _reportExports.StartAsync(query, format, User.Identity?.Name, cancellationToken);
+            return Accepted(StatusUrl(job.Id), ToExportResult(job));
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(new { error = ex.Message, code = "validation_error" });
         }
         catch (Exception ex)
         {
@@ -625,6 +753,56 @@ public class ReportingController : ControllerBase
         }
     }
 
+    /// <summary>
+    /// Stream a report's dataset straight into the response as CSV or gzip'd JSON Lines, without staging it
+    /// on the server; Parquet is only available through export jobs
+    /// </summary>
+    [HttpGet("export/stream")]
+    public async Task<IActionResult> StreamExport(
+        [FromQuery] string reportType,
+        [FromQuery] string format = "csv",
+        [FromQuery] DateTime? startDate = null,
+        [FromQuery] DateTime? endDate = null,
+        [FromQuery] Guid? branchId = null,
+        [FromQuery] Guid? warehouseId = null,
+        CancellationToken cancellationToken = default)
+    {
+        if (!TryBuildExport(reportType, format, startDate, endDate, branchId, warehouseId, out var query, out var exportFormat, out var error))
+        {
+            return ValidationError(error);
+        }
+
+        if (!ReportExportFormats.CanStream(exportFormat))
+        {
+            return ValidationError($"{exportFormat} exports are only available through POST export");
+        }
+
+        try
+        {
+            HttpContext.Features.Get<IHttpResponseBodyFeature>()?.DisableBuffering();
+            Response.ContentType = ReportExportFormats.ContentType(exportFormat);
+            Response.Headers.ContentDisposition =
+                $"attachment; filename=\"{query.Dataset}_{DateTime.UtcNow:yyyyMMddHHmmss}.{ReportExportFormats.Extension(exportFormat)}\"";
+
+            await _reportExports.StreamAsync(query, exportFormat, Response.Body, cancellationToken);
+            return new EmptyResult();
+        }
+        catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+        {
+            // Client went away mid-download
+            return new EmptyResult();
+        }
+        catch (ArgumentException ex) when (!Response.HasStarted)
+        {
+            return ValidationError(ex.Message);
+        }
+        catch (Exception ex) when (!Response.HasStarted)
+        {
+            _logger.LogError(ex, "Error streaming {Dataset} export", query.Dataset);
+            return ServerError("Failed to stream export");
+        }
+    }
+
     /// <summary>
     /// Get export status
     /// </summary>
@@ -635,17 +813,13 @@ public class ReportingController : ControllerBase
     {
         try
         {
-            var status = new ExportResult
+            var job = await _reportExports.GetAsync(fileId, cancellationToken);
+            if (job == null)
             {
-                FileId = fileId,
-                FileName = $"report_{fileId:N}.pdf",
-                Format = "pdf",
-                Status = "Completed",
-                DownloadUrl = $"/api/reporting/export/{fileId}/download",
-                GeneratedAt = DateTime.UtcNow
-            };
+                return NotFound(new { error = $"Export {fileId} not found", code = "not_found" });
+            }
 
-            return Ok(status);
+            return Ok(ToExportResult(job));
         }
         catch (Exception ex)
         {
@@ -655,7 +829,32 @@ public class ReportingController : ControllerBase
     }
 
     /// <summary>
-    /// Download exported report
+    /// Resume a failed export from its last checkpoint
+    /// </summary>
+    [HttpPost("export/{fileId}/resume")]
+    public async Task<ActionResult<ExportResult>> ResumeExport(
+        Guid fileId,
+        CancellationToken cancellationToken = default)
+    {
+        try
+        {
+            var job = await _reportExports.ResumeAsync(fileId, cancellationToken);
+            if (job == null)
+            {
+                return NotFound(new { error = $"Export {fileId} not found", code = "not_found" });
+            }
+
+            return Accepted(StatusUrl(job.Id), ToExportResult(job));
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Error resuming export {FileId}", fileId);
+            return StatusCode(500, new { error = "Failed to resume export", code = "server_error" });
+        }
+    }
+
+    /// <summary>
+    /// Download exported report; supports range requests so interrupted downloads can pick up where they stopped
     /// </summary>
     [HttpGet("export/{fileId}/download")]
     public async Task<IActionResult> DownloadExport(
@@ -664,8 +863,24 @@ public class ReportingController : ControllerBase
     {
         try
         {
-            var fileBytes = Array.Empty<byte>();
-            return File(fileBytes, "application/pdf", $"report_{fileId:N}.pdf");
+            var job = await _reportExports.GetAsync(fileId, cancellationToken);
+            if (job == null)
+            {
+                return NotFound(new { error = $"Export {fileId} not found", code = "not_found" });
+            }
+
+            if (job.Status != ReportExportStatus.Completed)
+            {
+                return Conflict(new { error = $"Export {fileId} is {job.Status.ToLowerInvariant()}", code = "export_not_ready" });
+            }
+
+            var stream = _reportExports.OpenResult(job);
+            if (stream == null)
+            {
+                return NotFound(new { error = $"Export file for {fileId} is no longer available", code = "not_found" });
+            }
+
+            return File(stream, ReportExportFormats.ContentType(job.Format), job.FileName, enableRangeProcessing: true);
         }
         catch (Exception ex)
         {
@@ -674,6 +889,62 @@ public class ReportingController : ControllerBase
         }
     }
 
+    private static bool TryBuildExport(
+        string? reportType,
+        string? format,
+        DateTime? startDate,
+        DateTime? endDate,
+        Guid? branchId,
+        Guid? warehouseId,
+        out ReportExportQuery query,
+        out ReportExportFormat exportFormat,
+        out string error)
+    {
+        query = null!;
+        error = string.Empty;
+
+        if (!ReportExportFormats.TryParse(format, out exportFormat))
+        {
+            error = $"Unsupported export format '{format}'. Expected one of: csv, jsonl, parquet";
+            return false;
+        }
+
+        var dataset = ReportExportDatasets.Resolve(reportType);
+        if (dataset == null)
+        {
+            error = $"Report '{reportType}' cannot be exported. Expected one of: {string.Join(", ", ReportExportDatasets.All)}";
+            return false;
+        }
+
+        query = new ReportExportQuery
+        {
+            Dataset = dataset,
+            StartDate = startDate,
+            EndDate = endDate,
+            BranchId = branchId,
+            WarehouseId = warehouseId
+        };
+        return true;
+    }
+
+    private static string StatusUrl(Guid fileId) => $"/api/reporting/export/{fileId}/status";
+
+    private static ExportResult ToExportResult(ReportExportJob job) => new()
+    {
+        FileId = job.Id,
+        FileName = job.FileName,
+        Dataset = job.Query.Dataset,
+        Format = ReportExportFormats.Extension(job.Format),
+        Status = job.Status,
+        RowsWritten = job.RowsWritten,
+        BytesWritten = job.BytesWritten,
+        Error = job.Error,
+        StatusUrl = StatusUrl(job.Id),
+        DownloadUrl = job.Status == ReportExportStatus.Completed ? $"/api/reporting/export/{job.Id}/download" : null,
+        StartedAt = job.StartedAt,
+        GeneratedAt = job.CompletedAt
+    };
+
     #endregion
 
     #region Performance Monitoring
@@ -727,9 +998,17 @@ public class ReportingController : ControllerBase
 
     public class RealTimeMetrics
     {
-        public decimal CurrentRevenue { get; set; }
-        public int ActiveOrders { get; set; }
-        public int OnlineCustomers { get; set; }
+        public Guid? LocationId { get; set; }
+        public decimal TodaySales { get; set; }
+        public decimal CurrentHourSales { get; set; }
+        public int Transactions { get; set; }
+        public int Returns { get; set; }
+        public decimal Refunds { get; set; }
+        public int ItemsSold { get; set; }
+        public int LowStockItems { get; set; }
+        public int ConnectedDashboards { get; set; }
+        public long Sequence { get; set; }
+        public List<BranchDashboardTotals> Branches { get; set; } = new();
         public DateTime LastUpdated { get; set; }
     }
 
@@ -751,11 +1030,16 @@ public class ReportingController : ControllerBase
     {
         public Guid FileId { get; set; }
         public string FileName { get; set; } = string.Empty;
+        public string Dataset { get; set; } = string.Empty;
         public string Format { get; set; } = string.Empty;
         public string Status { get; set; } = string.Empty;
+        public long RowsWritten { get; set; }
+        public long BytesWritten { get; set; }
+        public string? Error { get; set; }
+        public string? StatusUrl { get; set; }
         public string? DownloadUrl { get; set; }
+        public DateTime? StartedAt { get; set; }
         public DateTime? GeneratedAt { get; set; }
-        public DateTime? EstimatedCompletion { get; set; }
     }
 
     public class CustomReportRunRequest : IValidatableObject
@@ -1,12 +1,32 @@
+using NationalClothingStore.Infrastructure.Caching;
 using NationalClothingStore.Infrastructure.Data;
+using NationalClothingStore.Infrastructure.Exports;
 using NationalClothingStore.Infrastructure.Extensions;
+using NationalClothingStore.Infrastructure.External;
+using NationalClothingStore.Infrastructure.RateLimiting;
+using NationalClothingStore.Infrastructure.Services;
 using NationalClothingStore.API;
+using Microsoft.Extensions.FileProviders;
+using Microsoft.Extensions.Options;
 var builder = WebApplication.CreateBuilder(args);
 
 // Add services to the container.
 builder.Services.AddDatabase(builder.Configuration);
+builder.Services.AddCatalogCache(builder.Configuration);
+builder.Services.AddHealthChecks()
+    .AddCheck<NationalClothingStore.Infrastructure.HealthChecks.CatalogCacheHealthCheck>("catalog-cache");
+builder.Services.AddReportCache(builder.Configuration);
+builder.Services.AddRateLimiting(builder.Configuration);
+builder.Services.AddAuditLog(builder.Configuration);
 builder.Services.AddRepositories();
 builder.Services.AddApplicationServices();
+builder.Services.AddDataArchival(builder.Configuration);
+builder.Services.AddAnalyticsEtl(builder.Configuration);
+builder.Services.AddQuartzBackgroundJobs();
+builder.Services.AddReportGeneration(builder.Configuration);
+builder.Services.AddRealTimeDashboard(builder.Configuration);
+builder.Services.AddReportExports(builder.Configuration);
+builder.Services.AddFileUploads(builder.Configuration);
 
 // Learn more about configuring Swagger/OpenAPI at https://aka.ms/aspnet/swashbuckle
 builder.Services.AddEndpointsApiExplorer();
@@ -66,4 +86,24 @@ if (app.Environment.IsDevelopment())
 
 app.UseHttpsRedirection();
 
+app.MapHealthChecks("/health");
+
+// Uploaded files: originals and derivatives are stored under their content hash, so their URLs never change content
+var uploads = app.Services.GetRequiredService<IOptions<FileUploadOptions>>().Value;
+Directory.CreateDirectory(uploads.BasePath);
+app.UseStaticFiles(new StaticFileOptions
+{
+    FileProvider = new PhysicalFileProvider(Path.GetFullPath(uploads.BasePath)),
+    RequestPath = uploads.BaseUrl,
+    OnPrepareResponse = context =>
+    {
+        var path = context.Context.Request.Path;
+        if (path.StartsWithSegments($"{uploads.BaseUrl}/{ImageDerivativeService.ObjectsFolder}")
+            || path.StartsWithSegments($"{uploads.BaseUrl}/{ImageDerivativeService.DerivativesFolder}"))
+        {
+            context.Context.Response.Headers.CacheControl = "public, max-age=31536000, immutable";
+        }
+    }
+});
+
 app.Run();
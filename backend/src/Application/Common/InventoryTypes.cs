@@ -1,3 +1,5 @@
+using NationalClothingStore.Domain.Entities;
+
 namespace NationalClothingStore.Application.Common;
 
 /// <summary>
@@ -85,3 +87,23 @@ public class TransactionStatistics
     public Dictionary<string, int> TransactionsByType { get; set; } = new();
     public Dictionary<string, int> TransactionsByDay { get; set; } = new();
 }
+
+/// <summary>
+/// Rows a bulk inventory operation reads, locked for the duration of its database transaction
+/// </summary>
+public class InventoryBatchSnapshot
+{
+    public Dictionary<Guid, Inventory> Inventories { get; set; } = new();
+    public HashSet<Guid> BranchIds { get; set; } = new();
+    public HashSet<Guid> WarehouseIds { get; set; } = new();
+}
+
+/// <summary>
+/// Writes a bulk inventory operation applies in one database transaction
+/// </summary>
+public class InventoryBatchPlan
+{
+    public List<Inventory> NewInventories { get; set; } = new();
+    public Dictionary<Guid, Inventory> UpdatedInventories { get; set; } = new();
+    public List<InventoryTransaction> Transactions { get; set; } = new();
+}
@@ -0,0 +1,41 @@
+using System.Buffers.Text;
+using System.Text.Json;
+
+namespace NationalClothingStore.Application.Common;
+
+/// <summary>
+/// Opaque keyset pagination cursor: the sort key values and id of the last row on a page
+/// </summary>
+public sealed record PageCursor(IReadOnlyList<string> Keys, Guid Id)
+{
+    private const int Version = 1;
+
+    private sealed record Payload(int V, string[] K, Guid I);
+
+    public string Encode()
+    {
+        var json = JsonSerializer.SerializeToUtf8Bytes(new Payload(Version, Keys.ToArray(), Id));
+        return Base64Url.EncodeToString(json);
+    }
+
+    /// <summary>
+    /// Decode a cursor produced by <see cref="Encode"/>; throws ArgumentException for anything else
+    /// </summary>
+    public static PageCursor Decode(string cursor, int expectedKeys)
+    {
+        try
+        {
+            var payload = JsonSerializer.Deserialize<Payload>(Base64Url.DecodeFromChars(cursor));
+            if (payload is { V: Version, K: not null } && payload.K.Length == expectedKeys)
+            {
+                return new PageCursor(payload.K, payload.I);
+            }
+        }
+        catch (Exception ex) when (ex is FormatException or JsonException)
+        {
+            throw new ArgumentException("The pagination cursor is invalid or has expired.", nameof(cursor), ex);
+        }
+
+        throw new ArgumentException("The pagination cursor is invalid or has expired.", nameof(cursor));
+    }
+}
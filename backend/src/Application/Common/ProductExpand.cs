@@ -0,0 +1,65 @@
+namespace NationalClothingStore.Application.Common;
+
+/// <summary>
+/// Related data a product listing loads alongside each product.
+/// None (no expand value, or "expand=none") returns lean <see cref="ProductSummary"/> rows instead of full entities.
+/// </summary>
+[Flags]
+public enum ProductExpand
+{
+    None = 0,
+    Category = 1,
+    Variations = 2,
+    Images = 4,
+    All = Category | Variations | Images
+}
+
+public static class ProductExpansion
+{
+    /// <summary>
+    /// Parse an expand query value such as "variations,images", "all" or "none";
+    /// no value loads nothing, so the full graph is opt-in.
+    /// Throws ArgumentException for unknown names.
+    /// </summary>
+    public static ProductExpand Parse(string? expand)
+    {
+        if (string.IsNullOrWhiteSpace(expand))
+        {
+            return ProductExpand.None;
+        }
+
+        var result = ProductExpand.None;
+        foreach (var name in expand.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+        {
+            if (!Enum.TryParse<ProductExpand>(name, ignoreCase: true, out var value) || int.TryParse(name, out _))
+            {
+                throw new ArgumentException(
+                    $"Unknown expand value '{name}'. Use none, category, variations, images or all.", nameof(expand));
+            }
+
+            result |= value;
+        }
+
+        return result;
+    }
+}
+
+/// <summary>
+/// Lean product row for catalog grids and search results
+/// </summary>
+public record ProductSummary
+{
+    public Guid Id { get; init; }
+    public string Name { get; init; } = string.Empty;
+    public string SKU { get; init; } = string.Empty;
+    public string? Brand { get; init; }
+    public string? Season { get; init; }
+    public decimal BasePrice { get; init; }
+    public Guid CategoryId { get; init; }
+    public string? CategoryName { get; init; }
+    public bool IsActive { get; init; }
+    public int VariationCount { get; init; }
+    public string? PrimaryImageUrl { get; init; }
+    public DateTime CreatedAt { get; init; }
+    public DateTime UpdatedAt { get; init; }
+};
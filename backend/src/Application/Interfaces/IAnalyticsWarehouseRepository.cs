@@ -0,0 +1,124 @@
+namespace NationalClothingStore.Application.Interfaces;
+
+/// <summary>
+/// How far the incremental load of one source table has got
+/// </summary>
+public record EtlWatermark
+{
+    public string SourceTable { get; init; } = string.Empty;
+
+    /// <summary>Modified timestamp of the last row loaded; DateTime.MinValue before the first load</summary>
+    public DateTime LastModifiedAt { get; init; }
+
+    public long RowsLoaded { get; init; }
+    public DateTime? LastRunAt { get; init; }
+}
+
+/// <summary>
+/// Sales of one period, read from the sales rollups
+/// </summary>
+public record SalesPeriodTotals
+{
+    /// <summary>First day of the period</summary>
+    public DateTime PeriodStart { get; init; }
+
+    public int TransactionCount { get; init; }
+    public long Quantity { get; init; }
+    public decimal GrossSales { get; init; }
+    public decimal NetSales { get; init; }
+    public decimal CostAmount { get; init; }
+    public decimal GrossProfit { get; init; }
+}
+
+public record ProductSalesTotals
+{
+    public Guid ProductId { get; init; }
+    public string ProductName { get; init; } = string.Empty;
+    public string? ProductCategory { get; init; }
+    public long Quantity { get; init; }
+    public decimal NetSales { get; init; }
+}
+
+public record PaymentMethodSalesTotals
+{
+    public string PaymentMethod { get; init; } = string.Empty;
+    public int TransactionCount { get; init; }
+    public decimal NetSales { get; init; }
+}
+
+/// <summary>
+/// Period buckets the sales rollups can be read in
+/// </summary>
+public enum SalesBucket
+{
+    Day,
+    Week,
+    Month,
+    Quarter,
+    Year
+}
+
+/// <summary>
+/// Incremental loading of the analytics star schema (see Data/Analytics/002_CreateIncrementalLoad.sql)
+/// </summary>
+public interface IAnalyticsWarehouseRepository
+{
+    /// <summary>
+    /// Upsert the next batch of rows of <paramref name="sourceTable"/> modified after its watermark and no
+    /// later than <paramref name="loadedUntil"/>, advancing the watermark in the same transaction;
+    /// returns how many source rows the batch covered
+    /// </summary>
+    Task<int> LoadBatchAsync(string sourceTable, DateTime loadedUntil, int batchSize, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Get the load position of every source table loaded so far
+    /// </summary>
+    Task<IReadOnlyList<EtlWatermark>> GetWatermarksAsync(CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Rebuild the sales rollups of up to <paramref name="maxDays"/> days whose facts changed, along with the
+    /// weeks and months containing them; returns how many days were rebuilt
+    /// </summary>
+    Task<int> RefreshSalesRollupsAsync(int maxDays, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Completed sales per <paramref name="bucket"/> over the days from <paramref name="from"/> up to but
+    /// excluding <paramref name="to"/>, for one location or all of them; empty buckets are omitted
+    /// </summary>
+    Task<IReadOnlyList<SalesPeriodTotals>> GetSalesByPeriodAsync(
+        SalesBucket bucket, DateOnly from, DateOnly to, Guid? locationId = null, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Best-selling products by net sales over the days from <paramref name="from"/> up to but excluding <paramref name="to"/>
+    /// </summary>
+    Task<IReadOnlyList<ProductSalesTotals>> GetTopProductsAsync(
+        DateOnly from, DateOnly to, int limit, Guid? locationId = null, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Completed sales per payment method over the days from <paramref name="from"/> up to but excluding <paramref name="to"/>
+    /// </summary>
+    Task<IReadOnlyList<PaymentMethodSalesTotals>> GetSalesByPaymentMethodAsync(
+        DateOnly from, DateOnly to, Guid? locationId = null, CancellationToken cancellationToken = default);
+}
+
+/// <summary>
+/// Operational tables loaded into the warehouse, in load order: dimensions before the facts that reference them
+/// </summary>
+public static class WarehouseSources
+{
+    public const string Products = "Products";
+    public const string Customers = "Customers";
+    public const string Branches = "Branches";
+    public const string Warehouses = "Warehouses";
+    public const string Suppliers = "Suppliers";
+    public const string SalesTransactions = "SalesTransactions";
+    public const string InventoryTransactions = "InventoryTransactions";
+    public const string PurchaseOrders = "PurchaseOrders";
+    public const string LoyaltyTransactions = "LoyaltyTransactions";
+
+    public static readonly IReadOnlyList<string> LoadOrder =
+    [
+        Products, Customers, Branches, Warehouses, Suppliers,
+        SalesTransactions, InventoryTransactions, PurchaseOrders, LoyaltyTransactions
+    ];
+}
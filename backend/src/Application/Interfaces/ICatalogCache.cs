@@ -0,0 +1,49 @@
+namespace NationalClothingStore.Application.Interfaces;
+
+/// <summary>
+/// Read-through cache for catalog reads, shared by every API replica
+/// </summary>
+public interface ICatalogCache
+{
+    /// <summary>
+    /// Get the cached value for <paramref name="key"/>, or run <paramref name="factory"/> and cache its result.
+    /// Null results are returned but never cached.
+    /// </summary>
+    Task<T?> GetOrCreateAsync<T>(
+        string region,
+        string key,
+        Func<CancellationToken, Task<T?>> factory,
+        CancellationToken cancellationToken = default) where T : class;
+
+    /// <summary>
+    /// Remove individual entries from a region
+    /// </summary>
+    Task RemoveAsync(string region, IEnumerable<string> keys, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Invalidate every entry in a region at once
+    /// </summary>
+    Task InvalidateRegionAsync(string region, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Hit, miss and error counts since this process started
+    /// </summary>
+    CatalogCacheStatistics GetStatistics();
+}
+
+/// <summary>
+/// Cache regions; each region has its own TTL and can be invalidated as a whole
+/// </summary>
+public static class CatalogCacheRegions
+{
+    public const string Products = "products";
+    public const string Categories = "categories";
+}
+
+public record CatalogCacheStatistics
+{
+    public long Hits { get; init; }
+    public long Misses { get; init; }
+    public long Errors { get; init; }
+    public double HitRatio => Hits + Misses == 0 ? 0 : (double)Hits / (Hits + Misses);
+};
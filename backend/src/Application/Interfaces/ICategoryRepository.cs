@@ -83,7 +83,8 @@ public interface ICategoryRepository
     Task<int> GetActiveCountAsync(CancellationToken cancellationToken = default);
 
     /// <summary>
-    /// Get category hierarchy (recursive)
+    /// Get category hierarchy in a single query, ordered depth-first (parents before children).
+    /// Starts at the active root categories, or at <paramref name="rootId"/> when given.
     /// </summary>
     Task<IEnumerable<Category>> GetHierarchyAsync(Guid? rootId = null, CancellationToken cancellationToken = default);
 
@@ -11,6 +11,11 @@ public interface ICustomerRepository
     /// Get customer by ID with navigation properties
     /// </summary>
     Task<Customer?> GetByIdAsync(Guid id, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Get customer by ID with only the loyalty record loaded (no transaction history)
+    /// </summary>
+    Task<Customer?> GetWithLoyaltyAsync(Guid id, CancellationToken cancellationToken = default);
     
     /// <summary>
     /// Get customer by email
@@ -8,10 +8,11 @@ namespace NationalClothingStore.Application.Interfaces;
 public interface IFileUploadService
 {
     /// <summary>
-    /// Upload a file asynchronously
+    /// Upload a file asynchronously. Files are stored by content hash, so the same image uploaded twice is
+    /// stored once, and image derivatives become available shortly after the upload returns.
     /// </summary>
     /// <param name="file">File to upload</param>
-    /// <param name="folder">Target folder path</param>
+    /// <param name="folder">Folder the upload belongs to</param>
     /// <param name="cancellationToken">Cancellation token</param>
     /// <returns>Upload result with file information</returns>
     Task<FileUploadResult> UploadFileAsync(IFormFile file, string folder, CancellationToken cancellationToken = default);
@@ -26,12 +27,14 @@ public interface IFileUploadService
     Task<IEnumerable<FileUploadResult>> UploadFilesAsync(IEnumerable<IFormFile> files, string folder, CancellationToken cancellationToken = default);
 
     /// <summary>
-    /// Delete a file asynchronously
+    /// Delete a file asynchronously. An uploaded file is shared by every folder it was uploaded to: the
+    /// folder lets go of it, and it is deleted with its derivatives once no folder references it.
     /// </summary>
     /// <param name="filePath">Path to file to delete</param>
+    /// <param name="folder">Folder the file was uploaded to</param>
     /// <param name="cancellationToken">Cancellation token</param>
-    /// <returns>True if file was deleted successfully</returns>
-    Task<bool> DeleteFileAsync(string filePath, CancellationToken cancellationToken = default);
+    /// <returns>True if the file was deleted or released by the folder</returns>
+    Task<bool> DeleteFileAsync(string filePath, string folder = "uploads", CancellationToken cancellationToken = default);
 
     /// <summary>
     /// Validate file upload
@@ -58,13 +61,6 @@ public interface IFileUploadService
     /// <returns>True if file exists</returns>
     Task<bool> FileExistsAsync(string filePath, CancellationToken cancellationToken = default);
 
-    /// <summary>
-    /// Generate unique file name
-    /// </summary>
-    /// <param name="fileName">Original file name</param>
-    /// <returns>Unique file name</returns>
-    string GenerateUniqueFileName(string fileName);
-
     /// <summary>
     /// Get file URL from file path
     /// </summary>
@@ -85,6 +81,14 @@ public class FileUploadResult
     public string FileUrl { get; set; } = string.Empty;
     public long FileSize { get; set; }
     public string ContentType { get; set; } = string.Empty;
+    public string ContentHash { get; set; } = string.Empty;
+    public bool Deduplicated { get; set; }
+
+    /// <summary>
+    /// URLs of the resized derivatives by name and format, e.g. "thumb.webp"; generated in the background,
+    /// so briefly missing after the upload returns
+    /// </summary>
+    public Dictionary<string, string> Derivatives { get; set; } = new();
     public string ErrorMessage { get; set; } = string.Empty;
     public DateTime UploadedAt { get; set; } = DateTime.UtcNow;
 }
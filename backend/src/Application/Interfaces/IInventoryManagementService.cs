@@ -138,7 +138,7 @@ public interface IInventoryManagementService
 
     // Adjustment operations
     Task<Inventory> AdjustInventoryAsync(Guid inventoryId, AdjustInventoryRequest request, CancellationToken cancellationToken = default);
-    Task<IEnumerable<Inventory>> BulkAdjustInventoryAsync(BulkInventoryUpdateRequest request, CancellationToken cancellationToken = default);
+    Task<BulkInventoryAdjustmentResult> BulkAdjustInventoryAsync(BulkInventoryUpdateRequest request, CancellationToken cancellationToken = default);
 
     // Search and filtering
     Task<(IEnumerable<Inventory> items, int totalCount)> SearchInventoryAsync(InventorySearchRequest request, CancellationToken cancellationToken = default);
@@ -205,7 +205,38 @@ public record InventoryTransferResult
     public decimal TransferredValue { get; init; }
     public string Message { get; init; } = string.Empty;
     public List<string> Warnings { get; init; } = new();
+    /// <summary>Reference shared by every movement of a bulk transfer</summary>
+    public string? ReferenceNumber { get; init; }
     public List<InventoryTransaction> Transactions { get; init; } = new();
+    public List<BulkInventoryLineResult> Lines { get; init; } = new();
+}
+
+/// <summary>
+/// Result of bulk inventory adjustment
+/// </summary>
+public record BulkInventoryAdjustmentResult
+{
+    public bool Success { get; init; }
+    public int AdjustedCount { get; init; }
+    public string Message { get; init; } = string.Empty;
+    public List<string> Warnings { get; init; } = new();
+    /// <summary>Reference shared by every adjustment of the batch</summary>
+    public string? ReferenceNumber { get; init; }
+    public List<BulkInventoryLineResult> Lines { get; init; } = new();
+    public List<Inventory> Inventories { get; init; } = new();
+}
+
+/// <summary>
+/// Outcome of one line of a bulk transfer or adjustment; Line is the 1-based position in the request
+/// </summary>
+public record BulkInventoryLineResult
+{
+    public int Line { get; init; }
+    public Guid InventoryId { get; init; }
+    public Guid? ToInventoryId { get; init; }
+    public bool Success { get; init; }
+    public int Quantity { get; init; }
+    public string Message { get; init; } = string.Empty;
 }
 
 /// <summary>
@@ -13,6 +13,11 @@ public interface IInventoryRepository : IRepository<Inventory>
     /// </summary>
     new Task<Inventory?> GetByIdAsync(Guid id, CancellationToken cancellationToken = default);
 
+    /// <summary>
+    /// Get inventory rows by ID in one query, without related entities
+    /// </summary>
+    Task<IEnumerable<Inventory>> GetByIdsAsync(IReadOnlyCollection<Guid> ids, CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Get inventory by product and location
     /// </summary>
@@ -81,14 +86,29 @@ public interface IInventoryRepository : IRepository<Inventory>
     Task UpdateQuantityAsync(Guid id, int quantity, decimal unitCost, string? reason = null, Guid? userId = null, CancellationToken cancellationToken = default);
 
     /// <summary>
-    /// Reserve inventory quantity
+    /// Atomically reserve quantity if that much is still available, recording <paramref name="movement"/>
+    /// in the same statement. Throws InvalidOperationException when stock is insufficient.
     /// </summary>
-    Task ReserveQuantityAsync(Guid id, int quantity, CancellationToken cancellationToken = default);
+    Task<Inventory> ReserveQuantityAsync(Guid id, int quantity, InventoryTransaction movement, CancellationToken cancellationToken = default);
 
     /// <summary>
-    /// Release reserved inventory quantity
+    /// Atomically release reserved quantity, recording <paramref name="movement"/> in the same statement.
+    /// Throws InvalidOperationException when less than <paramref name="quantity"/> is reserved.
     /// </summary>
-    Task ReleaseReservedQuantityAsync(Guid id, int quantity, CancellationToken cancellationToken = default);
+    Task<Inventory> ReleaseReservedQuantityAsync(Guid id, int quantity, InventoryTransaction movement, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Compare-and-set the on-hand quantity: applies only while it still equals <paramref name="expectedQuantity"/>
+    /// and still covers the reserved quantity, recording <paramref name="movement"/> in the same statement.
+    /// Returns null when another writer got there first, so the caller can re-read and retry.
+    /// </summary>
+    Task<Inventory?> TrySetQuantityAsync(
+        Guid id,
+        int expectedQuantity,
+        int quantity,
+        decimal unitCost,
+        InventoryTransaction movement,
+        CancellationToken cancellationToken = default);
 
     /// <summary>
     /// Get inventory statistics
@@ -108,6 +128,19 @@ public interface IInventoryRepository : IRepository<Inventory>
     /// </summary>
     Task<bool> ExistsAsync(Guid productId, Guid? productVariationId, Guid branchId, Guid? warehouseId, CancellationToken cancellationToken = default);
 
+    /// <summary>
+    /// Run a bulk operation in one database transaction: lock the given rows (plus every row of their
+    /// products at the destination branches), let <paramref name="planner"/> validate the batch against
+    /// them, then bulk-insert its new rows and transactions and apply its updates in a single statement.
+    /// The planner may run more than once if the transaction is retried, so it must only read the snapshot.
+    /// </summary>
+    Task<TResult> ExecuteBatchAsync<TResult>(
+        IReadOnlyCollection<Guid> inventoryIds,
+        IReadOnlyCollection<Guid> destinationBranchIds,
+        IReadOnlyCollection<Guid> destinationWarehouseIds,
+        Func<InventoryBatchSnapshot, (InventoryBatchPlan plan, TResult result)> planner,
+        CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Get inventory movements for a specific period
     /// </summary>
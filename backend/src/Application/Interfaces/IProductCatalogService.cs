@@ -16,6 +16,7 @@ public interface IProductCatalogService
     Task<IEnumerable<Category>> GetCategoriesAsync(bool includeHierarchy = false, CancellationToken cancellationToken = default);
     Task<IEnumerable<Category>> GetRootCategoriesAsync(CancellationToken cancellationToken = default);
     Task<IEnumerable<Category>> GetChildCategoriesAsync(Guid parentId, CancellationToken cancellationToken = default);
+    Task<IEnumerable<CategoryTreeNode>> GetCategoryTreeAsync(Guid? rootId = null, CancellationToken cancellationToken = default);
 
     // Product Management
     Task<Product> CreateProductAsync(CreateProductRequest request, CancellationToken cancellationToken = default);
@@ -29,6 +30,12 @@ public interface IProductCatalogService
     Task<(IEnumerable<Product> products, PaginationMetadata pagination)> SearchProductsAsync(
         SearchProductsRequest request,
         CancellationToken cancellationToken = default);
+    Task<(IEnumerable<ProductSummary> products, PaginationMetadata pagination)> GetProductSummariesAsync(
+        GetProductsRequest request,
+        CancellationToken cancellationToken = default);
+    Task<(IEnumerable<ProductSummary> products, PaginationMetadata pagination)> SearchProductSummariesAsync(
+        SearchProductsRequest request,
+        CancellationToken cancellationToken = default);
 
     // Product Variation Management
     Task<ProductVariation> CreateProductVariationAsync(CreateProductVariationRequest request, CancellationToken cancellationToken = default);
@@ -87,6 +94,19 @@ public record UpdateCategoryRequest
     public bool IsActive { get; init; }
 };
 
+public record CategoryTreeNode
+{
+    public Guid Id { get; init; }
+    public string Name { get; init; } = string.Empty;
+    public string? Description { get; init; }
+    public string? Code { get; init; }
+    public Guid? ParentId { get; init; }
+    public int SortOrder { get; init; }
+    public bool IsActive { get; init; }
+    public int Depth { get; init; }
+    public List<CategoryTreeNode> Children { get; init; } = new();
+};
+
 public record CreateProductRequest
 {
     public string Name { get; init; } = string.Empty;
@@ -150,6 +170,9 @@ public record GetProductsRequest
     public bool? IsActive { get; init; }
     public string? Brand { get; init; }
     public string? Season { get; init; }
+    public string? Cursor { get; init; }
+    public bool IncludeTotalCount { get; init; } = true;
+    public ProductExpand Expand { get; init; } = ProductExpand.All;
 };
 
 public record SearchProductsRequest
@@ -158,6 +181,7 @@ public record SearchProductsRequest
     public int PageNumber { get; init; } = 1;
     public int PageSize { get; init; } = 20;
     public bool IncludeInactive { get; init; } = false;
+    public ProductExpand Expand { get; init; } = ProductExpand.All;
 };
 
 public record GetProductVariationsRequest
@@ -167,6 +191,8 @@ public record GetProductVariationsRequest
     public string? Size { get; init; }
     public string? Color { get; init; }
     public bool? IsActive { get; init; }
+    public string? Cursor { get; init; }
+    public bool IncludeTotalCount { get; init; } = true;
 };
 
 public record AddProductImageRequest
@@ -192,8 +218,11 @@ public record PaginationMetadata
 {
     public int PageNumber { get; init; }
     public int PageSize { get; init; }
-    public int TotalCount { get; init; }
-    public int TotalPages { get; init; }
+    // Null when the caller opted out of counting with includeTotalCount=false
+    public int? TotalCount { get; init; }
+    public int? TotalPages { get; init; }
     public bool HasPreviousPage { get; init; }
     public bool HasNextPage { get; init; }
+    // Opaque keyset cursor for the next page; null on the last page
+    public string? NextCursor { get; init; }
 };
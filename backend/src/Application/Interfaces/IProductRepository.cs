@@ -1,3 +1,4 @@
+using NationalClothingStore.Application.Common;
 using NationalClothingStore.Domain.Entities;
 
 namespace NationalClothingStore.Application.Interfaces;
@@ -12,13 +13,18 @@ public interface IProductRepository
     /// </summary>
     Task<Product?> GetByIdAsync(Guid id, CancellationToken cancellationToken = default);
 
+    /// <summary>
+    /// Get product by ID loading only the navigations named by <paramref name="expand"/>; stock rows are never loaded
+    /// </summary>
+    Task<Product?> GetByIdAsync(Guid id, ProductExpand expand, CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Get product by SKU
     /// </summary>
     Task<Product?> GetBySkuAsync(string sku, CancellationToken cancellationToken = default);
 
     /// <summary>
-    /// Get products with pagination and filtering
+    /// Get products with pagination and filtering, loading the navigations named by <paramref name="expand"/>
     /// </summary>
     Task<(IEnumerable<Product> products, int totalCount)> GetPagedAsync(
         int pageNumber,
@@ -26,22 +32,69 @@ public interface IProductRepository
         Guid? categoryId = null,
         string? search = null,
         bool? isActive = null,
+        ProductExpand expand = ProductExpand.All,
+        CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Get a page of lean product summaries with the same filtering and ordering as <see cref="GetPagedAsync"/>
+    /// </summary>
+    Task<(IEnumerable<ProductSummary> products, int totalCount)> GetPagedSummariesAsync(
+        int pageNumber,
+        int pageSize,
+        Guid? categoryId = null,
+        string? search = null,
+        bool? isActive = null,
+        CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Get up to <paramref name="take"/> products ordered by name then ID, starting after
+    /// the (afterName, afterId) keyset position; the count is skipped when not requested
+    /// </summary>
+    Task<(IEnumerable<Product> products, int? totalCount)> GetPageAfterAsync(
+        int take,
+        string? afterName = null,
+        Guid? afterId = null,
+        Guid? categoryId = null,
+        string? search = null,
+        bool? isActive = null,
+        bool includeTotalCount = true,
+        ProductExpand expand = ProductExpand.All,
+        CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Keyset page of lean product summaries; see <see cref="GetPageAfterAsync"/>
+    /// </summary>
+    Task<(IEnumerable<ProductSummary> products, int? totalCount)> GetSummaryPageAfterAsync(
+        int take,
+        string? afterName = null,
+        Guid? afterId = null,
+        Guid? categoryId = null,
+        string? search = null,
+        bool? isActive = null,
+        bool includeTotalCount = true,
         CancellationToken cancellationToken = default);
 
     /// <summary>
     /// Get all products
     /// </summary>
-    Task<IEnumerable<Product>> GetAllAsync(CancellationToken cancellationToken = default);
+    Task<IEnumerable<Product>> GetAllAsync(
+        ProductExpand expand = ProductExpand.All,
+        CancellationToken cancellationToken = default);
 
     /// <summary>
     /// Get active products only
     /// </summary>
-    Task<IEnumerable<Product>> GetActiveAsync(CancellationToken cancellationToken = default);
+    Task<IEnumerable<Product>> GetActiveAsync(
+        ProductExpand expand = ProductExpand.All,
+        CancellationToken cancellationToken = default);
 
     /// <summary>
     /// Get products by category
     /// </summary>
-    Task<IEnumerable<Product>> GetByCategoryAsync(Guid categoryId, CancellationToken cancellationToken = default);
+    Task<IEnumerable<Product>> GetByCategoryAsync(
+        Guid categoryId,
+        ProductExpand expand = ProductExpand.All,
+        CancellationToken cancellationToken = default);
 
     /// <summary>
     /// Create a new product
@@ -87,6 +140,16 @@ public interface IProductRepository
     /// Search products by name, description, SKU, brand
     /// </summary>
     Task<(IEnumerable<Product> products, int totalCount)> SearchAsync(
+        string searchTerm,
+        int pageNumber = 1,
+        int pageSize = 20,
+        ProductExpand expand = ProductExpand.All,
+        CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Search products, returning lean summaries in relevance order
+    /// </summary>
+    Task<(IEnumerable<ProductSummary> products, int totalCount)> SearchSummariesAsync(
         string searchTerm,
         int pageNumber = 1,
         int pageSize = 20,
@@ -34,6 +34,22 @@ public interface IProductVariationRepository
         bool? isActive = null,
         CancellationToken cancellationToken = default);
 
+    /// <summary>
+    /// Get up to <paramref name="take"/> variations of a product ordered by size, color then ID,
+    /// starting after the given keyset position; the count is skipped when not requested
+    /// </summary>
+    Task<(IEnumerable<ProductVariation> variations, int? totalCount)> GetByProductIdPageAfterAsync(
+        Guid productId,
+        int take,
+        string? afterSize = null,
+        string? afterColor = null,
+        Guid? afterId = null,
+        string? size = null,
+        string? color = null,
+        bool? isActive = null,
+        bool includeTotalCount = true,
+        CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Get all product variations
     /// </summary>
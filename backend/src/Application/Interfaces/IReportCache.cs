@@ -0,0 +1,38 @@
+namespace NationalClothingStore.Application.Interfaces;
+
+/// <summary>
+/// Shared cache for generated reports. Entries are keyed by the current version of the data sets
+/// a report reads, so any write to those data sets makes older entries unreachable.
+/// </summary>
+public interface IReportCache
+{
+    /// <summary>
+    /// Get a cached report or generate it. Concurrent callers asking for the same key share a single
+    /// generation; <paramref name="factory"/> is not cancelled when one of them gives up.
+    /// </summary>
+    Task<T> GetOrCreateAsync<T>(
+        string key,
+        IReadOnlyCollection<string> dataSets,
+        Func<CancellationToken, Task<T>> factory,
+        CancellationToken cancellationToken = default) where T : class;
+
+    /// <summary>
+    /// Record that the given data sets changed, invalidating every report that depends on them
+    /// </summary>
+    Task BumpDataVersionAsync(IEnumerable<string> dataSets, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Synchronous <see cref="BumpDataVersionAsync"/>, for callers on a synchronous path
+    /// </summary>
+    void BumpDataVersion(IEnumerable<string> dataSets);
+}
+
+/// <summary>
+/// Data sets reports depend on
+/// </summary>
+public static class ReportDataSets
+{
+    public const string Sales = "sales";
+    public const string Inventory = "inventory";
+    public const string Procurement = "procurement";
+}
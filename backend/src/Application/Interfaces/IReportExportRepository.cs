@@ -0,0 +1,87 @@
+namespace NationalClothingStore.Application.Interfaces;
+
+/// <summary>
+/// What to export: a dataset, optionally narrowed to a date range and a location
+/// </summary>
+public record ReportExportQuery
+{
+    /// <summary>One of <see cref="ReportExportDatasets.All"/></summary>
+    public string Dataset { get; init; } = string.Empty;
+
+    public DateTime? StartDate { get; init; }
+    public DateTime? EndDate { get; init; }
+    public Guid? BranchId { get; init; }
+    public Guid? WarehouseId { get; init; }
+}
+
+public static class ReportExportDatasets
+{
+    /// <summary>Completed sale and return lines, by completion time; needs a date range</summary>
+    public const string Sales = "sales";
+
+    /// <summary>Current stock rows</summary>
+    public const string Inventory = "inventory";
+
+    /// <summary>Customer records, optionally those created in a date range</summary>
+    public const string Customers = "customers";
+
+    /// <summary>Purchase order lines, by order date; needs a date range</summary>
+    public const string Procurement = "procurement";
+
+    public static readonly IReadOnlyList<string> All = new[] { Sales, Inventory, Customers, Procurement };
+
+    /// <summary>
+    /// Resolve a requested report type ("Sales", "analytics:customer", ...) to a dataset name
+    /// </summary>
+    public static string? Resolve(string? reportType)
+    {
+        var name = (reportType ?? string.Empty).Trim().ToLowerInvariant();
+        if (name.StartsWith("analytics:"))
+        {
+            name = name["analytics:".Length..];
+        }
+
+        return name switch
+        {
+            "sales" => Sales,
+            "inventory" => Inventory,
+            "customer" or "customers" => Customers,
+            "procurement" or "purchasing" => Procurement,
+            _ => null
+        };
+    }
+
+    public static bool NeedsDateRange(string dataset) => dataset is Sales or Procurement;
+}
+
+/// <summary>
+/// One exported column; <see cref="Type"/> is the non-nullable CLR type of its values
+/// </summary>
+public record ReportExportColumn(string Name, Type Type);
+
+/// <summary>
+/// Position in a dataset's export order: every row after it has a greater (Timestamp, Id)
+/// </summary>
+public readonly record struct ExportCursor(DateTime Timestamp, Guid Id);
+
+/// <summary>
+/// One exported row, with the cursor to resume after it
+/// </summary>
+public readonly record struct ReportExportRow(object?[] Values, ExportCursor Cursor);
+
+/// <summary>
+/// Forward-only reads of the export datasets
+/// </summary>
+public interface IReportExportRepository
+{
+    /// <summary>
+    /// Columns of a dataset, in the order rows carry their values
+    /// </summary>
+    IReadOnlyList<ReportExportColumn> GetColumns(string dataset);
+
+    /// <summary>
+    /// Stream a dataset's rows in cursor order, starting after <paramref name="after"/>; rows are read from the
+    /// database as they are enumerated, so memory does not grow with the size of the export
+    /// </summary>
+    IAsyncEnumerable<ReportExportRow> ReadRowsAsync(ReportExportQuery query, ExportCursor? after = null, CancellationToken cancellationToken = default);
+}
@@ -0,0 +1,117 @@
+namespace NationalClothingStore.Application.Interfaces;
+
+public enum ReportExportFormat
+{
+    Csv,
+
+    /// <summary>Gzip-compressed JSON Lines</summary>
+    JsonLines,
+
+    /// <summary>Columnar; written in row groups, so only available through export jobs</summary>
+    Parquet
+}
+
+public static class ReportExportFormats
+{
+    public static bool TryParse(string? value, out ReportExportFormat format)
+    {
+        switch ((value ?? string.Empty).Trim().ToLowerInvariant())
+        {
+            case "csv":
+                format = ReportExportFormat.Csv;
+                return true;
+            case "jsonl" or "jsonl.gz" or "ndjson" or "json":
+                format = ReportExportFormat.JsonLines;
+                return true;
+            case "parquet":
+                format = ReportExportFormat.Parquet;
+                return true;
+            default:
+                format = default;
+                return false;
+        }
+    }
+
+    public static string Extension(ReportExportFormat format) => format switch
+    {
+        ReportExportFormat.Csv => "csv",
+        ReportExportFormat.JsonLines => "jsonl.gz",
+        _ => "parquet"
+    };
+
+    public static string ContentType(ReportExportFormat format) => format switch
+    {
+        ReportExportFormat.Csv => "text/csv",
+        ReportExportFormat.JsonLines => "application/gzip",
+        _ => "application/vnd.apache.parquet"
+    };
+
+    /// <summary>Whether the format can be written straight to a non-seekable stream such as a response body</summary>
+    public static bool CanStream(ReportExportFormat format) => format != ReportExportFormat.Parquet;
+}
+
+public static class ReportExportStatus
+{
+    public const string Queued = "Queued";
+    public const string Running = "Running";
+    public const string Completed = "Completed";
+    public const string Failed = "Failed";
+}
+
+/// <summary>
+/// An asynchronous export and its progress. Rows are written in chunks, and after each chunk the file is
+/// complete up to <see cref="BytesWritten"/> and <see cref="Cursor"/> records the last row in it, so an
+/// interrupted job resumes from there rather than from the start.
+/// </summary>
+public class ReportExportJob
+{
+    public Guid Id { get; set; }
+    public ReportExportQuery Query { get; set; } = new();
+    public ReportExportFormat Format { get; set; }
+    public string Status { get; set; } = ReportExportStatus.Queued;
+    public string FileName { get; set; } = string.Empty;
+    public string? RequestedBy { get; set; }
+
+    public long RowsWritten { get; set; }
+    public long BytesWritten { get; set; }
+    public ExportCursor? Cursor { get; set; }
+
+    /// <summary>Times the job has been started, including resumptions</summary>
+    public int Attempts { get; set; }
+
+    public string? Error { get; set; }
+    public DateTime CreatedAt { get; set; }
+    public DateTime? StartedAt { get; set; }
+    public DateTime? UpdatedAt { get; set; }
+    public DateTime? CompletedAt { get; set; }
+}
+
+/// <summary>
+/// Exports report datasets as files without holding them in memory
+/// </summary>
+public interface IReportExportService
+{
+    /// <summary>
+    /// Write a dataset straight to <paramref name="destination"/> as it is read; for CSV and JSON Lines
+    /// </summary>
+    /// <exception cref="ArgumentException">The query or format is not valid for a streamed export</exception>
+    Task StreamAsync(ReportExportQuery query, ReportExportFormat format, Stream destination, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Queue an export job
+    /// </summary>
+    /// <exception cref="ArgumentException">The query is not valid</exception>
+    Task<ReportExportJob> StartAsync(ReportExportQuery query, ReportExportFormat format, string? requestedBy = null, CancellationToken cancellationToken = default);
+
+    Task<ReportExportJob?> GetAsync(Guid jobId, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Queue a failed job again, continuing from its last completed chunk; null when there is no such job
+    /// </summary>
+    Task<ReportExportJob?> ResumeAsync(Guid jobId, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Open the file of a completed job for reading; null until the job has completed
+    /// </summary>
+    Stream? OpenResult(ReportExportJob job);
+}
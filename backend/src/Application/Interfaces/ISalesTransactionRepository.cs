@@ -51,6 +51,19 @@ public interface ISalesTransactionRepository
     /// </summary>
     Task<SalesTransaction> CreateAsync(SalesTransaction transaction, CancellationToken cancellationToken = default);
     
+    /// <summary>
+    /// Persist a completed sale as one unit: the transaction with its items and payments, the stock
+    /// decrement for every item, the inventory movements and the loyalty points earned. Stock is only
+    /// taken if still available, otherwise nothing is written and an InvalidOperationException is thrown.
+    /// Joins the current database transaction if one is open.
+    /// </summary>
+    /// <returns>The available quantity of each stock row after the sale, by inventory ID</returns>
+    Task<IReadOnlyDictionary<Guid, int>> CommitSaleAsync(
+        SalesTransaction transaction,
+        IReadOnlyCollection<InventoryTransaction> stockMovements,
+        LoyaltyTransaction? loyaltyTransaction,
+        CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Update an existing sales transaction
     /// </summary>
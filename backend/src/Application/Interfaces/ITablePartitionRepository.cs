@@ -0,0 +1,58 @@
+namespace NationalClothingStore.Application.Interfaces;
+
+/// <summary>
+/// One monthly partition of a range-partitioned table; RangeEnd is exclusive
+/// </summary>
+public record TablePartition
+{
+    public string Table { get; init; } = string.Empty;
+    public string Name { get; init; } = string.Empty;
+    public DateTime RangeStart { get; init; }
+    public DateTime RangeEnd { get; init; }
+    public long EstimatedRows { get; init; }
+}
+
+/// <summary>
+/// Maintenance of the monthly partitions behind time-series tables: retention works by dropping whole
+/// partitions, which is near-instant and leaves no dead rows for vacuum
+/// </summary>
+public interface ITablePartitionRepository
+{
+    /// <summary>
+    /// Create any missing partitions from the current month through <paramref name="monthsAhead"/> months ahead;
+    /// returns how many were created
+    /// </summary>
+    Task<int> EnsureMonthlyPartitionsAsync(string table, int monthsAhead, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Move the rows of a table's default partition, which catches rows outside the provisioned months,
+    /// into monthly partitions of their own; returns how many partitions were created
+    /// </summary>
+    Task<int> SplitDefaultPartitionAsync(string table, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Get the partitions of a table, oldest first
+    /// </summary>
+    Task<IReadOnlyList<TablePartition>> GetPartitionsAsync(string table, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Write a partition's rows to <paramref name="filePath"/> as gzip-compressed CSV with a header row
+    /// </summary>
+    Task ExportPartitionAsync(TablePartition partition, string filePath, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Detach a partition from its table without blocking writers, then drop it
+    /// </summary>
+    Task DropPartitionAsync(TablePartition partition, CancellationToken cancellationToken = default);
+}
+
+/// <summary>
+/// Tables partitioned by month
+/// </summary>
+public static class PartitionedTables
+{
+    public const string AuditEvents = "AuditEvents";
+    public const string InventoryTransactions = "InventoryTransactions";
+
+    public static readonly IReadOnlyList<string> All = [AuditEvents, InventoryTransactions];
+}
@@ -43,4 +43,10 @@ public interface IUnitOfWork : IDisposable
     Task RollbackAsync(CancellationToken cancellationToken = default);
 
     Task CommitTransactionAsync(CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Run an operation in a database transaction that commits when it returns, retrying the whole
+    /// operation on transient failures. Inside an already open transaction the operation joins it.
+    /// </summary>
+    Task<T> ExecuteInTransactionAsync<T>(Func<CancellationToken, Task<T>> operation, CancellationToken cancellationToken = default);
 }
@@ -12,19 +12,27 @@ public class AnalyticsService : IAnalyticsService
     private readonly IInventoryManagementService _inventoryManagementService;
     private readonly ISalesProcessingService _salesProcessingService;
     private readonly ICustomerManagementService _customerManagementService;
+    private readonly IAnalyticsWarehouseRepository _warehouseRepository;
     private readonly ILogger<AnalyticsService> _logger;
 
+    // Day-of-week patterns are read from the most recent part of the range only, so long ranges don't pull
+    // years of daily rows
+    private const int SeasonalTrendDays = 91;
+    private const int TopProductCount = 10;
+
     public AnalyticsService(
         IReportingService reportingService,
         IInventoryManagementService inventoryManagementService,
         ISalesProcessingService salesProcessingService,
         ICustomerManagementService customerManagementService,
+        IAnalyticsWarehouseRepository warehouseRepository,
         ILogger<AnalyticsService> logger)
     {
         _reportingService = reportingService;
         _inventoryManagementService = inventoryManagementService;
         _salesProcessingService = salesProcessingService;
         _customerManagementService = customerManagementService;
+        _warehouseRepository = warehouseRepository;
         _logger = logger;
     }
 
@@ -40,29 +48,42 @@ public class AnalyticsService : IAnalyticsService
         {
             _logger.LogInformation("Generating sales analytics from {StartDate} to {EndDate}", startDate, endDate);
 
-            var salesReport = await _reportingService.GenerateSalesReportAsync(startDate, endDate, branchId, warehouseId, cancellationToken);
+            // Everything below reads the pre-aggregated sales rollups, so the cost depends on the number of
+            // periods in the range rather than the number of transactions
+            var (from, to) = ToDayRange(startDate, endDate);
+            var locationId = branchId ?? warehouseId;
+
+            var periodSales = await _warehouseRepository.GetSalesByPeriodAsync(ToSalesBucket(period), from, to, locationId, cancellationToken);
+            var totalSales = periodSales.Sum(p => p.NetSales);
+            var totalTransactions = periodSales.Sum(p => p.TransactionCount);
 
-            // Calculate growth metrics
-            var previousPeriodStart = startDate.AddDays(-(endDate - startDate).Days);
-            var previousPeriodEnd = startDate.AddDays(-1);
-            var previousReport = await _reportingService.GenerateSalesReportAsync(previousPeriodStart, previousPeriodEnd, branchId, warehouseId, cancellationToken);
+            // Calculate growth metrics against the equally long range just before
+            var previousSales = await _warehouseRepository.GetSalesByPeriodAsync(
+                SalesBucket.Year, from.AddDays(from.DayNumber - to.DayNumber), from, locationId, cancellationToken);
+            var previousTotalSales = previousSales.Sum(p => p.NetSales);
+            var previousTotalTransactions = previousSales.Sum(p => p.TransactionCount);
 
-            var salesGrowth = previousReport.TotalSales > 0 
-                ? ((salesReport.TotalSales - previousReport.TotalSales) / previousReport.TotalSales) * 100m 
+            var salesGrowth = previousTotalSales > 0 
+                ? ((totalSales - previousTotalSales) / previousTotalSales) * 100m 
                 : 0m;
 
-            var transactionGrowth = previousReport.TotalTransactions > 0 
-                ? ((double)(salesReport.TotalTransactions - previousReport.TotalTransactions) / previousReport.TotalTransactions) * 100 
+            var transactionGrowth = previousTotalTransactions > 0 
+                ? ((double)(totalTransactions - previousTotalTransactions) / previousTotalTransactions) * 100 
                 : 0;
 
             // Calculate period-based analytics
-            var periodData = CalculatePeriodAnalytics(salesReport.DailySales, period);
+            var periodData = CalculatePeriodAnalytics(periodSales, period);
 
             // Calculate seasonal trends
-            var seasonalTrends = CalculateSeasonalTrends(salesReport.DailySales);
+            var seasonalFrom = DateOnly.FromDayNumber(Math.Max(from.DayNumber, to.DayNumber - SeasonalTrendDays));
+            var dailySales = await _warehouseRepository.GetSalesByPeriodAsync(SalesBucket.Day, seasonalFrom, to, locationId, cancellationToken);
+            var seasonalTrends = CalculateSeasonalTrends(dailySales.Select(ToDailySalesData).ToList());
 
             // Calculate product performance metrics
-            var productPerformance = CalculateProductPerformance(salesReport.TopProducts);
+            var topProducts = await _warehouseRepository.GetTopProductsAsync(from, to, TopProductCount, locationId, cancellationToken);
+            var productPerformance = CalculateProductPerformance(topProducts.Select(ToProductSalesData).ToList());
+
+            var paymentMethods = await _warehouseRepository.GetSalesByPaymentMethodAsync(from, to, locationId, cancellationToken);
 
             // Calculate customer behavior patterns
             var customerBehavior = await CalculateCustomerBehavior(startDate, endDate, cancellationToken);
@@ -72,16 +93,16 @@ public class AnalyticsService : IAnalyticsService
                 StartDate = startDate,
                 EndDate = endDate,
                 Period = period,
-                TotalSales = salesReport.TotalSales,
+                TotalSales = totalSales,
                 SalesGrowth = salesGrowth,
-                TotalTransactions = salesReport.TotalTransactions,
+                TotalTransactions = totalTransactions,
                 TransactionGrowth = transactionGrowth,
-                AverageTransactionValue = salesReport.AverageTransactionValue,
+                AverageTransactionValue = totalTransactions > 0 ? totalSales / totalTransactions : 0,
                 PeriodData = periodData,
                 SeasonalTrends = seasonalTrends,
                 TopProducts = productPerformance,
                 CustomerBehavior = customerBehavior,
-                SalesByPaymentMethod = salesReport.SalesByPaymentMethod,
+                SalesByPaymentMethod = ToPaymentMethodData(paymentMethods, totalSales),
                 GeneratedAt = DateTime.UtcNow
             };
         }
@@ -201,7 +222,7 @@ public class AnalyticsService : IAnalyticsService
         {
             _logger.LogInformation("Generating financial analytics from {StartDate} to {EndDate}", startDate, endDate);
 
-            var financialReport = await _reportingService.GenerateFinancialReportAsync(startDate, endDate, cancellationToken);
+            var financialReport = await GenerateFinancialReportAsync(startDate, endDate, cancellationToken);
 
             // Calculate profitability metrics
             var profitabilityMetrics = await CalculateProfitabilityMetrics(startDate, endDate, cancellationToken);
@@ -213,7 +234,7 @@ public class AnalyticsService : IAnalyticsService
             var expenseBreakdown = await CalculateExpenseBreakdown(startDate, endDate, cancellationToken);
 
             // Calculate revenue trends
-            var revenueTrends = await CalculateRevenueTrends(startDate, endDate, period, cancellationToken);
+            var revenueTrends = await CalculateRevenueTrends(startDate, endDate, financialReport.TotalRevenue, cancellationToken);
 
             // Calculate financial ratios
             var financialRatios = CalculateFinancialRatios(financialReport);
@@ -280,43 +301,22 @@ public class AnalyticsService : IAnalyticsService
 
     #region Helper Methods
 
-    private List<PeriodData> CalculatePeriodAnalytics(List<DailySalesData> dailySales, AnalyticsPeriod period)
-    {
-        var periodData = new List<PeriodData>();
-
-        switch (period)
-        {
-            case AnalyticsPeriod.Daily:
-                periodData = dailySales.Select(d => new PeriodData
-                {
-                    Period = d.Date.ToString("yyyy-MM-dd"),
-                    Value = d.TotalSales,
-                    Count = d.TransactionCount
-                }).ToList();
-                break;
-            
-            case AnalyticsPeriod.Weekly:
-                var weeklyData = dailySales.GroupBy(d => GetWeekNumber(d.Date));
-                periodData = weeklyData.Select(g => new PeriodData
-                {
-                    Period = $"Week {g.Key}",
-                    Value = g.Sum(d => d.TotalSales),
-                    Count = g.Sum(d => d.TransactionCount)
-                }).ToList();
-                break;
-            
-            case AnalyticsPeriod.Monthly:
-                var monthlyData = dailySales.GroupBy(d => new { d.Date.Year, d.Date.Month });
-                periodData = monthlyData.Select(g => new PeriodData
-                {
-                    Period = $"{g.Key.Year}-{g.Key.Month:D2}",
-                    Value = g.Sum(d => d.TotalSales),
-                    Count = g.Sum(d => d.TransactionCount)
-                }).ToList();
-                break;
-        }
-
-        return periodData;
+    private List<PeriodData> CalculatePeriodAnalytics(IReadOnlyList<SalesPeriodTotals> periodSales, AnalyticsPeriod period)
+    {
+        // The rollups are already bucketed by the requested period
+        return periodSales.Select(p => new PeriodData
+        {
+            Period = period switch
+            {
+                AnalyticsPeriod.Daily => p.PeriodStart.ToString("yyyy-MM-dd"),
+                AnalyticsPeriod.Weekly => $"Week {GetWeekNumber(p.PeriodStart)}",
+                AnalyticsPeriod.Monthly => $"{p.PeriodStart.Year}-{p.PeriodStart.Month:D2}",
+                AnalyticsPeriod.Quarterly => $"{p.PeriodStart.Year}-Q{(p.PeriodStart.Month - 1) / 3 + 1}",
+                _ => p.PeriodStart.Year.ToString()
+            },
+            Value = p.NetSales,
+            Count = p.TransactionCount
+        }).ToList();
     }
 
     private List<SeasonalTrend> CalculateSeasonalTrends(List<DailySalesData> dailySales)
@@ -514,15 +514,58 @@ public class AnalyticsService : IAnalyticsService
         };
     }
 
-    private async Task<RevenueTrends> CalculateRevenueTrends(DateTime startDate, DateTime endDate, AnalyticsPeriod period, CancellationToken cancellationToken)
+    private async Task<RevenueTrends> CalculateRevenueTrends(DateTime startDate, DateTime endDate, decimal currentRevenue, CancellationToken cancellationToken)
     {
+        var (from, to) = ToDayRange(startDate, endDate);
+
+        // The equally long range just before, and the same range a year earlier
+        var previous = await _warehouseRepository.GetSalesByPeriodAsync(
+            SalesBucket.Year, from.AddDays(from.DayNumber - to.DayNumber), from, cancellationToken: cancellationToken);
+        var lastYear = await _warehouseRepository.GetSalesByPeriodAsync(
+            SalesBucket.Year, from.AddYears(-1), to.AddYears(-1), cancellationToken: cancellationToken);
+
+        var previousRevenue = previous.Sum(p => p.NetSales);
+        var lastYearRevenue = lastYear.Sum(p => p.NetSales);
+        var growthRate = previousRevenue > 0 ? (double)((currentRevenue - previousRevenue) / previousRevenue) * 100 : 0;
+
         return new RevenueTrends
         {
-            CurrentPeriodRevenue = 125000.00m, // Example
-            PreviousPeriodRevenue = 115000.00m, // Example
-            GrowthRate = 8.7, // Example percentage
-            TrendDirection = "Upward", // Example
-            SeasonalImpact = "Positive" // Example
+            CurrentPeriodRevenue = currentRevenue,
+            PreviousPeriodRevenue = previousRevenue,
+            GrowthRate = growthRate,
+            TrendDirection = growthRate > 0 ? "Upward" : growthRate < 0 ? "Downward" : "Flat",
+            SeasonalImpact = lastYearRevenue == 0 || currentRevenue == lastYearRevenue ? "Neutral"
+                : currentRevenue > lastYearRevenue ? "Positive" : "Negative"
+        };
+    }
+
+    private async Task<FinancialReport> GenerateFinancialReportAsync(DateTime startDate, DateTime endDate, CancellationToken cancellationToken)
+    {
+        // Revenue comes from the monthly sales rollups; costs are still the purchases placed in the range
+        var (from, to) = ToDayRange(startDate, endDate);
+        var monthlySales = await _warehouseRepository.GetSalesByPeriodAsync(SalesBucket.Month, from, to, cancellationToken: cancellationToken);
+        var procurementReport = await _reportingService.GenerateProcurementReportAsync(startDate, endDate, cancellationToken);
+
+        var totalRevenue = monthlySales.Sum(m => m.NetSales);
+        var totalCosts = procurementReport.TotalPurchaseValue;
+        var grossProfit = totalRevenue - totalCosts;
+
+        return new FinancialReport
+        {
+            StartDate = startDate,
+            EndDate = endDate,
+            TotalRevenue = totalRevenue,
+            TotalCosts = totalCosts,
+            GrossProfit = grossProfit,
+            ProfitMargin = totalRevenue > 0 ? (grossProfit / totalRevenue) * 100 : 0,
+            MonthlyBreakdown = monthlySales.Select(m => new MonthlyFinancialData
+            {
+                Month = m.PeriodStart,
+                Revenue = m.NetSales,
+                Costs = m.CostAmount,
+                Profit = m.GrossProfit
+            }).ToList(),
+            GeneratedAt = DateTime.UtcNow
         };
     }
 
@@ -589,6 +632,55 @@ public class AnalyticsService : IAnalyticsService
 
     #region Utility Methods
 
+    // Whole days from startDate's up to and including endDate's
+    private static (DateOnly From, DateOnly To) ToDayRange(DateTime startDate, DateTime endDate)
+    {
+        return (DateOnly.FromDateTime(startDate), DateOnly.FromDateTime(endDate).AddDays(1));
+    }
+
+    private static SalesBucket ToSalesBucket(AnalyticsPeriod period) => period switch
+    {
+        AnalyticsPeriod.Daily => SalesBucket.Day,
+        AnalyticsPeriod.Weekly => SalesBucket.Week,
+        AnalyticsPeriod.Monthly => SalesBucket.Month,
+        AnalyticsPeriod.Quarterly => SalesBucket.Quarter,
+        _ => SalesBucket.Year
+    };
+
+    private static DailySalesData ToDailySalesData(SalesPeriodTotals day)
+    {
+        return new DailySalesData
+        {
+            Date = day.PeriodStart,
+            TotalSales = day.NetSales,
+            TransactionCount = day.TransactionCount,
+            AverageTransactionValue = day.TransactionCount > 0 ? day.NetSales / day.TransactionCount : 0
+        };
+    }
+
+    private static ProductSalesData ToProductSalesData(ProductSalesTotals product)
+    {
+        return new ProductSalesData
+        {
+            ProductId = product.ProductId,
+            ProductName = product.ProductName,
+            TotalQuantity = (int)Math.Min(product.Quantity, int.MaxValue),
+            TotalRevenue = product.NetSales,
+            AveragePrice = product.Quantity > 0 ? product.NetSales / product.Quantity : 0
+        };
+    }
+
+    private static List<PaymentMethodData> ToPaymentMethodData(IReadOnlyList<PaymentMethodSalesTotals> paymentMethods, decimal totalSales)
+    {
+        return paymentMethods.Select(p => new PaymentMethodData
+        {
+            PaymentMethod = p.PaymentMethod,
+            TotalAmount = p.NetSales,
+            TransactionCount = p.TransactionCount,
+            Percentage = totalSales > 0 ? (double)(p.NetSales / totalSales) * 100 : 0
+        }).ToList();
+    }
+
     private int GetWeekNumber(DateTime date)
     {
         return System.Globalization.CultureInfo.CurrentCulture.Calendar.GetWeekOfYear(date, System.Globalization.CalendarWeekRule.FirstFourDayWeek, DayOfWeek.Monday);
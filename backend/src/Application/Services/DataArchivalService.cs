@@ -1,4 +1,6 @@
 using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using NationalClothingStore.Application.Interfaces;
 
 namespace NationalClothingStore.Application.Services;
 
@@ -7,46 +9,225 @@ public interface IDataArchivalService
     Task ArchiveOldDataAsync(DateTime cutoffDate, CancellationToken cancellationToken = default);
     Task PurgeExpiredDataAsync(CancellationToken cancellationToken = default);
     Task<ArchivalSummary> GetArchivalStatusAsync(CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Create the monthly partitions that upcoming writes will land in, and move rows that landed in a
+    /// table's default partition into monthly partitions
+    /// </summary>
+    Task EnsurePartitionsAsync(CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Export every partition of <paramref name="table"/> that ends on or before <paramref name="beforeDate"/>
+    /// and has not been exported yet; returns how many were exported
+    /// </summary>
+    Task<int> ExportPartitionsAsync(string table, DateTime beforeDate, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Drop every partition of <paramref name="table"/> that ends on or before <paramref name="beforeDate"/>,
+    /// exporting each one first when <paramref name="export"/> is set; returns how many were dropped.
+    /// Rows in a partially expired month stay until the whole month has expired.
+    /// </summary>
+    Task<int> DropPartitionsAsync(string table, DateTime beforeDate, bool export, CancellationToken cancellationToken = default);
+}
+
+/// <summary>
+/// Archival settings, bound from the "DataArchival" configuration section
+/// </summary>
+public class DataArchivalOptions
+{
+    /// <summary>Where dropped partitions are exported as .csv.gz files; null to drop without exporting</summary>
+    public string? ExportDirectory { get; set; }
+
+    /// <summary>How long exported files are kept before being purged</summary>
+    public TimeSpan ExportRetention { get; set; } = TimeSpan.FromDays(3650);
+
+    /// <summary>How many months of partitions to keep provisioned beyond the current one</summary>
+    public int MonthsAhead { get; set; } = 3;
 }
 
+/// <summary>
+/// Retention for the time-partitioned tables: expiring data detaches and drops whole monthly partitions,
+/// optionally exporting them to compressed files first, instead of deleting rows one by one
+/// </summary>
 public class DataArchivalService : IDataArchivalService
 {
+    private const string ExportExtension = ".csv.gz";
+
+    // Totals since process start, reported by GetArchivalStatusAsync
+    private static readonly object StatusLock = new();
+    private static long _archivedRecords;
+    private static long _purgedRecords;
+    private static DateTime? _lastArchival;
+    private static DateTime? _lastPurge;
+
     private readonly ILogger<DataArchivalService> _logger;
+    private readonly ITablePartitionRepository _partitionRepository;
+    private readonly DataArchivalOptions _options;
 
-    public DataArchivalService(ILogger<DataArchivalService> logger)
+    public DataArchivalService(
+        ILogger<DataArchivalService> logger,
+        ITablePartitionRepository partitionRepository,
+        IOptions<DataArchivalOptions> options)
     {
         _logger = logger;
+        _partitionRepository = partitionRepository;
+        _options = options.Value;
     }
 
     public async Task ArchiveOldDataAsync(DateTime cutoffDate, CancellationToken cancellationToken = default)
     {
         _logger.LogInformation("Archiving data older than {CutoffDate}", cutoffDate);
-        // Placeholder: Move records older than cutoffDate to archive tables/files
-        await Task.Delay(100, cancellationToken);
-        _logger.LogInformation("Archival completed for cutoff {CutoffDate}", cutoffDate);
+
+        var dropped = 0;
+        foreach (var table in PartitionedTables.All)
+        {
+            dropped += await DropPartitionsAsync(table, cutoffDate, export: _options.ExportDirectory != null, cancellationToken);
+        }
+
+        _logger.LogInformation("Archival completed for cutoff {CutoffDate}: {Count} partitions dropped", cutoffDate, dropped);
     }
 
-    public async Task PurgeExpiredDataAsync(CancellationToken cancellationToken = default)
+    public Task PurgeExpiredDataAsync(CancellationToken cancellationToken = default)
     {
+        if (_options.ExportDirectory == null || !Directory.Exists(_options.ExportDirectory))
+        {
+            return Task.CompletedTask;
+        }
+
         _logger.LogInformation("Purging expired archived data");
-        // Placeholder: Delete archive records older than retention period (e.g., 7 years)
-        await Task.Delay(100, cancellationToken);
-        _logger.LogInformation("Expired data purge completed");
+
+        var expiresBefore = DateTime.UtcNow - _options.ExportRetention;
+        var purged = 0;
+        foreach (var file in Directory.EnumerateFiles(_options.ExportDirectory, "*" + ExportExtension, SearchOption.AllDirectories))
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+            if (File.GetLastWriteTimeUtc(file) < expiresBefore)
+            {
+                File.Delete(file);
+                purged++;
+            }
+        }
+
+        lock (StatusLock)
+        {
+            _lastPurge = DateTime.UtcNow;
+        }
+
+        _logger.LogInformation("Expired data purge completed: {Count} archive files deleted", purged);
+        return Task.CompletedTask;
     }
 
     public async Task<ArchivalSummary> GetArchivalStatusAsync(CancellationToken cancellationToken = default)
     {
-        // Placeholder: Return counts of active, archived, and purged records
-        await Task.Delay(50, cancellationToken);
-        return new ArchivalSummary
+        long activeRecords = 0;
+        foreach (var table in PartitionedTables.All)
+        {
+            var partitions = await _partitionRepository.GetPartitionsAsync(table, cancellationToken);
+            activeRecords += partitions.Sum(p => p.EstimatedRows);
+        }
+
+        lock (StatusLock)
+        {
+            return new ArchivalSummary
+            {
+                ActiveRecords = ToInt(activeRecords),
+                ArchivedRecords = ToInt(_archivedRecords),
+                PurgedRecords = ToInt(_purgedRecords),
+                LastArchival = _lastArchival,
+                LastPurge = _lastPurge
+            };
+        }
+    }
+
+    public async Task EnsurePartitionsAsync(CancellationToken cancellationToken = default)
+    {
+        foreach (var table in PartitionedTables.All)
         {
-            ActiveRecords = 125000,
-            ArchivedRecords = 35000,
-            PurgedRecords = 8000,
-            LastArchival = DateTime.UtcNow.AddDays(-7),
-            LastPurge = DateTime.UtcNow.AddDays(-30)
-        };
+            var created = await _partitionRepository.EnsureMonthlyPartitionsAsync(table, _options.MonthsAhead, cancellationToken);
+            if (created > 0)
+            {
+                _logger.LogInformation("Created {Count} partitions for {Table}", created, table);
+            }
+
+            // Backdated rows, and rows for months beyond the provisioned ones, wait in the default partition
+            var split = await _partitionRepository.SplitDefaultPartitionAsync(table, cancellationToken);
+            if (split > 0)
+            {
+                _logger.LogInformation("Split {Count} monthly partitions out of the {Table} default partition", split, table);
+            }
+        }
     }
+
+    public async Task<int> ExportPartitionsAsync(string table, DateTime beforeDate, CancellationToken cancellationToken = default)
+    {
+        if (_options.ExportDirectory == null)
+        {
+            _logger.LogWarning("DataArchival:ExportDirectory is not configured; {Table} partitions were not exported", table);
+            return 0;
+        }
+
+        var exported = 0;
+        foreach (var partition in await GetExpiredPartitionsAsync(table, beforeDate, cancellationToken))
+        {
+            if (!File.Exists(ExportPath(partition)))
+            {
+                await ExportAsync(partition, cancellationToken);
+                exported++;
+            }
+        }
+
+        return exported;
+    }
+
+    public async Task<int> DropPartitionsAsync(string table, DateTime beforeDate, bool export, CancellationToken cancellationToken = default)
+    {
+        var expired = await GetExpiredPartitionsAsync(table, beforeDate, cancellationToken);
+        foreach (var partition in expired)
+        {
+            if (export && !File.Exists(ExportPath(partition)))
+            {
+                await ExportAsync(partition, cancellationToken);
+            }
+
+            await _partitionRepository.DropPartitionAsync(partition, cancellationToken);
+
+            lock (StatusLock)
+            {
+                _purgedRecords += partition.EstimatedRows;
+            }
+
+            _logger.LogInformation("Dropped partition {Partition} ({RangeStart:yyyy-MM}, ~{Rows} rows)",
+                partition.Name, partition.RangeStart, partition.EstimatedRows);
+        }
+
+        return expired.Count;
+    }
+
+    private async Task<List<TablePartition>> GetExpiredPartitionsAsync(string table, DateTime beforeDate, CancellationToken cancellationToken)
+    {
+        var partitions = await _partitionRepository.GetPartitionsAsync(table, cancellationToken);
+        return partitions.Where(p => p.RangeEnd <= beforeDate).ToList();
+    }
+
+    private async Task ExportAsync(TablePartition partition, CancellationToken cancellationToken)
+    {
+        await _partitionRepository.ExportPartitionAsync(partition, ExportPath(partition), cancellationToken);
+
+        lock (StatusLock)
+        {
+            _archivedRecords += partition.EstimatedRows;
+            _lastArchival = DateTime.UtcNow;
+        }
+
+        _logger.LogInformation("Exported partition {Partition} to {Path}", partition.Name, ExportPath(partition));
+    }
+
+    private string ExportPath(TablePartition partition)
+    {
+        return Path.Combine(_options.ExportDirectory!, partition.Table, partition.Name + ExportExtension);
+    }
+
+    private static int ToInt(long value) => (int)Math.Min(value, int.MaxValue);
 }
 
 public class ArchivalSummary
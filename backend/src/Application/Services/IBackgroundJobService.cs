@@ -88,6 +88,11 @@ public class JobExecutionContext
     public Dictionary<string, object> JobData { get; set; } = new();
     public int RefireCount { get; set; }
     public CancellationToken CancellationToken { get; set; }
+
+    /// <summary>
+    /// Set by the job to describe what it did; recorded with the execution in the job's history
+    /// </summary>
+    public object? Result { get; set; }
 }
 
 /// <summary>
@@ -12,9 +12,12 @@ public class InventoryManagementService(
     IInventoryRepository inventoryRepository,
     IInventoryTransactionRepository transactionRepository,
     IProductCatalogService productCatalogService,
+    IRealTimeDashboardService realTimeDashboard,
     ILogger<InventoryManagementService> logger)
     : IInventoryManagementService
 {
+    private const int MaxConcurrencyRetries = 5;
+
     // Inventory CRUD operations
     public async Task<Inventory> CreateInventoryAsync(CreateInventoryRequest request, CancellationToken cancellationToken = default)
     {
@@ -103,31 +106,10 @@ public class InventoryManagementService(
             throw new ArgumentException(string.Join(", ", validationResult.Errors));
         }
 
-        // Update inventory
-        inventory.Quantity = request.Quantity;
-        inventory.AvailableQuantity = inventory.Quantity - inventory.ReservedQuantity;
-        inventory.UnitCost = request.UnitCost;
-        inventory.LastUpdated = DateTime.UtcNow;
-
-        await inventoryRepository.UpdateQuantityAsync(id, inventory.Quantity, inventory.UnitCost, request.Reason, request.UpdatedByUserId, cancellationToken);
-
-        // Create adjustment transaction
-        var quantityDiff = request.Quantity - inventory.Quantity;
-        await CreateTransactionAsync(
-            id,
-            quantityDiff > 0 ? "IN" : "OUT",
-            Math.Abs(quantityDiff),
-            request.UnitCost,
-            $"INV-{id}:N8",
-            request.Reason,
-            request.UpdatedByUserId,
-            null,
-            null,
-            null,
-            null,
-            cancellationToken);
+        var oldQuantity = inventory.Quantity;
+        inventory = await SetQuantityAsync(inventory, request.Quantity, request.UnitCost, null, "INV", request.Reason, request.UpdatedByUserId, cancellationToken);
 
-        logger.LogInformation("Inventory updated successfully with ID: {InventoryId}, NewQuantity: {NewQuantity}, OldQuantity: {OldQuantity}", inventory.Id, request.Quantity, inventory.Quantity);
+        logger.LogInformation("Inventory updated successfully with ID: {InventoryId}, NewQuantity: {NewQuantity}, OldQuantity: {OldQuantity}", inventory.Id, request.Quantity, oldQuantity);
 
         return inventory;
     }
@@ -199,69 +181,53 @@ public class InventoryManagementService(
     // Stock management operations
     public async Task ReserveInventoryAsync(Guid inventoryId, ReserveInventoryRequest request, CancellationToken cancellationToken = default)
     {
-        var inventory = await inventoryRepository.GetByIdAsync(inventoryId, cancellationToken);
-        if (inventory == null)
-        {
-            throw new KeyNotFoundException($"Inventory with ID {inventoryId} not found");
-        }
-
-        if (inventory.AvailableQuantity < request.Quantity)
+        if (request.Quantity <= 0)
         {
-            throw new InvalidOperationException($"Insufficient available quantity. Available: {inventory.AvailableQuantity}, Requested: {request.Quantity}");
+            throw new ArgumentException("Quantity must be greater than 0");
         }
 
-        // Reserve inventory
-        await inventoryRepository.ReserveQuantityAsync(inventoryId, request.Quantity, cancellationToken);
-
-        // Create reservation transaction
-        await CreateTransactionAsync(
+        // The availability check and the reservation are one conditional UPDATE, so concurrent
+        // reservations against the same SKU can never oversell it
+        var reserved = await inventoryRepository.ReserveQuantityAsync(
             inventoryId,
-            "RESERVATION",
             request.Quantity,
-            inventory.UnitCost,
-            $"RES-{inventoryId:N8}",
-            request.Reason,
-            request.ReservedByUserId,
-            null,
-            null,
-            null,
-            null,
+            new InventoryTransaction
+            {
+                TransactionType = "RESERVATION",
+                Quantity = request.Quantity,
+                ReferenceNumber = $"RES-{inventoryId:N}",
+                Reason = request.Reason,
+                CreatedByUserId = request.ReservedByUserId
+            },
             cancellationToken);
 
+        realTimeDashboard.RecordStockLevel(reserved);
+
         logger.LogInformation("Inventory reserved successfully with ID: {InventoryId}, Quantity: {Quantity}", inventoryId, request.Quantity);
     }
 
     public async Task ReleaseInventoryAsync(Guid inventoryId, ReleaseInventoryRequest request, CancellationToken cancellationToken = default)
     {
-        var inventory = await inventoryRepository.GetByIdAsync(inventoryId, cancellationToken);
-        if (inventory == null)
-        {
-            throw new KeyNotFoundException($"Inventory with ID {inventoryId} not found");
-        }
-
-        if (inventory.ReservedQuantity < request.Quantity)
+        if (request.Quantity <= 0)
         {
-            throw new InvalidOperationException($"Cannot release more than reserved quantity. Reserved: {inventory.ReservedQuantity}, Requested: {request.Quantity}");
+            throw new ArgumentException("Quantity must be greater than 0");
         }
 
-        // Release inventory
-        await inventoryRepository.ReleaseReservedQuantityAsync(inventoryId, request.Quantity, cancellationToken);
-
-        // Create release transaction
-        await CreateTransactionAsync(
+        var released = await inventoryRepository.ReleaseReservedQuantityAsync(
             inventoryId,
-            "RELEASE",
             request.Quantity,
-            inventory.UnitCost,
-            $"REL-{inventoryId:N8}",
-            request.Reason,
-            request.ReleasedByUserId,
-            null,
-            null,
-            null,
-            null,
+            new InventoryTransaction
+            {
+                TransactionType = "RELEASE",
+                Quantity = request.Quantity,
+                ReferenceNumber = $"REL-{inventoryId:N}",
+                Reason = request.Reason,
+                CreatedByUserId = request.ReleasedByUserId
+            },
             cancellationToken);
 
+        realTimeDashboard.RecordStockLevel(released);
+
         logger.LogInformation("Inventory released successfully with ID: {InventoryId}, Quantity: {Quantity}", inventoryId, request.Quantity);
     }
 
@@ -274,34 +240,69 @@ public class InventoryManagementService(
         }
 
         var oldQuantity = inventory.Quantity;
-        inventory.Quantity = quantity;
-        inventory.AvailableQuantity = quantity - inventory.ReservedQuantity;
-        inventory.UnitCost = unitCost;
-        inventory.LastUpdated = DateTime.UtcNow;
-
-        await inventoryRepository.UpdateQuantityAsync(id, quantity, unitCost, reason, userId, cancellationToken);
-
-        // Create stock update transaction
-        var quantityDiff = quantity - oldQuantity;
-        await CreateTransactionAsync(
-            id,
-            quantityDiff > 0 ? "IN" : "OUT",
-            Math.Abs(quantityDiff),
-            unitCost,
-            $"STK-{id:N8}",
-            reason,
-            userId,
-            null,
-            null,
-            null,
-            null,
-            cancellationToken);
+        inventory = await SetQuantityAsync(inventory, quantity, unitCost, null, "STK", reason, userId, cancellationToken);
 
         logger.LogInformation("Stock updated successfully with ID: {InventoryId}, OldQuantity: {OldQuantity}, NewQuantity: {NewQuantity}", id, oldQuantity, quantity);
 
         return inventory;
     }
 
+    // Optimistic compare-and-set on the on-hand quantity: re-read and retry a few times when another
+    // writer changes the row between our read and our write, rather than holding a lock across both
+    private async Task<Inventory> SetQuantityAsync(
+        Inventory inventory,
+        int quantity,
+        decimal unitCost,
+        string? transactionType,
+        string referencePrefix,
+        string reason,
+        Guid userId,
+        CancellationToken cancellationToken)
+    {
+        var current = inventory;
+        for (var attempt = 1; ; attempt++)
+        {
+            if (quantity < current.ReservedQuantity)
+            {
+                throw new InvalidOperationException($"Quantity cannot be less than the reserved quantity. Reserved: {current.ReservedQuantity}, Requested: {quantity}");
+            }
+
+            var quantityDiff = quantity - current.Quantity;
+            var movement = new InventoryTransaction
+            {
+                TransactionType = transactionType ?? (quantityDiff > 0 ? "IN" : "OUT"),
+                Quantity = Math.Abs(quantityDiff),
+                ReferenceNumber = $"{referencePrefix}-{inventory.Id:N}",
+                Reason = reason,
+                CreatedByUserId = userId
+            };
+
+            var updated = await inventoryRepository.TrySetQuantityAsync(inventory.Id, current.Quantity, quantity, unitCost, movement, cancellationToken);
+            if (updated != null)
+            {
+                // Keep the related entities loaded by the caller on the returned instance
+                inventory.Quantity = updated.Quantity;
+                inventory.ReservedQuantity = updated.ReservedQuantity;
+                inventory.AvailableQuantity = updated.AvailableQuantity;
+                inventory.UnitCost = updated.UnitCost;
+                inventory.LastUpdated = updated.LastUpdated;
+                realTimeDashboard.RecordStockLevel(inventory);
+                return inventory;
+            }
+
+            if (attempt == MaxConcurrencyRetries)
+            {
+                throw new InvalidOperationException($"Inventory with ID {inventory.Id} is being updated concurrently; please retry");
+            }
+
+            logger.LogDebug("Concurrent update on inventory {InventoryId}, retrying (attempt {Attempt})", inventory.Id, attempt);
+            await Task.Delay(Random.Shared.Next(5, 25 * attempt), cancellationToken);
+
+            current = (await inventoryRepository.GetByIdsAsync([inventory.Id], cancellationToken)).FirstOrDefault()
+                ?? throw new KeyNotFoundException($"Inventory with ID {inventory.Id} not found");
+        }
+    }
+
     // Transfer operations
     public async Task<InventoryTransferResult> TransferInventoryAsync(TransferInventoryRequest request, CancellationToken cancellationToken = default)
     {
@@ -404,6 +405,9 @@ public class InventoryManagementService(
         await inventoryRepository.UpdateQuantityAsync(fromInventory.Id, fromInventory.Quantity, fromInventory.UnitCost, "Transfer out", request.TransferredByUserId, cancellationToken);
         await inventoryRepository.UpdateQuantityAsync(toInventory.Id, toInventory.Quantity, toInventory.UnitCost, "Transfer in", request.TransferredByUserId, cancellationToken);
 
+        realTimeDashboard.RecordStockLevel(fromInventory);
+        realTimeDashboard.RecordStockLevel(toInventory);
+
         // Create transfer transactions
         var transferOutTransaction = await CreateTransactionAsync(
             fromInventory.Id,
@@ -455,30 +459,159 @@ public class InventoryManagementService(
 
     public async Task<InventoryTransferResult> BulkTransferInventoryAsync(List<TransferInventoryRequest> requests, Guid userId, CancellationToken cancellationToken = default)
     {
-        var results = new List<InventoryTransferResult>();
-        var warnings = new List<string>();
+        // One locking read validates the whole batch; valid lines are applied together, invalid ones reported
+        InventoryBatchPlan? applied = null;
+        var result = await inventoryRepository.ExecuteBatchAsync(
+            requests.Select(r => r.FromInventoryId).ToList(),
+            requests.Select(r => r.ToBranchId).ToList(),
+            requests.Where(r => r.ToWarehouseId.HasValue).Select(r => r.ToWarehouseId!.Value).ToList(),
+            snapshot =>
+            {
+                var planned = PlanBulkTransfer(requests, userId, snapshot);
+                applied = planned.plan;
+                return planned;
+            },
+            cancellationToken);
 
-        foreach (var request in requests)
+        RecordStockLevels(applied);
+
+        logger.LogInformation("Bulk transfer completed: {Succeeded} of {Total} lines applied",
+            result.Lines.Count(l => l.Success), requests.Count);
+
+        return result;
+    }
+
+    private static (InventoryBatchPlan plan, InventoryTransferResult result) PlanBulkTransfer(
+        List<TransferInventoryRequest> requests,
+        Guid userId,
+        InventoryBatchSnapshot snapshot)
+    {
+        var plan = new InventoryBatchPlan();
+        var lines = new List<BulkInventoryLineResult>(requests.Count);
+        var created = new HashSet<Guid>();
+        var byLocation = new Dictionary<(Guid, Guid?, Guid, Guid?), Inventory>();
+        foreach (var row in snapshot.Inventories.Values)
         {
-            var result = await TransferInventoryAsync(request, cancellationToken);
-            results.Add(result);
-            if (!result.Success)
+            byLocation.TryAdd((row.ProductId, row.ProductVariationId, row.BranchId, row.WarehouseId), row);
+        }
+
+        var now = DateTime.UtcNow;
+        // Every movement of the batch shares one reference, so the whole bulk transfer can be traced
+        var referenceNumber = $"TRF-{Guid.NewGuid():N}";
+        for (var index = 0; index < requests.Count; index++)
+        {
+            var request = requests[index];
+            var source = snapshot.Inventories.GetValueOrDefault(request.FromInventoryId);
+
+            // Same rules as ValidateTransferRequest, checked against the locked rows and earlier lines of the batch
+            var errors = new List<string>();
+            if (source == null)
+                errors.Add("Source inventory not found");
+            if (!snapshot.BranchIds.Contains(request.ToBranchId))
+                errors.Add("Destination branch not found");
+            if (request.ToWarehouseId.HasValue && !snapshot.WarehouseIds.Contains(request.ToWarehouseId.Value))
+                errors.Add("Destination warehouse not found");
+            if (request.Quantity <= 0)
+                errors.Add("Transfer quantity must be greater than 0");
+            else if (source != null && source.AvailableQuantity < request.Quantity)
+                errors.Add($"Insufficient quantity available. Available: {source.AvailableQuantity}, Requested: {request.Quantity}");
+            if (request.UnitCost < 0)
+                errors.Add("Unit cost must be greater than or equal to 0");
+            if (source != null && source.BranchId == request.ToBranchId && source.WarehouseId == request.ToWarehouseId)
+                errors.Add("Source and destination are the same location");
+
+            if (errors.Any())
+            {
+                lines.Add(new BulkInventoryLineResult
+                {
+                    Line = index + 1,
+                    InventoryId = request.FromInventoryId,
+                    Success = false,
+                    Message = string.Join(", ", errors)
+                });
+                continue;
+            }
+
+            var location = (source!.ProductId, source.ProductVariationId, request.ToBranchId, request.ToWarehouseId);
+            if (!byLocation.TryGetValue(location, out var destination))
+            {
+                destination = new Inventory
+                {
+                    Id = Guid.NewGuid(),
+                    ProductId = source.ProductId,
+                    ProductVariationId = source.ProductVariationId,
+                    BranchId = request.ToBranchId,
+                    WarehouseId = request.ToWarehouseId,
+                    UnitCost = request.UnitCost,
+                    CreatedAt = now,
+                    LastUpdated = now
+                };
+                byLocation[location] = destination;
+                created.Add(destination.Id);
+                plan.NewInventories.Add(destination);
+            }
+
+            source.Quantity -= request.Quantity;
+            source.AvailableQuantity -= request.Quantity;
+            source.LastUpdated = now;
+            plan.UpdatedInventories[source.Id] = source;
+
+            destination.Quantity += request.Quantity;
+            destination.AvailableQuantity += request.Quantity;
+            destination.LastUpdated = now;
+            if (!created.Contains(destination.Id))
             {
-                warnings.Add(result.Message);
+                plan.UpdatedInventories[destination.Id] = destination;
             }
+
+            var transferredBy = request.TransferredByUserId != Guid.Empty ? request.TransferredByUserId : userId;
+            foreach (var inventoryId in new[] { source.Id, destination.Id })
+            {
+                plan.Transactions.Add(new InventoryTransaction
+                {
+                    Id = Guid.NewGuid(),
+                    InventoryId = inventoryId,
+                    TransactionType = "TRANSFER",
+                    Quantity = request.Quantity,
+                    UnitCost = request.UnitCost,
+                    ReferenceNumber = referenceNumber,
+                    Reason = request.Reason,
+                    CreatedByUserId = transferredBy,
+                    FromBranchId = source.BranchId,
+                    ToBranchId = request.ToBranchId,
+                    FromWarehouseId = source.WarehouseId,
+                    ToWarehouseId = request.ToWarehouseId,
+                    CreatedAt = now
+                });
+            }
+
+            lines.Add(new BulkInventoryLineResult
+            {
+                Line = index + 1,
+                InventoryId = source.Id,
+                ToInventoryId = destination.Id,
+                Success = true,
+                Quantity = request.Quantity,
+                Message = "Transferred"
+            });
         }
 
-        return new InventoryTransferResult
+        var warnings = lines.Where(l => !l.Success).Select(l => $"Line {l.Line}: {l.Message}").ToList();
+        var succeeded = lines.Where(l => l.Success).ToList();
+
+        return (plan, new InventoryTransferResult
         {
-            Success = results.All(r => r.Success),
+            Success = warnings.Count == 0,
             FromInventoryId = Guid.Empty,
             ToInventoryId = Guid.Empty,
-            TransferredQuantity = results.Where(r => r.Success).Sum(r => r.TransferredQuantity),
-            TransferredValue = results.Where(r => r.Success).Sum(r => r.TransferredValue),
+            TransferredQuantity = succeeded.Sum(l => l.Quantity),
+            TransferredValue = succeeded.Sum(l => l.Quantity * requests[l.Line - 1].UnitCost),
             Message = warnings.Any() ? string.Join("; ", warnings) : "Bulk transfer completed",
             Warnings = warnings,
-            Transactions = results.SelectMany(r => r.Transactions).ToList()
-        };
+            ReferenceNumber = referenceNumber,
+            Transactions = plan.Transactions,
+            Lines = lines
+        });
     }
 
     // Adjustment operations
@@ -498,64 +631,136 @@ public class InventoryManagementService(
         }
 
         var oldQuantity = inventory.Quantity;
-        inventory.Quantity = request.Quantity;
-        inventory.AvailableQuantity = inventory.Quantity - inventory.ReservedQuantity;
-        inventory.UnitCost = request.UnitCost;
-        inventory.LastUpdated = DateTime.UtcNow;
+        inventory = await SetQuantityAsync(inventory, request.Quantity, request.UnitCost, "ADJUSTMENT", "ADJ", request.Reason, request.AdjustedByUserId, cancellationToken);
 
-        await inventoryRepository.UpdateQuantityAsync(inventoryId, inventory.Quantity, inventory.UnitCost, request.Reason, request.AdjustedByUserId, cancellationToken);
+        logger.LogInformation("Inventory adjusted successfully with ID: {InventoryId}, OldQuantity: {OldQuantity}, NewQuantity: {NewQuantity}", inventoryId, oldQuantity, request.Quantity);
 
-        // Create adjustment transaction
-        var quantityDiff = request.Quantity - oldQuantity;
-        await CreateTransactionAsync(
-            inventoryId,
-            "ADJUSTMENT",
-            Math.Abs(quantityDiff),
-            request.UnitCost,
-            $"ADJ-{inventoryId:N8}",
-            request.Reason,
-            request.AdjustedByUserId,
-            null,
-            null,
-            null,
-            null,
+        return inventory;
+    }
+
+    public async Task<BulkInventoryAdjustmentResult> BulkAdjustInventoryAsync(BulkInventoryUpdateRequest request, CancellationToken cancellationToken = default)
+    {
+        InventoryBatchPlan? applied = null;
+        var result = await inventoryRepository.ExecuteBatchAsync(
+            request.Items.Select(i => i.InventoryId).ToList(),
+            [],
+            [],
+            snapshot =>
+            {
+                var planned = PlanBulkAdjustment(request, snapshot);
+                applied = planned.plan;
+                return planned;
+            },
             cancellationToken);
 
-        logger.LogInformation("Inventory adjusted successfully with ID: {InventoryId}, OldQuantity: {OldQuantity}, NewQuantity: {NewQuantity}", inventoryId, oldQuantity, request.Quantity);
+        RecordStockLevels(applied);
 
-        return inventory;
+        if (result.Warnings.Any())
+        {
+            logger.LogWarning("Some inventory adjustments failed: {Warnings}", string.Join("; ", result.Warnings));
+        }
+
+        return result;
+    }
+
+    // The planner runs again when the batch is retried; only the plan of the committed attempt is published
+    private void RecordStockLevels(InventoryBatchPlan? plan)
+    {
+        if (plan == null)
+        {
+            return;
+        }
+
+        foreach (var inventory in plan.UpdatedInventories.Values.Concat(plan.NewInventories))
+        {
+            realTimeDashboard.RecordStockLevel(inventory);
+        }
     }
 
-    public async Task<IEnumerable<Inventory>> BulkAdjustInventoryAsync(BulkInventoryUpdateRequest request, CancellationToken cancellationToken = default)
+    private static (InventoryBatchPlan plan, BulkInventoryAdjustmentResult result) PlanBulkAdjustment(
+        BulkInventoryUpdateRequest request,
+        InventoryBatchSnapshot snapshot)
     {
-        var results = new List<Inventory>();
-        var warnings = new List<string>();
+        var plan = new InventoryBatchPlan();
+        var lines = new List<BulkInventoryLineResult>(request.Items.Count);
+        var now = DateTime.UtcNow;
+        // Every adjustment of the batch shares one reference, like the movements of a bulk transfer
+        var referenceNumber = $"ADJ-{Guid.NewGuid():N}";
 
-        foreach (var item in request.Items)
+        for (var index = 0; index < request.Items.Count; index++)
         {
-            try
+            var item = request.Items[index];
+            var inventory = snapshot.Inventories.GetValueOrDefault(item.InventoryId);
+
+            // Same rules as ValidateAdjustmentRequest, plus the on-hand guards SetQuantityAsync applies
+            var errors = new List<string>();
+            if (inventory == null)
+                errors.Add("Inventory not found");
+            if (item.Quantity < -1000 || item.Quantity > 1000)
+                errors.Add("Adjustment quantity must be between -1000 and 1000");
+            if (item.Quantity < 0)
+                errors.Add("Quantity cannot be negative");
+            else if (inventory != null && item.Quantity < inventory.ReservedQuantity)
+                errors.Add($"Quantity cannot be less than the reserved quantity. Reserved: {inventory.ReservedQuantity}, Requested: {item.Quantity}");
+            if (item.UnitCost < 0)
+                errors.Add("Unit cost must be greater than or equal to 0");
+            if (string.IsNullOrWhiteSpace(request.Reason))
+                errors.Add("Reason is required");
+
+            if (errors.Any())
             {
-                var result = await AdjustInventoryAsync(item.InventoryId, new AdjustInventoryRequest
+                lines.Add(new BulkInventoryLineResult
                 {
-                    Quantity = item.Quantity,
-                    UnitCost = item.UnitCost,
-                    Reason = request.Reason,
-                    AdjustedByUserId = request.UpdatedByUserId
-                }, cancellationToken);
-                results.Add(result);
+                    Line = index + 1,
+                    InventoryId = item.InventoryId,
+                    Success = false,
+                    Message = $"Failed to adjust inventory {item.InventoryId}: {string.Join(", ", errors)}"
+                });
+                continue;
             }
-            catch (Exception ex)
+
+            var oldQuantity = inventory!.Quantity;
+            inventory.Quantity = item.Quantity;
+            inventory.AvailableQuantity = inventory.Quantity - inventory.ReservedQuantity;
+            inventory.UnitCost = item.UnitCost;
+            inventory.LastUpdated = now;
+            plan.UpdatedInventories[inventory.Id] = inventory;
+
+            plan.Transactions.Add(new InventoryTransaction
             {
-                warnings.Add($"Failed to adjust inventory {item.InventoryId}: {ex.Message}");
-            }
-        }
+                Id = Guid.NewGuid(),
+                InventoryId = inventory.Id,
+                TransactionType = "ADJUSTMENT",
+                Quantity = Math.Abs(item.Quantity - oldQuantity),
+                UnitCost = item.UnitCost,
+                ReferenceNumber = referenceNumber,
+                Reason = request.Reason,
+                CreatedByUserId = request.UpdatedByUserId,
+                CreatedAt = now
+            });
 
-        if (warnings.Any())
-        {
-            logger.LogWarning("Some inventory adjustments failed", new { warnings });
+            lines.Add(new BulkInventoryLineResult
+            {
+                Line = index + 1,
+                InventoryId = inventory.Id,
+                Success = true,
+                Quantity = item.Quantity,
+                Message = "Adjusted"
+            });
         }
 
-        return results;
+        var warnings = lines.Where(l => !l.Success).Select(l => $"Line {l.Line}: {l.Message}").ToList();
+
+        return (plan, new BulkInventoryAdjustmentResult
+        {
+            Success = warnings.Count == 0,
+            AdjustedCount = lines.Count(l => l.Success),
+            Message = warnings.Any() ? string.Join("; ", warnings) : "Bulk adjustment completed",
+            Warnings = warnings,
+            ReferenceNumber = referenceNumber,
+            Lines = lines,
+            Inventories = plan.UpdatedInventories.Values.ToList()
+        });
     }
 
     // Search and filtering
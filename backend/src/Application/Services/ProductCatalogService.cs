@@ -14,7 +14,8 @@ public class ProductCatalogService(
     IProductVariationRepository productVariationRepository,
     ILogger<ProductCatalogService> logger,
     IBranchRepository branchRepository,
-    IWarehouseRepository warehouseRepository) : IProductCatalogService
+    IWarehouseRepository warehouseRepository,
+    ICatalogCache catalogCache) : IProductCatalogService
 {
     // Category Management
     public async Task<Category> CreateCategoryAsync(CreateCategoryRequest request, CancellationToken cancellationToken = default)
@@ -31,7 +32,9 @@ public class ProductCatalogService(
             IsActive = request.IsActive
         };
 
-        return await categoryRepository.CreateAsync(category, cancellationToken);
+        var created = await categoryRepository.CreateAsync(category, cancellationToken);
+        await catalogCache.InvalidateRegionAsync(CatalogCacheRegions.Categories, cancellationToken);
+        return created;
     }
 
     public async Task<Category> UpdateCategoryAsync(Guid id, UpdateCategoryRequest request, CancellationToken cancellationToken = default)
@@ -49,7 +52,12 @@ public class ProductCatalogService(
             IsActive = request.IsActive
         };
 
-        return await categoryRepository.UpdateAsync(category, cancellationToken);
+        var updated = await categoryRepository.UpdateAsync(category, cancellationToken);
+
+        // Cached products embed their category, so they go too
+        await catalogCache.InvalidateRegionAsync(CatalogCacheRegions.Categories, cancellationToken);
+        await catalogCache.InvalidateRegionAsync(CatalogCacheRegions.Products, cancellationToken);
+        return updated;
     }
 
     public async Task DeleteCategoryAsync(Guid id, CancellationToken cancellationToken = default)
@@ -63,31 +71,94 @@ public class ProductCatalogService(
         }
 
         await categoryRepository.DeleteAsync(id, cancellationToken);
+        await catalogCache.InvalidateRegionAsync(CatalogCacheRegions.Categories, cancellationToken);
     }
 
     public async Task<Category?> GetCategoryAsync(Guid id, CancellationToken cancellationToken = default)
     {
-        return await categoryRepository.GetByIdAsync(id, cancellationToken);
+        return await catalogCache.GetOrCreateAsync(
+            CatalogCacheRegions.Categories,
+            $"category:{id}",
+            token => categoryRepository.GetByIdAsync(id, token),
+            cancellationToken);
     }
 
     public async Task<IEnumerable<Category>> GetCategoriesAsync(bool includeHierarchy = false, CancellationToken cancellationToken = default)
     {
         if (includeHierarchy)
         {
-            return await categoryRepository.GetHierarchyAsync(cancellationToken: cancellationToken);
+            return await GetCachedListAsync(
+                CatalogCacheRegions.Categories,
+                "hierarchy",
+                token => categoryRepository.GetHierarchyAsync(cancellationToken: token),
+                cancellationToken);
         }
 
-        return await categoryRepository.GetActiveAsync(cancellationToken);
+        return await GetCachedListAsync(
+            CatalogCacheRegions.Categories,
+            "active",
+            categoryRepository.GetActiveAsync,
+            cancellationToken);
     }
 
     public async Task<IEnumerable<Category>> GetRootCategoriesAsync(CancellationToken cancellationToken = default)
     {
-        return await categoryRepository.GetRootCategoriesAsync(cancellationToken);
+        return await GetCachedListAsync(
+            CatalogCacheRegions.Categories,
+            "roots",
+            categoryRepository.GetRootCategoriesAsync,
+            cancellationToken);
     }
 
     public async Task<IEnumerable<Category>> GetChildCategoriesAsync(Guid parentId, CancellationToken cancellationToken = default)
     {
-        return await categoryRepository.GetChildCategoriesAsync(parentId, cancellationToken);
+        return await GetCachedListAsync(
+            CatalogCacheRegions.Categories,
+            $"children:{parentId}",
+            token => categoryRepository.GetChildCategoriesAsync(parentId, token),
+            cancellationToken);
+    }
+
+    public async Task<IEnumerable<CategoryTreeNode>> GetCategoryTreeAsync(Guid? rootId = null, CancellationToken cancellationToken = default)
+    {
+        return await GetCachedListAsync(
+            CatalogCacheRegions.Categories,
+            $"tree:{rootId?.ToString() ?? "all"}",
+            token => BuildCategoryTreeAsync(rootId, token),
+            cancellationToken);
+    }
+
+    private async Task<IEnumerable<CategoryTreeNode>> BuildCategoryTreeAsync(Guid? rootId, CancellationToken cancellationToken)
+    {
+        var categories = await categoryRepository.GetHierarchyAsync(rootId, cancellationToken);
+
+        // The hierarchy arrives depth-first, so every parent node exists before its children
+        var nodes = new Dictionary<Guid, CategoryTreeNode>();
+        var roots = new List<CategoryTreeNode>();
+
+        foreach (var category in categories)
+        {
+            var parent = category.ParentCategoryId.HasValue
+                ? nodes.GetValueOrDefault(category.ParentCategoryId.Value)
+                : null;
+
+            var node = new CategoryTreeNode
+            {
+                Id = category.Id,
+                Name = category.Name,
+                Description = category.Description,
+                Code = category.Code,
+                ParentId = category.ParentCategoryId,
+                SortOrder = category.SortOrder,
+                IsActive = category.IsActive,
+                Depth = parent == null ? 0 : parent.Depth + 1
+            };
+
+            nodes[category.Id] = node;
+            (parent?.Children ?? roots).Add(node);
+        }
+
+        return roots;
     }
 
     // Product Management
@@ -111,7 +182,11 @@ public class ProductCatalogService(
             IsActive = request.IsActive
         };
 
-        return await productRepository.CreateAsync(product, cancellationToken);
+        var created = await productRepository.CreateAsync(product, cancellationToken);
+
+        // Cached category lookups include their products
+        await catalogCache.InvalidateRegionAsync(CatalogCacheRegions.Categories, cancellationToken);
+        return created;
     }
 
     public async Task<Product> UpdateProductAsync(Guid id, UpdateProductRequest request, CancellationToken cancellationToken = default)
@@ -134,7 +209,10 @@ public class ProductCatalogService(
             IsActive = request.IsActive
         };
 
-        return await productRepository.UpdateAsync(product, cancellationToken);
+        var updated = await productRepository.UpdateAsync(product, cancellationToken);
+        await catalogCache.RemoveAsync(CatalogCacheRegions.Products, new[] { ProductKey(id) }, cancellationToken);
+        await catalogCache.InvalidateRegionAsync(CatalogCacheRegions.Categories, cancellationToken);
+        return updated;
     }
 
     public async Task DeleteProductAsync(Guid id, CancellationToken cancellationToken = default)
@@ -148,15 +226,42 @@ public class ProductCatalogService(
         }
 
         await productRepository.DeleteAsync(id, cancellationToken);
+        await catalogCache.RemoveAsync(CatalogCacheRegions.Products, new[] { ProductKey(id) }, cancellationToken);
+        await catalogCache.InvalidateRegionAsync(CatalogCacheRegions.Categories, cancellationToken);
     }
 
     public async Task<Product?> GetProductAsync(Guid id, CancellationToken cancellationToken = default)
     {
-        return await productRepository.GetByIdAsync(id, cancellationToken);
+        // Cached without Inventories: stock changes on every sale and movement, none of which evict this entry
+        return await catalogCache.GetOrCreateAsync(
+            CatalogCacheRegions.Products,
+            ProductKey(id),
+            token => productRepository.GetByIdAsync(id, ProductExpand.All, token),
+            cancellationToken);
     }
 
     public async Task<Product?> GetProductBySkuAsync(string sku, CancellationToken cancellationToken = default)
     {
+        // SKU -> ID is cached separately so writes only ever have to evict the product:{id} entry
+        var skuKey = $"product-sku:{sku}";
+        var productId = await catalogCache.GetOrCreateAsync(
+            CatalogCacheRegions.Products,
+            skuKey,
+            async token => (await productRepository.GetBySkuAsync(sku, token))?.Id.ToString(),
+            cancellationToken);
+
+        if (productId == null)
+        {
+            return null;
+        }
+
+        var product = await GetProductAsync(Guid.Parse(productId), cancellationToken);
+        if (product?.SKU == sku)
+        {
+            return product;
+        }
+
+        await catalogCache.RemoveAsync(CatalogCacheRegions.Products, new[] { skuKey }, cancellationToken);
         return await productRepository.GetBySkuAsync(sku, cancellationToken);
     }
 
@@ -164,48 +269,79 @@ public class ProductCatalogService(
         GetProductsRequest request,
         CancellationToken cancellationToken = default)
     {
-        var (products, totalCount) = await productRepository.GetPagedAsync(
+        return await PageProductsAsync<Product>(
+            request,
+            () => productRepository.GetPagedAsync(
+                request.PageNumber,
+                request.PageSize,
+                request.CategoryId,
+                request.Search,
+                request.IsActive,
+                request.Expand,
+                cancellationToken),
+            (take, afterName, afterId) => productRepository.GetPageAfterAsync(
+                take,
+                afterName,
+                afterId,
+                request.CategoryId,
+                request.Search,
+                request.IsActive,
+                request.IncludeTotalCount,
+                request.Expand,
+                cancellationToken),
+            EncodeCursor);
+    }
+
+    public async Task<(IEnumerable<ProductSummary> products, PaginationMetadata pagination)> GetProductSummariesAsync(
+        GetProductsRequest request,
+        CancellationToken cancellationToken = default)
+    {
+        return await PageProductsAsync<ProductSummary>(
+            request,
+            () => productRepository.GetPagedSummariesAsync(
+                request.PageNumber,
+                request.PageSize,
+                request.CategoryId,
+                request.Search,
+                request.IsActive,
+                cancellationToken),
+            (take, afterName, afterId) => productRepository.GetSummaryPageAfterAsync(
+                take,
+                afterName,
+                afterId,
+                request.CategoryId,
+                request.Search,
+                request.IsActive,
+                request.IncludeTotalCount,
+                cancellationToken),
+            EncodeCursor);
+    }
+
+    public async Task<(IEnumerable<Product> products, PaginationMetadata pagination)> SearchProductsAsync(
+        SearchProductsRequest request,
+        CancellationToken cancellationToken = default)
+    {
+        var (products, totalCount) = await productRepository.SearchAsync(
+            request.SearchTerm,
             request.PageNumber,
             request.PageSize,
-            request.CategoryId,
-            request.Search,
-            request.IsActive,
+            request.Expand,
             cancellationToken);
 
-        var pagination = new PaginationMetadata
-        {
-            PageNumber = request.PageNumber,
-            PageSize = request.PageSize,
-            TotalCount = totalCount,
-            TotalPages = (int)Math.Ceiling((double)totalCount / request.PageSize),
-            HasPreviousPage = request.PageNumber > 1,
-            HasNextPage = request.PageNumber < (int)Math.Ceiling((double)totalCount / request.PageSize)
-        };
-
-        return (products, pagination);
+        return (products, BuildSearchPagination(request, totalCount));
     }
 
-    public async Task<(IEnumerable<Product> products, PaginationMetadata pagination)> SearchProductsAsync(
+    public async Task<(IEnumerable<ProductSummary> products, PaginationMetadata pagination)> SearchProductSummariesAsync(
         SearchProductsRequest request,
         CancellationToken cancellationToken = default)
     {
-        var (products, totalCount) = await productRepository.SearchAsync(
+        var (products, totalCount) = await productRepository.SearchSummariesAsync(
             request.SearchTerm,
             request.PageNumber,
             request.PageSize,
             cancellationToken);
 
-        var pagination = new PaginationMetadata
-        {
-            PageNumber = request.PageNumber,
-            PageSize = request.PageSize,
-            TotalCount = totalCount,
-            TotalPages = (int)Math.Ceiling((double)totalCount / request.PageSize),
-            HasPreviousPage = request.PageNumber > 1,
-            HasNextPage = request.PageNumber < (int)Math.Ceiling((double)totalCount / request.PageSize)
-        };
-
-        return (products, pagination);
+        return (products, BuildSearchPagination(request, totalCount));
     }
 
     // Product Variation Management
@@ -231,7 +367,9 @@ public class ProductCatalogService(
             IsActive = request.IsActive
         };
 
-        return await productVariationRepository.CreateAsync(variation, cancellationToken);
+        var created = await productVariationRepository.CreateAsync(variation, cancellationToken);
+        await catalogCache.RemoveAsync(CatalogCacheRegions.Products, new[] { ProductKey(created.ProductId) }, cancellationToken);
+        return created;
     }
 
     public async Task<ProductVariation> UpdateProductVariationAsync(Guid id, UpdateProductVariationRequest request, CancellationToken cancellationToken = default)
@@ -250,22 +388,51 @@ public class ProductCatalogService(
             IsActive = request.IsActive
         };
 
-        return await productVariationRepository.UpdateAsync(variation, cancellationToken);
+        var updated = await productVariationRepository.UpdateAsync(variation, cancellationToken);
+        await EvictVariationAsync(id, updated.ProductId, cancellationToken);
+        return updated;
     }
 
     public async Task DeleteProductVariationAsync(Guid id, CancellationToken cancellationToken = default)
     {
         logger.LogInformation("Deleting product variation: {Id}", id);
+
+        var existing = await GetProductVariationAsync(id, cancellationToken);
         await productVariationRepository.DeleteAsync(id, cancellationToken);
+        await EvictVariationAsync(id, existing?.ProductId, cancellationToken);
     }
 
     public async Task<ProductVariation?> GetProductVariationAsync(Guid id, CancellationToken cancellationToken = default)
     {
-        return await productVariationRepository.GetByIdAsync(id, cancellationToken);
+        return await catalogCache.GetOrCreateAsync(
+            CatalogCacheRegions.Products,
+            VariationKey(id),
+            token => productVariationRepository.GetByIdAsync(id, token),
+            cancellationToken);
     }
 
     public async Task<ProductVariation?> GetProductVariationBySkuAsync(string sku, CancellationToken cancellationToken = default)
     {
+        var skuKey = $"variation-sku:{sku}";
+        var variationId = await catalogCache.GetOrCreateAsync(
+            CatalogCacheRegions.Products,
+            skuKey,
+            async token => (await productVariationRepository.GetBySkuAsync(sku, token))?.Id.ToString(),
+            cancellationToken);
+
+        if (variationId == null)
+        {
+            return null;
+        }
+
+        // Variation SKUs can be edited, so the mapping is only trusted when it still matches
+        var variation = await GetProductVariationAsync(Guid.Parse(variationId), cancellationToken);
+        if (variation?.SKU == sku)
+        {
+            return variation;
+        }
+
+        await catalogCache.RemoveAsync(CatalogCacheRegions.Products, new[] { skuKey }, cancellationToken);
         return await productVariationRepository.GetBySkuAsync(sku, cancellationToken);
     }
 
@@ -274,26 +441,56 @@ public class ProductCatalogService(
         GetProductVariationsRequest request,
         CancellationToken cancellationToken = default)
     {
-        var (variations, totalCount) = await productVariationRepository.GetByProductIdPagedAsync(
+        if (request.Cursor == null && request.PageNumber > 1)
+        {
+            var (offsetPage, count) = await productVariationRepository.GetByProductIdPagedAsync(
+                productId,
+                request.PageNumber,
+                request.PageSize,
+                request.Size,
+                request.Color,
+                request.IsActive,
+                cancellationToken);
+
+            var offsetVariations = offsetPage.ToList();
+            var hasNextOffsetPage = request.PageNumber < (int)Math.Ceiling((double)count / request.PageSize);
+            return (offsetVariations, BuildPagination(
+                request.PageNumber,
+                request.PageSize,
+                count,
+                hasPreviousPage: true,
+                hasNextOffsetPage,
+                hasNextOffsetPage && offsetVariations.Count > 0 ? EncodeCursor(offsetVariations[^1]) : null));
+        }
+
+        var after = request.Cursor != null ? PageCursor.Decode(request.Cursor, expectedKeys: 2) : null;
+
+        var (page, totalCount) = await productVariationRepository.GetByProductIdPageAfterAsync(
             productId,
-            request.PageNumber,
-            request.PageSize,
+            request.PageSize + 1,
+            after?.Keys[0],
+            after?.Keys[1],
+            after?.Id,
             request.Size,
             request.Color,
             request.IsActive,
+            request.IncludeTotalCount,
             cancellationToken);
 
-        var pagination = new PaginationMetadata
+        var variations = page.ToList();
+        var hasNextPage = variations.Count > request.PageSize;
+        if (hasNextPage)
         {
-            PageNumber = request.PageNumber,
-            PageSize = request.PageSize,
-            TotalCount = totalCount,
-            TotalPages = (int)Math.Ceiling((double)totalCount / request.PageSize),
-            HasPreviousPage = request.PageNumber > 1,
-            HasNextPage = request.PageNumber < (int)Math.Ceiling((double)totalCount / request.PageSize)
-        };
+            variations.RemoveAt(variations.Count - 1);
+        }
 
-        return (variations, pagination);
+        return (variations, BuildPagination(
+            request.PageNumber,
+            request.PageSize,
+            totalCount,
+            hasPreviousPage: after != null,
+            hasNextPage,
+            hasNextPage ? EncodeCursor(variations[^1]) : null));
     }
 
     public async Task<IEnumerable<string>> GetAvailableSizesAsync(Guid productId, CancellationToken cancellationToken = default)
@@ -332,11 +529,14 @@ public class ProductCatalogService(
             }
         }
 
-        return await productRepository.CreateAsync(new Product
+        var added = await productRepository.CreateAsync(new Product
         {
             Id = request.ProductId,
             Images = new List<ProductImage> { image }
         }, cancellationToken).ContinueWith(t => image, cancellationToken);
+
+        await catalogCache.RemoveAsync(CatalogCacheRegions.Products, new[] { ProductKey(request.ProductId) }, cancellationToken);
+        return added;
     }
 
     public async Task<ProductImage> UpdateProductImageAsync(Guid id, UpdateProductImageRequest request, CancellationToken cancellationToken = default)
@@ -376,7 +576,10 @@ public class ProductCatalogService(
     public async Task UpdateVariationStockAsync(Guid variationId, int quantity, CancellationToken cancellationToken = default)
     {
         logger.LogInformation("Updating stock for variation {Id} to {Quantity}", variationId, quantity);
+
+        var existing = await GetProductVariationAsync(variationId, cancellationToken);
         await productVariationRepository.UpdateStockAsync(variationId, quantity, cancellationToken);
+        await EvictVariationAsync(variationId, existing?.ProductId, cancellationToken);
     }
 
     public async Task<int> GetTotalStockForProductAsync(Guid productId, CancellationToken cancellationToken = default)
@@ -440,6 +643,120 @@ public class ProductCatalogService(
         return errors.Any() ? ValidationResult.Failure(errors) : ValidationResult.Success();
     }
 
+    // Caching
+    private static string ProductKey(Guid productId) => $"product:{productId}";
+
+    private static string VariationKey(Guid variationId) => $"variation:{variationId}";
+
+    private async Task<IEnumerable<T>> GetCachedListAsync<T>(
+        string region,
+        string key,
+        Func<CancellationToken, Task<IEnumerable<T>>> load,
+        CancellationToken cancellationToken)
+    {
+        return await catalogCache.GetOrCreateAsync<List<T>>(
+            region,
+            key,
+            async token => (await load(token)).ToList(),
+            cancellationToken) ?? new List<T>();
+    }
+
+    private async Task EvictVariationAsync(Guid variationId, Guid? productId, CancellationToken cancellationToken)
+    {
+        // Cached products embed their variations
+        var keys = productId.HasValue
+            ? new[] { VariationKey(variationId), ProductKey(productId.Value) }
+            : new[] { VariationKey(variationId) };
+        await catalogCache.RemoveAsync(CatalogCacheRegions.Products, keys, cancellationToken);
+    }
+
+    // Pagination
+    private static string EncodeCursor(Product product) =>
+        new PageCursor(new[] { product.Name }, product.Id).Encode();
+
+    private static string EncodeCursor(ProductSummary product) =>
+        new PageCursor(new[] { product.Name }, product.Id).Encode();
+
+    private static string EncodeCursor(ProductVariation variation) =>
+        new PageCursor(new[] { variation.Size, variation.Color }, variation.Id).Encode();
+
+    private static async Task<(IEnumerable<T> items, PaginationMetadata pagination)> PageProductsAsync<T>(
+        GetProductsRequest request,
+        Func<Task<(IEnumerable<T> items, int totalCount)>> offsetPage,
+        Func<int, string?, Guid?, Task<(IEnumerable<T> items, int? totalCount)>> pageAfter,
+        Func<T, string> encodeCursor)
+    {
+        // Deep offset pages stay supported for existing clients; everything else uses keyset paging
+        if (request.Cursor == null && request.PageNumber > 1)
+        {
+            var (offsetPageItems, count) = await offsetPage();
+
+            var offsetItems = offsetPageItems.ToList();
+            var hasNextOffsetPage = request.PageNumber < (int)Math.Ceiling((double)count / request.PageSize);
+            return (offsetItems, BuildPagination(
+                request.PageNumber,
+                request.PageSize,
+                count,
+                hasPreviousPage: true,
+                hasNextOffsetPage,
+                hasNextOffsetPage && offsetItems.Count > 0 ? encodeCursor(offsetItems[^1]) : null));
+        }
+
+        var after = request.Cursor != null ? PageCursor.Decode(request.Cursor, expectedKeys: 1) : null;
+
+        // One extra row tells us whether another page exists without counting
+        var (page, totalCount) = await pageAfter(request.PageSize + 1, after?.Keys[0], after?.Id);
+
+        var items = page.ToList();
+        var hasNextPage = items.Count > request.PageSize;
+        if (hasNextPage)
+        {
+            items.RemoveAt(items.Count - 1);
+        }
+
+        return (items, BuildPagination(
+            request.PageNumber,
+            request.PageSize,
+            totalCount,
+            hasPreviousPage: after != null,
+            hasNextPage,
+            hasNextPage ? encodeCursor(items[^1]) : null));
+    }
+
+    private static PaginationMetadata BuildSearchPagination(SearchProductsRequest request, int totalCount)
+    {
+        var totalPages = (int)Math.Ceiling((double)totalCount / request.PageSize);
+        return new PaginationMetadata
+        {
+            PageNumber = request.PageNumber,
+            PageSize = request.PageSize,
+            TotalCount = totalCount,
+            TotalPages = totalPages,
+            HasPreviousPage = request.PageNumber > 1,
+            HasNextPage = request.PageNumber < totalPages
+        };
+    }
+
+    private static PaginationMetadata BuildPagination(
+        int pageNumber,
+        int pageSize,
+        int? totalCount,
+        bool hasPreviousPage,
+        bool hasNextPage,
+        string? nextCursor)
+    {
+        return new PaginationMetadata
+        {
+            PageNumber = pageNumber,
+            PageSize = pageSize,
+            TotalCount = totalCount,
+            TotalPages = totalCount.HasValue ? (int)Math.Ceiling((double)totalCount.Value / pageSize) : null,
+            HasPreviousPage = hasPreviousPage,
+            HasNextPage = hasNextPage,
+            NextCursor = nextCursor
+        };
+    }
+
     // Branch and Warehouse Management
     public async Task<Branch?> GetBranchAsync(Guid id, CancellationToken cancellationToken = default)
     {
@@ -0,0 +1,321 @@
+using System.Threading.Channels;
+using Microsoft.Extensions.Options;
+using NationalClothingStore.Domain.Entities;
+
+namespace NationalClothingStore.Application.Services;
+
+public interface IRealTimeDashboardService
+{
+    /// <summary>
+    /// Fold a committed sale or return into its branch's running totals and push the change to subscribers;
+    /// <paramref name="items"/> defaults to the transaction's own items
+    /// </summary>
+    void RecordSale(SalesTransaction transaction, IEnumerable<SalesTransactionItem>? items = null);
+
+    /// <summary>
+    /// Record an inventory row's available quantity after a stock movement, updating its branch's low-stock count
+    /// </summary>
+    void RecordStockLevel(Inventory inventory);
+
+    /// <summary>
+    /// Current totals of one branch, or of every branch that has had activity today
+    /// </summary>
+    IReadOnlyList<BranchDashboardTotals> GetSnapshot(Guid? branchId = null);
+
+    /// <summary>
+    /// Start receiving the deltas of one branch, or of all branches; dispose the subscription to stop
+    /// </summary>
+    DashboardSubscription Subscribe(Guid? branchId = null);
+
+    /// <summary>Number of open subscriptions</summary>
+    int SubscriberCount { get; }
+}
+
+/// <summary>
+/// Real-time dashboard settings, bound from the "RealTimeDashboard" configuration section
+/// </summary>
+public class RealTimeDashboardOptions
+{
+    /// <summary>Available quantity at or below which an inventory row counts as low on stock</summary>
+    public int LowStockThreshold { get; set; } = 10;
+
+    /// <summary>Deltas buffered per subscriber; a subscriber that falls further behind loses the oldest ones</summary>
+    public int SubscriberBufferSize { get; set; } = 256;
+
+    /// <summary>Longest a stream stays silent before a keep-alive comment is sent</summary>
+    public TimeSpan HeartbeatInterval { get; set; } = TimeSpan.FromSeconds(15);
+}
+
+/// <summary>
+/// In-memory aggregator behind the real-time dashboard: sales, returns and stock movements update per-branch
+/// running totals as they are committed, and each change is pushed to the subscribers of that branch, so a
+/// dashboard costs one message per event instead of a report query per poll.
+/// Totals cover the current UTC day and the events seen by this process.
+/// </summary>
+public class RealTimeDashboardService(IOptions<RealTimeDashboardOptions> options) : IRealTimeDashboardService
+{
+    private readonly RealTimeDashboardOptions _options = options.Value;
+
+    // Events are O(1) to apply, so one lock keeps totals, sequence numbers and fan-out order consistent
+    private readonly object _lock = new();
+    private readonly Dictionary<Guid, BranchState> _branches = new();
+    private readonly List<DashboardSubscription> _subscribers = new();
+    private long _sequence;
+
+    public void RecordSale(SalesTransaction transaction, IEnumerable<SalesTransactionItem>? items = null)
+    {
+        var itemsSold = (items ?? transaction.Items).Sum(i => i.Quantity);
+        var isReturn = transaction.TransactionType == "RETURN";
+
+        Apply(transaction.BranchId, isReturn ? "return" : "sale", transaction.CompletedAt ?? DateTime.UtcNow, (state, delta) =>
+        {
+            state.TodaySales += transaction.TotalAmount;
+            state.CurrentHourSales += transaction.TotalAmount;
+            delta.SalesChange = transaction.TotalAmount;
+
+            if (isReturn)
+            {
+                state.Returns++;
+                state.Refunds -= transaction.TotalAmount;
+                state.ItemsSold -= itemsSold;
+                delta.ItemsSoldChange = -itemsSold;
+            }
+            else
+            {
+                state.Transactions++;
+                state.ItemsSold += itemsSold;
+                delta.TransactionsChange = 1;
+                delta.ItemsSoldChange = itemsSold;
+            }
+
+            return true;
+        });
+    }
+
+    public void RecordStockLevel(Inventory inventory)
+    {
+        var isLow = inventory.AvailableQuantity <= _options.LowStockThreshold;
+
+        // Only a change in the low-stock count is worth a message
+        Apply(inventory.BranchId, "stock", DateTime.UtcNow, (state, delta) =>
+        {
+            var changed = isLow ? state.LowStockInventoryIds.Add(inventory.Id) : state.LowStockInventoryIds.Remove(inventory.Id);
+            delta.LowStockChange = isLow ? 1 : -1;
+            return changed;
+        });
+    }
+
+    public IReadOnlyList<BranchDashboardTotals> GetSnapshot(Guid? branchId = null)
+    {
+        var now = DateTime.UtcNow;
+        lock (_lock)
+        {
+            return _branches.Values
+                .Where(state => branchId == null || state.BranchId == branchId)
+                .Select(state => state.ToTotals(now))
+                .ToList();
+        }
+    }
+
+    public DashboardSubscription Subscribe(Guid? branchId = null)
+    {
+        var subscription = new DashboardSubscription(this, branchId, Channel.CreateBounded<DashboardDelta>(
+            new BoundedChannelOptions(_options.SubscriberBufferSize)
+            {
+                // Deltas carry the branch's new totals, so a lagging subscriber can skip old ones safely
+                FullMode = BoundedChannelFullMode.DropOldest,
+                SingleReader = true,
+                SingleWriter = true
+            }));
+
+        lock (_lock)
+        {
+            _subscribers.Add(subscription);
+        }
+
+        return subscription;
+    }
+
+    public int SubscriberCount
+    {
+        get
+        {
+            lock (_lock)
+            {
+                return _subscribers.Count;
+            }
+        }
+    }
+
+    internal void Unsubscribe(DashboardSubscription subscription)
+    {
+        lock (_lock)
+        {
+            _subscribers.Remove(subscription);
+        }
+
+        subscription.Complete();
+    }
+
+    // update returns false when the event left the totals unchanged, in which case nothing is pushed
+    private void Apply(Guid branchId, string eventType, DateTime occurredAt, Func<BranchState, DashboardDelta, bool> update)
+    {
+        lock (_lock)
+        {
+            var state = GetState(branchId, occurredAt);
+            var delta = new DashboardDelta { BranchId = branchId, EventType = eventType };
+            if (!update(state, delta))
+            {
+                return;
+            }
+
+            state.Sequence = delta.Sequence = ++_sequence;
+            state.LastUpdated = occurredAt;
+            delta.Totals = state.ToTotals(occurredAt);
+
+            foreach (var subscriber in _subscribers)
+            {
+                if (subscriber.BranchId == null || subscriber.BranchId == branchId)
+                {
+                    subscriber.Publish(delta);
+                }
+            }
+        }
+    }
+
+    // Caller holds _lock
+    private BranchState GetState(Guid branchId, DateTime now)
+    {
+        if (!_branches.TryGetValue(branchId, out var state))
+        {
+            state = new BranchState(branchId);
+            _branches[branchId] = state;
+        }
+
+        state.Roll(now);
+        return state;
+    }
+
+    private sealed class BranchState(Guid branchId)
+    {
+        public Guid BranchId { get; } = branchId;
+        public DateTime TradingDay { get; private set; } = DateTime.UtcNow.Date;
+        public DateTime HourStart { get; private set; } = StartOfHour(DateTime.UtcNow);
+        public decimal TodaySales { get; set; }
+        public decimal CurrentHourSales { get; set; }
+        public int Transactions { get; set; }
+        public int Returns { get; set; }
+        public decimal Refunds { get; set; }
+        public int ItemsSold { get; set; }
+        public HashSet<Guid> LowStockInventoryIds { get; } = new();
+        public long Sequence { get; set; }
+        public DateTime LastUpdated { get; set; }
+
+        // Day and hour totals start again at their boundaries; the low-stock set carries over
+        public void Roll(DateTime now)
+        {
+            if (now.Date > TradingDay)
+            {
+                TradingDay = now.Date;
+                TodaySales = 0;
+                Transactions = 0;
+                Returns = 0;
+                Refunds = 0;
+                ItemsSold = 0;
+            }
+
+            if (StartOfHour(now) > HourStart)
+            {
+                HourStart = StartOfHour(now);
+                CurrentHourSales = 0;
+            }
+        }
+
+        public BranchDashboardTotals ToTotals(DateTime now)
+        {
+            var currentDay = now.Date <= TradingDay;
+            return new BranchDashboardTotals
+            {
+                BranchId = BranchId,
+                TradingDay = currentDay ? TradingDay : now.Date,
+                TodaySales = currentDay ? TodaySales : 0,
+                CurrentHourSales = StartOfHour(now) <= HourStart ? CurrentHourSales : 0,
+                Transactions = currentDay ? Transactions : 0,
+                Returns = currentDay ? Returns : 0,
+                Refunds = currentDay ? Refunds : 0,
+                ItemsSold = currentDay ? ItemsSold : 0,
+                LowStockItems = LowStockInventoryIds.Count,
+                Sequence = Sequence,
+                LastUpdated = LastUpdated
+            };
+        }
+
+        private static DateTime StartOfHour(DateTime time) => new(time.Year, time.Month, time.Day, time.Hour, 0, 0, time.Kind);
+    }
+}
+
+/// <summary>
+/// One subscriber's stream of dashboard deltas
+/// </summary>
+public sealed class DashboardSubscription : IDisposable
+{
+    private readonly RealTimeDashboardService _service;
+    private readonly Channel<DashboardDelta> _channel;
+
+    internal DashboardSubscription(RealTimeDashboardService service, Guid? branchId, Channel<DashboardDelta> channel)
+    {
+        _service = service;
+        _channel = channel;
+        BranchId = branchId;
+    }
+
+    /// <summary>The branch subscribed to, or null for all branches</summary>
+    public Guid? BranchId { get; }
+
+    public ChannelReader<DashboardDelta> Reader => _channel.Reader;
+
+    internal void Publish(DashboardDelta delta) => _channel.Writer.TryWrite(delta);
+
+    internal void Complete() => _channel.Writer.TryComplete();
+
+    public void Dispose() => _service.Unsubscribe(this);
+}
+
+/// <summary>
+/// Running totals of one branch for the current day
+/// </summary>
+public class BranchDashboardTotals
+{
+    public Guid BranchId { get; set; }
+    public DateTime TradingDay { get; set; }
+    public decimal TodaySales { get; set; }
+    public decimal CurrentHourSales { get; set; }
+    public int Transactions { get; set; }
+    public int Returns { get; set; }
+    public decimal Refunds { get; set; }
+    public int ItemsSold { get; set; }
+    public int LowStockItems { get; set; }
+
+    /// <summary>Sequence number of the last event applied; later deltas for the branch have higher numbers</summary>
+    public long Sequence { get; set; }
+
+    public DateTime LastUpdated { get; set; }
+}
+
+/// <summary>
+/// The change one event made to a branch, with the branch's totals after it
+/// </summary>
+public class DashboardDelta
+{
+    public Guid BranchId { get; set; }
+    public long Sequence { get; set; }
+
+    /// <summary>"sale", "return" or "stock"</summary>
+    public string EventType { get; set; } = string.Empty;
+
+    public decimal SalesChange { get; set; }
+    public int TransactionsChange { get; set; }
+    public int ItemsSoldChange { get; set; }
+    public int LowStockChange { get; set; }
+    public BranchDashboardTotals Totals { get; set; } = new();
+}
@@ -338,35 +338,7 @@ public class ReportingService : IReportingService
             // Get procurement data
             var procurementReport = await GenerateProcurementReportAsync(startDate, endDate, cancellationToken);
 
-            // Calculate financial metrics
-            var totalRevenue = salesReport.TotalSales;
-            var totalCosts = procurementReport.TotalPurchaseValue;
-            var grossProfit = totalRevenue - totalCosts;
-            var profitMargin = totalRevenue > 0 ? (grossProfit / totalRevenue) * 100 : 0;
-
-            // Monthly breakdown
-            var monthlyData = Enumerable.Range(0, ((endDate.Year - startDate.Year) * 12) + endDate.Month - startDate.Month + 1)
-                .Select(i => startDate.AddMonths(i))
-                .Select(month => new MonthlyFinancialData
-                {
-                    Month = month,
-                    Revenue = 0, // Would calculate from actual sales data
-                    Costs = 0, // Would calculate from actual procurement data
-                    Profit = 0
-                })
-                .ToList();
-
-            return new FinancialReport
-            {
-                StartDate = startDate,
-                EndDate = endDate,
-                TotalRevenue = totalRevenue,
-                TotalCosts = totalCosts,
-                GrossProfit = grossProfit,
-                ProfitMargin = profitMargin,
-                MonthlyBreakdown = monthlyData,
-                GeneratedAt = DateTime.UtcNow
-            };
+            return ComposeFinancialReport(salesReport, procurementReport, startDate, endDate);
         }
         catch (Exception ex)
         {
@@ -374,6 +346,46 @@ public class ReportingService : IReportingService
             throw;
         }
     }
+
+    /// <summary>
+    /// Financial figures for a window from its sales and procurement reports, for callers that already hold them
+    /// </summary>
+    public static FinancialReport ComposeFinancialReport(
+        SalesReport salesReport,
+        ProcurementReport procurementReport,
+        DateTime startDate,
+        DateTime endDate)
+    {
+        // Calculate financial metrics
+        var totalRevenue = salesReport.TotalSales;
+        var totalCosts = procurementReport.TotalPurchaseValue;
+        var grossProfit = totalRevenue - totalCosts;
+        var profitMargin = totalRevenue > 0 ? (grossProfit / totalRevenue) * 100 : 0;
+
+        // Monthly breakdown
+        var monthlyData = Enumerable.Range(0, ((endDate.Year - startDate.Year) * 12) + endDate.Month - startDate.Month + 1)
+            .Select(i => startDate.AddMonths(i))
+            .Select(month => new MonthlyFinancialData
+            {
+                Month = month,
+                Revenue = 0, // Would calculate from actual sales data
+                Costs = 0, // Would calculate from actual procurement data
+                Profit = 0
+            })
+            .ToList();
+
+        return new FinancialReport
+        {
+            StartDate = startDate,
+            EndDate = endDate,
+            TotalRevenue = totalRevenue,
+            TotalCosts = totalCosts,
+            GrossProfit = grossProfit,
+            ProfitMargin = profitMargin,
+            MonthlyBreakdown = monthlyData,
+            GeneratedAt = DateTime.UtcNow
+        };
+    }
 }
 
 // Data transfer objects for reports
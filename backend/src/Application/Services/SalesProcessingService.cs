@@ -13,8 +13,8 @@ public class SalesProcessingService(
     ICustomerRepository customerRepository,
     IInventoryRepository inventoryRepository,
     IInventoryTransactionRepository inventoryTransactionRepository,
-    IProductRepository productRepository,
     IUnitOfWork unitOfWork,
+    IRealTimeDashboardService realTimeDashboard,
     ILogger<SalesProcessingService> logger)
     : ISalesProcessingService
 {
@@ -22,259 +22,297 @@ public class SalesProcessingService(
     {
         try
         {
-            await unitOfWork.BeginTransactionAsync(cancellationToken);
+            var (savedTransaction, stockLevels) = await RecordSaleAsync(request, null, cancellationToken);
 
-            // Validate customer if provided
-            Customer? customer = null;
-            if (request.CustomerId.HasValue)
+            realTimeDashboard.RecordSale(savedTransaction);
+            foreach (var inventory in stockLevels)
             {
-                customer = await customerRepository.GetByIdAsync(request.CustomerId.Value, cancellationToken);
-                if (customer == null)
-                {
-                    throw new ValidationException($"Customer with ID '{request.CustomerId.Value}' not found.");
-                }
+                realTimeDashboard.RecordStockLevel(inventory);
             }
 
-            // Create sales transaction
-            var transaction = new SalesTransaction
-            {
-                TransactionNumber = GenerateTransactionNumber(),
-                BranchId = request.BranchId,
-                CustomerId = request.CustomerId,
-                UserId = request.UserId,
-                TransactionType = "SALE",
-                Status = "PENDING",
-                Notes = request.Notes
-            };
-
-            decimal subtotal = 0;
-            decimal taxAmount = 0;
-            var transactionItems = new List<SalesTransactionItem>();
+            logger.LogInformation("Sale processed successfully. Transaction: {TransactionNumber}", savedTransaction.TransactionNumber);
+            return savedTransaction;
+        }
+        catch (Exception ex)
+        {
+            logger.LogError(ex, "Error processing sale");
+            throw;
+        }
+    }
 
-            // Process each item
-            foreach (var itemRequest in request.Items)
+    /// <summary>
+    /// Write a sale, committing it unless a transaction is already open
+    /// </summary>
+    /// <returns>The saved transaction and the stock rows it changed</returns>
+    private async Task<(SalesTransaction Transaction, List<Inventory> StockLevels)> RecordSaleAsync(
+        ProcessSaleRequest request, Guid? originalTransactionId, CancellationToken cancellationToken)
+    {
+        // Validate customer if provided
+        Customer? customer = null;
+        if (request.CustomerId.HasValue)
+        {
+            customer = await customerRepository.GetWithLoyaltyAsync(request.CustomerId.Value, cancellationToken);
+            if (customer == null)
             {
-                var transactionItem = await ProcessSaleItemAsync(itemRequest, transaction.Id, cancellationToken);
-                transactionItems.Add(transactionItem);
-                subtotal += transactionItem.PriceAfterDiscount;
-                taxAmount += transactionItem.TaxAmount;
+                throw new ValidationException($"Customer with ID '{request.CustomerId.Value}' not found.");
             }
+        }
 
-            // Calculate totals
-            transaction.Subtotal = subtotal;
-            transaction.TaxAmount = taxAmount;
-            transaction.TotalAmount = subtotal + taxAmount;
-            transaction.AmountPaid = request.Payments.Sum(p => p.Amount);
-            transaction.ChangeGiven = Math.Max(0, transaction.AmountPaid - transaction.TotalAmount);
-            
-            // Process loyalty points
-            if (customer?.Loyalty is { IsActive: true })
-            {
-                var pointsEarned = CalculateLoyaltyPoints(transaction.TotalAmount, customer.Loyalty.TierDiscountPercentage);
-                transaction.LoyaltyPointsEarned = pointsEarned;
-            }
+        // Stock rows for the whole basket in one query
+        var inventoryIds = request.Items.Select(i => i.InventoryId).Distinct().ToList();
+        var inventories = (await inventoryRepository.GetByIdsAsync(inventoryIds, cancellationToken))
+            .ToDictionary(i => i.Id);
+
+        var now = DateTime.UtcNow;
+        var transaction = new SalesTransaction
+        {
+            TransactionNumber = GenerateTransactionNumber(),
+            BranchId = request.BranchId,
+            CustomerId = request.CustomerId,
+            UserId = request.UserId,
+            TransactionType = "SALE",
+            Status = "COMPLETED",
+            OriginalTransactionId = originalTransactionId,
+            Notes = request.Notes,
+            CompletedAt = now
+        };
+
+        decimal subtotal = 0;
+        decimal taxAmount = 0;
+        var requestedByInventory = new Dictionary<Guid, int>();
+
+        // Process each item
+        foreach (var itemRequest in request.Items)
+        {
+            var transactionItem = BuildSaleItem(itemRequest, transaction.Id, inventories, requestedByInventory);
+            transaction.Items.Add(transactionItem);
+            subtotal += transactionItem.PriceAfterDiscount;
+            taxAmount += transactionItem.TaxAmount;
+        }
 
-            // Save transaction
-            var savedTransaction = await salesTransactionRepository.CreateAsync(transaction, cancellationToken);
+        // Calculate totals
+        transaction.Subtotal = subtotal;
+        transaction.TaxAmount = taxAmount;
+        transaction.TotalAmount = subtotal + taxAmount;
+        transaction.AmountPaid = request.Payments.Sum(p => p.Amount);
+        transaction.ChangeGiven = Math.Max(0, transaction.AmountPaid - transaction.TotalAmount);
 
-            // Save transaction items
-            foreach (var item in transactionItems)
+        // Process payments
+        foreach (var paymentRequest in request.Payments)
+        {
+            transaction.Payments.Add(new SalesTransactionPayment
             {
-                item.SalesTransactionId = savedTransaction.Id;
-                await unitOfWork.SaveChangesAsync(cancellationToken);
-            }
+                SalesTransactionId = transaction.Id,
+                PaymentMethod = paymentRequest.PaymentMethod,
+                Amount = paymentRequest.Amount,
+                Currency = paymentRequest.Currency,
+                ReferenceNumber = paymentRequest.ReferenceNumber,
+                CardLastFour = paymentRequest.CardLastFour,
+                CardType = paymentRequest.CardType,
+                GiftCardNumber = paymentRequest.GiftCardNumber,
+                AuthorizationCode = paymentRequest.AuthorizationCode,
+                IsApproved = true
+            });
+        }
 
-            // Process payments
-            foreach (var paymentRequest in request.Payments)
+        // Process loyalty points
+        LoyaltyTransaction? loyaltyTransaction = null;
+        if (customer?.Loyalty is { IsActive: true })
+        {
+            transaction.LoyaltyPointsEarned = CalculateLoyaltyPoints(transaction.TotalAmount, customer.Loyalty.TierDiscountPercentage);
+            if (transaction.LoyaltyPointsEarned > 0)
             {
-                var payment = new SalesTransactionPayment
-                {
-                    SalesTransactionId = savedTransaction.Id,
-                    PaymentMethod = paymentRequest.PaymentMethod,
-                    Amount = paymentRequest.Amount,
-                    Currency = paymentRequest.Currency,
-                    ReferenceNumber = paymentRequest.ReferenceNumber,
-                    CardLastFour = paymentRequest.CardLastFour,
-                    CardType = paymentRequest.CardType,
-                    GiftCardNumber = paymentRequest.GiftCardNumber,
-                    AuthorizationCode = paymentRequest.AuthorizationCode,
-                    IsApproved = true
-                };
-                
-                // Don't add directly; save transaction will handle persistence
-                // unitOfWork.Context.Set<SalesTransactionPayment>().Add(payment);
+                loyaltyTransaction = NewLoyaltyTransaction(customer.Loyalty.Id, transaction.LoyaltyPointsEarned,
+                    "EARNED", $"Purchase transaction {transaction.TransactionNumber}", transaction.Id);
             }
+        }
 
-            // Update inventory
-            await UpdateInventoryForSaleAsync(transactionItems, request.UserId, cancellationToken);
-
-            // Update loyalty points if applicable
-            if (customer?.Loyalty != null && transaction.LoyaltyPointsEarned > 0)
+        var stockMovements = transaction.Items
+            .Select(item => new InventoryTransaction
             {
-                await UpdateLoyaltyPointsAsync(customer.Loyalty.Id, transaction.LoyaltyPointsEarned, 
-                    "EARNED", $"Purchase transaction {transaction.TransactionNumber}", 
-                    savedTransaction.Id, cancellationToken);
-            }
+                Id = Guid.NewGuid(),
+                InventoryId = item.InventoryId,
+                TransactionType = "SALE",
+                Quantity = -item.Quantity,
+                UnitCost = inventories[item.InventoryId].UnitCost,
+                ReferenceNumber = $"SALE-{transaction.TransactionNumber}",
+                Reason = $"Sale of {item.Quantity} units",
+                CreatedByUserId = request.UserId,
+                CreatedAt = now
+            })
+            .ToList();
+
+        // Everything above is written in one database transaction
+        var availableQuantities = await salesTransactionRepository.CommitSaleAsync(
+            transaction, stockMovements, loyaltyTransaction, cancellationToken);
+
+        // The rows read above predate the sale and any concurrent ones; take the quantities the update left
+        var stockLevels = new List<Inventory>();
+        foreach (var (inventoryId, availableQuantity) in availableQuantities)
+        {
+            var inventory = inventories[inventoryId];
+            inventory.AvailableQuantity = availableQuantity;
+            stockLevels.Add(inventory);
+        }
 
-            transaction.Status = "COMPLETED";
-            transaction.CompletedAt = DateTime.UtcNow;
-            await salesTransactionRepository.UpdateAsync(transaction, cancellationToken);
+        return (transaction, stockLevels);
+    }
 
-            await unitOfWork.SaveChangesAsync(cancellationToken);
+    public async Task<SalesTransaction> ProcessReturnAsync(ProcessReturnRequest request, CancellationToken cancellationToken = default)
+    {
+        try
+        {
+            var (returnTransaction, returnItems, restoredInventories) = await unitOfWork.ExecuteInTransactionAsync(
+                ct => RecordReturnAsync(request, ct), cancellationToken);
 
-            logger.LogInformation("Sale processed successfully. Transaction: {TransactionNumber}", transaction.TransactionNumber);
-            return savedTransaction;
+            realTimeDashboard.RecordSale(returnTransaction, returnItems);
+            foreach (var inventory in restoredInventories)
+            {
+                realTimeDashboard.RecordStockLevel(inventory);
+            }
+
+            logger.LogInformation("Return processed successfully. Return Transaction: {TransactionNumber}", returnTransaction.TransactionNumber);
+            return returnTransaction;
         }
         catch (Exception ex)
         {
-            await unitOfWork.RollbackAsync(cancellationToken);
-            logger.LogError(ex, "Error processing sale");
+            logger.LogError(ex, "Error processing return");
             throw;
         }
     }
 
-    public async Task<SalesTransaction> ProcessReturnAsync(ProcessReturnRequest request, CancellationToken cancellationToken = default)
+    /// <summary>
+    /// Write a return; call inside <see cref="IUnitOfWork.ExecuteInTransactionAsync{T}"/>
+    /// </summary>
+    /// <returns>The saved return transaction, its items and the stock rows it restored</returns>
+    private async Task<(SalesTransaction Transaction, List<SalesTransactionItem> Items, List<Inventory> StockLevels)> RecordReturnAsync(
+        ProcessReturnRequest request, CancellationToken cancellationToken)
     {
-        try
+        // Get original transaction
+        var originalTransaction = await salesTransactionRepository.GetByTransactionNumberAsync(
+            request.OriginalTransactionNumber, cancellationToken);
+        
+        if (originalTransaction == null)
+        {
+            throw new ValidationException($"Original transaction '{request.OriginalTransactionNumber}' not found.");
+        }
+
+        if (originalTransaction.Status != "COMPLETED")
         {
-            await unitOfWork.BeginTransactionAsync(cancellationToken);
+            throw new ValidationException($"Cannot return transaction with status '{originalTransaction.Status}'.");
+        }
 
-            // Get original transaction
-            var originalTransaction = await salesTransactionRepository.GetByTransactionNumberAsync(
-                request.OriginalTransactionNumber, cancellationToken);
-            
-            if (originalTransaction == null)
+        // Create return transaction
+        var returnTransaction = new SalesTransaction
+        {
+            TransactionNumber = GenerateTransactionNumber(),
+            BranchId = originalTransaction.BranchId,
+            CustomerId = originalTransaction.CustomerId,
+            UserId = request.UserId,
+            TransactionType = "RETURN",
+            Status = "PENDING",
+            OriginalTransactionId = originalTransaction.Id,
+            Notes = request.Reason
+        };
+
+        decimal refundAmount = 0;
+        var returnItems = new List<SalesTransactionItem>();
+
+        // Process return items
+        foreach (var itemRequest in request.Items)
+        {
+            var originalItem = originalTransaction.Items.FirstOrDefault(i => i.Id == itemRequest.OriginalItemId);
+            if (originalItem == null)
             {
-                throw new ValidationException($"Original transaction '{request.OriginalTransactionNumber}' not found.");
+                throw new ValidationException($"Original item with ID '{itemRequest.OriginalItemId}' not found.");
             }
 
-            if (originalTransaction.Status != "COMPLETED")
+            if (itemRequest.Quantity > originalItem.Quantity)
             {
-                throw new ValidationException($"Cannot return transaction with status '{originalTransaction.Status}'.");
+                throw new ValidationException($"Cannot return more items ({itemRequest.Quantity}) than originally purchased ({originalItem.Quantity}).");
             }
 
-            // Create return transaction
-            var returnTransaction = new SalesTransaction
+            var returnItem = new SalesTransactionItem
             {
-                TransactionNumber = GenerateTransactionNumber(),
-                BranchId = originalTransaction.BranchId,
-                CustomerId = originalTransaction.CustomerId,
-                UserId = request.UserId,
-                TransactionType = "RETURN",
-                Status = "PENDING",
-                OriginalTransactionId = originalTransaction.Id,
-                Notes = request.Reason
+                ProductId = originalItem.ProductId,
+                ProductVariationId = originalItem.ProductVariationId,
+                InventoryId = originalItem.InventoryId,
+                Quantity = itemRequest.Quantity,
+                UnitPrice = originalItem.UnitPrice,
+                DiscountAmount = (originalItem.DiscountAmount / originalItem.Quantity) * itemRequest.Quantity,
+                TaxAmount = (originalItem.TaxAmount / originalItem.Quantity) * itemRequest.Quantity,
+                Notes = itemRequest.Reason
             };
 
-            decimal refundAmount = 0;
-            var returnItems = new List<SalesTransactionItem>();
-
-            // Process return items
-            foreach (var itemRequest in request.Items)
-            {
-                var originalItem = originalTransaction.Items.FirstOrDefault(i => i.Id == itemRequest.OriginalItemId);
-                if (originalItem == null)
-                {
-                    throw new ValidationException($"Original item with ID '{itemRequest.OriginalItemId}' not found.");
-                }
-
-                if (itemRequest.Quantity > originalItem.Quantity)
-                {
-                    throw new ValidationException($"Cannot return more items ({itemRequest.Quantity}) than originally purchased ({originalItem.Quantity}).");
-                }
-
-                var returnItem = new SalesTransactionItem
-                {
-                    ProductId = originalItem.ProductId,
-                    ProductVariationId = originalItem.ProductVariationId,
-                    InventoryId = originalItem.InventoryId,
-                    Quantity = itemRequest.Quantity,
-                    UnitPrice = originalItem.UnitPrice,
-                    DiscountAmount = (originalItem.DiscountAmount / originalItem.Quantity) * itemRequest.Quantity,
-                    TaxAmount = (originalItem.TaxAmount / originalItem.Quantity) * itemRequest.Quantity,
-                    Notes = itemRequest.Reason
-                };
-
-                returnItem.TotalPrice = -(returnItem.Quantity * returnItem.UnitPrice - returnItem.DiscountAmount + returnItem.TaxAmount);
-                refundAmount += Math.Abs(returnItem.TotalPrice);
-                returnItems.Add(returnItem);
-            }
+            returnItem.TotalPrice = -(returnItem.Quantity * returnItem.UnitPrice - returnItem.DiscountAmount + returnItem.TaxAmount);
+            refundAmount += Math.Abs(returnItem.TotalPrice);
+            returnItems.Add(returnItem);
+        }
 
-            returnTransaction.Subtotal = -refundAmount;
-            returnTransaction.TaxAmount = -returnItems.Sum(i => i.TaxAmount);
-            returnTransaction.TotalAmount = -refundAmount;
-            returnTransaction.AmountPaid = -refundAmount;
+        returnTransaction.Subtotal = -refundAmount;
+        returnTransaction.TaxAmount = -returnItems.Sum(i => i.TaxAmount);
+        returnTransaction.TotalAmount = -refundAmount;
+        returnTransaction.AmountPaid = -refundAmount;
 
-            // Save return transaction
-            var savedReturnTransaction = await salesTransactionRepository.CreateAsync(returnTransaction, cancellationToken);
+        // Save return transaction
+        var savedReturnTransaction = await salesTransactionRepository.CreateAsync(returnTransaction, cancellationToken);
 
-            // Save return items
-            foreach (var item in returnItems)
-            {
-                item.SalesTransactionId = savedReturnTransaction.Id;
-                // Item will be persisted with transaction
-            }
+        // Save return items
+        foreach (var item in returnItems)
+        {
+            item.SalesTransactionId = savedReturnTransaction.Id;
+            // Item will be persisted with transaction
+        }
 
-            // Process refund payment
-            if (request.RefundPayment != null)
+        // Process refund payment
+        if (request.RefundPayment != null)
+        {
+            var refundPayment = new SalesTransactionPayment
             {
-                var refundPayment = new SalesTransactionPayment
-                {
-                    SalesTransactionId = savedReturnTransaction.Id,
-                    PaymentMethod = request.RefundPayment.PaymentMethod,
-                    Amount = -refundAmount,
-                    Currency = request.RefundPayment.Currency,
-                    ReferenceNumber = request.RefundPayment.ReferenceNumber,
-                    CardLastFour = request.RefundPayment.CardLastFour,
-                    CardType = request.RefundPayment.CardType,
-                    IsApproved = true
-                };
-                // Refund will be persisted with transaction
-            }
+                SalesTransactionId = savedReturnTransaction.Id,
+                PaymentMethod = request.RefundPayment.PaymentMethod,
+                Amount = -refundAmount,
+                Currency = request.RefundPayment.Currency,
+                ReferenceNumber = request.RefundPayment.ReferenceNumber,
+                CardLastFour = request.RefundPayment.CardLastFour,
+                CardType = request.RefundPayment.CardType,
+                IsApproved = true
+            };
+            // Refund will be persisted with transaction
+        }
 
-            // Restore inventory
-            await RestoreInventoryForReturnAsync(returnItems, request.UserId, cancellationToken);
+        // Restore inventory
+        var restoredInventories = await RestoreInventoryForReturnAsync(returnItems, request.UserId, cancellationToken);
 
-            // Deduct loyalty points if they were earned on original transaction
-            if (originalTransaction is { LoyaltyPointsEarned: > 0, CustomerId: not null })
+        // Deduct loyalty points if they were earned on original transaction
+        if (originalTransaction is { LoyaltyPointsEarned: > 0, CustomerId: not null })
+        {
+            var customer = await customerRepository.GetByIdAsync(originalTransaction.CustomerId.Value, cancellationToken);
+            if (customer?.Loyalty != null)
             {
-                var customer = await customerRepository.GetByIdAsync(originalTransaction.CustomerId.Value, cancellationToken);
-                if (customer?.Loyalty != null)
-                {
-                    await UpdateLoyaltyPointsAsync(customer.Loyalty.Id, -originalTransaction.LoyaltyPointsEarned,
-                        "REDEEMED", $"Return of transaction {originalTransaction.TransactionNumber}",
-                        savedReturnTransaction.Id, cancellationToken);
-                }
+                await UpdateLoyaltyPointsAsync(customer.Loyalty.Id, -originalTransaction.LoyaltyPointsEarned,
+                    "REDEEMED", $"Return of transaction {originalTransaction.TransactionNumber}",
+                    savedReturnTransaction.Id, cancellationToken);
             }
+        }
 
-            returnTransaction.Status = "COMPLETED";
-            returnTransaction.CompletedAt = DateTime.UtcNow;
-            await salesTransactionRepository.UpdateAsync(returnTransaction, cancellationToken);
+        returnTransaction.Status = "COMPLETED";
+        returnTransaction.CompletedAt = DateTime.UtcNow;
+        await salesTransactionRepository.UpdateAsync(returnTransaction, cancellationToken);
 
-            await unitOfWork.SaveChangesAsync(cancellationToken);
+        await unitOfWork.SaveChangesAsync(cancellationToken);
 
-            logger.LogInformation("Return processed successfully. Return Transaction: {TransactionNumber}", returnTransaction.TransactionNumber);
-            return savedReturnTransaction;
-        }
-        catch (Exception ex)
-        {
-            await unitOfWork.RollbackAsync(cancellationToken);
-            logger.LogError(ex, "Error processing return");
-            throw;
-        }
+        return (savedReturnTransaction, returnItems, restoredInventories);
     }
 
-    private async Task<SalesTransactionItem> ProcessSaleItemAsync(SaleItemRequest itemRequest, Guid transactionId, CancellationToken cancellationToken)
+    private SalesTransactionItem BuildSaleItem(
+        SaleItemRequest itemRequest,
+        Guid transactionId,
+        IReadOnlyDictionary<Guid, Inventory> inventories,
+        Dictionary<Guid, int> requestedByInventory)
     {
-        // Get product and inventory
-        var product = await productRepository.GetByIdAsync(itemRequest.ProductId, cancellationToken);
-        if (product == null)
-        {
-            throw new ValidationException($"Product with ID '{itemRequest.ProductId}' not found.");
-        }
-
-        var inventory = await inventoryRepository.GetByIdAsync(itemRequest.InventoryId, cancellationToken);
-        if (inventory == null)
+        // The inventory row's foreign key guarantees the product exists
+        if (!inventories.TryGetValue(itemRequest.InventoryId, out var inventory))
         {
             throw new ValidationException($"Inventory with ID '{itemRequest.InventoryId}' not found.");
         }
@@ -284,11 +322,13 @@ public class SalesProcessingService(
             throw new ValidationException("Inventory does not match the product.");
         }
 
-        // Check stock availability
-        if (inventory.AvailableQuantity < itemRequest.Quantity)
+        // Check stock availability, counting earlier lines for the same stock row
+        var requested = requestedByInventory.GetValueOrDefault(inventory.Id) + itemRequest.Quantity;
+        if (inventory.AvailableQuantity < requested)
         {
-            throw new ValidationException($"Insufficient stock. Available: {inventory.AvailableQuantity}, Requested: {itemRequest.Quantity}");
+            throw new ValidationException($"Insufficient stock. Available: {inventory.AvailableQuantity}, Requested: {requested}");
         }
+        requestedByInventory[inventory.Id] = requested;
 
         // Get price (could come from inventory, product, or be specified)
         var unitPrice = itemRequest.UnitPrice > 0 ? itemRequest.UnitPrice : inventory.UnitCost * 1.5m; // Default markup
@@ -312,35 +352,9 @@ public class SalesProcessingService(
         return transactionItem;
     }
 
-    private async Task UpdateInventoryForSaleAsync(List<SalesTransactionItem> items, Guid userId, CancellationToken cancellationToken)
-    {
-        foreach (var item in items)
-        {
-            var inventory = await inventoryRepository.GetByIdAsync(item.InventoryId, cancellationToken);
-            if (inventory != null)
-            {
-                inventory.AvailableQuantity -= item.Quantity;
-                inventory.ReservedQuantity = Math.Max(0, inventory.ReservedQuantity - item.Quantity);
-                await inventoryRepository.UpdateAsync(inventory, cancellationToken);
-
-                // Create inventory transaction
-                var inventoryTransaction = new InventoryTransaction
-                {
-                    InventoryId = inventory.Id,
-                    TransactionType = "SALE",
-                    Quantity = -item.Quantity,
-                    UnitCost = inventory.UnitCost,
-                    ReferenceNumber = $"SALE-{Guid.NewGuid():N}",
-                    Reason = $"Sale of {item.Quantity} units",
-                    CreatedByUserId = userId
-                };
-                await inventoryTransactionRepository.AddAsync(inventoryTransaction, cancellationToken);
-            }
-        }
-    }
-
-    private async Task RestoreInventoryForReturnAsync(List<SalesTransactionItem> items, Guid userId, CancellationToken cancellationToken)
+    private async Task<List<Inventory>> RestoreInventoryForReturnAsync(List<SalesTransactionItem> items, Guid userId, CancellationToken cancellationToken)
     {
+        var restored = new List<Inventory>();
         foreach (var item in items)
         {
             var inventory = await inventoryRepository.GetByIdAsync(item.InventoryId, cancellationToken);
@@ -348,6 +362,7 @@ public class SalesProcessingService(
             {
                 inventory.AvailableQuantity += item.Quantity;
                 await inventoryRepository.UpdateAsync(inventory, cancellationToken);
+                restored.Add(inventory);
 
                 // Create inventory transaction
                 var inventoryTransaction = new InventoryTransaction
@@ -363,12 +378,26 @@ public class SalesProcessingService(
                 await inventoryTransactionRepository.AddAsync(inventoryTransaction, cancellationToken);
             }
         }
+
+        return restored;
     }
 
     private async Task UpdateLoyaltyPointsAsync(Guid customerLoyaltyId, int points, string transactionType, 
         string reason, Guid salesTransactionId, CancellationToken cancellationToken)
     {
-        var loyaltyTransaction = new LoyaltyTransaction
+        var loyaltyTransaction = NewLoyaltyTransaction(customerLoyaltyId, points, transactionType, reason, salesTransactionId);
+
+        // Loyalty transactions are persisted through repository
+        // var loyaltyDbSet = unitOfWork.Context.Set<LoyaltyTransaction>();
+        // loyaltyDbSet.Add(loyaltyTransaction);
+
+        // Note: Customer loyalty updates require direct repository access
+    }
+
+    private static LoyaltyTransaction NewLoyaltyTransaction(Guid customerLoyaltyId, int points, string transactionType,
+        string reason, Guid salesTransactionId)
+    {
+        return new LoyaltyTransaction
         {
             CustomerLoyaltyId = customerLoyaltyId,
             Points = points,
@@ -377,12 +406,6 @@ public class SalesProcessingService(
             SalesTransactionId = salesTransactionId,
             TransactionDate = DateTime.UtcNow
         };
-
-        // Loyalty transactions are persisted through repository
-        // var loyaltyDbSet = unitOfWork.Context.Set<LoyaltyTransaction>();
-        // loyaltyDbSet.Add(loyaltyTransaction);
-
-        // Note: Customer loyalty updates require direct repository access
     }
 
     private string GenerateTransactionNumber()
@@ -506,7 +529,6 @@ public class SalesProcessingService(
 
     public async Task<SalesTransaction> ProcessExchangeAsync(ProcessExchangeRequest request, CancellationToken cancellationToken = default)
     {
-        // First process the return
         var returnRequest = new ProcessReturnRequest
         {
             OriginalTransactionNumber = request.OriginalTransactionNumber,
@@ -515,25 +537,35 @@ public class SalesProcessingService(
             Reason = request.Reason
         };
 
-        var returnTransaction = await ProcessReturnAsync(returnRequest, cancellationToken);
-
-        // Then process the new sale
-        var saleRequest = new ProcessSaleRequest
+        // The return and the new sale commit together or not at all
+        var (returned, sold) = await unitOfWork.ExecuteInTransactionAsync(async ct =>
         {
-            BranchId = returnTransaction.BranchId,
-            UserId = request.UserId,
-            CustomerId = returnTransaction.CustomerId,
-            Items = request.NewItems,
-            Payments = request.Payments,
-            Notes = $"Exchange for transaction {request.OriginalTransactionNumber}" + (string.IsNullOrEmpty(request.Reason) ? "" : $" - {request.Reason}")
-        };
+            var returnResult = await RecordReturnAsync(returnRequest, ct);
+
+            var saleRequest = new ProcessSaleRequest
+            {
+                BranchId = returnResult.Transaction.BranchId,
+                UserId = request.UserId,
+                CustomerId = returnResult.Transaction.CustomerId,
+                Items = request.NewItems,
+                Payments = request.Payments,
+                Notes = $"Exchange for transaction {request.OriginalTransactionNumber}" + (string.IsNullOrEmpty(request.Reason) ? "" : $" - {request.Reason}")
+            };
 
-        var newSaleTransaction = await ProcessSaleAsync(saleRequest, cancellationToken);
+            // The sale joins the open transaction and is linked to the return as it is written
+            var saleResult = await RecordSaleAsync(saleRequest, returnResult.Transaction.Id, ct);
+            return (returnResult, saleResult);
+        }, cancellationToken);
 
-        // Link the transactions
-        newSaleTransaction.OriginalTransactionId = returnTransaction.Id;
-        await salesTransactionRepository.UpdateAsync(newSaleTransaction, cancellationToken);
+        realTimeDashboard.RecordSale(returned.Transaction, returned.Items);
+        realTimeDashboard.RecordSale(sold.Transaction);
+        foreach (var inventory in returned.StockLevels.Concat(sold.StockLevels))
+        {
+            realTimeDashboard.RecordStockLevel(inventory);
+        }
 
-        return newSaleTransaction;
+        logger.LogInformation("Exchange processed successfully. Return: {ReturnNumber}, Sale: {SaleNumber}",
+            returned.Transaction.TransactionNumber, sold.Transaction.TransactionNumber);
+        return sold.Transaction;
     }
 }
\ No newline at end of file
@@ -0,0 +1,231 @@
+using System.Buffers.Binary;
+using System.Diagnostics.Metrics;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using NationalClothingStore.Application.Interfaces;
+
+namespace NationalClothingStore.Infrastructure.Caching;
+
+/// <summary>
+/// Catalog cache settings, bound from the "CatalogCache" configuration section
+/// </summary>
+public class CatalogCacheOptions
+{
+    public bool Enabled { get; set; } = true;
+    public string KeyPrefix { get; set; } = "catalog";
+    // Cached products carry variation stock levels, so keep this short
+    public TimeSpan ProductTtl { get; set; } = TimeSpan.FromMinutes(2);
+    public TimeSpan CategoryTtl { get; set; } = TimeSpan.FromMinutes(30);
+}
+
+/// <summary>
+/// Read-through logic shared by the Redis cache and the in-memory fake. Every entry is stamped
+/// with its region's generation and its key's version when it is written; bumping the generation
+/// invalidates the whole region and bumping the version invalidates the key, and a value computed
+/// while either bump was in flight is never served afterwards.
+/// Cache failures are logged and counted, and the read falls through to the database.
+/// </summary>
+public abstract class CatalogCache : ICatalogCache
+{
+    public const string MeterName = "NationalClothingStore.CatalogCache";
+
+    private static readonly Meter Meter = new(MeterName);
+    private static readonly Counter<long> HitCounter = Meter.CreateCounter<long>("catalog_cache.hits");
+    private static readonly Counter<long> MissCounter = Meter.CreateCounter<long>("catalog_cache.misses");
+    private static readonly Counter<long> ErrorCounter = Meter.CreateCounter<long>("catalog_cache.errors");
+
+    // Entities carry back-references (Product.Category.Products, Variation.Product)
+    private static readonly JsonSerializerOptions SerializerOptions = new(JsonSerializerDefaults.Web)
+    {
+        ReferenceHandler = ReferenceHandler.IgnoreCycles
+    };
+
+    private readonly CatalogCacheOptions _options;
+    private readonly ILogger _logger;
+    private long _hits;
+    private long _misses;
+    private long _errors;
+
+    protected CatalogCache(IOptions<CatalogCacheOptions> options, ILogger logger)
+    {
+        _options = options.Value;
+        _logger = logger;
+    }
+
+    public async Task<T?> GetOrCreateAsync<T>(
+        string region,
+        string key,
+        Func<CancellationToken, Task<T?>> factory,
+        CancellationToken cancellationToken = default) where T : class
+    {
+        if (!_options.Enabled)
+        {
+            return await factory(cancellationToken);
+        }
+
+        var entryKey = EntryKey(region, key);
+        long generation;
+        long version;
+
+        try
+        {
+            (generation, version, var payload) = await ReadAsync(GenerationKey(region), VersionKey(entryKey), entryKey, cancellationToken);
+            if (payload != null && TryUnwrap(payload, generation, version, out T? cached))
+            {
+                Interlocked.Increment(ref _hits);
+                HitCounter.Add(1, new KeyValuePair<string, object?>("region", region));
+                return cached;
+            }
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            RecordError(region, ex, "read", entryKey);
+            return await factory(cancellationToken);
+        }
+
+        Interlocked.Increment(ref _misses);
+        MissCounter.Add(1, new KeyValuePair<string, object?>("region", region));
+
+        var value = await factory(cancellationToken);
+        if (value != null)
+        {
+            try
+            {
+                await WriteAsync(entryKey, Wrap(value, generation, version), TtlFor(region), cancellationToken);
+            }
+            catch (Exception ex) when (ex is not OperationCanceledException)
+            {
+                RecordError(region, ex, "write", entryKey);
+            }
+        }
+
+        return value;
+    }
+
+    public async Task RemoveAsync(string region, IEnumerable<string> keys, CancellationToken cancellationToken = default)
+    {
+        var entryKeys = keys.Select(key => EntryKey(region, key)).ToList();
+        if (entryKeys.Count == 0)
+        {
+            return;
+        }
+
+        try
+        {
+            // Bumping the versions first means a read that started before this removal, and may have
+            // loaded the old value, cannot put it back: its write carries the old version
+            foreach (var entryKey in entryKeys)
+            {
+                await IncrementAsync(VersionKey(entryKey), VersionTtl, cancellationToken);
+            }
+
+            await DeleteAsync(entryKeys, cancellationToken);
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            // The entries expire on their own; stale reads are bounded by the region TTL
+            RecordError(region, ex, "remove", string.Join(", ", entryKeys));
+        }
+    }
+
+    public async Task InvalidateRegionAsync(string region, CancellationToken cancellationToken = default)
+    {
+        try
+        {
+            await IncrementAsync(GenerationKey(region), null, cancellationToken);
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            RecordError(region, ex, "invalidate", GenerationKey(region));
+        }
+    }
+
+    public CatalogCacheStatistics GetStatistics()
+    {
+        return new CatalogCacheStatistics
+        {
+            Hits = Interlocked.Read(ref _hits),
+            Misses = Interlocked.Read(ref _misses),
+            Errors = Interlocked.Read(ref _errors)
+        };
+    }
+
+    /// <summary>
+    /// Read the region generation, the key version and the entry payload, ideally in one round-trip
+    /// </summary>
+    protected abstract Task<(long generation, long version, byte[]? payload)> ReadAsync(
+        string generationKey,
+        string versionKey,
+        string entryKey,
+        CancellationToken cancellationToken);
+
+    protected abstract Task WriteAsync(string entryKey, byte[] payload, TimeSpan ttl, CancellationToken cancellationToken);
+
+    protected abstract Task DeleteAsync(IReadOnlyList<string> entryKeys, CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Increment a generation or version counter, (re)setting its expiry when <paramref name="ttl"/> is given
+    /// </summary>
+    protected abstract Task IncrementAsync(string counterKey, TimeSpan? ttl, CancellationToken cancellationToken);
+
+    private string EntryKey(string region, string key) => $"{_options.KeyPrefix}:{region}:{key}";
+
+    private string GenerationKey(string region) => $"{_options.KeyPrefix}:{region}:generation";
+
+    private static string VersionKey(string entryKey) => $"{entryKey}:version";
+
+    // A key's version only has to outlive the entries stamped with it; once it expires and reads as 0
+    // again, every entry written under an older version has expired too. Region generations are few
+    // and never expire.
+    private TimeSpan VersionTtl => 2 * (_options.ProductTtl > _options.CategoryTtl ? _options.ProductTtl : _options.CategoryTtl);
+
+    private TimeSpan TtlFor(string region) => region switch
+    {
+        CatalogCacheRegions.Categories => _options.CategoryTtl,
+        _ => _options.ProductTtl
+    };
+
+    private const int StampLength = 2 * sizeof(long);
+
+    // Payload layout: 8-byte generation stamp, 8-byte version stamp, then the UTF-8 JSON value
+    private static byte[] Wrap<T>(T value, long generation, long version)
+    {
+        var json = JsonSerializer.SerializeToUtf8Bytes(value, SerializerOptions);
+        var payload = new byte[StampLength + json.Length];
+        BinaryPrimitives.WriteInt64LittleEndian(payload, generation);
+        BinaryPrimitives.WriteInt64LittleEndian(payload.AsSpan(sizeof(long)), version);
+        json.CopyTo(payload, StampLength);
+        return payload;
+    }
+
+    private static bool TryUnwrap<T>(byte[] payload, long generation, long version, out T? value) where T : class
+    {
+        value = null;
+        if (payload.Length <= StampLength
+            || BinaryPrimitives.ReadInt64LittleEndian(payload) != generation
+            || BinaryPrimitives.ReadInt64LittleEndian(payload.AsSpan(sizeof(long))) != version)
+        {
+            return false;
+        }
+
+        try
+        {
+            value = JsonSerializer.Deserialize<T>(payload.AsSpan(StampLength), SerializerOptions);
+            return value != null;
+        }
+        catch (JsonException)
+        {
+            // Written by an older build with a different shape; treat as a miss and overwrite
+            return false;
+        }
+    }
+
+    private void RecordError(string region, Exception ex, string operation, string key)
+    {
+        Interlocked.Increment(ref _errors);
+        ErrorCounter.Add(1, new KeyValuePair<string, object?>("region", region));
+        _logger.LogWarning(ex, "Catalog cache {Operation} failed for {Key}; using the database", operation, key);
+    }
+}
@@ -0,0 +1,49 @@
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.DependencyInjection.Extensions;
+using NationalClothingStore.Application.Interfaces;
+using StackExchange.Redis;
+
+namespace NationalClothingStore.Infrastructure.Caching;
+
+/// <summary>
+/// Catalog cache configuration extensions
+/// </summary>
+public static class CatalogCacheConfiguration
+{
+    /// <summary>
+    /// Registers the catalog cache: Redis when "Redis:ConnectionString" is set, otherwise the in-memory cache
+    /// </summary>
+    public static IServiceCollection AddCatalogCache(this IServiceCollection services, IConfiguration configuration)
+    {
+        services.Configure<CatalogCacheOptions>(configuration.GetSection("CatalogCache"));
+
+        var redisConnectionString = configuration["Redis:ConnectionString"];
+        if (string.IsNullOrWhiteSpace(redisConnectionString))
+        {
+            services.AddSingleton<ICatalogCache, InMemoryCatalogCache>();
+            return services;
+        }
+
+        services.AddRedisConnection(redisConnectionString);
+        services.AddSingleton<ICatalogCache, RedisCatalogCache>();
+
+        return services;
+    }
+
+    /// <summary>
+    /// Registers the Redis connection shared by the catalog and report caches
+    /// </summary>
+    internal static IServiceCollection AddRedisConnection(this IServiceCollection services, string connectionString)
+    {
+        services.TryAddSingleton<IConnectionMultiplexer>(_ =>
+        {
+            var redisOptions = ConfigurationOptions.Parse(connectionString);
+            // Start even when Redis is down; cache reads fall back to the database until it returns
+            redisOptions.AbortOnConnectFail = false;
+            return ConnectionMultiplexer.Connect(redisOptions);
+        });
+
+        return services;
+    }
+}
@@ -0,0 +1,81 @@
+using System.Collections.Concurrent;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace NationalClothingStore.Infrastructure.Caching;
+
+/// <summary>
+/// Process-local catalog cache with the same semantics as <see cref="RedisCatalogCache"/>.
+/// Used when no Redis connection is configured and as a fake in tests; values are stored
+/// serialized, so callers never share instances, exactly as with Redis.
+/// </summary>
+public class InMemoryCatalogCache(
+    IOptions<CatalogCacheOptions> options,
+    ILogger<InMemoryCatalogCache> logger,
+    TimeProvider? timeProvider = null) : CatalogCache(options, logger)
+{
+    private readonly TimeProvider _time = timeProvider ?? TimeProvider.System;
+    private readonly ConcurrentDictionary<string, (byte[] payload, DateTimeOffset expiresAt)> _entries = new();
+    private readonly ConcurrentDictionary<string, long> _generations = new();
+    private readonly ConcurrentDictionary<string, (long version, DateTimeOffset expiresAt)> _versions = new();
+
+    /// <summary>
+    /// Number of live entries, for assertions in tests
+    /// </summary>
+    public int Count => _entries.Count(entry => entry.Value.expiresAt > _time.GetUtcNow());
+
+    protected override Task<(long generation, long version, byte[]? payload)> ReadAsync(
+        string generationKey,
+        string versionKey,
+        string entryKey,
+        CancellationToken cancellationToken)
+    {
+        var generation = _generations.GetValueOrDefault(generationKey);
+        var version = _versions.TryGetValue(versionKey, out var counter) && counter.expiresAt > _time.GetUtcNow()
+            ? counter.version
+            : 0;
+        if (_entries.TryGetValue(entryKey, out var entry))
+        {
+            if (entry.expiresAt > _time.GetUtcNow())
+            {
+                return Task.FromResult<(long, long, byte[]?)>((generation, version, entry.payload));
+            }
+
+            _entries.TryRemove(new KeyValuePair<string, (byte[], DateTimeOffset)>(entryKey, entry));
+        }
+
+        return Task.FromResult<(long, long, byte[]?)>((generation, version, null));
+    }
+
+    protected override Task WriteAsync(string entryKey, byte[] payload, TimeSpan ttl, CancellationToken cancellationToken)
+    {
+        _entries[entryKey] = (payload, _time.GetUtcNow() + ttl);
+        return Task.CompletedTask;
+    }
+
+    protected override Task DeleteAsync(IReadOnlyList<string> entryKeys, CancellationToken cancellationToken)
+    {
+        foreach (var key in entryKeys)
+        {
+            _entries.TryRemove(key, out _);
+        }
+
+        return Task.CompletedTask;
+    }
+
+    protected override Task IncrementAsync(string counterKey, TimeSpan? ttl, CancellationToken cancellationToken)
+    {
+        if (ttl == null)
+        {
+            _generations.AddOrUpdate(counterKey, 1, (_, generation) => generation + 1);
+            return Task.CompletedTask;
+        }
+
+        var now = _time.GetUtcNow();
+        _versions.AddOrUpdate(
+            counterKey,
+            _ => (1, now + ttl.Value),
+            (_, counter) => (counter.expiresAt > now ? counter.version + 1 : 1, now + ttl.Value));
+        return Task.CompletedTask;
+    }
+}
@@ -0,0 +1,54 @@
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using StackExchange.Redis;
+
+namespace NationalClothingStore.Infrastructure.Caching;
+
+/// <summary>
+/// Catalog cache backed by Redis, so every API replica shares entries and invalidations
+/// </summary>
+public class RedisCatalogCache(
+    IConnectionMultiplexer redis,
+    IOptions<CatalogCacheOptions> options,
+    ILogger<RedisCatalogCache> logger) : CatalogCache(options, logger)
+{
+    protected override async Task<(long generation, long version, byte[]? payload)> ReadAsync(
+        string generationKey,
+        string versionKey,
+        string entryKey,
+        CancellationToken cancellationToken)
+    {
+        // MGET returns the generation, the version and the entry in a single round-trip
+        var values = await redis.GetDatabase().StringGetAsync(new RedisKey[] { generationKey, versionKey, entryKey });
+        var generation = values[0].HasValue ? (long)values[0] : 0;
+        var version = values[1].HasValue ? (long)values[1] : 0;
+        return (generation, version, values[2].HasValue ? (byte[]?)values[2] : null);
+    }
+
+    protected override async Task WriteAsync(string entryKey, byte[] payload, TimeSpan ttl, CancellationToken cancellationToken)
+    {
+        await redis.GetDatabase().StringSetAsync(entryKey, payload, ttl, flags: CommandFlags.FireAndForget);
+    }
+
+    protected override async Task DeleteAsync(IReadOnlyList<string> entryKeys, CancellationToken cancellationToken)
+    {
+        await redis.GetDatabase().KeyDeleteAsync(entryKeys.Select(key => (RedisKey)key).ToArray());
+    }
+
+    protected override async Task IncrementAsync(string counterKey, TimeSpan? ttl, CancellationToken cancellationToken)
+    {
+        var database = redis.GetDatabase();
+        if (ttl == null)
+        {
+            await database.StringIncrementAsync(counterKey);
+            return;
+        }
+
+        // INCR and EXPIRE go out together, so a counter is never left without its expiry
+        var transaction = database.CreateTransaction();
+        var increment = transaction.StringIncrementAsync(counterKey);
+        var expire = transaction.KeyExpireAsync(counterKey, ttl);
+        await transaction.ExecuteAsync();
+        await Task.WhenAll(increment, expire);
+    }
+}
@@ -0,0 +1,168 @@
+using System.Collections.Concurrent;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using Microsoft.Extensions.Caching.Distributed;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using NationalClothingStore.Application.Interfaces;
+
+namespace NationalClothingStore.Infrastructure.Caching;
+
+/// <summary>
+/// Report cache settings, bound from the "ReportCache" configuration section
+/// </summary>
+public class ReportCacheOptions
+{
+    public string KeyPrefix { get; set; } = "reports";
+    public TimeSpan Ttl { get; set; } = TimeSpan.FromMinutes(10);
+}
+
+/// <summary>
+/// Report cache on <see cref="IDistributedCache"/> (Redis across replicas, memory otherwise) with
+/// in-process single-flight: however many requests arrive for one key, each replica generates it once
+/// </summary>
+public class ReportCache(
+    IDistributedCache cache,
+    IOptions<ReportCacheOptions> options,
+    ILogger<ReportCache> logger) : IReportCache
+{
+    private static readonly JsonSerializerOptions SerializerOptions = new(JsonSerializerDefaults.Web)
+    {
+        ReferenceHandler = ReferenceHandler.IgnoreCycles
+    };
+
+    private readonly ReportCacheOptions _options = options.Value;
+    private readonly ConcurrentDictionary<string, Lazy<Task<object>>> _inFlight = new();
+
+    public async Task<T> GetOrCreateAsync<T>(
+        string key,
+        IReadOnlyCollection<string> dataSets,
+        Func<CancellationToken, Task<T>> factory,
+        CancellationToken cancellationToken = default) where T : class
+    {
+        var versionedKey = await VersionedKeyAsync(key, dataSets, cancellationToken);
+        var flightKey = versionedKey ?? $"{_options.KeyPrefix}:uncached:{key}";
+
+        var flight = _inFlight.GetOrAdd(
+            flightKey,
+            k => new Lazy<Task<object>>(() => LoadAsync(k, versionedKey != null, factory)));
+
+        // Waiters can give up individually; the shared generation keeps running for the others
+        return (T)await flight.Value.WaitAsync(cancellationToken);
+    }
+
+    public async Task BumpDataVersionAsync(IEnumerable<string> dataSets, CancellationToken cancellationToken = default)
+    {
+        foreach (var dataSet in dataSets.Distinct())
+        {
+            try
+            {
+                // A fresh random version rather than INCR: IDistributedCache has no atomic increment,
+                // and two concurrent bumps only need to produce *a* new version, not distinct ones
+                await cache.SetStringAsync(VersionKey(dataSet), Guid.NewGuid().ToString("N"), cancellationToken);
+            }
+            catch (Exception ex) when (ex is not OperationCanceledException)
+            {
+                // Reports for this data set may be served stale until their TTL runs out
+                logger.LogWarning(ex, "Failed to bump report data version for {DataSet}", dataSet);
+            }
+        }
+    }
+
+    public void BumpDataVersion(IEnumerable<string> dataSets)
+    {
+        foreach (var dataSet in dataSets.Distinct())
+        {
+            try
+            {
+                cache.SetString(VersionKey(dataSet), Guid.NewGuid().ToString("N"));
+            }
+            catch (Exception ex)
+            {
+                logger.LogWarning(ex, "Failed to bump report data version for {DataSet}", dataSet);
+            }
+        }
+    }
+
+    private async Task<object> LoadAsync<T>(string flightKey, bool useCache, Func<CancellationToken, Task<T>> factory)
+        where T : class
+    {
+        try
+        {
+            if (useCache)
+            {
+                var cached = await TryGetAsync<T>(flightKey);
+                if (cached != null)
+                {
+                    return cached;
+                }
+            }
+
+            // Not tied to any caller's token: other requests may be waiting on this result
+            var report = await factory(CancellationToken.None);
+
+            if (useCache)
+            {
+                await TrySetAsync(flightKey, report);
+            }
+
+            return report;
+        }
+        finally
+        {
+            _inFlight.TryRemove(flightKey, out _);
+        }
+    }
+
+    private async Task<string?> VersionedKeyAsync(string key, IReadOnlyCollection<string> dataSets, CancellationToken cancellationToken)
+    {
+        try
+        {
+            var versions = new List<string>();
+            foreach (var dataSet in dataSets.Distinct().Order())
+            {
+                var version = await cache.GetStringAsync(VersionKey(dataSet), cancellationToken) ?? "0";
+                versions.Add($"{dataSet}={version}");
+            }
+
+            return $"{_options.KeyPrefix}:{key}:{string.Join(",", versions)}";
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            logger.LogWarning(ex, "Report cache unavailable; generating {Key} without it", key);
+            return null;
+        }
+    }
+
+    private async Task<T?> TryGetAsync<T>(string key) where T : class
+    {
+        try
+        {
+            var payload = await cache.GetAsync(key);
+            return payload == null ? null : JsonSerializer.Deserialize<T>(payload, SerializerOptions);
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            logger.LogWarning(ex, "Could not read cached report {Key}", key);
+            return null;
+        }
+    }
+
+    private async Task TrySetAsync<T>(string key, T report)
+    {
+        try
+        {
+            var payload = JsonSerializer.SerializeToUtf8Bytes(report, SerializerOptions);
+            await cache.SetAsync(key, payload, new DistributedCacheEntryOptions
+            {
+                AbsoluteExpirationRelativeToNow = _options.Ttl
+            });
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            logger.LogWarning(ex, "Could not cache report {Key}", key);
+        }
+    }
+
+    private string VersionKey(string dataSet) => $"{_options.KeyPrefix}:version:{dataSet}";
+}
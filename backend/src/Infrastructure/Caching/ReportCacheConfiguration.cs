@@ -0,0 +1,44 @@
+using Microsoft.EntityFrameworkCore.Diagnostics;
+using Microsoft.Extensions.Caching.StackExchangeRedis;
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using NationalClothingStore.Application.Interfaces;
+using NationalClothingStore.Infrastructure.Data;
+using StackExchange.Redis;
+
+namespace NationalClothingStore.Infrastructure.Caching;
+
+/// <summary>
+/// Report cache configuration extensions
+/// </summary>
+public static class ReportCacheConfiguration
+{
+    /// <summary>
+    /// Registers the report cache over Redis when "Redis:ConnectionString" is set (entries shared by all
+    /// replicas), otherwise over process memory, plus the SaveChanges hook that invalidates it
+    /// </summary>
+    public static IServiceCollection AddReportCache(this IServiceCollection services, IConfiguration configuration)
+    {
+        services.Configure<ReportCacheOptions>(configuration.GetSection("ReportCache"));
+
+        var redisConnectionString = configuration["Redis:ConnectionString"];
+        if (string.IsNullOrWhiteSpace(redisConnectionString))
+        {
+            services.AddDistributedMemoryCache();
+        }
+        else
+        {
+            services.AddRedisConnection(redisConnectionString);
+            services.AddStackExchangeRedisCache(_ => { });
+            services.AddOptions<RedisCacheOptions>()
+                .Configure<IServiceProvider>((options, serviceProvider) =>
+                    options.ConnectionMultiplexerFactory = () =>
+                        Task.FromResult(serviceProvider.GetRequiredService<IConnectionMultiplexer>()));
+        }
+
+        services.AddSingleton<IReportCache, ReportCache>();
+        services.AddSingleton<IInterceptor, ReportDataVersionInterceptor>();
+
+        return services;
+    }
+}
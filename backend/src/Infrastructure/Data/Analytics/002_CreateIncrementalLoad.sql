@@ -0,0 +1,716 @@
+-- Migration: Incremental Load Into the Analytics Data Warehouse
+-- Version: 002
+-- Description: Watermark-based loaders that upsert new and changed operational rows into the
+--              dimension and fact tables created by 001_CreateAnalyticsDataWarehouse.sql
+
+-- Load position per source table: the (modified timestamp, Id) of the last row loaded. Sources are read
+-- in that order, so ties on the timestamp are neither skipped nor loaded twice.
+CREATE TABLE IF NOT EXISTS "analytics"."EtlWatermarks" (
+    "SourceTable" VARCHAR(100) PRIMARY KEY,
+    "LastModifiedAt" TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT '-infinity',
+    "LastSourceId" UUID NOT NULL DEFAULT '00000000-0000-0000-0000-000000000000',
+    "RowsLoaded" BIGINT NOT NULL DEFAULT 0,
+    "LastRunAt" TIMESTAMP WITH TIME ZONE
+);
+
+-- Fact rows are keyed by the operational row they were loaded from, so reloading a changed row updates it
+ALTER TABLE "analytics"."SalesFact" ADD COLUMN IF NOT EXISTS "SourceId" UUID;
+ALTER TABLE "analytics"."InventoryFact" ADD COLUMN IF NOT EXISTS "SourceId" UUID;
+ALTER TABLE "analytics"."ProcurementFact" ADD COLUMN IF NOT EXISTS "SourceId" UUID;
+ALTER TABLE "analytics"."CustomerLoyaltyFact" ADD COLUMN IF NOT EXISTS "SourceId" UUID;
+
+CREATE UNIQUE INDEX IF NOT EXISTS "UX_SalesFact_SourceId" ON "analytics"."SalesFact"("SourceId");
+CREATE UNIQUE INDEX IF NOT EXISTS "UX_InventoryFact_SourceId" ON "analytics"."InventoryFact"("SourceId");
+CREATE UNIQUE INDEX IF NOT EXISTS "UX_ProcurementFact_SourceId" ON "analytics"."ProcurementFact"("SourceId");
+CREATE UNIQUE INDEX IF NOT EXISTS "UX_CustomerLoyaltyFact_SourceId" ON "analytics"."CustomerLoyaltyFact"("SourceId");
+
+CREATE INDEX IF NOT EXISTS "IX_SalesFact_TransactionId" ON "analytics"."SalesFact"("TransactionId");
+CREATE INDEX IF NOT EXISTS "IX_ProcurementFact_PurchaseOrderId" ON "analytics"."ProcurementFact"("PurchaseOrderId");
+
+-- The movement ledger records quantities moved, not the stock level either side of the move
+ALTER TABLE "analytics"."InventoryFact" ALTER COLUMN "QuantityBefore" DROP NOT NULL;
+ALTER TABLE "analytics"."InventoryFact" ALTER COLUMN "QuantityAfter" DROP NOT NULL;
+
+-- Key of the "Unknown" member of each dimension, used when a fact has no (or a not yet loaded) reference
+CREATE OR REPLACE FUNCTION "analytics"."UnknownMember"()
+RETURNS UUID
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT '00000000-0000-0000-0000-000000000000'::uuid
+$$;
+
+CREATE OR REPLACE FUNCTION "analytics"."DateKeyOf"(ts TIMESTAMP WITH TIME ZONE)
+RETURNS INTEGER
+LANGUAGE sql STABLE AS $$
+    SELECT to_char(ts AT TIME ZONE 'UTC', 'YYYYMMDD')::integer
+$$;
+
+INSERT INTO "analytics"."ProductDimension" ("ProductKey", "ProductId", "ProductName", "ProductSku", "IsActive", "CreatedDate", "StartDate")
+VALUES ("analytics"."UnknownMember"(), "analytics"."UnknownMember"(), 'Unknown', 'UNKNOWN', FALSE, NOW(), DATE '1900-01-01')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO "analytics"."CustomerDimension" ("CustomerKey", "CustomerId", "CustomerFirstName", "IsActive", "CreatedDate", "StartDate")
+VALUES ("analytics"."UnknownMember"(), "analytics"."UnknownMember"(), 'Unknown', FALSE, NOW(), DATE '1900-01-01')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO "analytics"."LocationDimension" ("LocationKey", "LocationId", "LocationName", "LocationType", "IsActive", "CreatedDate", "StartDate")
+VALUES ("analytics"."UnknownMember"(), "analytics"."UnknownMember"(), 'Unknown', 'Unknown', FALSE, NOW(), DATE '1900-01-01')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO "analytics"."SupplierDimension" ("SupplierKey", "SupplierId", "SupplierName", "IsActive", "CreatedDate", "StartDate")
+VALUES ("analytics"."UnknownMember"(), "analytics"."UnknownMember"(), 'Unknown', FALSE, NOW(), DATE '1900-01-01')
+ON CONFLICT DO NOTHING;
+
+-- Procedure to populate date dimension
+CREATE OR REPLACE FUNCTION "analytics"."PopulateDateDimension"(start_date DATE, end_date DATE)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO "analytics"."DateDimension" (
+        "DateKey", "FullDate", "DayOfMonth", "DayOfYear", "WeekOfYear", "Month", "Quarter", "Year",
+        "DayName", "MonthName", "QuarterName", "IsWeekend", "IsWeekday", "IsMonthEnd", "IsQuarterEnd", "IsYearEnd", "Season")
+    SELECT
+        to_char(d, 'YYYYMMDD')::integer,
+        d,
+        extract(day FROM d)::integer,
+        extract(doy FROM d)::integer,
+        extract(week FROM d)::integer,
+        extract(month FROM d)::integer,
+        extract(quarter FROM d)::integer,
+        extract(year FROM d)::integer,
+        trim(to_char(d, 'Day')),
+        trim(to_char(d, 'Month')),
+        'Q' || extract(quarter FROM d),
+        extract(isodow FROM d) IN (6, 7),
+        extract(isodow FROM d) NOT IN (6, 7),
+        d = (date_trunc('month', d) + interval '1 month - 1 day')::date,
+        d = (date_trunc('quarter', d) + interval '3 months - 1 day')::date,
+        extract(month FROM d) = 12 AND extract(day FROM d) = 31,
+        CASE
+            WHEN extract(month FROM d) IN (12, 1, 2) THEN 'Winter'
+            WHEN extract(month FROM d) IN (3, 4, 5) THEN 'Spring'
+            WHEN extract(month FROM d) IN (6, 7, 8) THEN 'Summer'
+            ELSE 'Autumn'
+        END
+    FROM generate_series(start_date, end_date, interval '1 day') AS series(day)
+    CROSS JOIN LATERAL (SELECT series.day::date AS d) AS days
+    ON CONFLICT ("DateKey") DO NOTHING;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Source views: operational rows shaped as dimension attributes
+
+CREATE OR REPLACE VIEW "analytics"."ProductSource" AS
+SELECT
+    p."Id" AS "ProductId",
+    left(p."Name", 255) AS "ProductName",
+    left(p."SKU", 100) AS "ProductSku",
+    left(coalesce(parent."Name", c."Name"), 100) AS "ProductCategory",
+    CASE WHEN parent."Id" IS NOT NULL THEN left(c."Name", 100) END AS "ProductSubcategory",
+    left(p."Brand", 100) AS "Brand",
+    left(p."Color", 50) AS "Color",
+    left(p."Material", 100) AS "Material",
+    p."BasePrice" AS "Price",
+    p."CostPrice" AS "Cost",
+    p."BasePrice" - p."CostPrice" AS "Margin",
+    p."IsActive",
+    p."CreatedAt" AS "CreatedDate",
+    p."UpdatedAt" AS "ModifiedDate"
+FROM "Products" p
+LEFT JOIN "Categories" c ON c."Id" = p."CategoryId"
+LEFT JOIN "Categories" parent ON parent."Id" = c."ParentCategoryId";
+
+CREATE OR REPLACE VIEW "analytics"."CustomerSource" AS
+SELECT
+    c."Id" AS "CustomerId",
+    left(c."FirstName", 100) AS "CustomerFirstName",
+    left(c."LastName", 100) AS "CustomerLastName",
+    left(c."Email", 255) AS "CustomerEmail",
+    left(c."PhoneNumber", 20) AS "CustomerPhone",
+    left(c."City", 100) AS "CustomerCity",
+    left(c."State", 100) AS "CustomerState",
+    left(c."Country", 100) AS "CustomerCountry",
+    left(c."PostalCode", 20) AS "CustomerPostalCode",
+    CASE WHEN cl."Id" IS NULL THEN 'Standard' ELSE 'Loyalty' END AS "CustomerSegment",
+    left(cl."Tier", 20) AS "CustomerTier",
+    c."CreatedAt"::date AS "RegistrationDate",
+    c."DateOfBirth"::date AS "BirthDate",
+    left(c."Gender", 10) AS "Gender",
+    CASE
+        WHEN c."DateOfBirth" IS NULL THEN NULL
+        WHEN age(c."DateOfBirth") < interval '18 years' THEN 'Under 18'
+        WHEN age(c."DateOfBirth") < interval '25 years' THEN '18-24'
+        WHEN age(c."DateOfBirth") < interval '35 years' THEN '25-34'
+        WHEN age(c."DateOfBirth") < interval '45 years' THEN '35-44'
+        WHEN age(c."DateOfBirth") < interval '55 years' THEN '45-54'
+        WHEN age(c."DateOfBirth") < interval '65 years' THEN '55-64'
+        ELSE '65+'
+    END AS "AgeGroup",
+    c."IsActive",
+    c."CreatedAt" AS "CreatedDate",
+    c."UpdatedAt" AS "ModifiedDate"
+FROM "Customers" c
+LEFT JOIN "CustomerLoyalty" cl ON cl."CustomerId" = c."Id";
+
+CREATE OR REPLACE VIEW "analytics"."LocationSource" AS
+SELECT
+    'Branches'::text AS "SourceTable",
+    b."Id" AS "LocationId",
+    left(b."Name", 255) AS "LocationName",
+    'Branch'::varchar(50) AS "LocationType",
+    left(b."Code", 50) AS "LocationCode",
+    left(b."Address", 500) AS "Address",
+    left(b."City", 100) AS "City",
+    left(b."Country", 100) AS "Country",
+    b."IsActive",
+    b."CreatedAt" AS "CreatedDate",
+    b."UpdatedAt" AS "ModifiedDate"
+FROM "Branches" b
+UNION ALL
+SELECT
+    'Warehouses'::text,
+    w."Id",
+    left(w."Name", 255),
+    'Warehouse'::varchar(50),
+    left(w."Code", 50),
+    left(w."Address", 500),
+    left(w."City", 100),
+    left(w."Country", 100),
+    w."IsActive",
+    w."CreatedAt",
+    w."UpdatedAt"
+FROM "Warehouses" w;
+
+CREATE OR REPLACE VIEW "analytics"."SupplierSource" AS
+SELECT
+    s."Id" AS "SupplierId",
+    left(s."Name", 255) AS "SupplierName",
+    left(s."Code", 50) AS "SupplierCode",
+    left(s."ContactPerson", 100) AS "ContactPerson",
+    left(s."Email", 255) AS "Email",
+    left(s."Phone", 20) AS "Phone",
+    left(s."Address", 500) AS "Address",
+    left(s."City", 100) AS "City",
+    left(s."Country", 100) AS "Country",
+    left(s."PaymentTerms", 50) AS "PaymentTerms",
+    left(s."Rating", 20) AS "Rating",
+    s."IsActive",
+    s."CreatedAt" AS "CreatedDate",
+    s."UpdatedAt" AS "ModifiedDate"
+FROM "Suppliers" s;
+
+-- Claims the next batch of a source table past its watermark into the session's etl_batch table and
+-- advances the watermark. Rows modified after loaded_until are left for the next run. The watermark row
+-- stays locked until the caller's transaction commits, so concurrent loaders take turns.
+CREATE OR REPLACE FUNCTION "analytics"."ClaimEtlBatch"(source_table TEXT, modified_column TEXT, loaded_until TIMESTAMP WITH TIME ZONE, batch_size INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    watermark "analytics"."EtlWatermarks"%ROWTYPE;
+    claimed INTEGER;
+BEGIN
+    CREATE TEMP TABLE IF NOT EXISTS etl_batch ("Id" UUID PRIMARY KEY, "ModifiedAt" TIMESTAMP WITH TIME ZONE NOT NULL) ON COMMIT DELETE ROWS;
+    DELETE FROM etl_batch;
+
+    INSERT INTO "analytics"."EtlWatermarks" ("SourceTable") VALUES (source_table) ON CONFLICT DO NOTHING;
+    SELECT * INTO watermark FROM "analytics"."EtlWatermarks" WHERE "SourceTable" = source_table FOR UPDATE;
+
+    EXECUTE format(
+        'INSERT INTO etl_batch ("Id", "ModifiedAt")
+         SELECT "Id", %1$I FROM %2$I
+         WHERE (%1$I, "Id") > ($1, $2) AND %1$I <= $3
+         ORDER BY %1$I, "Id"
+         LIMIT $4',
+        modified_column, source_table)
+    USING watermark."LastModifiedAt", watermark."LastSourceId", loaded_until, batch_size;
+    GET DIAGNOSTICS claimed = ROW_COUNT;
+
+    IF claimed > 0 THEN
+        UPDATE "analytics"."EtlWatermarks"
+        SET ("LastModifiedAt", "LastSourceId") = (
+                SELECT "ModifiedAt", "Id" FROM etl_batch ORDER BY "ModifiedAt" DESC, "Id" DESC LIMIT 1),
+            "RowsLoaded" = "RowsLoaded" + claimed,
+            "LastRunAt" = NOW()
+        WHERE "SourceTable" = source_table;
+    ELSE
+        UPDATE "analytics"."EtlWatermarks" SET "LastRunAt" = NOW() WHERE "SourceTable" = source_table;
+    END IF;
+
+    RETURN claimed;
+END $$;
+
+-- Dimension loaders. Products are overwritten in place (Type 1); customers, locations and suppliers keep
+-- history (Type 2): a changed row closes the current version and opens a new one starting today, and a
+-- version that already started today is updated in place.
+
+CREATE OR REPLACE FUNCTION "analytics"."LoadProductDimension"(loaded_until TIMESTAMP WITH TIME ZONE, batch_size INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    claimed INTEGER := "analytics"."ClaimEtlBatch"('Products', 'UpdatedAt', loaded_until, batch_size);
+BEGIN
+    INSERT INTO "analytics"."ProductDimension" (
+        "ProductId", "ProductName", "ProductSku", "ProductCategory", "ProductSubcategory", "Brand", "Color",
+        "Material", "Price", "Cost", "Margin", "IsActive", "CreatedDate", "ModifiedDate")
+    SELECT
+        s."ProductId", s."ProductName", s."ProductSku", s."ProductCategory", s."ProductSubcategory", s."Brand", s."Color",
+        s."Material", s."Price", s."Cost", s."Margin", s."IsActive", s."CreatedDate", s."ModifiedDate"
+    FROM etl_batch b
+    JOIN "analytics"."ProductSource" s ON s."ProductId" = b."Id"
+    ON CONFLICT ("ProductId") DO UPDATE SET
+        "ProductName" = EXCLUDED."ProductName",
+        "ProductSku" = EXCLUDED."ProductSku",
+        "ProductCategory" = EXCLUDED."ProductCategory",
+        "ProductSubcategory" = EXCLUDED."ProductSubcategory",
+        "Brand" = EXCLUDED."Brand",
+        "Color" = EXCLUDED."Color",
+        "Material" = EXCLUDED."Material",
+        "Price" = EXCLUDED."Price",
+        "Cost" = EXCLUDED."Cost",
+        "Margin" = EXCLUDED."Margin",
+        "IsActive" = EXCLUDED."IsActive",
+        "ModifiedDate" = EXCLUDED."ModifiedDate";
+
+    RETURN claimed;
+END $$;
+
+CREATE OR REPLACE FUNCTION "analytics"."LoadCustomerDimension"(loaded_until TIMESTAMP WITH TIME ZONE, batch_size INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    claimed INTEGER := "analytics"."ClaimEtlBatch"('Customers', 'UpdatedAt', loaded_until, batch_size);
+BEGIN
+    UPDATE "analytics"."CustomerDimension" d
+    SET "EndDate" = CURRENT_DATE, "IsCurrent" = FALSE
+    FROM etl_batch b
+    JOIN "analytics"."CustomerSource" s ON s."CustomerId" = b."Id"
+    WHERE d."CustomerId" = s."CustomerId" AND d."IsCurrent" AND d."StartDate" < CURRENT_DATE
+      AND (d."CustomerFirstName", d."CustomerLastName", d."CustomerEmail", d."CustomerPhone", d."CustomerCity",
+           d."CustomerState", d."CustomerCountry", d."CustomerPostalCode", d."CustomerSegment", d."CustomerTier",
+           d."BirthDate", d."Gender", d."AgeGroup", d."IsActive")
+          IS DISTINCT FROM
+          (s."CustomerFirstName", s."CustomerLastName", s."CustomerEmail", s."CustomerPhone", s."CustomerCity",
+           s."CustomerState", s."CustomerCountry", s."CustomerPostalCode", s."CustomerSegment", s."CustomerTier",
+           s."BirthDate", s."Gender", s."AgeGroup", s."IsActive");
+
+    INSERT INTO "analytics"."CustomerDimension" (
+        "CustomerId", "CustomerFirstName", "CustomerLastName", "CustomerEmail", "CustomerPhone", "CustomerCity",
+        "CustomerState", "CustomerCountry", "CustomerPostalCode", "CustomerSegment", "CustomerTier",
+        "RegistrationDate", "BirthDate", "Gender", "AgeGroup", "IsActive", "CreatedDate", "ModifiedDate", "StartDate")
+    SELECT
+        s."CustomerId", s."CustomerFirstName", s."CustomerLastName", s."CustomerEmail", s."CustomerPhone", s."CustomerCity",
+        s."CustomerState", s."CustomerCountry", s."CustomerPostalCode", s."CustomerSegment", s."CustomerTier",
+        s."RegistrationDate", s."BirthDate", s."Gender", s."AgeGroup", s."IsActive", s."CreatedDate", s."ModifiedDate", CURRENT_DATE
+    FROM etl_batch b
+    JOIN "analytics"."CustomerSource" s ON s."CustomerId" = b."Id"
+    WHERE NOT EXISTS (
+        SELECT 1 FROM "analytics"."CustomerDimension" d
+        WHERE d."CustomerId" = s."CustomerId" AND d."IsCurrent" AND d."StartDate" < CURRENT_DATE)
+    ON CONFLICT ("CustomerId", "StartDate") DO UPDATE SET
+        "CustomerFirstName" = EXCLUDED."CustomerFirstName",
+        "CustomerLastName" = EXCLUDED."CustomerLastName",
+        "CustomerEmail" = EXCLUDED."CustomerEmail",
+        "CustomerPhone" = EXCLUDED."CustomerPhone",
+        "CustomerCity" = EXCLUDED."CustomerCity",
+        "CustomerState" = EXCLUDED."CustomerState",
+        "CustomerCountry" = EXCLUDED."CustomerCountry",
+        "CustomerPostalCode" = EXCLUDED."CustomerPostalCode",
+        "CustomerSegment" = EXCLUDED."CustomerSegment",
+        "CustomerTier" = EXCLUDED."CustomerTier",
+        "BirthDate" = EXCLUDED."BirthDate",
+        "Gender" = EXCLUDED."Gender",
+        "AgeGroup" = EXCLUDED."AgeGroup",
+        "IsActive" = EXCLUDED."IsActive",
+        "ModifiedDate" = EXCLUDED."ModifiedDate",
+        "EndDate" = NULL,
+        "IsCurrent" = TRUE;
+
+    RETURN claimed;
+END $$;
+
+-- Branches and warehouses share the location dimension but are separate sources with their own watermarks
+CREATE OR REPLACE FUNCTION "analytics"."LoadLocationDimension"(source_table TEXT, loaded_until TIMESTAMP WITH TIME ZONE, batch_size INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    claimed INTEGER := "analytics"."ClaimEtlBatch"(source_table, 'UpdatedAt', loaded_until, batch_size);
+BEGIN
+    UPDATE "analytics"."LocationDimension" d
+    SET "EndDate" = CURRENT_DATE, "IsCurrent" = FALSE
+    FROM etl_batch b
+    JOIN "analytics"."LocationSource" s ON s."LocationId" = b."Id" AND s."SourceTable" = source_table
+    WHERE d."LocationId" = s."LocationId" AND d."IsCurrent" AND d."StartDate" < CURRENT_DATE
+      AND (d."LocationName", d."LocationType", d."LocationCode", d."Address", d."City", d."Country", d."IsActive")
+          IS DISTINCT FROM
+          (s."LocationName", s."LocationType", s."LocationCode", s."Address", s."City", s."Country", s."IsActive");
+
+    INSERT INTO "analytics"."LocationDimension" (
+        "LocationId", "LocationName", "LocationType", "LocationCode", "Address", "City", "Country",
+        "IsActive", "CreatedDate", "ModifiedDate", "StartDate")
+    SELECT
+        s."LocationId", s."LocationName", s."LocationType", s."LocationCode", s."Address", s."City", s."Country",
+        s."IsActive", s."CreatedDate", s."ModifiedDate", CURRENT_DATE
+    FROM etl_batch b
+    JOIN "analytics"."LocationSource" s ON s."LocationId" = b."Id" AND s."SourceTable" = source_table
+    WHERE NOT EXISTS (
+        SELECT 1 FROM "analytics"."LocationDimension" d
+        WHERE d."LocationId" = s."LocationId" AND d."IsCurrent" AND d."StartDate" < CURRENT_DATE)
+    ON CONFLICT ("LocationId", "StartDate") DO UPDATE SET
+        "LocationName" = EXCLUDED."LocationName",
+        "LocationType" = EXCLUDED."LocationType",
+        "LocationCode" = EXCLUDED."LocationCode",
+        "Address" = EXCLUDED."Address",
+        "City" = EXCLUDED."City",
+        "Country" = EXCLUDED."Country",
+        "IsActive" = EXCLUDED."IsActive",
+        "ModifiedDate" = EXCLUDED."ModifiedDate",
+        "EndDate" = NULL,
+        "IsCurrent" = TRUE;
+
+    RETURN claimed;
+END $$;
+
+CREATE OR REPLACE FUNCTION "analytics"."LoadSupplierDimension"(loaded_until TIMESTAMP WITH TIME ZONE, batch_size INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    claimed INTEGER := "analytics"."ClaimEtlBatch"('Suppliers', 'UpdatedAt', loaded_until, batch_size);
+BEGIN
+    UPDATE "analytics"."SupplierDimension" d
+    SET "EndDate" = CURRENT_DATE, "IsCurrent" = FALSE
+    FROM etl_batch b
+    JOIN "analytics"."SupplierSource" s ON s."SupplierId" = b."Id"
+    WHERE d."SupplierId" = s."SupplierId" AND d."IsCurrent" AND d."StartDate" < CURRENT_DATE
+      AND (d."SupplierName", d."SupplierCode", d."ContactPerson", d."Email", d."Phone", d."Address", d."City",
+           d."Country", d."PaymentTerms", d."Rating", d."IsActive")
+          IS DISTINCT FROM
+          (s."SupplierName", s."SupplierCode", s."ContactPerson", s."Email", s."Phone", s."Address", s."City",
+           s."Country", s."PaymentTerms", s."Rating", s."IsActive");
+
+    INSERT INTO "analytics"."SupplierDimension" (
+        "SupplierId", "SupplierName", "SupplierCode", "ContactPerson", "Email", "Phone", "Address", "City",
+        "Country", "PaymentTerms", "Rating", "IsActive", "CreatedDate", "ModifiedDate", "StartDate")
+    SELECT
+        s."SupplierId", s."SupplierName", s."SupplierCode", s."ContactPerson", s."Email", s."Phone", s."Address", s."City",
+        s."Country", s."PaymentTerms", s."Rating", s."IsActive", s."CreatedDate", s."ModifiedDate", CURRENT_DATE
+    FROM etl_batch b
+    JOIN "analytics"."SupplierSource" s ON s."SupplierId" = b."Id"
+    WHERE NOT EXISTS (
+        SELECT 1 FROM "analytics"."SupplierDimension" d
+        WHERE d."SupplierId" = s."SupplierId" AND d."IsCurrent" AND d."StartDate" < CURRENT_DATE)
+    ON CONFLICT ("SupplierId", "StartDate") DO UPDATE SET
+        "SupplierName" = EXCLUDED."SupplierName",
+        "SupplierCode" = EXCLUDED."SupplierCode",
+        "ContactPerson" = EXCLUDED."ContactPerson",
+        "Email" = EXCLUDED."Email",
+        "Phone" = EXCLUDED."Phone",
+        "Address" = EXCLUDED."Address",
+        "City" = EXCLUDED."City",
+        "Country" = EXCLUDED."Country",
+        "PaymentTerms" = EXCLUDED."PaymentTerms",
+        "Rating" = EXCLUDED."Rating",
+        "IsActive" = EXCLUDED."IsActive",
+        "ModifiedDate" = EXCLUDED."ModifiedDate",
+        "EndDate" = NULL,
+        "IsCurrent" = TRUE;
+
+    RETURN claimed;
+END $$;
+
+-- Fact loaders. New facts reference the dimension versions current at load time; reloading a changed
+-- row updates its measures and statuses but keeps the dimension versions it was first loaded against.
+
+CREATE OR REPLACE FUNCTION "analytics"."LoadSalesFact"(loaded_until TIMESTAMP WITH TIME ZONE, batch_size INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    claimed INTEGER := "analytics"."ClaimEtlBatch"('SalesTransactions', 'UpdatedAt', loaded_until, batch_size);
+    first_day DATE;
+    last_day DATE;
+BEGIN
+    IF claimed = 0 THEN
+        RETURN 0;
+    END IF;
+
+    SELECT min(st."CreatedAt" AT TIME ZONE 'UTC')::date, max(st."CreatedAt" AT TIME ZONE 'UTC')::date
+    INTO first_day, last_day
+    FROM etl_batch b
+    JOIN "SalesTransactions" st ON st."Id" = b."Id";
+    PERFORM "analytics"."PopulateDateDimension"(first_day, last_day);
+
+    -- Lines removed from a transaction since it was last loaded
+    DELETE FROM "analytics"."SalesFact" f
+    USING etl_batch b
+    WHERE f."TransactionId" = b."Id"
+      AND NOT EXISTS (SELECT 1 FROM "SalesTransactionItems" i WHERE i."Id" = f."SourceId");
+
+    INSERT INTO "analytics"."SalesFact" (
+        "SourceId", "DateKey", "ProductKey", "CustomerKey", "LocationKey", "TransactionId", "TransactionNumber",
+        "TransactionType", "Quantity", "UnitPrice", "TotalAmount", "DiscountAmount", "TaxAmount", "NetAmount",
+        "CostAmount", "GrossProfit", "MarginPercentage", "PaymentMethod", "PaymentStatus", "RefundAmount",
+        "ReturnQuantity", "CreatedDate")
+    SELECT
+        i."Id",
+        "analytics"."DateKeyOf"(st."CreatedAt"),
+        coalesce(pd."ProductKey", "analytics"."UnknownMember"()),
+        coalesce(cd."CustomerKey", "analytics"."UnknownMember"()),
+        coalesce(ld."LocationKey", "analytics"."UnknownMember"()),
+        st."Id",
+        left(st."TransactionNumber", 50),
+        left(st."TransactionType", 50),
+        i."Quantity",
+        i."UnitPrice",
+        i."Quantity" * i."UnitPrice",
+        i."DiscountAmount",
+        i."TaxAmount",
+        i."TotalPrice",
+        amounts.cost,
+        i."TotalPrice" - amounts.cost,
+        CASE WHEN i."TotalPrice" <> 0
+             THEN least(greatest(round((i."TotalPrice" - amounts.cost) / i."TotalPrice" * 100, 2), -999.99), 999.99)
+        END,
+        left(payment."PaymentMethod", 50),
+        left(st."Status", 20),
+        CASE WHEN st."TransactionType" = 'RETURN' THEN i."TotalPrice" ELSE 0 END,
+        CASE WHEN st."TransactionType" = 'RETURN' THEN i."Quantity" ELSE 0 END,
+        st."CreatedAt"
+    FROM etl_batch b
+    JOIN "SalesTransactions" st ON st."Id" = b."Id"
+    JOIN "SalesTransactionItems" i ON i."SalesTransactionId" = st."Id"
+    LEFT JOIN "Inventories" inv ON inv."Id" = i."InventoryId"
+    LEFT JOIN "Products" p ON p."Id" = i."ProductId"
+    LEFT JOIN "analytics"."ProductDimension" pd ON pd."ProductId" = i."ProductId"
+    LEFT JOIN "analytics"."CustomerDimension" cd ON cd."CustomerId" = st."CustomerId" AND cd."IsCurrent"
+    LEFT JOIN "analytics"."LocationDimension" ld ON ld."LocationId" = st."BranchId" AND ld."IsCurrent"
+    LEFT JOIN LATERAL (
+        SELECT pay."PaymentMethod"
+        FROM "SalesTransactionPayments" pay
+        WHERE pay."SalesTransactionId" = st."Id"
+        ORDER BY pay."Amount" DESC
+        LIMIT 1) payment ON TRUE
+    CROSS JOIN LATERAL (SELECT i."Quantity" * coalesce(inv."UnitCost", p."CostPrice", 0) AS cost) amounts
+    ON CONFLICT ("SourceId") DO UPDATE SET
+        "TransactionNumber" = EXCLUDED."TransactionNumber",
+        "TransactionType" = EXCLUDED."TransactionType",
+        "Quantity" = EXCLUDED."Quantity",
+        "UnitPrice" = EXCLUDED."UnitPrice",
+        "TotalAmount" = EXCLUDED."TotalAmount",
+        "DiscountAmount" = EXCLUDED."DiscountAmount",
+        "TaxAmount" = EXCLUDED."TaxAmount",
+        "NetAmount" = EXCLUDED."NetAmount",
+        "CostAmount" = EXCLUDED."CostAmount",
+        "GrossProfit" = EXCLUDED."GrossProfit",
+        "MarginPercentage" = EXCLUDED."MarginPercentage",
+        "PaymentMethod" = EXCLUDED."PaymentMethod",
+        "PaymentStatus" = EXCLUDED."PaymentStatus",
+        "RefundAmount" = EXCLUDED."RefundAmount",
+        "ReturnQuantity" = EXCLUDED."ReturnQuantity",
+        "ProcessDate" = NOW();
+
+    RETURN claimed;
+END $$;
+
+-- Stock movements are immutable, so they are only ever inserted. Reservations and releases don't move
+-- stock and are left out.
+CREATE OR REPLACE FUNCTION "analytics"."LoadInventoryFact"(loaded_until TIMESTAMP WITH TIME ZONE, batch_size INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    claimed INTEGER := "analytics"."ClaimEtlBatch"('InventoryTransactions', 'CreatedAt', loaded_until, batch_size);
+    first_day DATE;
+    last_day DATE;
+BEGIN
+    IF claimed = 0 THEN
+        RETURN 0;
+    END IF;
+
+    SELECT min(b."ModifiedAt" AT TIME ZONE 'UTC')::date, max(b."ModifiedAt" AT TIME ZONE 'UTC')::date
+    INTO first_day, last_day
+    FROM etl_batch b;
+    PERFORM "analytics"."PopulateDateDimension"(first_day, last_day);
+
+    INSERT INTO "analytics"."InventoryFact" (
+        "SourceId", "DateKey", "ProductKey", "LocationKey", "TransactionId", "TransactionType", "QuantityChange",
+        "UnitCost", "TotalCost", "ReasonCode", "ReferenceNumber", "FromLocationKey", "ToLocationKey", "CreatedDate")
+    SELECT
+        t."Id",
+        "analytics"."DateKeyOf"(t."CreatedAt"),
+        coalesce(pd."ProductKey", "analytics"."UnknownMember"()),
+        coalesce(ld."LocationKey", "analytics"."UnknownMember"()),
+        t."Id",
+        left(t."TransactionType", 50),
+        CASE
+            WHEN t."TransactionType" IN ('IN', 'RETURN') THEN t."Quantity"
+            WHEN t."TransactionType" IN ('OUT', 'SALE') THEN -t."Quantity"
+            WHEN t."TransactionType" = 'TRANSFER' THEN
+                CASE WHEN inv."BranchId" IS NOT DISTINCT FROM t."ToBranchId"
+                      AND inv."WarehouseId" IS NOT DISTINCT FROM t."ToWarehouseId"
+                     THEN t."Quantity" ELSE -t."Quantity" END
+            -- Adjustments record the size of the correction but not its direction
+            ELSE t."Quantity"
+        END,
+        t."UnitCost",
+        t."Quantity" * t."UnitCost",
+        left(t."Reason", 50),
+        left(t."ReferenceNumber", 50),
+        from_ld."LocationKey",
+        to_ld."LocationKey",
+        t."CreatedAt"
+    FROM etl_batch b
+    JOIN "InventoryTransactions" t ON t."Id" = b."Id" AND t."CreatedAt" = b."ModifiedAt"
+    LEFT JOIN "Inventories" inv ON inv."Id" = t."InventoryId"
+    LEFT JOIN "analytics"."ProductDimension" pd ON pd."ProductId" = inv."ProductId"
+    LEFT JOIN "analytics"."LocationDimension" ld
+        ON ld."LocationId" = coalesce(inv."WarehouseId", inv."BranchId") AND ld."IsCurrent"
+    LEFT JOIN "analytics"."LocationDimension" from_ld
+        ON from_ld."LocationId" = coalesce(t."FromWarehouseId", t."FromBranchId") AND from_ld."IsCurrent"
+    LEFT JOIN "analytics"."LocationDimension" to_ld
+        ON to_ld."LocationId" = coalesce(t."ToWarehouseId", t."ToBranchId") AND to_ld."IsCurrent"
+    WHERE t."TransactionType" NOT IN ('RESERVATION', 'RELEASE')
+    ON CONFLICT ("SourceId") DO NOTHING;
+
+    RETURN claimed;
+END $$;
+
+CREATE OR REPLACE FUNCTION "analytics"."LoadProcurementFact"(loaded_until TIMESTAMP WITH TIME ZONE, batch_size INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    claimed INTEGER := "analytics"."ClaimEtlBatch"('PurchaseOrders', 'UpdatedAt', loaded_until, batch_size);
+    first_day DATE;
+    last_day DATE;
+BEGIN
+    IF claimed = 0 THEN
+        RETURN 0;
+    END IF;
+
+    SELECT min(po."OrderDate" AT TIME ZONE 'UTC')::date, max(po."OrderDate" AT TIME ZONE 'UTC')::date
+    INTO first_day, last_day
+    FROM etl_batch b
+    JOIN "PurchaseOrders" po ON po."Id" = b."Id";
+    PERFORM "analytics"."PopulateDateDimension"(first_day, last_day);
+
+    -- Lines removed from an order since it was last loaded
+    DELETE FROM "analytics"."ProcurementFact" f
+    USING etl_batch b
+    WHERE f."PurchaseOrderId" = b."Id"
+      AND NOT EXISTS (SELECT 1 FROM "PurchaseOrderItems" i WHERE i."Id" = f."SourceId");
+
+    INSERT INTO "analytics"."ProcurementFact" (
+        "SourceId", "DateKey", "ProductKey", "SupplierKey", "LocationKey", "PurchaseOrderId", "OrderNumber",
+        "OrderStatus", "Quantity", "UnitPrice", "TotalAmount", "DiscountAmount", "NetAmount", "ReceivedQuantity",
+        "PendingQuantity", "ExpectedDeliveryDate", "ActualDeliveryDate", "DeliveryDaysLate", "PaymentTerms",
+        "PaymentStatus", "CreatedDate")
+    SELECT
+        i."Id",
+        "analytics"."DateKeyOf"(po."OrderDate"),
+        coalesce(pd."ProductKey", "analytics"."UnknownMember"()),
+        coalesce(sd."SupplierKey", "analytics"."UnknownMember"()),
+        coalesce(ld."LocationKey", "analytics"."UnknownMember"()),
+        po."Id",
+        left(po."OrderNumber", 50),
+        left(po."Status", 50),
+        i."Quantity",
+        i."UnitPrice",
+        i."Quantity" * i."UnitPrice",
+        i."DiscountAmount",
+        i."TotalPrice",
+        i."ReceivedQuantity",
+        greatest(i."Quantity" - i."ReceivedQuantity", 0),
+        (po."ExpectedDeliveryDate" AT TIME ZONE 'UTC')::date,
+        (po."ReceivedDate" AT TIME ZONE 'UTC')::date,
+        (po."ReceivedDate" AT TIME ZONE 'UTC')::date - (po."ExpectedDeliveryDate" AT TIME ZONE 'UTC')::date,
+        left(s."PaymentTerms", 50),
+        left(po."PaymentStatus", 20),
+        po."CreatedAt"
+    FROM etl_batch b
+    JOIN "PurchaseOrders" po ON po."Id" = b."Id"
+    JOIN "PurchaseOrderItems" i ON i."PurchaseOrderId" = po."Id"
+    LEFT JOIN "Suppliers" s ON s."Id" = po."SupplierId"
+    LEFT JOIN "analytics"."ProductDimension" pd ON pd."ProductId" = i."ProductId"
+    LEFT JOIN "analytics"."SupplierDimension" sd ON sd."SupplierId" = po."SupplierId" AND sd."IsCurrent"
+    LEFT JOIN "analytics"."LocationDimension" ld ON ld."LocationId" = po."WarehouseId" AND ld."IsCurrent"
+    ON CONFLICT ("SourceId") DO UPDATE SET
+        "OrderStatus" = EXCLUDED."OrderStatus",
+        "Quantity" = EXCLUDED."Quantity",
+        "UnitPrice" = EXCLUDED."UnitPrice",
+        "TotalAmount" = EXCLUDED."TotalAmount",
+        "DiscountAmount" = EXCLUDED."DiscountAmount",
+        "NetAmount" = EXCLUDED."NetAmount",
+        "ReceivedQuantity" = EXCLUDED."ReceivedQuantity",
+        "PendingQuantity" = EXCLUDED."PendingQuantity",
+        "ExpectedDeliveryDate" = EXCLUDED."ExpectedDeliveryDate",
+        "ActualDeliveryDate" = EXCLUDED."ActualDeliveryDate",
+        "DeliveryDaysLate" = EXCLUDED."DeliveryDaysLate",
+        "PaymentStatus" = EXCLUDED."PaymentStatus",
+        "ProcessDate" = NOW();
+
+    RETURN claimed;
+END $$;
+
+-- Loyalty transactions are immutable; the balance is the running total of the account's points
+CREATE OR REPLACE FUNCTION "analytics"."LoadCustomerLoyaltyFact"(loaded_until TIMESTAMP WITH TIME ZONE, batch_size INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    claimed INTEGER := "analytics"."ClaimEtlBatch"('LoyaltyTransactions', 'TransactionDate', loaded_until, batch_size);
+    first_day DATE;
+    last_day DATE;
+BEGIN
+    IF claimed = 0 THEN
+        RETURN 0;
+    END IF;
+
+    SELECT min(b."ModifiedAt" AT TIME ZONE 'UTC')::date, max(b."ModifiedAt" AT TIME ZONE 'UTC')::date
+    INTO first_day, last_day
+    FROM etl_batch b;
+    PERFORM "analytics"."PopulateDateDimension"(first_day, last_day);
+
+    INSERT INTO "analytics"."CustomerLoyaltyFact" (
+        "SourceId", "DateKey", "CustomerKey", "LocationKey", "TransactionId", "PointsEarned", "PointsRedeemed",
+        "PointsBalance", "TierLevel", "PurchaseAmount", "RewardType", "CreatedDate")
+    SELECT
+        lt."Id",
+        "analytics"."DateKeyOf"(lt."TransactionDate"),
+        coalesce(cd."CustomerKey", "analytics"."UnknownMember"()),
+        coalesce(ld."LocationKey", "analytics"."UnknownMember"()),
+        lt."SalesTransactionId",
+        greatest(lt."Points", 0),
+        greatest(-lt."Points", 0),
+        (SELECT coalesce(sum(x."Points"), 0)
+         FROM "LoyaltyTransactions" x
+         WHERE x."CustomerLoyaltyId" = lt."CustomerLoyaltyId"
+           AND (x."TransactionDate", x."Id") <= (lt."TransactionDate", lt."Id")),
+        left(cl."Tier", 20),
+        coalesce(st."TotalAmount", 0),
+        left(lt."TransactionType", 50),
+        lt."TransactionDate"
+    FROM etl_batch b
+    JOIN "LoyaltyTransactions" lt ON lt."Id" = b."Id"
+    JOIN "CustomerLoyalty" cl ON cl."Id" = lt."CustomerLoyaltyId"
+    LEFT JOIN "SalesTransactions" st ON st."Id" = lt."SalesTransactionId"
+    LEFT JOIN "analytics"."CustomerDimension" cd ON cd."CustomerId" = cl."CustomerId" AND cd."IsCurrent"
+    LEFT JOIN "analytics"."LocationDimension" ld ON ld."LocationId" = st."BranchId" AND ld."IsCurrent"
+    ON CONFLICT ("SourceId") DO NOTHING;
+
+    RETURN claimed;
+END $$;
+
+-- Entry point used by the scheduled loader: loads the next batch of one source table and returns how many
+-- source rows it covered; the batch and its watermark commit together
+CREATE OR REPLACE FUNCTION "analytics"."LoadIncremental"(source_table TEXT, loaded_until TIMESTAMP WITH TIME ZONE, batch_size INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    CASE source_table
+        WHEN 'Products' THEN RETURN "analytics"."LoadProductDimension"(loaded_until, batch_size);
+        WHEN 'Customers' THEN RETURN "analytics"."LoadCustomerDimension"(loaded_until, batch_size);
+        WHEN 'Branches', 'Warehouses' THEN RETURN "analytics"."LoadLocationDimension"(source_table, loaded_until, batch_size);
+        WHEN 'Suppliers' THEN RETURN "analytics"."LoadSupplierDimension"(loaded_until, batch_size);
+        WHEN 'SalesTransactions' THEN RETURN "analytics"."LoadSalesFact"(loaded_until, batch_size);
+        WHEN 'InventoryTransactions' THEN RETURN "analytics"."LoadInventoryFact"(loaded_until, batch_size);
+        WHEN 'PurchaseOrders' THEN RETURN "analytics"."LoadProcurementFact"(loaded_until, batch_size);
+        WHEN 'LoyaltyTransactions' THEN RETURN "analytics"."LoadCustomerLoyaltyFact"(loaded_until, batch_size);
+        ELSE RAISE EXCEPTION 'No incremental load is defined for source table %', source_table;
+    END CASE;
+END $$;
+
+COMMENT ON TABLE "analytics"."EtlWatermarks" IS 'Incremental load position per operational source table';
@@ -0,0 +1,247 @@
+-- Migration: Sales Rollups
+-- Version: 003
+-- Description: Daily, weekly and monthly sales rollups over SalesFact, maintained incrementally so
+--              period analytics read a few pre-aggregated rows instead of the fact table
+
+-- Sales per location and product. "Grain" is 'D' (day), 'W' (ISO week, starting Monday) or 'M' (month),
+-- and "PeriodStart" the first day of the period. TransactionCount is the number of transactions that
+-- included the product, so it adds up across periods but not across products.
+CREATE TABLE IF NOT EXISTS "analytics"."SalesRollup" (
+    "Grain" CHAR(1) NOT NULL,
+    "PeriodStart" DATE NOT NULL,
+    "LocationId" UUID NOT NULL,
+    "ProductId" UUID NOT NULL,
+    "ProductCategory" VARCHAR(100),
+    "Quantity" BIGINT NOT NULL,
+    "TransactionCount" INTEGER NOT NULL,
+    "GrossSales" DECIMAL(18,2) NOT NULL,
+    "DiscountAmount" DECIMAL(18,2) NOT NULL,
+    "TaxAmount" DECIMAL(18,2) NOT NULL,
+    "NetSales" DECIMAL(18,2) NOT NULL,
+    "CostAmount" DECIMAL(18,2) NOT NULL,
+    "GrossProfit" DECIMAL(18,2) NOT NULL,
+    "RefundAmount" DECIMAL(18,2) NOT NULL,
+    PRIMARY KEY ("Grain", "PeriodStart", "LocationId", "ProductId")
+);
+
+CREATE INDEX IF NOT EXISTS "IX_SalesRollup_Grain_Category_PeriodStart" ON "analytics"."SalesRollup"("Grain", "ProductCategory", "PeriodStart");
+
+-- Sales per location and payment method (the transaction's largest payment); every transaction is counted
+-- under exactly one row, so these add up to location and overall totals
+CREATE TABLE IF NOT EXISTS "analytics"."SalesLocationRollup" (
+    "Grain" CHAR(1) NOT NULL,
+    "PeriodStart" DATE NOT NULL,
+    "LocationId" UUID NOT NULL,
+    "PaymentMethod" VARCHAR(50) NOT NULL,
+    "Quantity" BIGINT NOT NULL,
+    "TransactionCount" INTEGER NOT NULL,
+    "GrossSales" DECIMAL(18,2) NOT NULL,
+    "DiscountAmount" DECIMAL(18,2) NOT NULL,
+    "TaxAmount" DECIMAL(18,2) NOT NULL,
+    "NetSales" DECIMAL(18,2) NOT NULL,
+    "CostAmount" DECIMAL(18,2) NOT NULL,
+    "GrossProfit" DECIMAL(18,2) NOT NULL,
+    "RefundAmount" DECIMAL(18,2) NOT NULL,
+    PRIMARY KEY ("Grain", "PeriodStart", "LocationId", "PaymentMethod")
+);
+
+-- Days whose sales facts changed since their rollups were last built
+CREATE TABLE IF NOT EXISTS "analytics"."SalesRollupQueue" (
+    "Day" DATE PRIMARY KEY,
+    "QueuedAt" TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION "analytics"."QueueSalesRollupDays"()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO "analytics"."SalesRollupQueue" ("Day")
+    SELECT DISTINCT to_date(changed."DateKey"::text, 'YYYYMMDD')
+    FROM changed_rows changed
+    ON CONFLICT ("Day") DO NOTHING;
+
+    RETURN NULL;
+END $$;
+
+-- Statement-level, so a loader batch queues each day it touched once
+DROP TRIGGER IF EXISTS "TR_SalesFact_QueueRollup_Insert" ON "analytics"."SalesFact";
+CREATE TRIGGER "TR_SalesFact_QueueRollup_Insert"
+    AFTER INSERT ON "analytics"."SalesFact"
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION "analytics"."QueueSalesRollupDays"();
+
+DROP TRIGGER IF EXISTS "TR_SalesFact_QueueRollup_Update" ON "analytics"."SalesFact";
+CREATE TRIGGER "TR_SalesFact_QueueRollup_Update"
+    AFTER UPDATE ON "analytics"."SalesFact"
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION "analytics"."QueueSalesRollupDays"();
+
+DROP TRIGGER IF EXISTS "TR_SalesFact_QueueRollup_Delete" ON "analytics"."SalesFact";
+CREATE TRIGGER "TR_SalesFact_QueueRollup_Delete"
+    AFTER DELETE ON "analytics"."SalesFact"
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION "analytics"."QueueSalesRollupDays"();
+
+-- Facts loaded before the rollups existed
+INSERT INTO "analytics"."SalesRollupQueue" ("Day")
+SELECT DISTINCT to_date("DateKey"::text, 'YYYYMMDD') FROM "analytics"."SalesFact"
+ON CONFLICT ("Day") DO NOTHING;
+
+-- Rebuilds the periods of one grain that contain a day in rollup_days, from that grain's day rows
+CREATE OR REPLACE FUNCTION "analytics"."RollUpSalesPeriods"(grain CHAR(1), unit TEXT)
+RETURNS VOID
+LANGUAGE plpgsql AS $$
+BEGIN
+    CREATE TEMP TABLE IF NOT EXISTS rollup_periods ("PeriodStart" DATE PRIMARY KEY) ON COMMIT DELETE ROWS;
+    DELETE FROM rollup_periods;
+    INSERT INTO rollup_periods SELECT DISTINCT date_trunc(unit, "Day")::date FROM rollup_days;
+
+    DELETE FROM "analytics"."SalesRollup" r
+    USING rollup_periods p
+    WHERE r."Grain" = grain AND r."PeriodStart" = p."PeriodStart";
+
+    INSERT INTO "analytics"."SalesRollup" (
+        "Grain", "PeriodStart", "LocationId", "ProductId", "ProductCategory", "Quantity", "TransactionCount",
+        "GrossSales", "DiscountAmount", "TaxAmount", "NetSales", "CostAmount", "GrossProfit", "RefundAmount")
+    SELECT
+        grain, p."PeriodStart", r."LocationId", r."ProductId", r."ProductCategory", sum(r."Quantity"), sum(r."TransactionCount"),
+        sum(r."GrossSales"), sum(r."DiscountAmount"), sum(r."TaxAmount"), sum(r."NetSales"), sum(r."CostAmount"),
+        sum(r."GrossProfit"), sum(r."RefundAmount")
+    FROM rollup_periods p
+    JOIN "analytics"."SalesRollup" r
+        ON r."Grain" = 'D' AND r."PeriodStart" >= p."PeriodStart" AND r."PeriodStart" < p."PeriodStart" + ('1 ' || unit)::interval
+    GROUP BY p."PeriodStart", r."LocationId", r."ProductId", r."ProductCategory";
+
+    DELETE FROM "analytics"."SalesLocationRollup" r
+    USING rollup_periods p
+    WHERE r."Grain" = grain AND r."PeriodStart" = p."PeriodStart";
+
+    INSERT INTO "analytics"."SalesLocationRollup" (
+        "Grain", "PeriodStart", "LocationId", "PaymentMethod", "Quantity", "TransactionCount",
+        "GrossSales", "DiscountAmount", "TaxAmount", "NetSales", "CostAmount", "GrossProfit", "RefundAmount")
+    SELECT
+        grain, p."PeriodStart", r."LocationId", r."PaymentMethod", sum(r."Quantity"), sum(r."TransactionCount"),
+        sum(r."GrossSales"), sum(r."DiscountAmount"), sum(r."TaxAmount"), sum(r."NetSales"), sum(r."CostAmount"),
+        sum(r."GrossProfit"), sum(r."RefundAmount")
+    FROM rollup_periods p
+    JOIN "analytics"."SalesLocationRollup" r
+        ON r."Grain" = 'D' AND r."PeriodStart" >= p."PeriodStart" AND r."PeriodStart" < p."PeriodStart" + ('1 ' || unit)::interval
+    GROUP BY p."PeriodStart", r."LocationId", r."PaymentMethod";
+END $$;
+
+-- Rebuilds the rollups of up to max_days queued days, and the weeks and months containing them; returns
+-- how many days were refreshed. Refreshes take turns, since two of them may rebuild the same week or month.
+CREATE OR REPLACE FUNCTION "analytics"."RefreshSalesRollups"(max_days INTEGER)
+RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    refreshed INTEGER;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('analytics.RefreshSalesRollups'));
+
+    CREATE TEMP TABLE IF NOT EXISTS rollup_days ("Day" DATE PRIMARY KEY) ON COMMIT DELETE ROWS;
+    DELETE FROM rollup_days;
+
+    WITH claimed AS (
+        DELETE FROM "analytics"."SalesRollupQueue" q
+        WHERE q."Day" IN (
+            SELECT "Day" FROM "analytics"."SalesRollupQueue"
+            ORDER BY "Day"
+            LIMIT max_days)
+        RETURNING q."Day")
+    INSERT INTO rollup_days SELECT "Day" FROM claimed;
+    GET DIAGNOSTICS refreshed = ROW_COUNT;
+
+    IF refreshed = 0 THEN
+        RETURN 0;
+    END IF;
+
+    -- Only completed transactions count as sales; the fact's PaymentStatus carries the transaction status.
+    -- Return facts carry positive quantities and amounts, so they count only towards RefundAmount.
+    DELETE FROM "analytics"."SalesRollup" r
+    USING rollup_days d
+    WHERE r."Grain" = 'D' AND r."PeriodStart" = d."Day";
+
+    INSERT INTO "analytics"."SalesRollup" (
+        "Grain", "PeriodStart", "LocationId", "ProductId", "ProductCategory", "Quantity", "TransactionCount",
+        "GrossSales", "DiscountAmount", "TaxAmount", "NetSales", "CostAmount", "GrossProfit", "RefundAmount")
+    SELECT
+        'D', d."Day", ld."LocationId", pd."ProductId", pd."ProductCategory",
+        coalesce(sum(f."Quantity") FILTER (WHERE NOT f.is_return), 0),
+        count(DISTINCT f."TransactionId") FILTER (WHERE NOT f.is_return),
+        coalesce(sum(f."TotalAmount") FILTER (WHERE NOT f.is_return), 0),
+        coalesce(sum(f."DiscountAmount") FILTER (WHERE NOT f.is_return), 0),
+        coalesce(sum(f."TaxAmount") FILTER (WHERE NOT f.is_return), 0),
+        coalesce(sum(f."NetAmount") FILTER (WHERE NOT f.is_return), 0),
+        coalesce(sum(f."CostAmount") FILTER (WHERE NOT f.is_return), 0),
+        coalesce(sum(f."GrossProfit") FILTER (WHERE NOT f.is_return), 0),
+        sum(f."RefundAmount")
+    FROM rollup_days d
+    JOIN (SELECT *, "TransactionType" IS NOT DISTINCT FROM 'RETURN' AS is_return FROM "analytics"."SalesFact") f
+        ON f."DateKey" = to_char(d."Day", 'YYYYMMDD')::integer
+    JOIN "analytics"."LocationDimension" ld ON ld."LocationKey" = f."LocationKey"
+    JOIN "analytics"."ProductDimension" pd ON pd."ProductKey" = f."ProductKey"
+    WHERE f."PaymentStatus" = 'COMPLETED'
+    GROUP BY d."Day", ld."LocationId", pd."ProductId", pd."ProductCategory";
+
+    DELETE FROM "analytics"."SalesLocationRollup" r
+    USING rollup_days d
+    WHERE r."Grain" = 'D' AND r."PeriodStart" = d."Day";
+
+    INSERT INTO "analytics"."SalesLocationRollup" (
+        "Grain", "PeriodStart", "LocationId", "PaymentMethod", "Quantity", "TransactionCount",
+        "GrossSales", "DiscountAmount", "TaxAmount", "NetSales", "CostAmount", "GrossProfit", "RefundAmount")
+    SELECT
+        'D', d."Day", ld."LocationId", coalesce(f."PaymentMethod", ''),
+        coalesce(sum(f."Quantity") FILTER (WHERE NOT f.is_return), 0),
+        count(DISTINCT f."TransactionId") FILTER (WHERE NOT f.is_return),
+        coalesce(sum(f."TotalAmount") FILTER (WHERE NOT f.is_return), 0),
+        coalesce(sum(f."DiscountAmount") FILTER (WHERE NOT f.is_return), 0),
+        coalesce(sum(f."TaxAmount") FILTER (WHERE NOT f.is_return), 0),
+        coalesce(sum(f."NetAmount") FILTER (WHERE NOT f.is_return), 0),
+        coalesce(sum(f."CostAmount") FILTER (WHERE NOT f.is_return), 0),
+        coalesce(sum(f."GrossProfit") FILTER (WHERE NOT f.is_return), 0),
+        sum(f."RefundAmount")
+    FROM rollup_days d
+    JOIN (SELECT *, "TransactionType" IS NOT DISTINCT FROM 'RETURN' AS is_return FROM "analytics"."SalesFact") f
+        ON f."DateKey" = to_char(d."Day", 'YYYYMMDD')::integer
+    JOIN "analytics"."LocationDimension" ld ON ld."LocationKey" = f."LocationKey"
+    WHERE f."PaymentStatus" = 'COMPLETED'
+    GROUP BY d."Day", ld."LocationId", coalesce(f."PaymentMethod", '');
+
+    PERFORM "analytics"."RollUpSalesPeriods"('W', 'week');
+    PERFORM "analytics"."RollUpSalesPeriods"('M', 'month');
+
+    RETURN refreshed;
+END $$;
+
+-- The rollup rows covering the days from from_day up to but excluding to_day with as few rows as possible:
+-- rows of the given grain for the periods the range spans whole, day rows for partial periods at either end
+CREATE OR REPLACE FUNCTION "analytics"."CoveringSalesRollup"(grain TEXT, unit TEXT, from_day DATE, to_day DATE)
+RETURNS SETOF "analytics"."SalesRollup"
+LANGUAGE sql STABLE AS $$
+    SELECT r.*
+    FROM "analytics"."SalesRollup" r
+    CROSS JOIN LATERAL (
+        SELECT (date_trunc(unit, from_day - 1) + ('1 ' || unit)::interval)::date AS whole_from,
+               date_trunc(unit, to_day)::date AS whole_to) span
+    WHERE (r."Grain" = grain AND r."PeriodStart" >= span.whole_from AND r."PeriodStart" < span.whole_to)
+       OR (r."Grain" = 'D' AND r."PeriodStart" >= from_day AND r."PeriodStart" < to_day
+           AND (r."PeriodStart" < span.whole_from OR r."PeriodStart" >= span.whole_to))
+$$;
+
+CREATE OR REPLACE FUNCTION "analytics"."CoveringSalesLocationRollup"(grain TEXT, unit TEXT, from_day DATE, to_day DATE)
+RETURNS SETOF "analytics"."SalesLocationRollup"
+LANGUAGE sql STABLE AS $$
+    SELECT r.*
+    FROM "analytics"."SalesLocationRollup" r
+    CROSS JOIN LATERAL (
+        SELECT (date_trunc(unit, from_day - 1) + ('1 ' || unit)::interval)::date AS whole_from,
+               date_trunc(unit, to_day)::date AS whole_to) span
+    WHERE (r."Grain" = grain AND r."PeriodStart" >= span.whole_from AND r."PeriodStart" < span.whole_to)
+       OR (r."Grain" = 'D' AND r."PeriodStart" >= from_day AND r."PeriodStart" < to_day
+           AND (r."PeriodStart" < span.whole_from OR r."PeriodStart" >= span.whole_to))
+$$;
+
+COMMENT ON TABLE "analytics"."SalesRollup" IS 'Daily, weekly and monthly sales per location and product';
+COMMENT ON TABLE "analytics"."SalesLocationRollup" IS 'Daily, weekly and monthly sales per location and payment method';
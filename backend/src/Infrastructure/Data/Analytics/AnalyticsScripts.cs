@@ -0,0 +1,21 @@
+using System.Reflection;
+
+namespace NationalClothingStore.Infrastructure.Data.Analytics;
+
+/// <summary>
+/// The analytics warehouse scripts in this folder, embedded in the assembly so migrations can install them
+/// </summary>
+internal static class AnalyticsScripts
+{
+    public const string DataWarehouse = "001_CreateAnalyticsDataWarehouse.sql";
+    public const string IncrementalLoad = "002_CreateIncrementalLoad.sql";
+    public const string SalesRollups = "003_CreateSalesRollups.sql";
+
+    public static string Read(string fileName)
+    {
+        using var stream = Assembly.GetExecutingAssembly().GetManifestResourceStream($"Analytics.{fileName}")
+            ?? throw new InvalidOperationException($"Analytics script '{fileName}' is not embedded in the assembly");
+        using var reader = new StreamReader(stream);
+        return reader.ReadToEnd();
+    }
+}
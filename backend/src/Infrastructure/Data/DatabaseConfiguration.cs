@@ -1,4 +1,5 @@
 using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Diagnostics;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.Logging;
@@ -20,7 +21,7 @@ public static class DatabaseConfiguration
     {
         var connectionString = configuration.GetConnectionString("DefaultConnection");
         
-        services.AddDbContext<NationalClothingStoreDbContext>(options =>
+        services.AddDbContext<NationalClothingStoreDbContext>((serviceProvider, options) =>
         {
             options.UseNpgsql(connectionString, npgsqlOptions =>
             {
@@ -38,6 +39,9 @@ public static class DatabaseConfiguration
             // Query performance
             options.UseQueryTrackingBehavior(QueryTrackingBehavior.NoTracking);
             options.EnableServiceProviderCaching();
+
+            // SaveChanges interceptors registered elsewhere (e.g. report cache invalidation)
+            options.AddInterceptors(serviceProvider.GetServices<IInterceptor>());
         });
 
         // Configure connection pooling
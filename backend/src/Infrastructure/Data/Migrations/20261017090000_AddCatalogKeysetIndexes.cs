@@ -0,0 +1,41 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace NationalClothingStore.Infrastructure.Data.Migrations
+{
+    /// <summary>
+    /// Composite indexes matching the keyset sort orders of the product and variation listings
+    /// </summary>
+    [DbContext(typeof(NationalClothingStoreDbContext))]
+    [Migration("20261017090000_AddCatalogKeysetIndexes")]
+    public partial class AddCatalogKeysetIndexes : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.CreateIndex(
+                name: "IX_Products_Name_Id",
+                table: "Products",
+                columns: new[] { "Name", "Id" });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_ProductVariations_ProductId_Size_Color_Id",
+                table: "ProductVariations",
+                columns: new[] { "ProductId", "Size", "Color", "Id" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_Products_Name_Id",
+                table: "Products");
+
+            migrationBuilder.DropIndex(
+                name: "IX_ProductVariations_ProductId_Size_Color_Id",
+                table: "ProductVariations");
+        }
+    }
+}
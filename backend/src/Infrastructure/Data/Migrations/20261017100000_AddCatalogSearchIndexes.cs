@@ -0,0 +1,46 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace NationalClothingStore.Infrastructure.Data.Migrations
+{
+    /// <summary>
+    /// Full-text and trigram search indexes for products and categories
+    /// </summary>
+    [DbContext(typeof(NationalClothingStoreDbContext))]
+    [Migration("20261017100000_AddCatalogSearchIndexes")]
+    public partial class AddCatalogSearchIndexes : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql("CREATE EXTENSION IF NOT EXISTS pg_trgm;");
+
+            migrationBuilder.Sql(@"
+                ALTER TABLE ""Products"" ADD COLUMN ""SearchVector"" tsvector
+                    GENERATED ALWAYS AS (
+                        setweight(to_tsvector('simple', coalesce(""Name"", '')), 'A') ||
+                        setweight(to_tsvector('simple', coalesce(""Brand"", '')), 'B') ||
+                        setweight(to_tsvector('simple', coalesce(""Description"", '')), 'C')
+                    ) STORED;");
+
+            migrationBuilder.Sql(@"CREATE INDEX ""IX_Products_SearchVector"" ON ""Products"" USING gin (""SearchVector"");");
+            migrationBuilder.Sql(@"CREATE INDEX ""IX_Products_Name_Trgm"" ON ""Products"" USING gin (""Name"" gin_trgm_ops);");
+            migrationBuilder.Sql(@"CREATE INDEX ""IX_Products_SKU_Trgm"" ON ""Products"" USING gin (""SKU"" gin_trgm_ops);");
+            migrationBuilder.Sql(@"
+                CREATE INDEX ""IX_Categories_Search_Trgm"" ON ""Categories""
+                    USING gin (""Name"" gin_trgm_ops, ""Code"" gin_trgm_ops, ""Description"" gin_trgm_ops);");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(@"DROP INDEX IF EXISTS ""IX_Categories_Search_Trgm"";");
+            migrationBuilder.Sql(@"DROP INDEX IF EXISTS ""IX_Products_SKU_Trgm"";");
+            migrationBuilder.Sql(@"DROP INDEX IF EXISTS ""IX_Products_Name_Trgm"";");
+            migrationBuilder.Sql(@"DROP INDEX IF EXISTS ""IX_Products_SearchVector"";");
+            migrationBuilder.Sql(@"ALTER TABLE ""Products"" DROP COLUMN IF EXISTS ""SearchVector"";");
+        }
+    }
+}
@@ -0,0 +1,150 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace NationalClothingStore.Infrastructure.Data.Migrations
+{
+    /// <summary>
+    /// Monthly range partitioning of AuditEvents (by Timestamp) and InventoryTransactions (by CreatedAt),
+    /// so retention drops whole partitions instead of deleting rows
+    /// </summary>
+    [DbContext(typeof(NationalClothingStoreDbContext))]
+    [Migration("20261017110000_PartitionAuditAndInventoryTransactions")]
+    public partial class PartitionAuditAndInventoryTransactions : Migration
+    {
+        private const int MonthsAhead = 3;
+
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Creates any missing "<parent>_pYYYYMM" partitions for the months from from_month to to_month;
+            // also called by the archival job to keep partitions provisioned ahead of time
+            migrationBuilder.Sql(@"
+                CREATE OR REPLACE FUNCTION ncs_ensure_monthly_partitions(parent text, from_month date, to_month date)
+                RETURNS integer
+                LANGUAGE plpgsql AS $$
+                DECLARE
+                    month date := date_trunc('month', from_month)::date;
+                    partition_name text;
+                    created integer := 0;
+                BEGIN
+                    WHILE month <= to_month LOOP
+                        partition_name := format('%s_p%s', parent, to_char(month, 'YYYYMM'));
+                        IF to_regclass(format('%I', partition_name)) IS NULL THEN
+                            -- Bounds are UTC midnight; the offset is ignored for timestamp without time zone
+                            EXECUTE format('CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                                partition_name, parent,
+                                to_char(month, 'YYYY-MM-DD') || ' 00:00:00+00',
+                                to_char(month + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00');
+                            created := created + 1;
+                        END IF;
+                        month := (month + interval '1 month')::date;
+                    END LOOP;
+                    RETURN created;
+                END $$;");
+
+            // Rebuilds a table as its partitioned equivalent: same columns, defaults, checks, foreign keys and
+            // indexes, with the partition column added to the primary key as PostgreSQL requires
+            migrationBuilder.Sql(@"
+                CREATE OR REPLACE FUNCTION ncs_partition_table_by_month(parent text, partition_column text, months_ahead integer)
+                RETURNS void
+                LANGUAGE plpgsql AS $$
+                DECLARE
+                    legacy text := parent || '_unpartitioned';
+                    first_month date;
+                    foreign_keys text[];
+                    indexes text[];
+                    definition text;
+                BEGIN
+                    IF to_regclass(format('%I', parent)) IS NULL
+                       OR EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(format('%I', parent))) THEN
+                        RETURN;
+                    END IF;
+
+                    SELECT array_agg(format('ALTER TABLE %I ADD CONSTRAINT %I %s', parent, conname, pg_get_constraintdef(oid)))
+                    INTO foreign_keys
+                    FROM pg_constraint
+                    WHERE conrelid = to_regclass(format('%I', parent)) AND contype = 'f';
+
+                    -- Captured before the rename, so the definitions already target the new parent table. Unique
+                    -- indexes can't be enforced across partitions unless they include the partition column
+                    SELECT array_agg(pg_get_indexdef(i.indexrelid))
+                    INTO indexes
+                    FROM pg_index i
+                    WHERE i.indrelid = to_regclass(format('%I', parent))
+                      AND NOT i.indisprimary
+                      AND (NOT i.indisunique OR pg_get_indexdef(i.indexrelid) LIKE '%' || quote_ident(partition_column) || '%');
+
+                    EXECUTE format('ALTER TABLE %I RENAME TO %I', parent, legacy);
+                    EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED) PARTITION BY RANGE (%I)',
+                        parent, legacy, partition_column);
+
+                    EXECUTE format('SELECT min(%I)::date FROM %I', partition_column, legacy) INTO first_month;
+                    PERFORM ncs_ensure_monthly_partitions(parent,
+                        least(coalesce(first_month, current_date), current_date),
+                        (current_date + make_interval(months => months_ahead))::date);
+
+                    EXECUTE format('INSERT INTO %I SELECT * FROM %I', parent, legacy);
+                    EXECUTE format('DROP TABLE %I', legacy);
+
+                    EXECUTE format('ALTER TABLE %I ADD CONSTRAINT %I PRIMARY KEY (""Id"", %I)', parent, 'PK_' || parent, partition_column);
+                    FOREACH definition IN ARRAY coalesce(foreign_keys, '{}') LOOP
+                        EXECUTE definition;
+                    END LOOP;
+                    FOREACH definition IN ARRAY coalesce(indexes, '{}') LOOP
+                        EXECUTE definition;
+                    END LOOP;
+                END $$;");
+
+            migrationBuilder.Sql($@"SELECT ncs_partition_table_by_month('AuditEvents', 'Timestamp', {MonthsAhead});");
+            migrationBuilder.Sql($@"SELECT ncs_partition_table_by_month('InventoryTransactions', 'CreatedAt', {MonthsAhead});");
+            migrationBuilder.Sql(@"DROP FUNCTION ncs_partition_table_by_month(text, text, integer);");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(@"
+                DO $$
+                DECLARE
+                    parent text;
+                    foreign_keys text[];
+                    indexes text[];
+                    definition text;
+                BEGIN
+                    FOREACH parent IN ARRAY ARRAY['AuditEvents', 'InventoryTransactions'] LOOP
+                        CONTINUE WHEN NOT EXISTS (
+                            SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(format('%I', parent)));
+
+                        SELECT array_agg(format('ALTER TABLE %I ADD CONSTRAINT %I %s', parent, conname, pg_get_constraintdef(oid)))
+                        INTO foreign_keys
+                        FROM pg_constraint
+                        WHERE conrelid = to_regclass(format('%I', parent)) AND contype = 'f';
+
+                        -- Indexes on a partitioned table are defined ""ON ONLY"" the parent
+                        SELECT array_agg(replace(pg_get_indexdef(i.indexrelid), ' ON ONLY ', ' ON '))
+                        INTO indexes
+                        FROM pg_index i
+                        WHERE i.indrelid = to_regclass(format('%I', parent)) AND NOT i.indisprimary;
+
+                        EXECUTE format('ALTER TABLE %I RENAME TO %I', parent, parent || '_partitioned');
+                        EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)',
+                            parent, parent || '_partitioned');
+                        EXECUTE format('INSERT INTO %I SELECT * FROM %I', parent, parent || '_partitioned');
+                        EXECUTE format('DROP TABLE %I', parent || '_partitioned');
+
+                        EXECUTE format('ALTER TABLE %I ADD CONSTRAINT %I PRIMARY KEY (""Id"")', parent, 'PK_' || parent);
+                        FOREACH definition IN ARRAY coalesce(foreign_keys, '{}') LOOP
+                            EXECUTE definition;
+                        END LOOP;
+                        FOREACH definition IN ARRAY coalesce(indexes, '{}') LOOP
+                            EXECUTE definition;
+                        END LOOP;
+                    END LOOP;
+                END $$;");
+
+            migrationBuilder.Sql(@"DROP FUNCTION IF EXISTS ncs_ensure_monthly_partitions(text, date, date);");
+        }
+    }
+}
@@ -0,0 +1,52 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace NationalClothingStore.Infrastructure.Data.Migrations
+{
+    /// <summary>
+    /// Composite indexes matching the keyset order the report exports page through their datasets in
+    /// </summary>
+    [DbContext(typeof(NationalClothingStoreDbContext))]
+    [Migration("20261017130000_AddReportExportIndexes")]
+    public partial class AddReportExportIndexes : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Only completed sales are exported
+            migrationBuilder.CreateIndex(
+                name: "IX_SalesTransactions_CompletedAt_Id",
+                table: "SalesTransactions",
+                columns: new[] { "CompletedAt", "Id" },
+                filter: "\"Status\" = 'COMPLETED'");
+
+            migrationBuilder.CreateIndex(
+                name: "IX_Customers_CreatedAt_Id",
+                table: "Customers",
+                columns: new[] { "CreatedAt", "Id" });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_PurchaseOrders_OrderDate_Id",
+                table: "PurchaseOrders",
+                columns: new[] { "OrderDate", "Id" });
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropIndex(
+                name: "IX_SalesTransactions_CompletedAt_Id",
+                table: "SalesTransactions");
+
+            migrationBuilder.DropIndex(
+                name: "IX_Customers_CreatedAt_Id",
+                table: "Customers");
+
+            migrationBuilder.DropIndex(
+                name: "IX_PurchaseOrders_OrderDate_Id",
+                table: "PurchaseOrders");
+        }
+    }
+}
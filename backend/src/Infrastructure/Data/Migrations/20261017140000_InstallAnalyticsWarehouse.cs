@@ -0,0 +1,32 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+using NationalClothingStore.Infrastructure.Data.Analytics;
+
+#nullable disable
+
+namespace NationalClothingStore.Infrastructure.Data.Migrations
+{
+    /// <summary>
+    /// Installs the analytics star schema and the incremental loaders the analytics ETL job calls
+    /// (Data/Analytics/001 and 002). Both scripts are idempotent, so databases where they were run by hand
+    /// migrate cleanly.
+    /// </summary>
+    [DbContext(typeof(NationalClothingStoreDbContext))]
+    [Migration("20261017140000_InstallAnalyticsWarehouse")]
+    public partial class InstallAnalyticsWarehouse : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(AnalyticsScripts.Read(AnalyticsScripts.DataWarehouse));
+            migrationBuilder.Sql(AnalyticsScripts.Read(AnalyticsScripts.IncrementalLoad));
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            // Everything in the warehouse is loaded from the operational tables, so nothing is lost for good
+            migrationBuilder.Sql(@"DROP SCHEMA IF EXISTS ""analytics"" CASCADE;");
+        }
+    }
+}
@@ -0,0 +1,40 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+using NationalClothingStore.Infrastructure.Data.Analytics;
+
+#nullable disable
+
+namespace NationalClothingStore.Infrastructure.Data.Migrations
+{
+    /// <summary>
+    /// Installs the sales rollups the sales and financial analytics read (Data/Analytics/003). The rollups
+    /// start empty and fill as the analytics ETL job refreshes them.
+    /// </summary>
+    [DbContext(typeof(NationalClothingStoreDbContext))]
+    [Migration("20261017150000_InstallSalesRollups")]
+    public partial class InstallSalesRollups : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(AnalyticsScripts.Read(AnalyticsScripts.SalesRollups));
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(@"
+                DROP FUNCTION IF EXISTS ""analytics"".""CoveringSalesLocationRollup""(TEXT, TEXT, DATE, DATE);
+                DROP FUNCTION IF EXISTS ""analytics"".""CoveringSalesRollup""(TEXT, TEXT, DATE, DATE);
+                DROP FUNCTION IF EXISTS ""analytics"".""RefreshSalesRollups""(INTEGER);
+                DROP FUNCTION IF EXISTS ""analytics"".""RollUpSalesPeriods""(CHAR, TEXT);
+                DROP TRIGGER IF EXISTS ""TR_SalesFact_QueueRollup_Insert"" ON ""analytics"".""SalesFact"";
+                DROP TRIGGER IF EXISTS ""TR_SalesFact_QueueRollup_Update"" ON ""analytics"".""SalesFact"";
+                DROP TRIGGER IF EXISTS ""TR_SalesFact_QueueRollup_Delete"" ON ""analytics"".""SalesFact"";
+                DROP FUNCTION IF EXISTS ""analytics"".""QueueSalesRollupDays""();
+                DROP TABLE IF EXISTS ""analytics"".""SalesRollupQueue"";
+                DROP TABLE IF EXISTS ""analytics"".""SalesLocationRollup"";
+                DROP TABLE IF EXISTS ""analytics"".""SalesRollup"";");
+        }
+    }
+}
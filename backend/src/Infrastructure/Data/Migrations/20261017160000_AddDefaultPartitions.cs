@@ -0,0 +1,135 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace NationalClothingStore.Infrastructure.Data.Migrations
+{
+    /// <summary>
+    /// A DEFAULT partition for AuditEvents and InventoryTransactions, so rows dated outside the provisioned
+    /// months (backdated entries, or months the archival job has not reached yet) are stored instead of
+    /// failing the INSERT. The archival job splits them out into their monthly partitions.
+    /// </summary>
+    [DbContext(typeof(NationalClothingStoreDbContext))]
+    [Migration("20261017160000_AddDefaultPartitions")]
+    public partial class AddDefaultPartitions : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // As before, plus: a month whose rows already sit in "<parent>_default" is created as a plain
+            // table, the rows are moved into it, and it is attached; PostgreSQL refuses to create a partition
+            // over rows the default partition holds
+            migrationBuilder.Sql(@"
+                CREATE OR REPLACE FUNCTION ncs_ensure_monthly_partitions(parent text, from_month date, to_month date)
+                RETURNS integer
+                LANGUAGE plpgsql
+                SET timezone = 'UTC' AS $$
+                DECLARE
+                    month date := date_trunc('month', from_month)::date;
+                    default_name text := parent || '_default';
+                    partition_column text;
+                    partition_name text;
+                    lower_bound text;
+                    upper_bound text;
+                    has_rows boolean;
+                    created integer := 0;
+                BEGIN
+                    SELECT a.attname INTO partition_column
+                    FROM pg_partitioned_table p
+                    JOIN pg_attribute a ON a.attrelid = p.partrelid AND a.attnum = p.partattrs[0]
+                    WHERE p.partrelid = to_regclass(format('%I', parent));
+
+                    WHILE month <= to_month LOOP
+                        partition_name := format('%s_p%s', parent, to_char(month, 'YYYYMM'));
+                        IF to_regclass(format('%I', partition_name)) IS NULL THEN
+                            -- Bounds are UTC midnight; the offset is ignored for timestamp without time zone
+                            lower_bound := to_char(month, 'YYYY-MM-DD') || ' 00:00:00+00';
+                            upper_bound := to_char(month + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00';
+
+                            has_rows := false;
+                            IF to_regclass(format('%I', default_name)) IS NOT NULL THEN
+                                EXECUTE format('SELECT EXISTS (SELECT 1 FROM %I WHERE %I >= %L AND %I < %L)',
+                                    default_name, partition_column, lower_bound, partition_column, upper_bound)
+                                INTO has_rows;
+                            END IF;
+
+                            IF has_rows THEN
+                                EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)',
+                                    partition_name, parent);
+                                EXECUTE format('WITH moved AS (DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *) INSERT INTO %I SELECT * FROM moved',
+                                    default_name, partition_column, lower_bound, partition_column, upper_bound, partition_name);
+                                EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                                    parent, partition_name, lower_bound, upper_bound);
+                            ELSE
+                                EXECUTE format('CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                                    partition_name, parent, lower_bound, upper_bound);
+                            END IF;
+                            created := created + 1;
+                        END IF;
+                        month := (month + interval '1 month')::date;
+                    END LOOP;
+                    RETURN created;
+                END $$;");
+
+            // Moves every month found in "<parent>_default" into its own partition; called by the archival job
+            migrationBuilder.Sql(@"
+                CREATE OR REPLACE FUNCTION ncs_split_default_partition(parent text)
+                RETURNS integer
+                LANGUAGE plpgsql
+                SET timezone = 'UTC' AS $$
+                DECLARE
+                    default_name text := parent || '_default';
+                    partition_column text;
+                    month date;
+                    created integer := 0;
+                BEGIN
+                    IF to_regclass(format('%I', default_name)) IS NULL THEN
+                        RETURN 0;
+                    END IF;
+
+                    SELECT a.attname INTO partition_column
+                    FROM pg_partitioned_table p
+                    JOIN pg_attribute a ON a.attrelid = p.partrelid AND a.attnum = p.partattrs[0]
+                    WHERE p.partrelid = to_regclass(format('%I', parent));
+
+                    FOR month IN EXECUTE format('SELECT DISTINCT date_trunc(''month'', %I)::date FROM %I', partition_column, default_name) LOOP
+                        created := created + ncs_ensure_monthly_partitions(parent, month, month);
+                    END LOOP;
+                    RETURN created;
+                END $$;");
+
+            migrationBuilder.Sql(@"
+                DO $$
+                DECLARE
+                    parent text;
+                BEGIN
+                    FOREACH parent IN ARRAY ARRAY['AuditEvents', 'InventoryTransactions'] LOOP
+                        CONTINUE WHEN NOT EXISTS (
+                            SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(format('%I', parent)));
+                        EXECUTE format('CREATE TABLE IF NOT EXISTS %I PARTITION OF %I DEFAULT', parent || '_default', parent);
+                    END LOOP;
+                END $$;");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            // Rows are moved to monthly partitions before the default partitions go; the Up version of
+            // ncs_ensure_monthly_partitions stays, as it behaves as before without a default partition
+            migrationBuilder.Sql(@"
+                DO $$
+                DECLARE
+                    parent text;
+                BEGIN
+                    FOREACH parent IN ARRAY ARRAY['AuditEvents', 'InventoryTransactions'] LOOP
+                        CONTINUE WHEN to_regclass(format('%I', parent || '_default')) IS NULL;
+                        PERFORM ncs_split_default_partition(parent);
+                        EXECUTE format('DROP TABLE %I', parent || '_default');
+                    END LOOP;
+                END $$;");
+
+            migrationBuilder.Sql(@"DROP FUNCTION IF EXISTS ncs_split_default_partition(text);");
+        }
+    }
+}
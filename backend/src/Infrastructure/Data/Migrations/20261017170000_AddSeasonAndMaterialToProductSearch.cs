@@ -0,0 +1,48 @@
+using Microsoft.EntityFrameworkCore.Infrastructure;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace NationalClothingStore.Infrastructure.Data.Migrations
+{
+    /// <summary>
+    /// Season and Material in the product search vector, which the LIKE search matched before
+    /// 20261017100000_AddCatalogSearchIndexes replaced it
+    /// </summary>
+    [DbContext(typeof(NationalClothingStoreDbContext))]
+    [Migration("20261017170000_AddSeasonAndMaterialToProductSearch")]
+    public partial class AddSeasonAndMaterialToProductSearch : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // A generated column's expression cannot be altered; drop and re-add it with its index
+            migrationBuilder.Sql(@"DROP INDEX IF EXISTS ""IX_Products_SearchVector"";");
+            migrationBuilder.Sql(@"ALTER TABLE ""Products"" DROP COLUMN IF EXISTS ""SearchVector"";");
+            migrationBuilder.Sql(@"
+                ALTER TABLE ""Products"" ADD COLUMN ""SearchVector"" tsvector
+                    GENERATED ALWAYS AS (
+                        setweight(to_tsvector('simple', coalesce(""Name"", '')), 'A') ||
+                        setweight(to_tsvector('simple', coalesce(""Brand"", '')), 'B') ||
+                        setweight(to_tsvector('simple', coalesce(""Description"", '')), 'C') ||
+                        setweight(to_tsvector('simple', coalesce(""Season"", '') || ' ' || coalesce(""Material"", '')), 'D')
+                    ) STORED;");
+            migrationBuilder.Sql(@"CREATE INDEX ""IX_Products_SearchVector"" ON ""Products"" USING gin (""SearchVector"");");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.Sql(@"DROP INDEX IF EXISTS ""IX_Products_SearchVector"";");
+            migrationBuilder.Sql(@"ALTER TABLE ""Products"" DROP COLUMN IF EXISTS ""SearchVector"";");
+            migrationBuilder.Sql(@"
+                ALTER TABLE ""Products"" ADD COLUMN ""SearchVector"" tsvector
+                    GENERATED ALWAYS AS (
+                        setweight(to_tsvector('simple', coalesce(""Name"", '')), 'A') ||
+                        setweight(to_tsvector('simple', coalesce(""Brand"", '')), 'B') ||
+                        setweight(to_tsvector('simple', coalesce(""Description"", '')), 'C')
+                    ) STORED;");
+            migrationBuilder.Sql(@"CREATE INDEX ""IX_Products_SearchVector"" ON ""Products"" USING gin (""SearchVector"");");
+        }
+    }
+}
@@ -1,5 +1,6 @@
 using Microsoft.EntityFrameworkCore;
 using NationalClothingStore.Domain.Entities;
+using NpgsqlTypes;
 
 namespace NationalClothingStore.Infrastructure.Data;
 
@@ -54,6 +55,8 @@ public class NationalClothingStoreDbContext : DbContext
     protected override void OnModelCreating(ModelBuilder modelBuilder)
     {
         base.OnModelCreating(modelBuilder);
+
+        modelBuilder.HasPostgresExtension("pg_trgm");
         
         // Configure table names
         modelBuilder.Entity<Customer>().ToTable("Customers");
@@ -126,6 +129,43 @@ public class NationalClothingStoreDbContext : DbContext
         modelBuilder.Entity<SalesTransaction>()
             .HasIndex(st => st.CreatedAt);
             
+        // Keyset pagination sort keys for product and variation listings
+        modelBuilder.Entity<Product>()
+            .HasIndex(p => new { p.Name, p.Id });
+            
+        modelBuilder.Entity<ProductVariation>()
+            .HasIndex(pv => new { pv.ProductId, pv.Size, pv.Color, pv.Id });
+            
+        // Product search: weighted full-text vector plus trigram indexes, which also
+        // serve case-insensitive SKU prefix lookups (ILIKE 'abc%')
+        modelBuilder.Entity<Product>()
+            .Property<NpgsqlTsVector>("SearchVector")
+            .HasComputedColumnSql(
+                "setweight(to_tsvector('simple', coalesce(\"Name\", '')), 'A') || " +
+                "setweight(to_tsvector('simple', coalesce(\"Brand\", '')), 'B') || " +
+                "setweight(to_tsvector('simple', coalesce(\"Description\", '')), 'C') || " +
+                "setweight(to_tsvector('simple', coalesce(\"Season\", '') || ' ' || coalesce(\"Material\", '')), 'D')",
+                stored: true);
+            
+        modelBuilder.Entity<Product>()
+            .HasIndex("SearchVector")
+            .HasMethod("gin");
+            
+        modelBuilder.Entity<Product>()
+            .HasIndex(p => p.Name, "IX_Products_Name_Trgm")
+            .HasMethod("gin")
+            .HasOperators("gin_trgm_ops");
+            
+        modelBuilder.Entity<Product>()
+            .HasIndex(p => p.SKU, "IX_Products_SKU_Trgm")
+            .HasMethod("gin")
+            .HasOperators("gin_trgm_ops");
+            
+        modelBuilder.Entity<Category>()
+            .HasIndex(c => new { c.Name, c.Code, c.Description }, "IX_Categories_Search_Trgm")
+            .HasMethod("gin")
+            .HasOperators("gin_trgm_ops", "gin_trgm_ops", "gin_trgm_ops");
+            
         // Configure AuditEvent entity to handle the Metadata property
         modelBuilder.Entity<AuditEvent>()
             .Ignore(ae => ae.Metadata);
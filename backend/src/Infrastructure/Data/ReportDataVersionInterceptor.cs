@@ -0,0 +1,171 @@
+using System.Data.Common;
+using System.Diagnostics.CodeAnalysis;
+using System.Runtime.CompilerServices;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.EntityFrameworkCore.Diagnostics;
+using NationalClothingStore.Application.Interfaces;
+using NationalClothingStore.Domain.Entities;
+
+namespace NationalClothingStore.Infrastructure.Data;
+
+/// <summary>
+/// Bumps report data versions once a save that touched sales, inventory or procurement rows is committed,
+/// so cached reports over those data sets are regenerated on next request. Saves inside an explicit
+/// transaction are published when that transaction commits: bumping earlier would let a report computed
+/// before the commit, from the old rows, be cached under the new version.
+/// Set-based writes (ExecuteUpdate/ExecuteDelete, raw SQL) bypass SaveChanges and must call
+/// <see cref="IReportCache.BumpDataVersionAsync"/> themselves.
+/// </summary>
+public class ReportDataVersionInterceptor(IReportCache reportCache) : SaveChangesInterceptor, IDbTransactionInterceptor
+{
+    private static readonly Dictionary<Type, string> DataSetsByEntity = new()
+    {
+        [typeof(SalesTransaction)] = ReportDataSets.Sales,
+        [typeof(SalesTransactionItem)] = ReportDataSets.Sales,
+        [typeof(SalesTransactionPayment)] = ReportDataSets.Sales,
+        [typeof(Customer)] = ReportDataSets.Sales,
+        [typeof(CustomerLoyalty)] = ReportDataSets.Sales,
+        [typeof(LoyaltyTransaction)] = ReportDataSets.Sales,
+        [typeof(Inventory)] = ReportDataSets.Inventory,
+        [typeof(InventoryTransaction)] = ReportDataSets.Inventory,
+        [typeof(ProductVariation)] = ReportDataSets.Inventory,
+        [typeof(Supplier)] = ReportDataSets.Procurement,
+        [typeof(PurchaseOrder)] = ReportDataSets.Procurement,
+        [typeof(PurchaseOrderItem)] = ReportDataSets.Procurement
+    };
+
+    // The interceptor is a singleton shared by every context; changes are captured per context before
+    // saving (the change tracker is reset afterwards), accumulated across the saves of a transaction and
+    // published once they are committed
+    private readonly ConditionalWeakTable<DbContext, HashSet<string>> _pending = new();
+
+    public override InterceptionResult<int> SavingChanges(DbContextEventData eventData, InterceptionResult<int> result)
+    {
+        Capture(eventData.Context);
+        return base.SavingChanges(eventData, result);
+    }
+
+    public override ValueTask<InterceptionResult<int>> SavingChangesAsync(
+        DbContextEventData eventData,
+        InterceptionResult<int> result,
+        CancellationToken cancellationToken = default)
+    {
+        Capture(eventData.Context);
+        return base.SavingChangesAsync(eventData, result, cancellationToken);
+    }
+
+    public override int SavedChanges(SaveChangesCompletedEventData eventData, int result)
+    {
+        if (eventData.Context?.Database.CurrentTransaction == null)
+        {
+            Publish(eventData.Context);
+        }
+
+        return base.SavedChanges(eventData, result);
+    }
+
+    public override async ValueTask<int> SavedChangesAsync(
+        SaveChangesCompletedEventData eventData,
+        int result,
+        CancellationToken cancellationToken = default)
+    {
+        if (eventData.Context?.Database.CurrentTransaction == null)
+        {
+            // The rows are committed at this point; don't let a cancelled request skip the bump
+            await PublishAsync(eventData.Context, CancellationToken.None);
+        }
+
+        return await base.SavedChangesAsync(eventData, result, cancellationToken);
+    }
+
+    public override void SaveChangesFailed(DbContextErrorEventData eventData)
+    {
+        DiscardUnlessInTransaction(eventData.Context);
+        base.SaveChangesFailed(eventData);
+    }
+
+    public override Task SaveChangesFailedAsync(DbContextErrorEventData eventData, CancellationToken cancellationToken = default)
+    {
+        DiscardUnlessInTransaction(eventData.Context);
+        return base.SaveChangesFailedAsync(eventData, cancellationToken);
+    }
+
+    public void TransactionCommitted(DbTransaction transaction, TransactionEndEventData eventData) =>
+        Publish(eventData.Context);
+
+    public Task TransactionCommittedAsync(DbTransaction transaction, TransactionEndEventData eventData, CancellationToken cancellationToken = default) =>
+        PublishAsync(eventData.Context, CancellationToken.None);
+
+    public void TransactionRolledBack(DbTransaction transaction, TransactionEndEventData eventData) =>
+        Discard(eventData.Context);
+
+    public Task TransactionRolledBackAsync(DbTransaction transaction, TransactionEndEventData eventData, CancellationToken cancellationToken = default)
+    {
+        Discard(eventData.Context);
+        return Task.CompletedTask;
+    }
+
+    private void Capture(DbContext? context)
+    {
+        if (context == null)
+        {
+            return;
+        }
+
+        var dataSets = context.ChangeTracker.Entries()
+            .Where(entry => entry.State is EntityState.Added or EntityState.Modified or EntityState.Deleted)
+            .Select(entry => DataSetsByEntity.GetValueOrDefault(entry.Metadata.ClrType))
+            .OfType<string>()
+            .ToHashSet();
+
+        if (dataSets.Count > 0)
+        {
+            _pending.GetValue(context, _ => new HashSet<string>()).UnionWith(dataSets);
+        }
+    }
+
+    private void Publish(DbContext? context)
+    {
+        if (TryTake(context, out var dataSets))
+        {
+            reportCache.BumpDataVersion(dataSets);
+        }
+    }
+
+    private async Task PublishAsync(DbContext? context, CancellationToken cancellationToken)
+    {
+        if (TryTake(context, out var dataSets))
+        {
+            await reportCache.BumpDataVersionAsync(dataSets, cancellationToken);
+        }
+    }
+
+    private bool TryTake(DbContext? context, [NotNullWhen(true)] out HashSet<string>? dataSets)
+    {
+        dataSets = null;
+        if (context == null || !_pending.TryGetValue(context, out dataSets))
+        {
+            return false;
+        }
+
+        _pending.Remove(context);
+        return true;
+    }
+
+    // A failed save inside a transaction leaves that transaction's earlier saves to its commit or rollback
+    private void DiscardUnlessInTransaction(DbContext? context)
+    {
+        if (context?.Database.CurrentTransaction == null)
+        {
+            Discard(context);
+        }
+    }
+
+    private void Discard(DbContext? context)
+    {
+        if (context != null)
+        {
+            _pending.Remove(context);
+        }
+    }
+}
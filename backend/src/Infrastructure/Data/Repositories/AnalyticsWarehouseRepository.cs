@@ -0,0 +1,126 @@
+using Microsoft.EntityFrameworkCore;
+using NationalClothingStore.Application.Interfaces;
+
+namespace NationalClothingStore.Infrastructure.Data.Repositories;
+
+/// <summary>
+/// Runs the warehouse loaders defined in Data/Analytics/002_CreateIncrementalLoad.sql and reads the sales
+/// rollups from 003_CreateSalesRollups.sql
+/// </summary>
+public class AnalyticsWarehouseRepository(NationalClothingStoreDbContext context) : IAnalyticsWarehouseRepository
+{
+    public async Task<int> LoadBatchAsync(string sourceTable, DateTime loadedUntil, int batchSize, CancellationToken cancellationToken = default)
+    {
+        // A single statement, so the batch and its watermark commit or roll back together
+        var loaded = await context.Database
+            .SqlQuery<int>($"""
+                SELECT "analytics"."LoadIncremental"({sourceTable}, {loadedUntil}, {batchSize}) AS "Value"
+                """)
+            .ToListAsync(cancellationToken);
+
+        return loaded[0];
+    }
+
+    public async Task<IReadOnlyList<EtlWatermark>> GetWatermarksAsync(CancellationToken cancellationToken = default)
+    {
+        return await context.Database
+            .SqlQuery<EtlWatermark>($"""
+                SELECT "SourceTable", "LastModifiedAt", "RowsLoaded", "LastRunAt"
+                FROM "analytics"."EtlWatermarks"
+                ORDER BY "SourceTable"
+                """)
+            .ToListAsync(cancellationToken);
+    }
+
+    public async Task<int> RefreshSalesRollupsAsync(int maxDays, CancellationToken cancellationToken = default)
+    {
+        var refreshed = await context.Database
+            .SqlQuery<int>($"""
+                SELECT "analytics"."RefreshSalesRollups"({maxDays}) AS "Value"
+                """)
+            .ToListAsync(cancellationToken);
+
+        return refreshed[0];
+    }
+
+    public async Task<IReadOnlyList<SalesPeriodTotals>> GetSalesByPeriodAsync(
+        SalesBucket bucket, DateOnly from, DateOnly to, Guid? locationId = null, CancellationToken cancellationToken = default)
+    {
+        var (grain, grainUnit) = StoredGrain(bucket);
+        var bucketUnit = BucketUnit(bucket);
+
+        return await context.Database
+            .SqlQuery<SalesPeriodTotals>($"""
+                SELECT date_trunc({bucketUnit}, r."PeriodStart")::date AS "PeriodStart",
+                       sum(r."TransactionCount")::integer AS "TransactionCount",
+                       sum(r."Quantity")::bigint AS "Quantity",
+                       sum(r."GrossSales") AS "GrossSales",
+                       sum(r."NetSales") AS "NetSales",
+                       sum(r."CostAmount") AS "CostAmount",
+                       sum(r."GrossProfit") AS "GrossProfit"
+                FROM "analytics"."CoveringSalesLocationRollup"({grain}, {grainUnit}, {from}, {to}) r
+                WHERE ({locationId}::uuid IS NULL OR r."LocationId" = {locationId}::uuid)
+                GROUP BY 1
+                ORDER BY 1
+                """)
+            .ToListAsync(cancellationToken);
+    }
+
+    public async Task<IReadOnlyList<ProductSalesTotals>> GetTopProductsAsync(
+        DateOnly from, DateOnly to, int limit, Guid? locationId = null, CancellationToken cancellationToken = default)
+    {
+        var (grain, grainUnit) = StoredGrain(SalesBucket.Month);
+
+        return await context.Database
+            .SqlQuery<ProductSalesTotals>($"""
+                SELECT r."ProductId",
+                       coalesce(max(pd."ProductName"), 'Unknown') AS "ProductName",
+                       max(r."ProductCategory") AS "ProductCategory",
+                       sum(r."Quantity")::bigint AS "Quantity",
+                       sum(r."NetSales") AS "NetSales"
+                FROM "analytics"."CoveringSalesRollup"({grain}, {grainUnit}, {from}, {to}) r
+                LEFT JOIN "analytics"."ProductDimension" pd ON pd."ProductId" = r."ProductId"
+                WHERE ({locationId}::uuid IS NULL OR r."LocationId" = {locationId}::uuid)
+                GROUP BY r."ProductId"
+                ORDER BY "NetSales" DESC
+                LIMIT {limit}
+                """)
+            .ToListAsync(cancellationToken);
+    }
+
+    public async Task<IReadOnlyList<PaymentMethodSalesTotals>> GetSalesByPaymentMethodAsync(
+        DateOnly from, DateOnly to, Guid? locationId = null, CancellationToken cancellationToken = default)
+    {
+        var (grain, grainUnit) = StoredGrain(SalesBucket.Month);
+
+        return await context.Database
+            .SqlQuery<PaymentMethodSalesTotals>($"""
+                SELECT r."PaymentMethod",
+                       sum(r."TransactionCount")::integer AS "TransactionCount",
+                       sum(r."NetSales") AS "NetSales"
+                FROM "analytics"."CoveringSalesLocationRollup"({grain}, {grainUnit}, {from}, {to}) r
+                WHERE ({locationId}::uuid IS NULL OR r."LocationId" = {locationId}::uuid)
+                GROUP BY r."PaymentMethod"
+                ORDER BY "NetSales" DESC
+                """)
+            .ToListAsync(cancellationToken);
+    }
+
+    // The stored grain a bucket is built from: quarters and years are summed from months
+    private static (string Grain, string Unit) StoredGrain(SalesBucket bucket) => bucket switch
+    {
+        SalesBucket.Day => ("D", "day"),
+        SalesBucket.Week => ("W", "week"),
+        _ => ("M", "month")
+    };
+
+    private static string BucketUnit(SalesBucket bucket) => bucket switch
+    {
+        SalesBucket.Day => "day",
+        SalesBucket.Week => "week",
+        SalesBucket.Month => "month",
+        SalesBucket.Quarter => "quarter",
+        SalesBucket.Year => "year",
+        _ => throw new ArgumentOutOfRangeException(nameof(bucket), bucket, null)
+    };
+}
@@ -198,29 +198,35 @@ public class CategoryRepository(NationalClothingStoreDbContext context) : ICateg
 
     public async Task<IEnumerable<Category>> GetHierarchyAsync(Guid? rootId = null, CancellationToken cancellationToken = default)
     {
-        if (rootId.HasValue)
-        {
-            // Get hierarchy starting from specific root
-            var rootCategory = await GetByIdAsync(rootId.Value, cancellationToken);
-            if (rootCategory == null)
-            {
-                return Enumerable.Empty<Category>();
-            }
-            
-            return await GetCategoryHierarchyRecursive(rootCategory, cancellationToken);
-        }
-
-        // Get all root categories and their hierarchies
-        var rootCategories = await GetRootCategoriesAsync(cancellationToken);
-        var allCategories = new List<Category>();
-
-        foreach (var root in rootCategories)
-        {
-            var hierarchy = await GetCategoryHierarchyRecursive(root, cancellationToken);
-            allCategories.AddRange(hierarchy);
-        }
-
-        return allCategories;
+        // One round-trip: the recursive CTE walks every active branch below the root(s);
+        // the rows come back flat and are linked through ParentCategoryId
+        var categories = rootId.HasValue
+            ? await context.Categories
+                .FromSql($"""
+                    WITH RECURSIVE tree AS (
+                        SELECT c.* FROM "Categories" c WHERE c."Id" = {rootId.Value}
+                        UNION
+                        SELECT c.* FROM "Categories" c
+                        JOIN tree t ON c."ParentCategoryId" = t."Id"
+                        WHERE c."IsActive"
+                    )
+                    SELECT * FROM tree
+                    """)
+                .ToListAsync(cancellationToken)
+            : await context.Categories
+                .FromSql($"""
+                    WITH RECURSIVE tree AS (
+                        SELECT c.* FROM "Categories" c WHERE c."ParentCategoryId" IS NULL AND c."IsActive"
+                        UNION
+                        SELECT c.* FROM "Categories" c
+                        JOIN tree t ON c."ParentCategoryId" = t."Id"
+                        WHERE c."IsActive"
+                    )
+                    SELECT * FROM tree
+                    """)
+                .ToListAsync(cancellationToken);
+
+        return OrderDepthFirst(categories);
     }
 
     public async Task<IEnumerable<Category>> SearchAsync(string searchTerm, CancellationToken cancellationToken = default)
@@ -230,47 +236,70 @@ public class CategoryRepository(NationalClothingStoreDbContext context) : ICateg
             return await GetActiveAsync(cancellationToken);
         }
 
+        var pattern = $"%{SearchQueries.EscapeLike(searchTerm.Trim())}%";
+
         return await context.Categories
             .Include(c => c.ParentCategory)
             .Include(c => c.ChildCategories)
+            // ILIKE keeps the search case-insensitive and lets the trigram index serve it
             .Where(c => c.IsActive && (
-                c.Name.Contains(searchTerm) ||
-                (c.Description != null && c.Description.Contains(searchTerm)) ||
-                (c.Code != null && c.Code.Contains(searchTerm))
+                EF.Functions.ILike(c.Name, pattern) ||
+                (c.Description != null && EF.Functions.ILike(c.Description, pattern)) ||
+                (c.Code != null && EF.Functions.ILike(c.Code, pattern))
             ))
             .OrderBy(c => c.SortOrder)
             .ThenBy(c => c.Name)
             .ToListAsync(cancellationToken);
     }
 
-    private async Task<List<Category>> GetCategoryHierarchyRecursive(Category parent, CancellationToken cancellationToken)
+    private static List<Category> OrderDepthFirst(List<Category> categories)
     {
-        var hierarchy = new List<Category> { parent };
-        
-        var children = await context.Categories
-            .Include(c => c.ChildCategories)
-            .Where(c => c.ParentCategoryId == parent.Id && c.IsActive)
-            .OrderBy(c => c.SortOrder)
-            .ThenBy(c => c.Name)
-            .ToListAsync(cancellationToken);
-
-        foreach (var child in children)
+        // Parents come before their children, siblings by SortOrder then Name
+        var loadedIds = categories.Select(c => c.Id).ToHashSet();
+        var childrenByParent = categories
+            .Where(c => c.ParentCategoryId.HasValue && loadedIds.Contains(c.ParentCategoryId.Value))
+            .ToLookup(c => c.ParentCategoryId!.Value);
+
+        var ordered = new List<Category>(categories.Count);
+        var pending = new Stack<Category>(
+            categories
+                .Where(c => !c.ParentCategoryId.HasValue || !loadedIds.Contains(c.ParentCategoryId.Value))
+                .OrderByDescending(c => c.SortOrder)
+                .ThenByDescending(c => c.Name));
+
+        while (pending.Count > 0)
         {
-            hierarchy.AddRange(await GetCategoryHierarchyRecursive(child, cancellationToken));
+            var category = pending.Pop();
+            ordered.Add(category);
+
+            foreach (var child in childrenByParent[category.Id]
+                .OrderByDescending(c => c.SortOrder)
+                .ThenByDescending(c => c.Name))
+            {
+                pending.Push(child);
+            }
         }
 
-        return hierarchy;
+        return ordered;
     }
 
     private async Task<bool> WouldCreateCircularReference(Guid categoryId, Guid newParentId, CancellationToken cancellationToken)
     {
-        // Check if the new parent is already a descendant of the category
-        var descendants = await GetCategoryHierarchyRecursive(
-            await GetByIdAsync(categoryId, cancellationToken) ?? 
-            throw new InvalidOperationException($"Category with ID '{categoryId}' not found."),
-            cancellationToken
-        );
-
-        return descendants.Any(c => c.Id == newParentId);
+        // The move is circular when the category is the new parent or one of its ancestors;
+        // walking up from the new parent is a single query bounded by the tree depth.
+        // UNION (not UNION ALL) stops the walk even if the stored data already has a cycle.
+        var matches = await context.Database
+            .SqlQuery<Guid>($"""
+                WITH RECURSIVE ancestors AS (
+                    SELECT c."Id", c."ParentCategoryId" FROM "Categories" c WHERE c."Id" = {newParentId}
+                    UNION
+                    SELECT c."Id", c."ParentCategoryId" FROM "Categories" c
+                    JOIN ancestors a ON c."Id" = a."ParentCategoryId"
+                )
+                SELECT a."Id" AS "Value" FROM ancestors a WHERE a."Id" = {categoryId}
+                """)
+            .ToListAsync(cancellationToken);
+
+        return matches.Count > 0;
     }
 }
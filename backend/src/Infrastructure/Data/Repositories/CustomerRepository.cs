@@ -17,6 +17,13 @@ public class CustomerRepository(NationalClothingStoreDbContext context) : ICusto
             .FirstOrDefaultAsync(c => c.Id == id, cancellationToken);
     }
 
+    public async Task<Customer?> GetWithLoyaltyAsync(Guid id, CancellationToken cancellationToken = default)
+    {
+        return await context.Customers
+            .Include(c => c.Loyalty)
+            .FirstOrDefaultAsync(c => c.Id == id, cancellationToken);
+    }
+
     public async Task<Customer?> GetByEmailAsync(string email, CancellationToken cancellationToken = default)
     {
         return await context.Customers
@@ -8,7 +8,7 @@ namespace NationalClothingStore.Infrastructure.Data.Repositories;
 /// <summary>
 /// Repository implementation for Inventory entity
 /// </summary>
-public class InventoryRepository(NationalClothingStoreDbContext context)
+public class InventoryRepository(NationalClothingStoreDbContext context, IReportCache reportCache)
     : Repository<Inventory>(context), IInventoryRepository
 {
     /// <summary>
@@ -24,6 +24,16 @@ public class InventoryRepository(NationalClothingStoreDbContext context)
             .FirstOrDefaultAsync(i => i.Id == id, cancellationToken);
     }
 
+    /// <summary>
+    /// Get inventory rows by ID in one query, without related entities
+    /// </summary>
+    public async Task<IEnumerable<Inventory>> GetByIdsAsync(IReadOnlyCollection<Guid> ids, CancellationToken cancellationToken = default)
+    {
+        return await Context.Inventories
+            .Where(i => ids.Contains(i.Id))
+            .ToListAsync(cancellationToken);
+    }
+
     /// <summary>
     /// Get inventory by product and location
     /// </summary>
@@ -231,39 +241,101 @@ public class InventoryRepository(NationalClothingStoreDbContext context)
     /// <summary>
     /// Reserve inventory quantity
     /// </summary>
-    public async Task ReserveQuantityAsync(Guid id, int quantity, CancellationToken cancellationToken = default)
+    public async Task<Inventory> ReserveQuantityAsync(Guid id, int quantity, InventoryTransaction movement, CancellationToken cancellationToken = default)
     {
-        var inventory = await GetByIdAsync(id, cancellationToken);
-        if (inventory == null)
-            throw new KeyNotFoundException($"Inventory with ID {id} not found");
+        var inventory = await ApplyStockChangeAsync(id, quantity, null, null, null, movement, cancellationToken);
+        if (inventory != null)
+            return inventory;
 
-        if (inventory.AvailableQuantity < quantity)
-            throw new InvalidOperationException($"Insufficient available quantity. Available: {inventory.AvailableQuantity}, Requested: {quantity}");
+        var current = await FindCurrentAsync(id, cancellationToken);
+        throw new InvalidOperationException($"Insufficient available quantity. Available: {current.AvailableQuantity}, Requested: {quantity}");
+    }
 
-        inventory.ReservedQuantity += quantity;
-        inventory.AvailableQuantity = inventory.Quantity - inventory.ReservedQuantity;
-        inventory.LastUpdated = DateTime.UtcNow;
+    /// <summary>
+    /// Release reserved inventory quantity
+    /// </summary>
+    public async Task<Inventory> ReleaseReservedQuantityAsync(Guid id, int quantity, InventoryTransaction movement, CancellationToken cancellationToken = default)
+    {
+        var inventory = await ApplyStockChangeAsync(id, -quantity, null, null, null, movement, cancellationToken);
+        if (inventory != null)
+            return inventory;
 
-        await Context.SaveChangesAsync(cancellationToken);
+        var current = await FindCurrentAsync(id, cancellationToken);
+        throw new InvalidOperationException($"Cannot release more than reserved quantity. Reserved: {current.ReservedQuantity}, Requested: {quantity}");
     }
 
     /// <summary>
-    /// Release reserved inventory quantity
+    /// Set the on-hand quantity if it still equals the expected value
     /// </summary>
-    public async Task ReleaseReservedQuantityAsync(Guid id, int quantity, CancellationToken cancellationToken = default)
+    public async Task<Inventory?> TrySetQuantityAsync(
+        Guid id,
+        int expectedQuantity,
+        int quantity,
+        decimal unitCost,
+        InventoryTransaction movement,
+        CancellationToken cancellationToken = default)
     {
-        var inventory = await GetByIdAsync(id, cancellationToken);
-        if (inventory == null)
-            throw new KeyNotFoundException($"Inventory with ID {id} not found");
+        return await ApplyStockChangeAsync(id, 0, quantity, unitCost, expectedQuantity, movement, cancellationToken);
+    }
 
-        if (inventory.ReservedQuantity < quantity)
-            throw new InvalidOperationException($"Cannot release more than reserved quantity. Reserved: {inventory.ReservedQuantity}, Requested: {quantity}");
+    // One statement per change: the row lock is held only while the UPDATE runs, the guards are
+    // evaluated against the latest committed row (so concurrent writers can't oversell or lose
+    // updates), and the movement record commits atomically with the stock change
+    private async Task<Inventory?> ApplyStockChangeAsync(
+        Guid id,
+        int reservedDelta,
+        int? quantity,
+        decimal? unitCost,
+        int? expectedQuantity,
+        InventoryTransaction movement,
+        CancellationToken cancellationToken)
+    {
+        var now = DateTime.UtcNow;
+        var movementId = movement.Id == Guid.Empty ? Guid.NewGuid() : movement.Id;
+
+        var rows = await Context.Inventories
+            .FromSql($"""
+                WITH updated AS (
+                    UPDATE "Inventories"
+                    SET "Quantity" = COALESCE({quantity}::integer, "Quantity"),
+                        "ReservedQuantity" = "ReservedQuantity" + {reservedDelta},
+                        "AvailableQuantity" = COALESCE({quantity}::integer, "Quantity") - ("ReservedQuantity" + {reservedDelta}),
+                        "UnitCost" = COALESCE({unitCost}::numeric, "UnitCost"),
+                        "LastUpdated" = {now}
+                    WHERE "Id" = {id}
+                      AND ({expectedQuantity}::integer IS NULL OR "Quantity" = {expectedQuantity}::integer)
+                      AND "ReservedQuantity" + {reservedDelta} >= 0
+                      AND COALESCE({quantity}::integer, "Quantity") - ("ReservedQuantity" + {reservedDelta}) >= 0
+                    RETURNING *
+                ),
+                movement AS (
+                    INSERT INTO "InventoryTransactions"
+                        ("Id", "InventoryId", "TransactionType", "Quantity", "UnitCost", "ReferenceNumber", "Reason", "CreatedByUserId", "CreatedAt")
+                    SELECT {movementId}, u."Id", {movement.TransactionType}, {movement.Quantity}, u."UnitCost",
+                           {movement.ReferenceNumber}, {movement.Reason}, {movement.CreatedByUserId}, {now}
+                    FROM updated u
+                )
+                SELECT * FROM updated
+                """)
+            .ToListAsync(cancellationToken);
 
-        inventory.ReservedQuantity -= quantity;
-        inventory.AvailableQuantity = inventory.Quantity - inventory.ReservedQuantity;
-        inventory.LastUpdated = DateTime.UtcNow;
+        if (rows.Count == 0)
+            return null;
 
-        await Context.SaveChangesAsync(cancellationToken);
+        // Raw SQL bypasses SaveChanges, so the report data version interceptor never sees this write
+        await reportCache.BumpDataVersionAsync([ReportDataSets.Inventory], CancellationToken.None);
+
+        movement.Id = movementId;
+        movement.InventoryId = id;
+        movement.UnitCost = rows[0].UnitCost;
+        movement.CreatedAt = now;
+        return rows[0];
+    }
+
+    private async Task<Inventory> FindCurrentAsync(Guid id, CancellationToken cancellationToken)
+    {
+        return await Context.Inventories.FirstOrDefaultAsync(i => i.Id == id, cancellationToken)
+            ?? throw new KeyNotFoundException($"Inventory with ID {id} not found");
     }
 
     /// <summary>
@@ -343,6 +415,90 @@ public class InventoryRepository(NationalClothingStoreDbContext context)
                 cancellationToken);
     }
 
+    /// <summary>
+    /// Run a bulk operation in one database transaction over locked inventory rows
+    /// </summary>
+    public async Task<TResult> ExecuteBatchAsync<TResult>(
+        IReadOnlyCollection<Guid> inventoryIds,
+        IReadOnlyCollection<Guid> destinationBranchIds,
+        IReadOnlyCollection<Guid> destinationWarehouseIds,
+        Func<InventoryBatchSnapshot, (InventoryBatchPlan plan, TResult result)> planner,
+        CancellationToken cancellationToken = default)
+    {
+        var ids = inventoryIds.Distinct().ToArray();
+        var branchIds = destinationBranchIds.Distinct().ToArray();
+        var warehouseIds = destinationWarehouseIds.Distinct().ToArray();
+
+        // The retrying execution strategy only allows explicit transactions inside ExecuteAsync
+        var strategy = Context.Database.CreateExecutionStrategy();
+        return await strategy.ExecuteAsync(async ct =>
+        {
+            Context.ChangeTracker.Clear();
+            await using var transaction = await Context.Database.BeginTransactionAsync(ct);
+
+            var productIds = branchIds.Length == 0
+                ? []
+                : await Context.Inventories
+                    .Where(i => ids.Contains(i.Id))
+                    .Select(i => i.ProductId)
+                    .Distinct()
+                    .ToArrayAsync(ct);
+
+            // Sources and every candidate destination row in one statement, locked in Id order
+            // so concurrent batches over overlapping rows queue instead of deadlocking
+            var rows = await Context.Inventories
+                .FromSql($"""
+                    SELECT * FROM "Inventories"
+                    WHERE "Id" = ANY({ids})
+                       OR ("ProductId" = ANY({productIds}) AND "BranchId" = ANY({branchIds}))
+                    ORDER BY "Id"
+                    FOR UPDATE
+                    """)
+                .ToListAsync(ct);
+
+            var snapshot = new InventoryBatchSnapshot
+            {
+                Inventories = rows.ToDictionary(i => i.Id),
+                BranchIds = branchIds.Length == 0
+                    ? []
+                    : (await Context.Branches.Where(b => branchIds.Contains(b.Id)).Select(b => b.Id).ToListAsync(ct)).ToHashSet(),
+                WarehouseIds = warehouseIds.Length == 0
+                    ? []
+                    : (await Context.Warehouses.Where(w => warehouseIds.Contains(w.Id)).Select(w => w.Id).ToListAsync(ct)).ToHashSet()
+            };
+
+            var (plan, result) = planner(snapshot);
+
+            // New rows and transaction records go out in MaxBatchSize-sized INSERT batches
+            Context.Inventories.AddRange(plan.NewInventories);
+            Context.InventoryTransactions.AddRange(plan.Transactions);
+            await Context.SaveChangesAsync(ct);
+
+            if (plan.UpdatedInventories.Count > 0)
+            {
+                var updated = plan.UpdatedInventories.Values.ToList();
+                var updatedIds = updated.Select(i => i.Id).ToArray();
+                var quantities = updated.Select(i => i.Quantity).ToArray();
+                var available = updated.Select(i => i.AvailableQuantity).ToArray();
+                var unitCosts = updated.Select(i => i.UnitCost).ToArray();
+                var now = DateTime.UtcNow;
+
+                await Context.Database.ExecuteSqlAsync($"""
+                    UPDATE "Inventories" AS i
+                    SET "Quantity" = u.quantity,
+                        "AvailableQuantity" = u.available,
+                        "UnitCost" = u.unit_cost,
+                        "LastUpdated" = {now}
+                    FROM unnest({updatedIds}, {quantities}, {available}, {unitCosts}) AS u(id, quantity, available, unit_cost)
+                    WHERE i."Id" = u.id
+                    """, ct);
+            }
+
+            await transaction.CommitAsync(ct);
+            return result;
+        }, cancellationToken);
+    }
+
     /// <summary>
     /// Get inventory movements for a specific period
     /// </summary>
@@ -1,6 +1,9 @@
+using System.Linq.Expressions;
+using NationalClothingStore.Application.Common;
 using NationalClothingStore.Application.Interfaces;
 using NationalClothingStore.Domain.Entities;
 using Microsoft.EntityFrameworkCore;
+using NpgsqlTypes;
 
 namespace NationalClothingStore.Infrastructure.Data.Repositories;
 
@@ -9,6 +12,30 @@ namespace NationalClothingStore.Infrastructure.Data.Repositories;
 /// </summary>
 public class ProductRepository(NationalClothingStoreDbContext context) : IProductRepository
 {
+    // Translated to SQL: the counts and primary image come from correlated subqueries,
+    // so a summary page reads one row per product instead of every variation and image
+    private static readonly Expression<Func<Product, ProductSummary>> ToSummary = p => new ProductSummary
+    {
+        Id = p.Id,
+        Name = p.Name,
+        SKU = p.SKU,
+        Brand = p.Brand,
+        Season = p.Season,
+        BasePrice = p.BasePrice,
+        CategoryId = p.CategoryId,
+        CategoryName = p.Category.Name,
+        IsActive = p.IsActive,
+        VariationCount = p.Variations.Count(v => v.IsActive),
+        PrimaryImageUrl = p.Images
+            .Where(i => i.IsActive)
+            .OrderByDescending(i => i.IsPrimary)
+            .ThenBy(i => i.SortOrder)
+            .Select(i => i.ImageUrl)
+            .FirstOrDefault(),
+        CreatedAt = p.CreatedAt,
+        UpdatedAt = p.UpdatedAt
+    };
+
     public async Task<Product?> GetByIdAsync(Guid id, CancellationToken cancellationToken = default)
     {
         return await context.Products
@@ -19,6 +46,12 @@ public class ProductRepository(NationalClothingStoreDbContext context) : IProduc
             .FirstOrDefaultAsync(p => p.Id == id, cancellationToken);
     }
 
+    public async Task<Product?> GetByIdAsync(Guid id, ProductExpand expand, CancellationToken cancellationToken = default)
+    {
+        return await ApplyExpand(context.Products, expand)
+            .FirstOrDefaultAsync(p => p.Id == id, cancellationToken);
+    }
+
     public async Task<Product?> GetBySkuAsync(string sku, CancellationToken cancellationToken = default)
     {
         return await context.Products
@@ -34,15 +67,132 @@ public class ProductRepository(NationalClothingStoreDbContext context) : IProduc
         Guid? categoryId = null,
         string? search = null,
         bool? isActive = null,
+        ProductExpand expand = ProductExpand.All,
         CancellationToken cancellationToken = default)
     {
-        var query = context.Products
-            .Include(p => p.Category)
-            .Include(p => p.Variations)
-            .Include(p => p.Images)
-            .AsQueryable();
+        var query = ApplyFilters(context.Products, categoryId, search, isActive);
+
+        var totalCount = await query.CountAsync(cancellationToken);
+
+        var products = await OffsetPage(ApplyExpand(query, expand), pageNumber, pageSize)
+            .ToListAsync(cancellationToken);
+
+        return (products, totalCount);
+    }
+
+    public async Task<(IEnumerable<ProductSummary> products, int totalCount)> GetPagedSummariesAsync(
+        int pageNumber,
+        int pageSize,
+        Guid? categoryId = null,
+        string? search = null,
+        bool? isActive = null,
+        CancellationToken cancellationToken = default)
+    {
+        var query = ApplyFilters(context.Products, categoryId, search, isActive);
+
+        var totalCount = await query.CountAsync(cancellationToken);
+
+        var products = await OffsetPage(query, pageNumber, pageSize)
+            .Select(ToSummary)
+            .ToListAsync(cancellationToken);
+
+        return (products, totalCount);
+    }
+
+    public async Task<(IEnumerable<Product> products, int? totalCount)> GetPageAfterAsync(
+        int take,
+        string? afterName = null,
+        Guid? afterId = null,
+        Guid? categoryId = null,
+        string? search = null,
+        bool? isActive = null,
+        bool includeTotalCount = true,
+        ProductExpand expand = ProductExpand.All,
+        CancellationToken cancellationToken = default)
+    {
+        var query = ApplyFilters(context.Products, categoryId, search, isActive);
+
+        int? totalCount = includeTotalCount ? await query.CountAsync(cancellationToken) : null;
+
+        var products = await KeysetPage(ApplyExpand(query, expand), take, afterName, afterId)
+            .ToListAsync(cancellationToken);
+
+        return (products, totalCount);
+    }
+
+    public async Task<(IEnumerable<ProductSummary> products, int? totalCount)> GetSummaryPageAfterAsync(
+        int take,
+        string? afterName = null,
+        Guid? afterId = null,
+        Guid? categoryId = null,
+        string? search = null,
+        bool? isActive = null,
+        bool includeTotalCount = true,
+        CancellationToken cancellationToken = default)
+    {
+        var query = ApplyFilters(context.Products, categoryId, search, isActive);
+
+        int? totalCount = includeTotalCount ? await query.CountAsync(cancellationToken) : null;
 
-        // Apply filters
+        var products = await KeysetPage(query, take, afterName, afterId)
+            .Select(ToSummary)
+            .ToListAsync(cancellationToken);
+
+        return (products, totalCount);
+    }
+
+    private static IQueryable<Product> OffsetPage(IQueryable<Product> query, int pageNumber, int pageSize)
+    {
+        return query
+            .OrderBy(p => p.Name)
+            .ThenBy(p => p.Id)
+            .Skip((pageNumber - 1) * pageSize)
+            .Take(pageSize);
+    }
+
+    private static IQueryable<Product> KeysetPage(IQueryable<Product> query, int take, string? afterName, Guid? afterId)
+    {
+        if (afterName != null && afterId.HasValue)
+        {
+            // Row-value comparison (Name, Id) > (@name, @id) seeks the (Name, Id) index
+            // instead of skipping rows, so every page costs the same as the first
+            query = query.Where(p => EF.Functions.GreaterThan(
+                ValueTuple.Create(p.Name, p.Id),
+                ValueTuple.Create(afterName, afterId.Value)));
+        }
+
+        return query
+            .OrderBy(p => p.Name)
+            .ThenBy(p => p.Id)
+            .Take(take);
+    }
+
+    private static IQueryable<Product> ApplyExpand(IQueryable<Product> query, ProductExpand expand)
+    {
+        if (expand.HasFlag(ProductExpand.Category))
+        {
+            query = query.Include(p => p.Category);
+        }
+
+        if (expand.HasFlag(ProductExpand.Variations))
+        {
+            query = query.Include(p => p.Variations);
+        }
+
+        if (expand.HasFlag(ProductExpand.Images))
+        {
+            query = query.Include(p => p.Images);
+        }
+
+        return query;
+    }
+
+    private static IQueryable<Product> ApplyFilters(
+        IQueryable<Product> query,
+        Guid? categoryId,
+        string? search,
+        bool? isActive)
+    {
         if (categoryId.HasValue)
         {
             query = query.Where(p => p.CategoryId == categoryId.Value);
@@ -50,12 +200,7 @@ public class ProductRepository(NationalClothingStoreDbContext context) : IProduc
 
         if (!string.IsNullOrWhiteSpace(search))
         {
-            query = query.Where(p => 
-                p.Name.Contains(search) ||
-                (p.Description != null && p.Description.Contains(search)) ||
-                p.SKU.Contains(search) ||
-                (p.Brand != null && p.Brand.Contains(search))
-            );
+            query = ApplySearch(query, search.Trim());
         }
 
         if (isActive.HasValue)
@@ -63,44 +208,52 @@ public class ProductRepository(NationalClothingStoreDbContext context) : IProduc
             query = query.Where(p => p.IsActive == isActive.Value);
         }
 
-        var totalCount = await query.CountAsync(cancellationToken);
+        return query;
+    }
 
-        var products = await query
-            .OrderBy(p => p.Name)
-            .Skip((pageNumber - 1) * pageSize)
-            .Take(pageSize)
-            .ToListAsync(cancellationToken);
+    private static IQueryable<Product> ApplySearch(IQueryable<Product> query, string searchTerm)
+    {
+        // Word-prefix match on Name/Brand/Description/Season/Material via the GIN tsvector index, or a
+        // case-insensitive SKU prefix match via the trigram index; no sequential scan
+        var skuPrefix = SearchQueries.EscapeLike(searchTerm) + "%";
+        var tsQuery = SearchQueries.ToPrefixTsQuery(searchTerm);
 
-        return (products, totalCount);
+        if (tsQuery == null)
+        {
+            return query.Where(p => EF.Functions.ILike(p.SKU, skuPrefix));
+        }
+
+        return query.Where(p =>
+            EF.Property<NpgsqlTsVector>(p, "SearchVector")
+                .Matches(EF.Functions.ToTsQuery(SearchQueries.TextSearchConfig, tsQuery)) ||
+            EF.Functions.ILike(p.SKU, skuPrefix));
     }
 
-    public async Task<IEnumerable<Product>> GetAllAsync(CancellationToken cancellationToken = default)
+    public async Task<IEnumerable<Product>> GetAllAsync(
+        ProductExpand expand = ProductExpand.All,
+        CancellationToken cancellationToken = default)
     {
-        return await context.Products
-            .Include(p => p.Category)
-            .Include(p => p.Variations)
-            .Include(p => p.Images)
+        return await ApplyExpand(context.Products, expand)
             .OrderBy(p => p.Name)
             .ToListAsync(cancellationToken);
     }
 
-    public async Task<IEnumerable<Product>> GetActiveAsync(CancellationToken cancellationToken = default)
+    public async Task<IEnumerable<Product>> GetActiveAsync(
+        ProductExpand expand = ProductExpand.All,
+        CancellationToken cancellationToken = default)
     {
-        return await context.Products
-            .Include(p => p.Category)
-            .Include(p => p.Variations)
-            .Include(p => p.Images)
+        return await ApplyExpand(context.Products, expand)
             .Where(p => p.IsActive)
             .OrderBy(p => p.Name)
             .ToListAsync(cancellationToken);
     }
 
-    public async Task<IEnumerable<Product>> GetByCategoryAsync(Guid categoryId, CancellationToken cancellationToken = default)
+    public async Task<IEnumerable<Product>> GetByCategoryAsync(
+        Guid categoryId,
+        ProductExpand expand = ProductExpand.All,
+        CancellationToken cancellationToken = default)
     {
-        return await context.Products
-            .Include(p => p.Category)
-            .Include(p => p.Variations)
-            .Include(p => p.Images)
+        return await ApplyExpand(context.Products, expand)
             .Where(p => p.CategoryId == categoryId && p.IsActive)
             .OrderBy(p => p.Name)
             .ToListAsync(cancellationToken);
@@ -109,8 +262,7 @@ public class ProductRepository(NationalClothingStoreDbContext context) : IProduc
     public async Task<Product> CreateAsync(Product product, CancellationToken cancellationToken = default)
     {
         // Ensure unique SKU
-        var existingProduct = await GetBySkuAsync(product.SKU, cancellationToken);
-        if (existingProduct != null)
+        if (await SkuExistsAsync(product.SKU, cancellationToken))
         {
             throw new InvalidOperationException($"Product with SKU '{product.SKU}' already exists.");
         }
@@ -223,37 +375,64 @@ public class ProductRepository(NationalClothingStoreDbContext context) : IProduc
         string searchTerm,
         int pageNumber = 1,
         int pageSize = 20,
+        ProductExpand expand = ProductExpand.All,
         CancellationToken cancellationToken = default)
     {
         if (string.IsNullOrWhiteSpace(searchTerm))
         {
-            return await GetPagedAsync(pageNumber, pageSize, isActive: true, cancellationToken: cancellationToken);
+            return await GetPagedAsync(pageNumber, pageSize, isActive: true, expand: expand, cancellationToken: cancellationToken);
         }
 
-        var query = context.Products
-            .Include(p => p.Category)
-            .Include(p => p.Variations)
-            .Include(p => p.Images)
-            .Where(p => p.IsActive && (
-                p.Name.Contains(searchTerm) ||
-                (p.Description != null && p.Description.Contains(searchTerm)) ||
-                p.SKU.Contains(searchTerm) ||
-                (p.Brand != null && p.Brand.Contains(searchTerm)) ||
-                (p.Season != null && p.Season.Contains(searchTerm)) ||
-                (p.Material != null && p.Material.Contains(searchTerm))
-            ));
+        var term = searchTerm.Trim();
+        var query = ApplySearch(context.Products.Where(p => p.IsActive), term);
 
         var totalCount = await query.CountAsync(cancellationToken);
 
-        var products = await query
-            .OrderBy(p => p.Name)
-            .Skip((pageNumber - 1) * pageSize)
-            .Take(pageSize)
+        var products = await RankedPage(ApplyExpand(query, expand), term, pageNumber, pageSize)
+            .ToListAsync(cancellationToken);
+
+        return (products, totalCount);
+    }
+
+    public async Task<(IEnumerable<ProductSummary> products, int totalCount)> SearchSummariesAsync(
+        string searchTerm,
+        int pageNumber = 1,
+        int pageSize = 20,
+        CancellationToken cancellationToken = default)
+    {
+        if (string.IsNullOrWhiteSpace(searchTerm))
+        {
+            return await GetPagedSummariesAsync(pageNumber, pageSize, isActive: true, cancellationToken: cancellationToken);
+        }
+
+        var term = searchTerm.Trim();
+        var query = ApplySearch(context.Products.Where(p => p.IsActive), term);
+
+        var totalCount = await query.CountAsync(cancellationToken);
+
+        var products = await RankedPage(query, term, pageNumber, pageSize)
+            .Select(ToSummary)
             .ToListAsync(cancellationToken);
 
         return (products, totalCount);
     }
 
+    private static IQueryable<Product> RankedPage(IQueryable<Product> query, string term, int pageNumber, int pageSize)
+    {
+        // Exact SKU first, then SKU prefix hits, then full-text relevance (name > brand > description)
+        var tsQuery = SearchQueries.ToPrefixTsQuery(term) ?? string.Empty;
+        var skuPrefix = SearchQueries.EscapeLike(term) + "%";
+        return query
+            .OrderByDescending(p => p.SKU == term)
+            .ThenByDescending(p => EF.Functions.ILike(p.SKU, skuPrefix))
+            .ThenByDescending(p => EF.Property<NpgsqlTsVector>(p, "SearchVector")
+                .Rank(EF.Functions.ToTsQuery(SearchQueries.TextSearchConfig, tsQuery)))
+            .ThenBy(p => p.Name)
+            .ThenBy(p => p.Id)
+            .Skip((pageNumber - 1) * pageSize)
+            .Take(pageSize);
+    }
+
     public async Task<IEnumerable<Product>> GetByBrandAsync(string brand, CancellationToken cancellationToken = default)
     {
         return await context.Products
@@ -52,13 +52,63 @@ public class ProductVariationRepository : IProductVariationRepository
         bool? isActive = null,
         CancellationToken cancellationToken = default)
     {
-        var query = _context.ProductVariations
+        var query = ApplyFilters(productId, size, color, isActive);
+
+        var totalCount = await query.CountAsync(cancellationToken);
+
+        var variations = await query
             .Include(pv => pv.Product)
             .Include(pv => pv.Inventories)
-            .Where(pv => pv.ProductId == productId)
-            .AsQueryable();
+            .OrderBy(pv => pv.Size)
+            .ThenBy(pv => pv.Color)
+            .ThenBy(pv => pv.Id)
+            .Skip((pageNumber - 1) * pageSize)
+            .Take(pageSize)
+            .ToListAsync(cancellationToken);
+
+        return (variations, totalCount);
+    }
+
+    public async Task<(IEnumerable<ProductVariation> variations, int? totalCount)> GetByProductIdPageAfterAsync(
+        Guid productId,
+        int take,
+        string? afterSize = null,
+        string? afterColor = null,
+        Guid? afterId = null,
+        string? size = null,
+        string? color = null,
+        bool? isActive = null,
+        bool includeTotalCount = true,
+        CancellationToken cancellationToken = default)
+    {
+        var query = ApplyFilters(productId, size, color, isActive);
+
+        int? totalCount = includeTotalCount ? await query.CountAsync(cancellationToken) : null;
+
+        if (afterSize != null && afterColor != null && afterId.HasValue)
+        {
+            // (Size, Color, Id) > (@size, @color, @id) seeks the (ProductId, Size, Color, Id) index
+            query = query.Where(pv => EF.Functions.GreaterThan(
+                ValueTuple.Create(pv.Size, pv.Color, pv.Id),
+                ValueTuple.Create(afterSize, afterColor, afterId.Value)));
+        }
+
+        var variations = await query
+            .Include(pv => pv.Product)
+            .Include(pv => pv.Inventories)
+            .OrderBy(pv => pv.Size)
+            .ThenBy(pv => pv.Color)
+            .ThenBy(pv => pv.Id)
+            .Take(take)
+            .ToListAsync(cancellationToken);
+
+        return (variations, totalCount);
+    }
+
+    private IQueryable<ProductVariation> ApplyFilters(Guid productId, string? size, string? color, bool? isActive)
+    {
+        var query = _context.ProductVariations.Where(pv => pv.ProductId == productId);
 
-        // Apply filters
         if (!string.IsNullOrWhiteSpace(size))
         {
             query = query.Where(pv => pv.Size == size);
@@ -74,16 +124,7 @@ public class ProductVariationRepository : IProductVariationRepository
             query = query.Where(pv => pv.IsActive == isActive.Value);
         }
 
-        var totalCount = await query.CountAsync(cancellationToken);
-
-        var variations = await query
-            .OrderBy(pv => pv.Size)
-            .ThenBy(pv => pv.Color)
-            .Skip((pageNumber - 1) * pageSize)
-            .Take(pageSize)
-            .ToListAsync(cancellationToken);
-
-        return (variations, totalCount);
+        return query;
     }
 
     public async Task<IEnumerable<ProductVariation>> GetAllAsync(CancellationToken cancellationToken = default)
@@ -0,0 +1,221 @@
+using System.Data;
+using System.Runtime.CompilerServices;
+using Microsoft.EntityFrameworkCore;
+using NationalClothingStore.Application.Interfaces;
+using Npgsql;
+using NpgsqlTypes;
+
+namespace NationalClothingStore.Infrastructure.Data.Repositories;
+
+/// <summary>
+/// Reads the export datasets in keyset pages: each page is a short query ordered by the dataset's cursor
+/// columns and resumed after the last row of the previous one, so a long export neither holds a
+/// transaction open nor asks the database to sort the whole range at once
+/// </summary>
+public class ReportExportRepository(NationalClothingStoreDbContext context) : IReportExportRepository
+{
+    private const int PageSize = 10_000;
+
+    // Datasets without a natural timestamp order by Id alone under this constant
+    private static readonly DateTime NoTimestamp = DateTime.UnixEpoch;
+
+    private static readonly Dictionary<string, ExportDataset> Datasets = new()
+    {
+        [ReportExportDatasets.Sales] = new ExportDataset(
+            new ReportExportColumn[]
+            {
+                new("CompletedAt", typeof(DateTime)),
+                new("TransactionNumber", typeof(string)),
+                new("TransactionType", typeof(string)),
+                new("BranchCode", typeof(string)),
+                new("ProductSku", typeof(string)),
+                new("ProductName", typeof(string)),
+                new("Quantity", typeof(int)),
+                new("UnitPrice", typeof(decimal)),
+                new("DiscountAmount", typeof(decimal)),
+                new("TaxAmount", typeof(decimal)),
+                new("TotalPrice", typeof(decimal))
+            },
+            """
+            SELECT t."CompletedAt", t."TransactionNumber", t."TransactionType", b."Code", p."SKU", p."Name",
+                   i."Quantity", i."UnitPrice", i."DiscountAmount", i."TaxAmount", i."TotalPrice",
+                   t."CompletedAt" AS "CursorAt", i."Id" AS "CursorId"
+            FROM "SalesTransactions" t
+            JOIN "SalesTransactionItems" i ON i."SalesTransactionId" = t."Id"
+            JOIN "Branches" b ON b."Id" = t."BranchId"
+            JOIN "Products" p ON p."Id" = i."ProductId"
+            WHERE t."Status" = 'COMPLETED'
+              AND t."CompletedAt" >= @startDate AND t."CompletedAt" < @endDate
+              AND (@branchId IS NULL OR t."BranchId" = @branchId)
+              AND (t."CompletedAt", i."Id") > (@afterAt, @afterId)
+            ORDER BY t."CompletedAt", i."Id"
+            LIMIT @pageSize
+            """),
+
+        [ReportExportDatasets.Inventory] = new ExportDataset(
+            new ReportExportColumn[]
+            {
+                new("InventoryId", typeof(Guid)),
+                new("BranchCode", typeof(string)),
+                new("WarehouseCode", typeof(string)),
+                new("ProductSku", typeof(string)),
+                new("ProductName", typeof(string)),
+                new("Quantity", typeof(int)),
+                new("ReservedQuantity", typeof(int)),
+                new("AvailableQuantity", typeof(int)),
+                new("UnitCost", typeof(decimal)),
+                new("LastUpdated", typeof(DateTime))
+            },
+            """
+            SELECT inv."Id", b."Code", w."Code", p."SKU", p."Name",
+                   inv."Quantity", inv."ReservedQuantity", inv."AvailableQuantity", inv."UnitCost", inv."LastUpdated",
+                   @afterAt AS "CursorAt", inv."Id" AS "CursorId"
+            FROM "Inventories" inv
+            JOIN "Products" p ON p."Id" = inv."ProductId"
+            JOIN "Branches" b ON b."Id" = inv."BranchId"
+            LEFT JOIN "Warehouses" w ON w."Id" = inv."WarehouseId"
+            WHERE (@branchId IS NULL OR inv."BranchId" = @branchId)
+              AND (@warehouseId IS NULL OR inv."WarehouseId" = @warehouseId)
+              AND inv."Id" > @afterId
+            ORDER BY inv."Id"
+            LIMIT @pageSize
+            """,
+            TimestampOrdered: false),
+
+        [ReportExportDatasets.Customers] = new ExportDataset(
+            new ReportExportColumn[]
+            {
+                new("CustomerId", typeof(Guid)),
+                new("FirstName", typeof(string)),
+                new("LastName", typeof(string)),
+                new("Email", typeof(string)),
+                new("PhoneNumber", typeof(string)),
+                new("City", typeof(string)),
+                new("Country", typeof(string)),
+                new("EmailOptIn", typeof(bool)),
+                new("SmsOptIn", typeof(bool)),
+                new("IsActive", typeof(bool)),
+                new("CreatedAt", typeof(DateTime))
+            },
+            """
+            SELECT c."Id", c."FirstName", c."LastName", c."Email", c."PhoneNumber", c."City", c."Country",
+                   c."EmailOptIn", c."SmsOptIn", c."IsActive", c."CreatedAt",
+                   c."CreatedAt" AS "CursorAt", c."Id" AS "CursorId"
+            FROM "Customers" c
+            WHERE c."CreatedAt" >= @startDate AND c."CreatedAt" < @endDate
+              AND (c."CreatedAt", c."Id") > (@afterAt, @afterId)
+            ORDER BY c."CreatedAt", c."Id"
+            LIMIT @pageSize
+            """),
+
+        [ReportExportDatasets.Procurement] = new ExportDataset(
+            new ReportExportColumn[]
+            {
+                new("OrderDate", typeof(DateTime)),
+                new("OrderNumber", typeof(string)),
+                new("Status", typeof(string)),
+                new("SupplierCode", typeof(string)),
+                new("WarehouseCode", typeof(string)),
+                new("ProductSku", typeof(string)),
+                new("ProductName", typeof(string)),
+                new("Quantity", typeof(int)),
+                new("ReceivedQuantity", typeof(int)),
+                new("UnitPrice", typeof(decimal)),
+                new("DiscountAmount", typeof(decimal)),
+                new("TotalPrice", typeof(decimal))
+            },
+            """
+            SELECT o."OrderDate", o."OrderNumber", o."Status", s."Code", w."Code", p."SKU", p."Name",
+                   i."Quantity", i."ReceivedQuantity", i."UnitPrice", i."DiscountAmount", i."TotalPrice",
+                   o."OrderDate" AS "CursorAt", i."Id" AS "CursorId"
+            FROM "PurchaseOrders" o
+            JOIN "PurchaseOrderItems" i ON i."PurchaseOrderId" = o."Id"
+            JOIN "Suppliers" s ON s."Id" = o."SupplierId"
+            JOIN "Warehouses" w ON w."Id" = o."WarehouseId"
+            JOIN "Products" p ON p."Id" = i."ProductId"
+            WHERE o."OrderDate" >= @startDate AND o."OrderDate" < @endDate
+              AND (@warehouseId IS NULL OR o."WarehouseId" = @warehouseId)
+              AND (o."OrderDate", i."Id") > (@afterAt, @afterId)
+            ORDER BY o."OrderDate", i."Id"
+            LIMIT @pageSize
+            """)
+    };
+
+    public IReadOnlyList<ReportExportColumn> GetColumns(string dataset) => GetDataset(dataset).Columns;
+
+    public async IAsyncEnumerable<ReportExportRow> ReadRowsAsync(
+        ReportExportQuery query,
+        ExportCursor? after = null,
+        [EnumeratorCancellation] CancellationToken cancellationToken = default)
+    {
+        var dataset = GetDataset(query.Dataset);
+        var cursor = after ?? new ExportCursor(NoTimestamp, Guid.Empty);
+        var (startDate, endDate) = DateRange(query);
+
+        var connection = (NpgsqlConnection)context.Database.GetDbConnection();
+        await context.Database.OpenConnectionAsync(cancellationToken);
+        try
+        {
+            while (true)
+            {
+                await using var command = new NpgsqlCommand(dataset.Sql, connection);
+                command.Parameters.Add(new NpgsqlParameter("startDate", NpgsqlDbType.TimestampTz) { Value = startDate });
+                command.Parameters.Add(new NpgsqlParameter("endDate", NpgsqlDbType.TimestampTz) { Value = endDate });
+                command.Parameters.Add(new NpgsqlParameter("branchId", NpgsqlDbType.Uuid) { Value = (object?)query.BranchId ?? DBNull.Value });
+                command.Parameters.Add(new NpgsqlParameter("warehouseId", NpgsqlDbType.Uuid) { Value = (object?)query.WarehouseId ?? DBNull.Value });
+                command.Parameters.Add(new NpgsqlParameter("afterAt", NpgsqlDbType.TimestampTz) { Value = cursor.Timestamp });
+                command.Parameters.Add(new NpgsqlParameter("afterId", NpgsqlDbType.Uuid) { Value = cursor.Id });
+                command.Parameters.Add(new NpgsqlParameter("pageSize", NpgsqlDbType.Integer) { Value = PageSize });
+
+                var rows = 0;
+                await using (var reader = await command.ExecuteReaderAsync(CommandBehavior.SequentialAccess, cancellationToken))
+                {
+                    var columnCount = dataset.Columns.Count;
+                    while (await reader.ReadAsync(cancellationToken))
+                    {
+                        var values = new object?[columnCount];
+                        for (var i = 0; i < columnCount; i++)
+                        {
+                            values[i] = await reader.IsDBNullAsync(i, cancellationToken) ? null : reader.GetValue(i);
+                        }
+
+                        cursor = new ExportCursor(
+                            dataset.TimestampOrdered ? reader.GetFieldValue<DateTime>(columnCount) : NoTimestamp,
+                            reader.GetFieldValue<Guid>(columnCount + 1));
+                        rows++;
+                        yield return new ReportExportRow(values, cursor);
+                    }
+                }
+
+                if (rows < PageSize)
+                {
+                    yield break;
+                }
+            }
+        }
+        finally
+        {
+            await context.Database.CloseConnectionAsync();
+        }
+    }
+
+    private static ExportDataset GetDataset(string dataset) =>
+        Datasets.TryGetValue(dataset, out var definition)
+            ? definition
+            : throw new ArgumentException($"Unknown export dataset '{dataset}'. Expected one of: {string.Join(", ", ReportExportDatasets.All)}");
+
+    // An end date without a time of day includes that whole day
+    private static (DateTime start, DateTime end) DateRange(ReportExportQuery query)
+    {
+        var start = query.StartDate.HasValue ? DateTime.SpecifyKind(query.StartDate.Value, DateTimeKind.Utc) : NoTimestamp;
+        var end = query.EndDate.HasValue ? DateTime.SpecifyKind(query.EndDate.Value, DateTimeKind.Utc) : DateTime.UtcNow.AddDays(1);
+        if (query.EndDate.HasValue && end.TimeOfDay == TimeSpan.Zero)
+        {
+            end = end.AddDays(1);
+        }
+
+        return (start, end);
+    }
+
+    private sealed record ExportDataset(IReadOnlyList<ReportExportColumn> Columns, string Sql, bool TimestampOrdered = true);
+}
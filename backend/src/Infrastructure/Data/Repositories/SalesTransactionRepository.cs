@@ -179,6 +179,80 @@ public class SalesTransactionRepository(NationalClothingStoreDbContext context)
         return await GetByIdAsync(transaction.Id, cancellationToken) ?? transaction;
     }
 
+    public async Task<IReadOnlyDictionary<Guid, int>> CommitSaleAsync(
+        SalesTransaction transaction,
+        IReadOnlyCollection<InventoryTransaction> stockMovements,
+        LoyaltyTransaction? loyaltyTransaction,
+        CancellationToken cancellationToken = default)
+    {
+        var decrements = transaction.Items
+            .GroupBy(i => i.InventoryId)
+            .Select(g => (InventoryId: g.Key, Quantity: g.Sum(i => i.Quantity)))
+            .ToList();
+        var inventoryIds = decrements.Select(d => d.InventoryId).ToArray();
+        var quantities = decrements.Select(d => d.Quantity).ToArray();
+
+        async Task<IReadOnlyDictionary<Guid, int>> WriteAsync(CancellationToken ct)
+        {
+            var now = DateTime.UtcNow;
+
+            // Stock first: takes the row locks early and fails fast when a concurrent sale got there first
+            var updated = await context.Database
+                .SqlQuery<StockLevelRow>($"""
+                    UPDATE "Inventories" AS i
+                    SET "Quantity" = i."Quantity" - d.quantity,
+                        "AvailableQuantity" = i."AvailableQuantity" - d.quantity,
+                        "LastUpdated" = {now}
+                    FROM unnest({inventoryIds}, {quantities}) AS d(id, quantity)
+                    WHERE i."Id" = d.id AND i."AvailableQuantity" >= d.quantity
+                    RETURNING i."Id", i."AvailableQuantity"
+                    """)
+                .ToListAsync(ct);
+            if (updated.Count != inventoryIds.Length)
+            {
+                throw new InvalidOperationException("Insufficient stock for one or more items; the sale was not recorded.");
+            }
+
+            if (loyaltyTransaction != null)
+            {
+                var points = loyaltyTransaction.Points;
+                await context.Database.ExecuteSqlAsync($"""
+                    UPDATE "CustomerLoyalty"
+                    SET "PointsBalance" = "PointsBalance" + {points},
+                        "TotalPointsEarned" = "TotalPointsEarned" + GREATEST({points}, 0),
+                        "LastActivityDate" = {now},
+                        "UpdatedAt" = {now}
+                    WHERE "Id" = {loyaltyTransaction.CustomerLoyaltyId}
+                    """, ct);
+                context.LoyaltyTransactions.Add(loyaltyTransaction);
+            }
+
+            // Transaction, items, payments and movements go out together in batched INSERTs
+            context.SalesTransactions.Add(transaction);
+            context.InventoryTransactions.AddRange(stockMovements);
+            await context.SaveChangesAsync(ct);
+
+            return updated.ToDictionary(row => row.Id, row => row.AvailableQuantity);
+        }
+
+        if (context.Database.CurrentTransaction != null)
+        {
+            // Part of a larger unit of work (e.g. an exchange); the caller commits
+            return await WriteAsync(cancellationToken);
+        }
+
+        // The retrying execution strategy only allows explicit transactions inside ExecuteAsync
+        var strategy = context.Database.CreateExecutionStrategy();
+        return await strategy.ExecuteAsync(async ct =>
+        {
+            context.ChangeTracker.Clear();
+            await using var dbTransaction = await context.Database.BeginTransactionAsync(ct);
+            var availableQuantities = await WriteAsync(ct);
+            await dbTransaction.CommitAsync(ct);
+            return availableQuantities;
+        }, cancellationToken);
+    }
+
     public async Task<SalesTransaction> UpdateAsync(SalesTransaction transaction, CancellationToken cancellationToken = default)
     {
         var existingTransaction = await GetByIdAsync(transaction.Id, cancellationToken);
@@ -326,4 +400,10 @@ public class SalesTransactionRepository(NationalClothingStoreDbContext context)
             .OrderBy(dss => dss.Date)
             .ToListAsync(cancellationToken);
     }
-}
\ No newline at end of file
+
+    internal sealed class StockLevelRow
+    {
+        public Guid Id { get; set; }
+        public int AvailableQuantity { get; set; }
+    }
+}
@@ -0,0 +1,125 @@
+using System.IO.Compression;
+using Microsoft.EntityFrameworkCore;
+using NationalClothingStore.Application.Interfaces;
+using Npgsql;
+
+namespace NationalClothingStore.Infrastructure.Data.Repositories;
+
+/// <summary>
+/// Partition maintenance over the PostgreSQL catalog; partitions are named "&lt;table&gt;_pYYYYMM"
+/// by ncs_ensure_monthly_partitions (see the PartitionAuditAndInventoryTransactions migration), and rows
+/// outside them land in "&lt;table&gt;_default" (see the AddDefaultPartitions migration)
+/// </summary>
+public class TablePartitionRepository(NationalClothingStoreDbContext context) : ITablePartitionRepository
+{
+    public async Task<int> EnsureMonthlyPartitionsAsync(string table, int monthsAhead, CancellationToken cancellationToken = default)
+    {
+        var created = await context.Database
+            .SqlQuery<int>($"""
+                SELECT ncs_ensure_monthly_partitions({table}, current_date, (current_date + make_interval(months => {monthsAhead}))::date) AS "Value"
+                """)
+            .ToListAsync(cancellationToken);
+
+        return created[0];
+    }
+
+    public async Task<int> SplitDefaultPartitionAsync(string table, CancellationToken cancellationToken = default)
+    {
+        var created = await context.Database
+            .SqlQuery<int>($"""
+                SELECT ncs_split_default_partition({table}) AS "Value"
+                """)
+            .ToListAsync(cancellationToken);
+
+        return created[0];
+    }
+
+    public async Task<IReadOnlyList<TablePartition>> GetPartitionsAsync(string table, CancellationToken cancellationToken = default)
+    {
+        var rows = await context.Database
+            .SqlQuery<PartitionRow>($"""
+                SELECT c.relname::text AS "Name",
+                       to_date(right(c.relname, 6), 'YYYYMM') AS "RangeStart",
+                       greatest(c.reltuples, 0)::bigint AS "EstimatedRows"
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = to_regclass(quote_ident({table}))
+                  AND c.relname ~ '_p\d\d\d\d\d\d$'
+                ORDER BY c.relname
+                """)
+            .ToListAsync(cancellationToken);
+
+        return rows
+            .Select(row =>
+            {
+                var rangeStart = DateTime.SpecifyKind(row.RangeStart, DateTimeKind.Utc);
+                return new TablePartition
+                {
+                    Table = table,
+                    Name = row.Name,
+                    RangeStart = rangeStart,
+                    RangeEnd = rangeStart.AddMonths(1),
+                    EstimatedRows = row.EstimatedRows
+                };
+            })
+            .ToList();
+    }
+
+    public async Task ExportPartitionAsync(TablePartition partition, string filePath, CancellationToken cancellationToken = default)
+    {
+        Directory.CreateDirectory(Path.GetDirectoryName(Path.GetFullPath(filePath))!);
+
+        // Written under a temporary name so a half-written export is never mistaken for a finished one
+        var temporaryPath = filePath + ".partial";
+        var connection = (NpgsqlConnection)context.Database.GetDbConnection();
+        await context.Database.OpenConnectionAsync(cancellationToken);
+        try
+        {
+            await using (var file = File.Create(temporaryPath))
+            await using (var compressed = new GZipStream(file, CompressionLevel.Optimal))
+            await using (var writer = new StreamWriter(compressed))
+            using (var reader = await connection.BeginTextExportAsync(
+                $"COPY {QuoteIdentifier(partition.Name)} TO STDOUT (FORMAT csv, HEADER)", cancellationToken))
+            {
+                var buffer = new char[64 * 1024];
+                int read;
+                while ((read = await reader.ReadAsync(buffer, cancellationToken)) > 0)
+                {
+                    await writer.WriteAsync(buffer.AsMemory(0, read), cancellationToken);
+                }
+            }
+
+            File.Move(temporaryPath, filePath, overwrite: true);
+        }
+        catch
+        {
+            File.Delete(temporaryPath);
+            throw;
+        }
+        finally
+        {
+            await context.Database.CloseConnectionAsync();
+        }
+    }
+
+    public async Task DropPartitionAsync(TablePartition partition, CancellationToken cancellationToken = default)
+    {
+        // CONCURRENTLY only takes a SHARE UPDATE EXCLUSIVE lock, so inserts into current partitions carry on;
+        // it can't run inside a transaction block, which ExecuteSqlRaw doesn't open
+        await context.Database.ExecuteSqlRawAsync(
+            $"ALTER TABLE {QuoteIdentifier(partition.Table)} DETACH PARTITION {QuoteIdentifier(partition.Name)} CONCURRENTLY",
+            cancellationToken);
+        await context.Database.ExecuteSqlRawAsync(
+            $"DROP TABLE {QuoteIdentifier(partition.Name)}",
+            cancellationToken);
+    }
+
+    private static string QuoteIdentifier(string name) => "\"" + name.Replace("\"", "\"\"") + "\"";
+
+    internal sealed class PartitionRow
+    {
+        public string Name { get; set; } = string.Empty;
+        public DateTime RangeStart { get; set; }
+        public long EstimatedRows { get; set; }
+    }
+}
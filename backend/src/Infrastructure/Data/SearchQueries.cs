@@ -0,0 +1,55 @@
+using System.Text;
+
+namespace NationalClothingStore.Infrastructure.Data;
+
+/// <summary>
+/// Turns free-text user input into safe PostgreSQL full-text and LIKE search terms
+/// </summary>
+public static class SearchQueries
+{
+    /// <summary>
+    /// Full-text search configuration; 'simple' skips stemming, which suits brand and product names
+    /// </summary>
+    public const string TextSearchConfig = "simple";
+
+    /// <summary>
+    /// Build a prefix tsquery where every word must match, e.g. "slim cot" becomes "slim:* &amp; cot:*".
+    /// Returns null when the input has no searchable words.
+    /// </summary>
+    public static string? ToPrefixTsQuery(string searchTerm)
+    {
+        var words = new List<string>();
+        var word = new StringBuilder();
+
+        foreach (var ch in searchTerm)
+        {
+            if (char.IsLetterOrDigit(ch))
+            {
+                word.Append(char.ToLowerInvariant(ch));
+            }
+            else if (word.Length > 0)
+            {
+                words.Add(word.ToString());
+                word.Clear();
+            }
+        }
+
+        if (word.Length > 0)
+        {
+            words.Add(word.ToString());
+        }
+
+        return words.Count == 0 ? null : string.Join(" & ", words.Select(w => $"{w}:*"));
+    }
+
+    /// <summary>
+    /// Escape LIKE wildcards so user input only ever matches literally
+    /// </summary>
+    public static string EscapeLike(string value)
+    {
+        return value
+            .Replace("\\", "\\\\")
+            .Replace("%", "\\%")
+            .Replace("_", "\\_");
+    }
+}
@@ -1,3 +1,4 @@
+using Microsoft.EntityFrameworkCore;
 using Microsoft.EntityFrameworkCore.Storage;
 using NationalClothingStore.Application.Interfaces;
 using NationalClothingStore.Infrastructure.Data.Repositories;
@@ -86,6 +87,26 @@ public class UnitOfWork : IUnitOfWork, IDisposable
         }
     }
 
+    public async Task<T> ExecuteInTransactionAsync<T>(Func<CancellationToken, Task<T>> operation, CancellationToken cancellationToken = default)
+    {
+        if (Context.Database.CurrentTransaction != null)
+        {
+            // Part of a larger unit of work; its owner commits
+            return await operation(cancellationToken);
+        }
+
+        // The retrying execution strategy only allows explicit transactions inside ExecuteAsync
+        var strategy = Context.Database.CreateExecutionStrategy();
+        return await strategy.ExecuteAsync(async ct =>
+        {
+            Context.ChangeTracker.Clear();
+            await using var transaction = await Context.Database.BeginTransactionAsync(ct);
+            var result = await operation(ct);
+            await transaction.CommitAsync(ct);
+            return result;
+        }, cancellationToken);
+    }
+
     public async Task<int> SaveChangesAsync(CancellationToken cancellationToken = default)
     {
         return await Context.SaveChangesAsync(cancellationToken);
@@ -0,0 +1,26 @@
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using NationalClothingStore.Application.Interfaces;
+
+namespace NationalClothingStore.Infrastructure.Exports;
+
+/// <summary>
+/// Report export configuration extensions
+/// </summary>
+public static class ReportExportConfiguration
+{
+    /// <summary>
+    /// Registers the export engine and the background worker that runs export jobs; the dataset reads come
+    /// from the repository registered by AddRepositories
+    /// </summary>
+    public static IServiceCollection AddReportExports(this IServiceCollection services, IConfiguration configuration)
+    {
+        services.Configure<ReportExportOptions>(configuration.GetSection("ReportExport"));
+        services.AddSingleton<ReportExportJobStore>();
+        services.AddSingleton<ReportExportService>();
+        services.AddSingleton<IReportExportService>(serviceProvider => serviceProvider.GetRequiredService<ReportExportService>());
+        services.AddHostedService(serviceProvider => serviceProvider.GetRequiredService<ReportExportService>());
+
+        return services;
+    }
+}
@@ -0,0 +1,97 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using Microsoft.Extensions.Options;
+using NationalClothingStore.Application.Interfaces;
+
+namespace NationalClothingStore.Infrastructure.Exports;
+
+/// <summary>
+/// Keeps export jobs next to their files in the export directory: a JSON manifest per job, replaced
+/// atomically on every checkpoint, so job state survives restarts and is visible to every replica that
+/// shares the directory
+/// </summary>
+public class ReportExportJobStore(IOptions<ReportExportOptions> options)
+{
+    private static readonly JsonSerializerOptions SerializerOptions = new(JsonSerializerDefaults.Web)
+    {
+        Converters = { new JsonStringEnumConverter() }
+    };
+
+    private readonly string _directory = options.Value.StoragePath;
+
+    /// <summary>Where a completed job's file is</summary>
+    public string ResultPath(ReportExportJob job) =>
+        Path.Combine(_directory, $"{job.Id:N}.{ReportExportFormats.Extension(job.Format)}");
+
+    /// <summary>Where a job's file is written until it completes</summary>
+    public string PartialPath(ReportExportJob job) => ResultPath(job) + ".partial";
+
+    public async Task SaveAsync(ReportExportJob job, CancellationToken cancellationToken = default)
+    {
+        Directory.CreateDirectory(_directory);
+
+        // Readers see either the previous manifest or this one, never a half-written file
+        var path = ManifestPath(job.Id);
+        var temporaryPath = $"{path}.{Guid.NewGuid():N}.tmp";
+        await using (var file = File.Create(temporaryPath))
+        {
+            await JsonSerializer.SerializeAsync(file, job, SerializerOptions, cancellationToken);
+        }
+
+        File.Move(temporaryPath, path, overwrite: true);
+    }
+
+    public async Task<ReportExportJob?> GetAsync(Guid jobId, CancellationToken cancellationToken = default)
+    {
+        var path = ManifestPath(jobId);
+        if (!File.Exists(path))
+        {
+            return null;
+        }
+
+        await using var file = File.OpenRead(path);
+        return await JsonSerializer.DeserializeAsync<ReportExportJob>(file, SerializerOptions, cancellationToken);
+    }
+
+    /// <summary>
+    /// Jobs that are queued or were running when their process stopped
+    /// </summary>
+    public async Task<IReadOnlyList<ReportExportJob>> ListUnfinishedAsync(CancellationToken cancellationToken = default)
+    {
+        if (!Directory.Exists(_directory))
+        {
+            return Array.Empty<ReportExportJob>();
+        }
+
+        var jobs = new List<ReportExportJob>();
+        foreach (var path in Directory.EnumerateFiles(_directory, "*.json"))
+        {
+            if (Guid.TryParseExact(Path.GetFileNameWithoutExtension(path), "N", out var jobId)
+                && await GetAsync(jobId, cancellationToken) is { Status: ReportExportStatus.Queued or ReportExportStatus.Running } job)
+            {
+                jobs.Add(job);
+            }
+        }
+
+        return jobs.OrderBy(job => job.CreatedAt).ToList();
+    }
+
+    /// <summary>
+    /// Take the exclusive right to run a job, held until the returned handle is disposed or the process exits;
+    /// null when another worker, here or on another replica, holds it
+    /// </summary>
+    public IDisposable? TryClaim(Guid jobId)
+    {
+        Directory.CreateDirectory(_directory);
+        try
+        {
+            return new FileStream(Path.Combine(_directory, $"{jobId:N}.lock"), FileMode.OpenOrCreate, FileAccess.ReadWrite, FileShare.None);
+        }
+        catch (IOException)
+        {
+            return null;
+        }
+    }
+
+    private string ManifestPath(Guid jobId) => Path.Combine(_directory, $"{jobId:N}.json");
+}
@@ -0,0 +1,284 @@
+using System.Threading.Channels;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using NationalClothingStore.Application.Interfaces;
+
+namespace NationalClothingStore.Infrastructure.Exports;
+
+/// <summary>
+/// Report export settings, bound from the "ReportExport" configuration section
+/// </summary>
+public class ReportExportOptions
+{
+    /// <summary>Directory holding export files and job manifests; share it between replicas</summary>
+    public string StoragePath { get; set; } = "/reports/exports";
+
+    /// <summary>Rows per chunk: the unit of flushing, checkpointing and, for Parquet, of row groups</summary>
+    public int ChunkRows { get; set; } = 50_000;
+
+    /// <summary>Jobs run at the same time by this process</summary>
+    public int MaxConcurrentJobs { get; set; } = 2;
+
+    /// <summary>Runs of a job, including automatic retries after a failure, before it is marked failed</summary>
+    public int MaxAttempts { get; set; } = 3;
+}
+
+/// <summary>
+/// Streams report datasets from the database into CSV, gzip'd JSON Lines or Parquet, one row at a time and
+/// in constant memory. Streamed exports go straight to the caller; export jobs are queued, run in the
+/// background and checkpointed after every chunk, and jobs interrupted by a failure or a restart resume
+/// from their last checkpoint.
+/// </summary>
+public class ReportExportService(
+    IServiceScopeFactory scopeFactory,
+    ReportExportJobStore store,
+    IOptions<ReportExportOptions> options,
+    ILogger<ReportExportService> logger) : BackgroundService, IReportExportService
+{
+    private readonly ReportExportOptions _options = options.Value;
+    private readonly Channel<Guid> _queue = Channel.CreateUnbounded<Guid>(new UnboundedChannelOptions { SingleReader = false });
+
+    public async Task StreamAsync(ReportExportQuery query, ReportExportFormat format, Stream destination, CancellationToken cancellationToken = default)
+    {
+        if (!ReportExportFormats.CanStream(format))
+        {
+            throw new ArgumentException($"{format} exports are only available as export jobs");
+        }
+
+        Validate(query);
+
+        using var scope = scopeFactory.CreateScope();
+        var repository = scope.ServiceProvider.GetRequiredService<IReportExportRepository>();
+
+        await using var writer = ReportExportWriter.Create(format, destination, repository.GetColumns(query.Dataset), appending: false);
+        var inChunk = 0;
+        await foreach (var row in repository.ReadRowsAsync(query, cancellationToken: cancellationToken))
+        {
+            await writer.WriteRowAsync(row.Values, cancellationToken);
+            if (++inChunk == _options.ChunkRows)
+            {
+                await writer.EndChunkAsync(cancellationToken);
+                inChunk = 0;
+            }
+        }
+
+        await writer.EndChunkAsync(cancellationToken);
+    }
+
+    public async Task<ReportExportJob> StartAsync(
+        ReportExportQuery query,
+        ReportExportFormat format,
+        string? requestedBy = null,
+        CancellationToken cancellationToken = default)
+    {
+        Validate(query);
+
+        var now = DateTime.UtcNow;
+        var job = new ReportExportJob
+        {
+            Id = Guid.NewGuid(),
+            Query = query,
+            Format = format,
+            FileName = $"{query.Dataset}_{now:yyyyMMddHHmmss}.{ReportExportFormats.Extension(format)}",
+            RequestedBy = requestedBy,
+            CreatedAt = now,
+            UpdatedAt = now
+        };
+
+        await store.SaveAsync(job, cancellationToken);
+        await _queue.Writer.WriteAsync(job.Id, cancellationToken);
+
+        logger.LogInformation("Queued {Format} export {JobId} of {Dataset}", format, job.Id, query.Dataset);
+        return job;
+    }
+
+    public Task<ReportExportJob?> GetAsync(Guid jobId, CancellationToken cancellationToken = default) =>
+        store.GetAsync(jobId, cancellationToken);
+
+    public async Task<ReportExportJob?> ResumeAsync(Guid jobId, CancellationToken cancellationToken = default)
+    {
+        var job = await store.GetAsync(jobId, cancellationToken);
+        if (job is not { Status: ReportExportStatus.Failed })
+        {
+            return job;
+        }
+
+        job.Status = ReportExportStatus.Queued;
+        job.Attempts = 0;
+        job.Error = null;
+        job.UpdatedAt = DateTime.UtcNow;
+        await store.SaveAsync(job, cancellationToken);
+        await _queue.Writer.WriteAsync(job.Id, cancellationToken);
+
+        logger.LogInformation("Resuming export {JobId} after {RowsWritten} rows", job.Id, job.RowsWritten);
+        return job;
+    }
+
+    public Stream? OpenResult(ReportExportJob job)
+    {
+        var path = store.ResultPath(job);
+        if (job.Status != ReportExportStatus.Completed || !File.Exists(path))
+        {
+            return null;
+        }
+
+        return new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.Read, 64 * 1024, FileOptions.Asynchronous | FileOptions.SequentialScan);
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        // Jobs left queued or running by the previous run of this process carry on from their checkpoints
+        foreach (var job in await store.ListUnfinishedAsync(stoppingToken))
+        {
+            await _queue.Writer.WriteAsync(job.Id, stoppingToken);
+        }
+
+        var workers = Enumerable.Range(0, Math.Max(1, _options.MaxConcurrentJobs))
+            .Select(_ => RunWorkerAsync(stoppingToken));
+        await Task.WhenAll(workers);
+    }
+
+    private async Task RunWorkerAsync(CancellationToken stoppingToken)
+    {
+        try
+        {
+            await foreach (var jobId in _queue.Reader.ReadAllAsync(stoppingToken))
+            {
+                try
+                {
+                    await RunJobAsync(jobId, stoppingToken);
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    logger.LogError(ex, "Export {JobId} could not be run", jobId);
+                }
+            }
+        }
+        catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+        {
+        }
+    }
+
+    private async Task RunJobAsync(Guid jobId, CancellationToken stoppingToken)
+    {
+        using var claim = store.TryClaim(jobId);
+        if (claim == null)
+        {
+            // Another worker, possibly on another replica, is already running it
+            return;
+        }
+
+        var job = await store.GetAsync(jobId, stoppingToken);
+        if (job is not { Status: ReportExportStatus.Queued or ReportExportStatus.Running })
+        {
+            return;
+        }
+
+        job.Status = ReportExportStatus.Running;
+        job.Attempts++;
+        job.StartedAt ??= DateTime.UtcNow;
+        job.UpdatedAt = DateTime.UtcNow;
+        await store.SaveAsync(job, stoppingToken);
+
+        try
+        {
+            await WriteJobAsync(job, stoppingToken);
+
+            File.Move(store.PartialPath(job), store.ResultPath(job), overwrite: true);
+            job.Status = ReportExportStatus.Completed;
+            job.CompletedAt = job.UpdatedAt = DateTime.UtcNow;
+            await store.SaveAsync(job, stoppingToken);
+
+            logger.LogInformation(
+                "Export {JobId} completed: {RowsWritten} rows, {BytesWritten} bytes",
+                job.Id, job.RowsWritten, job.BytesWritten);
+        }
+        catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+        {
+            // Shutting down: the job stays Running and resumes from its checkpoint on the next start
+            throw;
+        }
+        catch (Exception ex)
+        {
+            var retry = job.Attempts < _options.MaxAttempts;
+            job.Status = retry ? ReportExportStatus.Queued : ReportExportStatus.Failed;
+            job.Error = ex.Message;
+            job.UpdatedAt = DateTime.UtcNow;
+            await store.SaveAsync(job, CancellationToken.None);
+
+            logger.LogError(ex, "Export {JobId} failed after {RowsWritten} rows (attempt {Attempt})", job.Id, job.RowsWritten, job.Attempts);
+            if (retry)
+            {
+                await _queue.Writer.WriteAsync(job.Id, stoppingToken);
+            }
+        }
+    }
+
+    private async Task WriteJobAsync(ReportExportJob job, CancellationToken cancellationToken)
+    {
+        using var scope = scopeFactory.CreateScope();
+        var repository = scope.ServiceProvider.GetRequiredService<IReportExportRepository>();
+
+        await using var file = new FileStream(
+            store.PartialPath(job), FileMode.OpenOrCreate, FileAccess.ReadWrite, FileShare.Read, 64 * 1024, FileOptions.Asynchronous);
+
+        // Anything past the last checkpoint belongs to a chunk that never completed
+        file.SetLength(job.BytesWritten);
+        file.Seek(job.BytesWritten, SeekOrigin.Begin);
+
+        await using var writer = ReportExportWriter.Create(job.Format, file, repository.GetColumns(job.Query.Dataset), appending: job.BytesWritten > 0);
+        var inChunk = 0;
+        var cursor = job.Cursor;
+        await foreach (var row in repository.ReadRowsAsync(job.Query, job.Cursor, cancellationToken))
+        {
+            await writer.WriteRowAsync(row.Values, cancellationToken);
+            cursor = row.Cursor;
+            if (++inChunk == _options.ChunkRows)
+            {
+                await CheckpointAsync(job, writer, file, inChunk, cursor, cancellationToken);
+                inChunk = 0;
+            }
+        }
+
+        await CheckpointAsync(job, writer, file, inChunk, cursor, cancellationToken);
+    }
+
+    private async Task CheckpointAsync(
+        ReportExportJob job,
+        ReportExportWriter writer,
+        FileStream file,
+        int rows,
+        ExportCursor? cursor,
+        CancellationToken cancellationToken)
+    {
+        await writer.EndChunkAsync(cancellationToken);
+        // On disk before the manifest says so
+        file.Flush(flushToDisk: true);
+
+        job.RowsWritten += rows;
+        job.BytesWritten = file.Length;
+        job.Cursor = cursor;
+        job.UpdatedAt = DateTime.UtcNow;
+        await store.SaveAsync(job, cancellationToken);
+    }
+
+    private static void Validate(ReportExportQuery query)
+    {
+        if (!ReportExportDatasets.All.Contains(query.Dataset))
+        {
+            throw new ArgumentException($"Unknown export dataset '{query.Dataset}'. Expected one of: {string.Join(", ", ReportExportDatasets.All)}");
+        }
+
+        if (ReportExportDatasets.NeedsDateRange(query.Dataset) && (!query.StartDate.HasValue || !query.EndDate.HasValue))
+        {
+            throw new ArgumentException($"StartDate and EndDate are required for {query.Dataset} exports");
+        }
+
+        if (query.StartDate > query.EndDate)
+        {
+            throw new ArgumentException("StartDate cannot be greater than EndDate");
+        }
+    }
+}
@@ -0,0 +1,300 @@
+using System.Buffers;
+using System.Globalization;
+using System.IO.Compression;
+using System.Text;
+using System.Text.Json;
+using NationalClothingStore.Application.Interfaces;
+using Parquet;
+using Parquet.Data;
+using Parquet.Schema;
+
+namespace NationalClothingStore.Infrastructure.Exports;
+
+/// <summary>
+/// Writes export rows to a stream in one format. Rows are written in chunks: after <see cref="EndChunkAsync"/>
+/// everything written so far is a complete, valid file, which is what lets an interrupted job truncate
+/// back to its last chunk and carry on. All writes are asynchronous, so the destination can be a response body.
+/// </summary>
+internal abstract class ReportExportWriter : IAsyncDisposable
+{
+    protected ReportExportWriter(Stream destination, IReadOnlyList<ReportExportColumn> columns)
+    {
+        Destination = destination;
+        Columns = columns;
+    }
+
+    protected Stream Destination { get; }
+    protected IReadOnlyList<ReportExportColumn> Columns { get; }
+
+    /// <param name="appending">The destination already holds earlier chunks of the same export</param>
+    public static ReportExportWriter Create(ReportExportFormat format, Stream destination, IReadOnlyList<ReportExportColumn> columns, bool appending) =>
+        format switch
+        {
+            ReportExportFormat.Csv => new CsvExportWriter(destination, columns, appending),
+            ReportExportFormat.JsonLines => new JsonLinesExportWriter(destination, columns),
+            ReportExportFormat.Parquet => new ParquetExportWriter(destination, columns, appending),
+            _ => throw new ArgumentOutOfRangeException(nameof(format), format, null)
+        };
+
+    public abstract ValueTask WriteRowAsync(object?[] values, CancellationToken cancellationToken);
+
+    /// <summary>
+    /// Finish the current chunk and flush it to the destination
+    /// </summary>
+    public abstract ValueTask EndChunkAsync(CancellationToken cancellationToken);
+
+    public virtual ValueTask DisposeAsync() => ValueTask.CompletedTask;
+}
+
+/// <summary>
+/// RFC 4180 CSV with a header row; values are invariant-culture, timestamps ISO 8601
+/// </summary>
+internal sealed class CsvExportWriter : ReportExportWriter
+{
+    private readonly StreamWriter _writer;
+    private readonly StringBuilder _line = new();
+    private bool _headerPending;
+
+    public CsvExportWriter(Stream destination, IReadOnlyList<ReportExportColumn> columns, bool appending)
+        : base(destination, columns)
+    {
+        _writer = new StreamWriter(destination, new UTF8Encoding(false), bufferSize: 64 * 1024, leaveOpen: true);
+        _headerPending = !appending;
+    }
+
+    public override async ValueTask WriteRowAsync(object?[] values, CancellationToken cancellationToken)
+    {
+        if (_headerPending)
+        {
+            _headerPending = false;
+            await WriteLineAsync(Columns.Select(column => (object?)column.Name).ToArray(), cancellationToken);
+        }
+
+        await WriteLineAsync(values, cancellationToken);
+    }
+
+    public override async ValueTask EndChunkAsync(CancellationToken cancellationToken)
+    {
+        if (_headerPending)
+        {
+            _headerPending = false;
+            await WriteLineAsync(Columns.Select(column => (object?)column.Name).ToArray(), cancellationToken);
+        }
+
+        await _writer.FlushAsync(cancellationToken);
+    }
+
+    public override ValueTask DisposeAsync() => _writer.DisposeAsync();
+
+    private async ValueTask WriteLineAsync(object?[] values, CancellationToken cancellationToken)
+    {
+        _line.Clear();
+        for (var i = 0; i < values.Length; i++)
+        {
+            if (i > 0)
+            {
+                _line.Append(',');
+            }
+
+            AppendField(values[i]);
+        }
+
+        _line.Append("\r\n");
+        await _writer.WriteAsync(_line, cancellationToken);
+    }
+
+    private void AppendField(object? value)
+    {
+        var text = value switch
+        {
+            null => string.Empty,
+            DateTime timestamp => timestamp.ToString("O", CultureInfo.InvariantCulture),
+            bool flag => flag ? "true" : "false",
+            IFormattable formattable => formattable.ToString(null, CultureInfo.InvariantCulture),
+            _ => value.ToString() ?? string.Empty
+        };
+
+        if (text.AsSpan().IndexOfAny(",\"\r\n") < 0)
+        {
+            _line.Append(text);
+            return;
+        }
+
+        _line.Append('"').Append(text.Replace("\"", "\"\"")).Append('"');
+    }
+}
+
+/// <summary>
+/// One JSON object per line, gzip-compressed. Each chunk is its own gzip member; concatenated members
+/// are a valid gzip file, so chunks can be appended to an earlier export.
+/// </summary>
+internal sealed class JsonLinesExportWriter : ReportExportWriter
+{
+    private static readonly byte[] NewLine = "\n"u8.ToArray();
+
+    private readonly ArrayBufferWriter<byte> _buffer = new(4096);
+    private readonly Utf8JsonWriter _json;
+    private readonly JsonEncodedText[] _names;
+    private GZipStream? _member;
+
+    public JsonLinesExportWriter(Stream destination, IReadOnlyList<ReportExportColumn> columns)
+        : base(destination, columns)
+    {
+        _json = new Utf8JsonWriter(_buffer);
+        _names = columns.Select(column => JsonEncodedText.Encode(JsonNamingPolicy.CamelCase.ConvertName(column.Name))).ToArray();
+    }
+
+    public override async ValueTask WriteRowAsync(object?[] values, CancellationToken cancellationToken)
+    {
+        _member ??= new GZipStream(Destination, CompressionLevel.Fastest, leaveOpen: true);
+
+        _buffer.ResetWrittenCount();
+        _json.Reset(_buffer);
+        _json.WriteStartObject();
+        for (var i = 0; i < values.Length; i++)
+        {
+            _json.WritePropertyName(_names[i]);
+            WriteValue(values[i]);
+        }
+
+        _json.WriteEndObject();
+        _json.Flush();
+
+        await _member.WriteAsync(_buffer.WrittenMemory, cancellationToken);
+        await _member.WriteAsync(NewLine, cancellationToken);
+    }
+
+    public override async ValueTask EndChunkAsync(CancellationToken cancellationToken)
+    {
+        if (_member != null)
+        {
+            // Writes the member's trailer without blocking
+            await _member.DisposeAsync();
+            _member = null;
+        }
+
+        await Destination.FlushAsync(cancellationToken);
+    }
+
+    public override async ValueTask DisposeAsync()
+    {
+        if (_member != null)
+        {
+            await _member.DisposeAsync();
+        }
+
+        await _json.DisposeAsync();
+    }
+
+    private void WriteValue(object? value)
+    {
+        switch (value)
+        {
+            case null:
+                _json.WriteNullValue();
+                break;
+            case string text:
+                _json.WriteStringValue(text);
+                break;
+            case DateTime timestamp:
+                _json.WriteStringValue(timestamp);
+                break;
+            case Guid id:
+                _json.WriteStringValue(id);
+                break;
+            case bool flag:
+                _json.WriteBooleanValue(flag);
+                break;
+            case int number:
+                _json.WriteNumberValue(number);
+                break;
+            case long number:
+                _json.WriteNumberValue(number);
+                break;
+            case decimal number:
+                _json.WriteNumberValue(number);
+                break;
+            case double number:
+                _json.WriteNumberValue(number);
+                break;
+            default:
+                _json.WriteStringValue(Convert.ToString(value, CultureInfo.InvariantCulture));
+                break;
+        }
+    }
+}
+
+/// <summary>
+/// Parquet, one row group per chunk. Column values are buffered for the current chunk only; ending a chunk
+/// writes its row group and the file footer, and the next chunk reopens the file in append mode.
+/// Needs a seekable, readable destination.
+/// </summary>
+internal sealed class ParquetExportWriter : ReportExportWriter
+{
+    private readonly ParquetSchema _schema;
+    private readonly DataField[] _fields;
+    private readonly List<object?>[] _chunk;
+    private bool _appending;
+
+    public ParquetExportWriter(Stream destination, IReadOnlyList<ReportExportColumn> columns, bool appending)
+        : base(destination, columns)
+    {
+        if (!destination.CanSeek || !destination.CanRead)
+        {
+            throw new ArgumentException("Parquet exports need a seekable, readable destination", nameof(destination));
+        }
+
+        // Guids have no portable Parquet type, so they are written as strings
+        _fields = columns
+            .Select(column => new DataField(column.Name, ParquetType(column.Type), isNullable: true))
+            .ToArray();
+        _schema = new ParquetSchema(_fields);
+        _chunk = columns.Select(_ => new List<object?>()).ToArray();
+        _appending = appending;
+    }
+
+    public override ValueTask WriteRowAsync(object?[] values, CancellationToken cancellationToken)
+    {
+        for (var i = 0; i < values.Length; i++)
+        {
+            _chunk[i].Add(values[i] is Guid id ? id.ToString() : values[i]);
+        }
+
+        return ValueTask.CompletedTask;
+    }
+
+    public override async ValueTask EndChunkAsync(CancellationToken cancellationToken)
+    {
+        if (_chunk[0].Count == 0 && _appending)
+        {
+            return;
+        }
+
+        using (var writer = await ParquetWriter.CreateAsync(_schema, Destination, append: _appending, cancellationToken: cancellationToken))
+        {
+            writer.CompressionMethod = CompressionMethod.Snappy;
+            using var rowGroup = writer.CreateRowGroup();
+            for (var i = 0; i < _fields.Length; i++)
+            {
+                await rowGroup.WriteColumnAsync(new DataColumn(_fields[i], ToArray(_chunk[i], _fields[i].ClrNullableIfHasNullsType)), cancellationToken);
+                _chunk[i].Clear();
+            }
+        }
+
+        _appending = true;
+        await Destination.FlushAsync(cancellationToken);
+    }
+
+    private static Type ParquetType(Type type) => type == typeof(Guid) ? typeof(string) : type;
+
+    private static Array ToArray(List<object?> values, Type elementType)
+    {
+        var array = Array.CreateInstance(elementType, values.Count);
+        for (var i = 0; i < values.Count; i++)
+        {
+            array.SetValue(values[i], i);
+        }
+
+        return array;
+    }
+}
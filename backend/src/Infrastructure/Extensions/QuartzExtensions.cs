@@ -26,6 +26,7 @@ public static class QuartzExtensions
         services.AddQuartzHostedService(q => q.WaitForJobsToComplete = true);
 
         // Register the background job service
+        services.AddSingleton<JobExecutionHistoryLog>();
         services.AddSingleton<IBackgroundJobService, BackgroundJobService>();
 
         return services;
@@ -48,6 +49,7 @@ public static class QuartzExtensions
         services.AddQuartzHostedService(q => q.WaitForJobsToComplete = true);
 
         // Register the background job service
+        services.AddSingleton<JobExecutionHistoryLog>();
         services.AddSingleton<IBackgroundJobService, BackgroundJobService>();
 
         return services;
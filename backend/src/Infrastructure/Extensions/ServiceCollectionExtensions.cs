@@ -1,11 +1,15 @@
+using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.DependencyInjection;
 using NationalClothingStore.Application.Interfaces;
 using NationalClothingStore.Application.Services;
 using NationalClothingStore.Infrastructure.Data;
 using NationalClothingStore.Infrastructure.Data.Repositories;
 using NationalClothingStore.Infrastructure.External;
+using NationalClothingStore.Infrastructure.Jobs;
 using NationalClothingStore.Infrastructure.Monitoring;
 using NationalClothingStore.Infrastructure.Security;
+using NationalClothingStore.Infrastructure.Services;
+using Quartz;
 
 namespace NationalClothingStore.Infrastructure.Extensions;
 
@@ -35,6 +39,9 @@ public static class ServiceCollectionExtensions
         services.AddScoped<IInventoryTransactionRepository, InventoryTransactionRepository>();
         services.AddScoped<ICustomerRepository, CustomerRepository>();
         services.AddScoped<ISalesTransactionRepository, SalesTransactionRepository>();
+        services.AddScoped<ITablePartitionRepository, TablePartitionRepository>();
+        services.AddScoped<IAnalyticsWarehouseRepository, AnalyticsWarehouseRepository>();
+        services.AddScoped<IReportExportRepository, ReportExportRepository>();
         
         return services;
     }
@@ -57,4 +64,81 @@ public static class ServiceCollectionExtensions
         
         return services;
     }
-}
\ No newline at end of file
+
+    /// <summary>
+    /// Registers partition-based data retention and the nightly job that runs it
+    /// </summary>
+    public static IServiceCollection AddDataArchival(this IServiceCollection services, IConfiguration configuration)
+    {
+        services.Configure<DataArchivalOptions>(configuration.GetSection("DataArchival"));
+        services.AddScoped<IDataArchivalService, DataArchivalService>();
+        services.AddHostedService<DataArchivalJob>();
+
+        return services;
+    }
+
+    /// <summary>
+    /// Registers the incremental analytics warehouse load and the job that schedules it
+    /// </summary>
+    public static IServiceCollection AddAnalyticsEtl(this IServiceCollection services, IConfiguration configuration)
+    {
+        services.Configure<AnalyticsEtlOptions>(configuration.GetSection("AnalyticsEtl"));
+        services.AddScoped<IAnalyticsEtlService, AnalyticsEtlService>();
+        services.AddHostedService<AnalyticsEtlJob>();
+
+        return services;
+    }
+
+    /// <summary>
+    /// Registers the report generation job and, when ReportGeneration:Schedule holds a cron expression, its
+    /// recurring trigger; requires AddQuartzBackgroundJobs
+    /// </summary>
+    public static IServiceCollection AddReportGeneration(this IServiceCollection services, IConfiguration configuration)
+    {
+        var section = configuration.GetSection("ReportGeneration");
+        services.Configure<ReportGenerationOptions>(section);
+        services.AddBackgroundJob<ReportGenerationJob>();
+
+        var schedule = section[nameof(ReportGenerationOptions.Schedule)];
+        if (!string.IsNullOrWhiteSpace(schedule))
+        {
+            services.Configure<QuartzOptions>(options =>
+            {
+                var jobKey = new JobKey(ReportGenerationJob.JobName);
+                options.AddJob<QuartzJobWrapper<ReportGenerationJob>>(job => job.WithIdentity(jobKey).StoreDurably());
+                options.AddTrigger(trigger => trigger
+                    .ForJob(jobKey)
+                    .WithIdentity($"{ReportGenerationJob.JobName}-trigger")
+                    .WithCronSchedule(schedule, cron => cron.InTimeZone(TimeZoneInfo.Utc)));
+            });
+        }
+
+        return services;
+    }
+
+    /// <summary>
+    /// Registers the in-memory aggregator that sales and inventory services feed and dashboard streams read;
+    /// required by AddApplicationServices
+    /// </summary>
+    public static IServiceCollection AddRealTimeDashboard(this IServiceCollection services, IConfiguration configuration)
+    {
+        services.Configure<RealTimeDashboardOptions>(configuration.GetSection("RealTimeDashboard"));
+        services.AddSingleton<IRealTimeDashboardService, RealTimeDashboardService>();
+
+        return services;
+    }
+
+    /// <summary>
+    /// Registers the content-addressed upload store and the background worker that resizes uploaded images
+    /// </summary>
+    public static IServiceCollection AddFileUploads(this IServiceCollection services, IConfiguration configuration)
+    {
+        services.Configure<FileUploadOptions>(configuration.GetSection("FileUpload"));
+        services.AddSingleton<UploadReferenceStore>();
+        services.AddSingleton<ImageDerivativeService>();
+        services.AddHostedService(serviceProvider => serviceProvider.GetRequiredService<ImageDerivativeService>());
+        services.AddScoped<IFileUploadService, FileUploadService>();
+
+        return services;
+    }
+}
@@ -1,28 +1,44 @@
 using NationalClothingStore.Application.Interfaces;
 using Microsoft.Extensions.Logging;
-using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.Options;
 using Microsoft.AspNetCore.Http;
-using System.Text;
+using System.Buffers;
+using System.Security.Cryptography;
 using System.Linq;
 
 namespace NationalClothingStore.Infrastructure.External;
 
 /// <summary>
-/// Service for file upload operations
+/// Service for file upload operations. Uploads are streamed to disk once, hashed on the way, and stored
+/// under their SHA-256 so an image uploaded twice is stored once; resized derivatives are generated in
+/// the background by <see cref="ImageDerivativeService"/>. Folders hold references to the stored files
+/// (see <see cref="UploadReferenceStore"/>), and a file is deleted when no folder references it any more.
 /// </summary>
 public class FileUploadService : IFileUploadService
 {
+    private const int CopyBufferSize = 80 * 1024;
+
+    private static readonly string[] DefaultAllowedExtensions = { ".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp" };
+
     private readonly ILogger<FileUploadService> _logger;
-    private readonly IConfiguration _configuration;
+    private readonly FileUploadOptions _options;
+    private readonly ImageDerivativeService _derivatives;
+    private readonly UploadReferenceStore _references;
     private readonly string _baseUploadPath;
     private readonly string _baseUrl;
 
-    public FileUploadService(ILogger<FileUploadService> logger, IConfiguration configuration)
+    public FileUploadService(
+        ILogger<FileUploadService> logger,
+        IOptions<FileUploadOptions> options,
+        ImageDerivativeService derivatives,
+        UploadReferenceStore references)
     {
         _logger = logger;
-        _configuration = configuration;
-        _baseUploadPath = configuration["FileUpload:BasePath"] ?? "uploads";
-        _baseUrl = configuration["FileUpload:BaseUrl"] ?? "/uploads";
+        _options = options.Value;
+        _derivatives = derivatives;
+        _references = references;
+        _baseUploadPath = _options.BasePath;
+        _baseUrl = _options.BaseUrl;
         
         // Ensure upload directory exists
         if (!Directory.Exists(_baseUploadPath))
@@ -44,12 +60,19 @@ public class FileUploadService : IFileUploadService
                 };
             }
 
+            if (!UploadReferenceStore.IsValidFolder(folder))
+            {
+                return new FileUploadResult
+                {
+                    Success = false,
+                    ErrorMessage = $"Folder '{folder}' is not allowed"
+                };
+            }
+
             // Validate file
-            var allowedExtensions = _configuration.GetSection("FileUpload:AllowedExtensions").Get<string[]>() ?? 
-                new[] { ".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp" };
-            var maxFileSize = _configuration.GetValue<long>("FileUpload:MaxFileSize", 5 * 1024 * 1024); // 5MB default
+            var allowedExtensions = _options.AllowedExtensions ?? DefaultAllowedExtensions;
 
-            var validationResult = await ValidateFile(file, allowedExtensions, maxFileSize);
+            var validationResult = await ValidateFile(file, allowedExtensions, _options.MaxFileSize);
             if (!validationResult.IsValid)
             {
                 return new FileUploadResult
@@ -59,37 +82,44 @@ public class FileUploadService : IFileUploadService
                 };
             }
 
-            // Create folder if it doesn't exist
-            var folderPath = Path.Combine(_baseUploadPath, folder);
-            if (!Directory.Exists(folderPath))
+            var stored = await StoreAsync(file, folder, cancellationToken);
+            if (stored == null)
             {
-                Directory.CreateDirectory(folderPath);
+                return new FileUploadResult
+                {
+                    Success = false,
+                    ErrorMessage = "Invalid or corrupted image file"
+                };
             }
 
-            // Generate unique file name
-            var uniqueFileName = GenerateUniqueFileName(file.FileName);
-            var filePath = Path.Combine(folderPath, uniqueFileName);
-
-            // Save file
-            using (var stream = new FileStream(filePath, FileMode.Create))
+            var derivatives = new Dictionary<string, string>();
+            if (ImageDerivativeService.RasterExtensions.Contains(stored.Extension))
             {
-                await file.CopyToAsync(stream, cancellationToken);
+                await _derivatives.EnqueueAsync(stored.ObjectPath, cancellationToken);
+                foreach (var derivative in _derivatives.Derivatives)
+                {
+                    derivatives[$"{derivative.Name}{derivative.Extension}"] =
+                        GetFileUrl(ImageDerivativeService.DerivativePath(stored.ContentHash, derivative));
+                }
             }
 
-            var relativePath = Path.Combine(folder, uniqueFileName).Replace("\\", "/");
-            var fileUrl = GetFileUrl(relativePath);
-
-            _logger.LogInformation("File uploaded successfully: {FileName} to {FilePath}", file.FileName, filePath);
+            var filePath = Path.Combine(_baseUploadPath, stored.ObjectPath);
+            _logger.LogInformation(
+                "File uploaded successfully: {FileName} in {Folder} to {FilePath} (deduplicated: {Deduplicated})",
+                file.FileName, folder, filePath, stored.Deduplicated);
 
             return new FileUploadResult
             {
                 Success = true,
-                FileName = uniqueFileName,
+                FileName = Path.GetFileName(stored.ObjectPath),
                 OriginalFileName = file.FileName,
                 FilePath = filePath,
-                FileUrl = fileUrl,
+                FileUrl = GetFileUrl(stored.ObjectPath),
                 FileSize = file.Length,
                 ContentType = file.ContentType,
+                ContentHash = stored.ContentHash,
+                Deduplicated = stored.Deduplicated,
+                Derivatives = derivatives,
                 UploadedAt = DateTime.UtcNow
             };
         }
@@ -117,11 +147,23 @@ public class FileUploadService : IFileUploadService
         return results;
     }
 
-    public async Task<bool> DeleteFileAsync(string filePath, CancellationToken cancellationToken = default)
+    public async Task<bool> DeleteFileAsync(string filePath, string folder = "uploads", CancellationToken cancellationToken = default)
     {
         try
         {
-            if (string.IsNullOrEmpty(filePath) || !File.Exists(filePath))
+            if (string.IsNullOrEmpty(filePath))
+            {
+                return false;
+            }
+
+            var objectPath = ObjectPathOf(filePath);
+            if (objectPath != null)
+            {
+                return UploadReferenceStore.IsValidFolder(folder)
+                    && await ReleaseAsync(folder, objectPath, cancellationToken);
+            }
+
+            if (!File.Exists(filePath))
             {
                 return false;
             }
@@ -138,7 +180,47 @@ public class FileUploadService : IFileUploadService
         }
     }
 
-    public async Task<FileValidationResult> ValidateFile(IFormFile file, string[] allowedExtensions, long maxFileSize)
+    /// <summary>
+    /// Drop a folder's reference to a stored file, and delete the file and its derivatives when it was the last
+    /// </summary>
+    /// <returns>False when the folder held no reference to the file</returns>
+    private async Task<bool> ReleaseAsync(string folder, string objectPath, CancellationToken cancellationToken)
+    {
+        var contentHash = Path.GetFileNameWithoutExtension(objectPath);
+        using (await _references.LockAsync(contentHash, cancellationToken))
+        {
+            if (!_references.Remove(folder, objectPath))
+            {
+                return false;
+            }
+
+            if (_references.IsReferenced(objectPath))
+            {
+                _logger.LogInformation("Released {ObjectPath} from {Folder}; still used by other folders", objectPath, folder);
+                return true;
+            }
+
+            File.Delete(Path.Combine(_baseUploadPath, objectPath));
+            foreach (var derivative in _derivatives.Derivatives)
+            {
+                File.Delete(Path.Combine(_baseUploadPath, ImageDerivativeService.DerivativePath(contentHash, derivative)));
+            }
+        }
+
+        _logger.LogInformation("File deleted successfully: {ObjectPath}, released by {Folder}", objectPath, folder);
+        return true;
+    }
+
+    /// <summary>
+    /// The path relative to the upload directory of a content-addressed file, or null for any other path
+    /// </summary>
+    private string? ObjectPathOf(string filePath)
+    {
+        var relativePath = Path.GetRelativePath(Path.GetFullPath(_baseUploadPath), Path.GetFullPath(filePath)).Replace('\\', '/');
+        return relativePath.StartsWith($"{ImageDerivativeService.ObjectsFolder}/", StringComparison.Ordinal) ? relativePath : null;
+    }
+
+    public Task<FileValidationResult> ValidateFile(IFormFile file, string[] allowedExtensions, long maxFileSize)
     {
         var errors = new List<string>();
 
@@ -167,31 +249,81 @@ public class FileUploadService : IFileUploadService
             errors.Add($"Content type '{file.ContentType}' is not allowed");
         }
 
-        // Additional validation for image files (basic validation without System.Drawing)
-        if (file.ContentType.StartsWith("image/"))
+        // The content itself is checked against the image signatures while it is stored
+        return Task.FromResult(errors.Any() ? FileValidationResult.Failure(errors.ToArray()) : FileValidationResult.Success());
+    }
+
+    /// <summary>
+    /// Copy an upload into the content-addressed store in a single pass, hashing it and checking its
+    /// signature on the way; null when the content is not the image it claims to be
+    /// </summary>
+    private async Task<StoredObject?> StoreAsync(IFormFile file, string folder, CancellationToken cancellationToken)
+    {
+        var objectsDirectory = Path.Combine(_baseUploadPath, ImageDerivativeService.ObjectsFolder);
+        Directory.CreateDirectory(objectsDirectory);
+
+        var partialPath = Path.Combine(objectsDirectory, $"{Guid.NewGuid():N}.partial");
+        var buffer = ArrayPool<byte>.Shared.Rent(CopyBufferSize);
+        try
         {
-            try
+            string? extension;
+            string contentHash;
+            await using (var source = file.OpenReadStream())
+            await using (var destination = new FileStream(partialPath, FileMode.CreateNew, FileAccess.Write, FileShare.None, CopyBufferSize, FileOptions.Asynchronous))
             {
-                // Basic validation - just check if we can read the stream
-                await using var imageStream = file.OpenReadStream();
-                var buffer = new byte[1024];
-                await imageStream.ReadExactlyAsync(buffer);
-                
-                // Reset stream position
-                imageStream.Position = 0;
-                
-                _logger.LogDebug("Image file validation passed for: {FileName}", file.FileName);
+                using var hash = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+
+                var read = await source.ReadAtLeastAsync(buffer.AsMemory(0, CopyBufferSize), ImageSignatures.Length, throwOnEndOfStream: false, cancellationToken);
+                extension = ImageSignatures.Detect(buffer.AsSpan(0, read))
+                    ?? (IsSvg(file) ? ".svg" : null);
+                if (extension == null)
+                {
+                    _logger.LogWarning("Rejected upload {FileName}: content does not match an image format", file.FileName);
+                    return null;
+                }
+
+                while (read > 0)
+                {
+                    hash.AppendData(buffer, 0, read);
+                    await destination.WriteAsync(buffer.AsMemory(0, read), cancellationToken);
+                    read = await source.ReadAsync(buffer.AsMemory(0, CopyBufferSize), cancellationToken);
+                }
+
+                contentHash = Convert.ToHexString(hash.GetHashAndReset()).ToLowerInvariant();
             }
-            catch (Exception ex)
+
+            var objectPath = ImageDerivativeService.ObjectPath(contentHash, extension);
+            var path = Path.Combine(_baseUploadPath, objectPath);
+            Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+
+            // Under the lock, so a delete releasing the last reference can't remove the file this upload reuses
+            using (await _references.LockAsync(contentHash, cancellationToken))
             {
-                _logger.LogWarning(ex, "Failed to validate image file: {FileName}", file.FileName);
-                errors.Add("Invalid or corrupted image file");
+                _references.Add(folder, objectPath);
+                if (File.Exists(path))
+                {
+                    // Already stored by an earlier upload; the bytes are the same
+                    return new StoredObject(objectPath, contentHash, extension, Deduplicated: true);
+                }
+
+                File.Move(partialPath, path);
+                return new StoredObject(objectPath, contentHash, extension, Deduplicated: false);
+            }
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+            if (File.Exists(partialPath))
+            {
+                File.Delete(partialPath);
             }
         }
-
-        return errors.Any() ? FileValidationResult.Failure(errors.ToArray()) : FileValidationResult.Success();
     }
 
+    private static bool IsSvg(IFormFile file) =>
+        string.Equals(file.ContentType, "image/svg+xml", StringComparison.OrdinalIgnoreCase)
+        && string.Equals(Path.GetExtension(file.FileName), ".svg", StringComparison.OrdinalIgnoreCase);
+
     public async Task<FileInfo?> GetFileInfoAsync(string filePath, CancellationToken cancellationToken = default)
     {
         try
@@ -224,53 +356,14 @@ public class FileUploadService : IFileUploadService
         }
     }
 
-    public string GenerateUniqueFileName(string fileName)
-    {
-        var extension = Path.GetExtension(fileName);
-        var fileNameWithoutExtension = Path.GetFileNameWithoutExtension(fileName);
-        
-        // Sanitize file name
-        var sanitizedFileName = SanitizeFileName(fileNameWithoutExtension);
-        
-        // Add timestamp and random suffix for uniqueness
-        var timestamp = DateTime.UtcNow.ToString("yyyyMMddHHmmss");
-        var randomSuffix = Guid.NewGuid().ToString("N")[..8];
-        
-        return $"{sanitizedFileName}_{timestamp}_{randomSuffix}{extension}";
-    }
-
     public string GetFileUrl(string filePath)
     {
         return $"{_baseUrl.TrimEnd('/')}/{filePath.Replace("\\", "/")}";
     }
 
-    private string SanitizeFileName(string fileName)
-    {
-        var invalidChars = Path.GetInvalidFileNameChars();
-        var sanitized = new StringBuilder(fileName.Length);
-        
-        foreach (var c in fileName)
-        {
-            if (!invalidChars.Contains(c))
-            {
-                sanitized.Append(c);
-            }
-            else
-            {
-                sanitized.Append('_');
-            }
-        }
-        
-        // Remove or replace other problematic characters
-        return sanitized.ToString()
-            .Replace(" ", "_")
-            .Replace("..", "_")
-            .Replace("/", "_")
-            .Replace("\\", "_");
-    }
-
     /// <summary>
-    /// Get upload statistics
+    /// Get upload statistics: the stored files the folder references, and files uploaded to the folder
+    /// before uploads were stored by content hash
     /// </summary>
     /// <param name="folder">Folder to check</param>
     /// <param name="cancellationToken">Cancellation token</param>
@@ -279,25 +372,21 @@ public class FileUploadService : IFileUploadService
     {
         try
         {
-            var folderPath = Path.Combine(_baseUploadPath, folder);
-            
-            if (!Directory.Exists(folderPath))
+            if (!UploadReferenceStore.IsValidFolder(folder))
             {
                 return new UploadStatistics
                 {
-                    TotalFiles = 0,
-                    TotalSize = 0,
-                    FileCountByType = new Dictionary<string, int>()
+                    FileCountByType = new Dictionary<string, int>(),
+                    ErrorMessage = $"Folder '{folder}' is not allowed"
                 };
             }
 
-            var files = await Task.Run(() => Directory.GetFiles(folderPath, "*", SearchOption.AllDirectories), cancellationToken);
+            var files = await Task.Run(() => FolderFiles(folder).ToList(), cancellationToken);
             var fileCountByType = new Dictionary<string, int>();
             var totalSize = 0L;
 
-            foreach (var file in files)
+            foreach (var (fileInfo, _, _) in files)
             {
-                var fileInfo = new FileInfo(file);
                 var extension = fileInfo.Extension.ToLowerInvariant();
                 
                 if (!fileCountByType.ContainsKey(extension))
@@ -311,7 +400,7 @@ public class FileUploadService : IFileUploadService
 
             return new UploadStatistics
             {
-                TotalFiles = files.Length,
+                TotalFiles = files.Count,
                 TotalSize = totalSize,
                 FileCountByType = fileCountByType,
                 LastUpdated = DateTime.UtcNow
@@ -331,7 +420,9 @@ public class FileUploadService : IFileUploadService
     }
 
     /// <summary>
-    /// Clean up old files
+    /// Clean up old files: the folder releases stored files last uploaded to it before the cutoff, which
+    /// are deleted only when no other folder references them, and deletes its old files from before uploads
+    /// were stored by content hash
     /// </summary>
     /// <param name="folder">Folder to clean</param>
     /// <param name="olderThanDays">Delete files older than this many days</param>
@@ -341,32 +432,36 @@ public class FileUploadService : IFileUploadService
     {
         try
         {
-            var folderPath = Path.Combine(_baseUploadPath, folder);
-            
-            if (!Directory.Exists(folderPath))
+            if (!UploadReferenceStore.IsValidFolder(folder))
             {
                 return 0;
             }
 
             var cutoffDate = DateTime.UtcNow.AddDays(-olderThanDays);
-            var files = await Task.Run(() => Directory.GetFiles(folderPath, "*", SearchOption.AllDirectories), cancellationToken);
+            var files = await Task.Run(() => FolderFiles(folder).Where(file => file.UploadedAt < cutoffDate).ToList(), cancellationToken);
             var deletedCount = 0;
 
-            foreach (var file in files)
+            foreach (var (fileInfo, objectPath, _) in files)
             {
-                var fileInfo = new FileInfo(file);
-                if (fileInfo.CreationTime < cutoffDate)
+                try
                 {
-                    try
+                    if (objectPath != null)
                     {
-                        File.Delete(file);
-                        deletedCount++;
-                        _logger.LogInformation("Deleted old file: {FilePath}", file);
-                    }
-                    catch (Exception ex)
-                    {
-                        _logger.LogWarning(ex, "Failed to delete old file: {FilePath}", file);
+                        if (await ReleaseAsync(folder, objectPath, cancellationToken))
+                        {
+                            deletedCount++;
+                        }
+
+                        continue;
                     }
+
+                    File.Delete(fileInfo.FullName);
+                    deletedCount++;
+                    _logger.LogInformation("Deleted old file: {FilePath}", fileInfo.FullName);
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    _logger.LogWarning(ex, "Failed to delete old file: {FilePath}", fileInfo.FullName);
                 }
             }
 
@@ -378,6 +473,79 @@ public class FileUploadService : IFileUploadService
             return 0;
         }
     }
+
+    /// <summary>
+    /// The files a folder holds: referenced stored files, with their object path and when they were last
+    /// uploaded to the folder, and files uploaded into the folder's own directory before uploads were stored
+    /// by content hash
+    /// </summary>
+    private IEnumerable<(FileInfo File, string? ObjectPath, DateTime UploadedAt)> FolderFiles(string folder)
+    {
+        foreach (var (objectPath, lastUploadedAt) in _references.List(folder))
+        {
+            var fileInfo = new FileInfo(Path.Combine(_baseUploadPath, objectPath));
+            if (fileInfo.Exists)
+            {
+                yield return (fileInfo, objectPath, lastUploadedAt);
+            }
+        }
+
+        var legacyDirectory = new DirectoryInfo(Path.Combine(_baseUploadPath, folder));
+        if (legacyDirectory.Exists)
+        {
+            foreach (var fileInfo in legacyDirectory.EnumerateFiles("*", SearchOption.AllDirectories))
+            {
+                yield return (fileInfo, null, fileInfo.CreationTimeUtc);
+            }
+        }
+    }
+}
+
+/// <summary>
+/// An upload's place in the content-addressed store
+/// </summary>
+internal sealed record StoredObject(string ObjectPath, string ContentHash, string Extension, bool Deduplicated);
+
+/// <summary>
+/// Identifies raster images by their leading bytes rather than by the name and content type the client sent
+/// </summary>
+internal static class ImageSignatures
+{
+    /// <summary>Bytes needed to tell the formats apart</summary>
+    public const int Length = 12;
+
+    /// <summary>
+    /// The canonical extension of the image format the bytes start with, or null
+    /// </summary>
+    public static string? Detect(ReadOnlySpan<byte> header)
+    {
+        if (header is [0xFF, 0xD8, 0xFF, ..])
+        {
+            return ".jpg";
+        }
+
+        if (header is [0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, ..])
+        {
+            return ".png";
+        }
+
+        if (header.StartsWith("GIF87a"u8) || header.StartsWith("GIF89a"u8))
+        {
+            return ".gif";
+        }
+
+        if (header.Length >= Length && header.StartsWith("RIFF"u8) && header[8..12].SequenceEqual("WEBP"u8))
+        {
+            return ".webp";
+        }
+
+        if (header.StartsWith("BM"u8))
+        {
+            return ".bmp";
+        }
+
+        return null;
+    }
 }
 
 /// <summary>
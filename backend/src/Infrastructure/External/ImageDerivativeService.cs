@@ -0,0 +1,216 @@
+using System.Collections.Concurrent;
+using System.Threading.Channels;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using SixLabors.ImageSharp;
+using SixLabors.ImageSharp.Formats;
+using SixLabors.ImageSharp.Formats.Jpeg;
+using SixLabors.ImageSharp.Formats.Webp;
+using SixLabors.ImageSharp.Processing;
+
+namespace NationalClothingStore.Infrastructure.External;
+
+/// <summary>
+/// File upload settings, bound from the "FileUpload" configuration section
+/// </summary>
+public class FileUploadOptions
+{
+    /// <summary>Directory holding uploaded files; share it between replicas</summary>
+    public string BasePath { get; set; } = "uploads";
+
+    /// <summary>URL path the upload directory is served under</summary>
+    public string BaseUrl { get; set; } = "/uploads";
+
+    public long MaxFileSize { get; set; } = 5 * 1024 * 1024;
+
+    /// <summary>Allowed file extensions; null allows the common raster image formats</summary>
+    public string[]? AllowedExtensions { get; set; }
+
+    /// <summary>Longest side of the thumbnail derivative, in pixels</summary>
+    public int ThumbnailSize { get; set; } = 320;
+
+    /// <summary>Longest side of the medium derivative, in pixels</summary>
+    public int MediumSize { get; set; } = 960;
+
+    public int JpegQuality { get; set; } = 82;
+
+    public int WebpQuality { get; set; } = 75;
+
+    /// <summary>Images resized at the same time by this process</summary>
+    public int DerivativeWorkers { get; set; } = 2;
+}
+
+/// <summary>
+/// A resized rendition of an uploaded image
+/// </summary>
+public record ImageDerivative(string Name, int MaxSize, string Extension);
+
+/// <summary>
+/// Generates the resized renditions of uploaded images in the background, so uploads return as soon as
+/// the original is stored. Every size is written as JPEG and WebP next to the others, keyed by the
+/// original's content hash; the work is idempotent, so a queued image that already has its derivatives,
+/// or one queued twice, costs a few file checks.
+/// </summary>
+public class ImageDerivativeService(IOptions<FileUploadOptions> options, ILogger<ImageDerivativeService> logger) : BackgroundService
+{
+    public const string ObjectsFolder = "objects";
+    public const string DerivativesFolder = "derivatives";
+
+    private readonly FileUploadOptions _options = options.Value;
+    private readonly Channel<string> _queue = Channel.CreateUnbounded<string>(new UnboundedChannelOptions { SingleReader = false });
+    private readonly ConcurrentDictionary<string, byte> _inFlight = new();
+
+    /// <summary>Extensions of the originals that get derivatives; vector images scale on their own</summary>
+    public static readonly IReadOnlySet<string> RasterExtensions = new HashSet<string> { ".jpg", ".png", ".gif", ".webp", ".bmp" };
+
+    public IReadOnlyList<ImageDerivative> Derivatives { get; } =
+    [
+        new("thumb", options.Value.ThumbnailSize, ".jpg"),
+        new("thumb", options.Value.ThumbnailSize, ".webp"),
+        new("medium", options.Value.MediumSize, ".jpg"),
+        new("medium", options.Value.MediumSize, ".webp")
+    ];
+
+    /// <summary>
+    /// Where an original is stored, relative to the upload directory
+    /// </summary>
+    public static string ObjectPath(string contentHash, string extension) =>
+        $"{ObjectsFolder}/{contentHash[..2]}/{contentHash}{extension}";
+
+    /// <summary>
+    /// Where a derivative of an original is stored, relative to the upload directory
+    /// </summary>
+    public static string DerivativePath(string contentHash, ImageDerivative derivative) =>
+        $"{DerivativesFolder}/{contentHash[..2]}/{contentHash}_{derivative.Name}{derivative.Extension}";
+
+    /// <summary>
+    /// Queue the derivatives of a stored original
+    /// </summary>
+    /// <param name="objectPath">The original's path relative to the upload directory</param>
+    public ValueTask EnqueueAsync(string objectPath, CancellationToken cancellationToken = default) =>
+        _queue.Writer.WriteAsync(objectPath, cancellationToken);
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        // Originals stored just before the previous run of this process stopped may still lack their derivatives
+        await Task.Run(() => EnqueueIncomplete(stoppingToken), stoppingToken);
+
+        var workers = Enumerable.Range(0, Math.Max(1, _options.DerivativeWorkers))
+            .Select(_ => RunWorkerAsync(stoppingToken));
+        await Task.WhenAll(workers);
+    }
+
+    private void EnqueueIncomplete(CancellationToken stoppingToken)
+    {
+        var objectsDirectory = Path.Combine(_options.BasePath, ObjectsFolder);
+        if (!Directory.Exists(objectsDirectory))
+        {
+            return;
+        }
+
+        foreach (var path in Directory.EnumerateFiles(objectsDirectory, "*", SearchOption.AllDirectories))
+        {
+            stoppingToken.ThrowIfCancellationRequested();
+            if (RasterExtensions.Contains(Path.GetExtension(path)) && PendingDerivatives(path).Any())
+            {
+                _queue.Writer.TryWrite(Path.GetRelativePath(_options.BasePath, path).Replace('\\', '/'));
+            }
+        }
+    }
+
+    private async Task RunWorkerAsync(CancellationToken stoppingToken)
+    {
+        try
+        {
+            await foreach (var objectPath in _queue.Reader.ReadAllAsync(stoppingToken))
+            {
+                if (!_inFlight.TryAdd(objectPath, 0))
+                {
+                    continue;
+                }
+
+                try
+                {
+                    await GenerateAsync(objectPath, stoppingToken);
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    logger.LogError(ex, "Derivatives of {ObjectPath} could not be generated", objectPath);
+                }
+                finally
+                {
+                    _inFlight.TryRemove(objectPath, out _);
+                }
+            }
+        }
+        catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+        {
+        }
+    }
+
+    private async Task GenerateAsync(string objectPath, CancellationToken cancellationToken)
+    {
+        var sourcePath = Path.Combine(_options.BasePath, objectPath);
+        var pending = PendingDerivatives(sourcePath).ToList();
+        if (pending.Count == 0)
+        {
+            return;
+        }
+
+        using var image = await Image.LoadAsync(sourcePath, cancellationToken);
+        image.Mutate(x => x.AutoOrient());
+        // Derivatives are served to shoppers; camera and location metadata stays with the original
+        image.Metadata.ExifProfile = null;
+        image.Metadata.XmpProfile = null;
+
+        var contentHash = Path.GetFileNameWithoutExtension(sourcePath);
+        foreach (var derivative in pending)
+        {
+            using var resized = image.Clone(x =>
+            {
+                if (Math.Max(image.Width, image.Height) > derivative.MaxSize)
+                {
+                    x.Resize(new ResizeOptions { Mode = ResizeMode.Max, Size = new Size(derivative.MaxSize) });
+                }
+
+                if (derivative.Extension == ".jpg")
+                {
+                    // JPEG has no alpha channel; product shots sit on white
+                    x.BackgroundColor(Color.White);
+                }
+            });
+
+            var path = Path.Combine(_options.BasePath, DerivativePath(contentHash, derivative));
+            Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+
+            var partialPath = $"{path}.{Guid.NewGuid():N}.partial";
+            await resized.SaveAsync(partialPath, Encoder(derivative), cancellationToken);
+            File.Move(partialPath, path, overwrite: true);
+        }
+
+        if (!File.Exists(sourcePath))
+        {
+            // The original was deleted while it was being resized; don't leave its derivatives behind
+            foreach (var derivative in Derivatives)
+            {
+                File.Delete(Path.Combine(_options.BasePath, DerivativePath(contentHash, derivative)));
+            }
+
+            return;
+        }
+
+        logger.LogInformation("Generated {Count} derivatives of {ObjectPath}", pending.Count, objectPath);
+    }
+
+    private IEnumerable<ImageDerivative> PendingDerivatives(string sourcePath)
+    {
+        var contentHash = Path.GetFileNameWithoutExtension(sourcePath);
+        return Derivatives.Where(derivative => !File.Exists(Path.Combine(_options.BasePath, DerivativePath(contentHash, derivative))));
+    }
+
+    private IImageEncoder Encoder(ImageDerivative derivative) =>
+        derivative.Extension == ".webp"
+            ? new WebpEncoder { Quality = _options.WebpQuality, FileFormat = WebpFileFormatType.Lossy }
+            : new JpegEncoder { Quality = _options.JpegQuality };
+}
@@ -0,0 +1,113 @@
+using Microsoft.Extensions.Options;
+
+namespace NationalClothingStore.Infrastructure.External;
+
+/// <summary>
+/// Records which upload folders hold each content-addressed file: an empty marker per folder and file,
+/// refs/{folder}/{hash}{ext}, touched on every upload. A stored file is shared by every folder it was
+/// uploaded to, and is deleted with its derivatives only when the last folder lets go of it.
+/// </summary>
+public class UploadReferenceStore(IOptions<FileUploadOptions> options)
+{
+    public const string ReferencesFolder = "refs";
+    private const string LocksFolder = "locks";
+
+    private static readonly HashSet<string> ReservedFolders = new(StringComparer.OrdinalIgnoreCase)
+    {
+        ImageDerivativeService.ObjectsFolder, ImageDerivativeService.DerivativesFolder, ReferencesFolder, LocksFolder
+    };
+
+    private readonly string _basePath = options.Value.BasePath;
+
+    /// <summary>
+    /// Whether a folder name from a request is a single, non-reserved path segment
+    /// </summary>
+    public static bool IsValidFolder(string? folder) =>
+        !string.IsNullOrWhiteSpace(folder)
+        && folder is not ("." or "..")
+        && folder.IndexOfAny(Path.GetInvalidFileNameChars()) < 0
+        && !ReservedFolders.Contains(folder);
+
+    /// <summary>
+    /// Take the exclusive right to change a stored file and its references, here or on another replica
+    /// that shares the upload directory
+    /// </summary>
+    public async Task<IDisposable> LockAsync(string contentHash, CancellationToken cancellationToken = default)
+    {
+        var path = Path.Combine(_basePath, LocksFolder, contentHash[..2], $"{contentHash}.lock");
+        Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+        while (true)
+        {
+            try
+            {
+                return new FileStream(path, FileMode.OpenOrCreate, FileAccess.ReadWrite, FileShare.None);
+            }
+            catch (IOException)
+            {
+                await Task.Delay(TimeSpan.FromMilliseconds(20), cancellationToken);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Record that a folder holds a stored file; call under <see cref="LockAsync"/>
+    /// </summary>
+    public void Add(string folder, string objectPath)
+    {
+        var path = ReferencePath(folder, objectPath);
+        Directory.CreateDirectory(Path.GetDirectoryName(path)!);
+        using (File.Open(path, FileMode.OpenOrCreate))
+        {
+        }
+
+        File.SetLastWriteTimeUtc(path, DateTime.UtcNow);
+    }
+
+    /// <summary>
+    /// Drop a folder's reference to a stored file; call under <see cref="LockAsync"/>
+    /// </summary>
+    /// <returns>False when the folder held no reference</returns>
+    public bool Remove(string folder, string objectPath)
+    {
+        var path = ReferencePath(folder, objectPath);
+        if (!File.Exists(path))
+        {
+            return false;
+        }
+
+        File.Delete(path);
+        return true;
+    }
+
+    /// <summary>
+    /// Whether any folder still holds a stored file
+    /// </summary>
+    public bool IsReferenced(string objectPath)
+    {
+        var referencesDirectory = Path.Combine(_basePath, ReferencesFolder);
+        return Directory.Exists(referencesDirectory)
+            && Directory.EnumerateDirectories(referencesDirectory)
+                .Any(folder => File.Exists(Path.Combine(folder, Path.GetFileName(objectPath))));
+    }
+
+    /// <summary>
+    /// The stored files a folder holds, as (object path, last uploaded at) pairs
+    /// </summary>
+    public IEnumerable<(string ObjectPath, DateTime LastUploadedAt)> List(string folder)
+    {
+        var directory = Path.Combine(_basePath, ReferencesFolder, folder);
+        if (!Directory.Exists(directory))
+        {
+            yield break;
+        }
+
+        foreach (var marker in new DirectoryInfo(directory).EnumerateFiles())
+        {
+            var contentHash = Path.GetFileNameWithoutExtension(marker.Name);
+            yield return (ImageDerivativeService.ObjectPath(contentHash, marker.Extension), marker.LastWriteTimeUtc);
+        }
+    }
+
+    private string ReferencePath(string folder, string objectPath) =>
+        Path.Combine(_basePath, ReferencesFolder, folder, Path.GetFileName(objectPath));
+}
@@ -1,7 +1,10 @@
 using Microsoft.AspNetCore.Mvc;
 using Microsoft.AspNetCore.Mvc.Filters;
-using Microsoft.Extensions.Caching.Memory;
 using Microsoft.AspNetCore.Http;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Options;
+using NationalClothingStore.Infrastructure.RateLimiting;
+using System.Globalization;
 using System.Security.Claims;
 using System.Net;
 
@@ -12,7 +15,6 @@ namespace NationalClothingStore.Infrastructure.Filters;
 /// </summary>
 public class RateLimitAttribute : ActionFilterAttribute
 {
-    private readonly IMemoryCache _cache;
     private readonly int _requests;
     private readonly TimeSpan _timeWindow;
     private readonly string _identifier;
@@ -24,26 +26,28 @@ public class RateLimitAttribute : ActionFilterAttribute
         _identifier = identifier;
     }
 
-    public override void OnActionExecuting(ActionExecutingContext context)
+    public override async Task OnActionExecutionAsync(ActionExecutingContext context, ActionExecutionDelegate next)
     {
-        var cache = context.HttpContext.RequestServices.GetService(typeof(IMemoryCache)) as IMemoryCache;
-        if (cache == null)
+        var services = context.HttpContext.RequestServices;
+        var limiter = services.GetService<IRateLimiter>();
+        var options = services.GetService<IOptions<RateLimitOptions>>()?.Value ?? new RateLimitOptions();
+        if (limiter == null || !options.Enabled)
         {
-            base.OnActionExecuting(context);
+            await next();
             return;
         }
 
         var clientId = GetClientIdentifier(context.HttpContext);
-        var cacheKey = $"rate_limit_{_identifier}_{clientId}";
+        var key = $"{options.KeyPrefix}:{_identifier}:{clientId}";
+        var decision = await limiter.AcquireAsync(key, _requests, _timeWindow, context.HttpContext.RequestAborted);
 
-        var requestCount = cache.GetOrCreate(cacheKey, entry =>
-        {
-            entry.AbsoluteExpirationRelativeToNow = _timeWindow;
-            return 0;
-        });
+        var headers = context.HttpContext.Response.Headers;
+        headers["X-RateLimit-Limit"] = _requests.ToString(CultureInfo.InvariantCulture);
+        headers["X-RateLimit-Remaining"] = decision.Remaining.ToString(CultureInfo.InvariantCulture);
 
-        if (requestCount >= _requests)
+        if (!decision.Allowed)
         {
+            headers.RetryAfter = Math.Ceiling(decision.RetryAfter.TotalSeconds).ToString(CultureInfo.InvariantCulture);
             context.Result = new ContentResult
             {
                 Content = $"Rate limit exceeded. Maximum {_requests} requests per {_timeWindow.TotalSeconds} seconds.",
@@ -52,8 +56,7 @@ public class RateLimitAttribute : ActionFilterAttribute
             return;
         }
 
-        cache.Set(cacheKey, requestCount + 1);
-        base.OnActionExecuting(context);
+        await next();
     }
 
     private static string GetClientIdentifier(HttpContext context)
@@ -72,8 +75,8 @@ public class RateLimitAttribute : ActionFilterAttribute
             return $"ip_{ipAddress}";
         }
 
-        // Ultimate fallback
-        return $"anonymous_{Guid.NewGuid()}";
+        // Unidentifiable callers share one allowance rather than each getting a fresh one
+        return "anonymous";
     }
 }
 
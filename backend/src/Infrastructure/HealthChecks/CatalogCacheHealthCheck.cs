@@ -0,0 +1,32 @@
+using Microsoft.Extensions.Diagnostics.HealthChecks;
+using NationalClothingStore.Application.Interfaces;
+
+namespace NationalClothingStore.Infrastructure.HealthChecks;
+
+/// <summary>
+/// Reports catalog cache hit/miss counters; degraded when more than 1% of lookups hit a cache error
+/// </summary>
+public class CatalogCacheHealthCheck(ICatalogCache cache) : IHealthCheck
+{
+    public Task<HealthCheckResult> CheckHealthAsync(
+        HealthCheckContext context,
+        CancellationToken cancellationToken = default)
+    {
+        var statistics = cache.GetStatistics();
+        var lookups = statistics.Hits + statistics.Misses;
+        var errorRate = lookups == 0 ? 0 : (double)statistics.Errors / lookups;
+
+        var data = new Dictionary<string, object>
+        {
+            ["hits"] = statistics.Hits,
+            ["misses"] = statistics.Misses,
+            ["errors"] = statistics.Errors,
+            ["hit_ratio"] = Math.Round(statistics.HitRatio, 4),
+            ["cache"] = cache.GetType().Name
+        };
+
+        return Task.FromResult(errorRate > 0.01
+            ? HealthCheckResult.Degraded("Catalog cache errors are sending reads to the database", null, data)
+            : HealthCheckResult.Healthy("Catalog cache is serving reads", data));
+    }
+}
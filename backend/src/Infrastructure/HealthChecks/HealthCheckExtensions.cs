@@ -18,6 +18,7 @@ public static class HealthCheckExtensions
         return Microsoft.Extensions.DependencyInjection.HealthCheckServiceCollectionExtensions.AddHealthChecks(services)
             .AddCheck<DatabaseHealthCheck>("database")
             .AddCheck<RedisHealthCheck>("redis")
+            .AddCheck<CatalogCacheHealthCheck>("catalog-cache")
             .AddCheck<MemoryHealthCheck>("memory");
     }
 }
@@ -0,0 +1,58 @@
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using NationalClothingStore.Application.Services;
+
+namespace NationalClothingStore.Infrastructure.Jobs;
+
+public class AnalyticsEtlJob : BackgroundService
+{
+    private readonly IServiceProvider _serviceProvider;
+    private readonly AnalyticsEtlOptions _options;
+    private readonly ILogger<AnalyticsEtlJob> _logger;
+
+    public AnalyticsEtlJob(IServiceProvider serviceProvider, IOptions<AnalyticsEtlOptions> options, ILogger<AnalyticsEtlJob> logger)
+    {
+        _serviceProvider = serviceProvider;
+        _options = options.Value;
+        _logger = logger;
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        if (!_options.Enabled)
+        {
+            _logger.LogInformation("AnalyticsEtlJob is disabled.");
+            return;
+        }
+
+        _logger.LogInformation("AnalyticsEtlJob started.");
+
+        while (!stoppingToken.IsCancellationRequested)
+        {
+            try
+            {
+                using var scope = _serviceProvider.CreateScope();
+                var etlService = scope.ServiceProvider.GetRequiredService<IAnalyticsEtlService>();
+
+                var result = await etlService.RunAsync(stoppingToken);
+                _logger.LogInformation("Analytics load completed up to {LoadedUntil}: {Count} rows in {Duration}",
+                    result.LoadedUntil, result.TotalRowsLoaded, result.Duration);
+
+                await Task.Delay(_options.Interval, stoppingToken);
+            }
+            catch (OperationCanceledException) when (stoppingToken.IsCancellationRequested)
+            {
+                break;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Error during analytics load");
+                await Task.Delay(TimeSpan.FromMinutes(5), stoppingToken);
+            }
+        }
+
+        _logger.LogInformation("AnalyticsEtlJob stopping.");
+    }
+}
@@ -19,6 +19,8 @@ public class DataArchivalJob : BackgroundService
     {
         _logger.LogInformation("DataArchivalJob started.");
 
+        await EnsurePartitionsAsync(stoppingToken);
+
         while (!stoppingToken.IsCancellationRequested)
         {
             try
@@ -30,6 +32,9 @@ public class DataArchivalJob : BackgroundService
                     using var scope = _serviceProvider.CreateScope();
                     var archivalService = scope.ServiceProvider.GetRequiredService<Application.Services.IDataArchivalService>();
 
+                    // Provision next months' partitions and split the default ones before dropping expired ones
+                    await archivalService.EnsurePartitionsAsync(stoppingToken);
+
                     var cutoff = now.AddYears(-7); // Retain 7 years
                     await archivalService.ArchiveOldDataAsync(cutoff, stoppingToken);
                     await archivalService.PurgeExpiredDataAsync(stoppingToken);
@@ -49,4 +54,18 @@ public class DataArchivalJob : BackgroundService
 
         _logger.LogInformation("DataArchivalJob stopping.");
     }
+
+    private async Task EnsurePartitionsAsync(CancellationToken stoppingToken)
+    {
+        try
+        {
+            using var scope = _serviceProvider.CreateScope();
+            var archivalService = scope.ServiceProvider.GetRequiredService<Application.Services.IDataArchivalService>();
+            await archivalService.EnsurePartitionsAsync(stoppingToken);
+        }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            _logger.LogError(ex, "Error provisioning table partitions");
+        }
+    }
 }
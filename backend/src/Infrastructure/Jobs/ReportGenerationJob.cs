@@ -1,34 +1,63 @@
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Text.Json;
 using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
 using NationalClothingStore.Application.Services;
 using NationalClothingStore.Application.Interfaces;
 
 namespace NationalClothingStore.Infrastructure.Jobs;
 
 /// <summary>
-/// Background job for generating scheduled reports
+/// Scheduled report generation settings, bound from the "ReportGeneration" configuration section
+/// </summary>
+public class ReportGenerationOptions
+{
+    /// <summary>Dataset queries run at the same time across a batch, each on its own database connection</summary>
+    public int MaxConcurrency { get; set; } = 3;
+
+    /// <summary>How long one report may take, including waiting for the datasets it shares with others</summary>
+    public TimeSpan ReportTimeout { get; set; } = TimeSpan.FromMinutes(15);
+
+    /// <summary>Quartz cron expression, in UTC, for the recurring run of the standard reports; null leaves it unscheduled</summary>
+    public string? Schedule { get; set; }
+}
+
+/// <summary>
+/// Background job for generating scheduled reports. Reports run in parallel; the datasets behind them are
+/// computed once per window and shared, so the financial report reuses the sales and procurement reports
+/// of the same window. Every finished report is checkpointed, and a rerun for the same day skips them.
 /// </summary>
 public class ReportGenerationJob : IBackgroundJob
 {
-    private readonly IReportingService _reportingService;
-    private readonly IAnalyticsService _analyticsService;
+    /// <summary>Name the recurring run is scheduled under</summary>
+    public const string JobName = "report-generation";
+
+    private static readonly JsonSerializerOptions CheckpointSerializerOptions = new(JsonSerializerDefaults.Web) { WriteIndented = true };
+
+    private readonly IServiceScopeFactory _scopeFactory;
+    private readonly ReportGenerationOptions _options;
     private readonly ILogger<ReportGenerationJob> _logger;
     private readonly IConfiguration _configuration;
 
     public ReportGenerationJob(
-        IReportingService reportingService,
-        IAnalyticsService analyticsService,
+        IServiceScopeFactory scopeFactory,
+        IOptions<ReportGenerationOptions> options,
         ILogger<ReportGenerationJob> logger,
         IConfiguration configuration)
     {
-        _reportingService = reportingService;
-        _analyticsService = analyticsService;
+        _scopeFactory = scopeFactory;
+        _options = options.Value;
         _logger = logger;
         _configuration = configuration;
     }
 
     public string Name => "Report Generation Job";
 
+    private string StoragePath => _configuration["ReportStorage:Path"] ?? "/reports";
+
     public async Task ExecuteAsync(JobExecutionContext context, CancellationToken cancellationToken = default)
     {
         try
@@ -45,9 +74,17 @@ public class ReportGenerationJob : IBackgroundJob
             }
 
             // Generate reports based on configuration
-            await GenerateReportsAsync(reportConfig, cancellationToken);
-
-            _logger.LogInformation("Completed scheduled report generation job for {ReportCount} reports", reportConfig.Reports.Count);
+            var result = await GenerateReportsAsync(context.JobName, reportConfig, cancellationToken);
+            context.Result = result;
+
+            _logger.LogInformation(
+                "Completed scheduled report generation job in {Duration}: {Completed} completed, {Skipped} already done, {Failed} failed, {TimedOut} timed out; {Datasets} datasets computed",
+                result.Duration,
+                result.Reports.Count(r => r.Status == ReportRunStatus.Completed && !r.FromCheckpoint),
+                result.Reports.Count(r => r.FromCheckpoint),
+                result.Reports.Count(r => r.Status == ReportRunStatus.Failed),
+                result.Reports.Count(r => r.Status == ReportRunStatus.TimedOut),
+                result.DatasetsComputed);
         }
         catch (Exception ex)
         {
@@ -60,13 +97,15 @@ public class ReportGenerationJob : IBackgroundJob
     {
         try
         {
-            if (!jobData.TryGetValue("ReportConfig", out var configObj))
+            switch (jobData.GetValueOrDefault("ReportConfig"))
             {
-                return null;
+                case ReportConfiguration configuration:
+                    return configuration;
+                case string json when !string.IsNullOrWhiteSpace(json):
+                    return JsonSerializer.Deserialize<ReportConfiguration>(json, CheckpointSerializerOptions);
             }
 
-            // In a real implementation, this would deserialize the configuration
-            // For now, we'll return a default configuration
+            // The recurring run carries no configuration, and neither may a manual one; both get the standard set
             return new ReportConfiguration
             {
                 Reports =
@@ -101,119 +140,247 @@ public class ReportGenerationJob : IBackgroundJob
         }
     }
 
-    private async Task GenerateReportsAsync(ReportConfiguration config, CancellationToken cancellationToken)
+    private async Task<ReportBatchResult> GenerateReportsAsync(string jobName, ReportConfiguration config, CancellationToken cancellationToken)
     {
-        var endDate = DateTime.UtcNow;
+        // Windows end at the start of the current UTC day: the batch reports on whole days, and a rerun later
+        // the same day covers the same windows, so its checkpoint applies
+        var endDate = DateTime.UtcNow.Date;
+        var batchKey = $"{string.Concat(jobName.Select(c => char.IsLetterOrDigit(c) ? c : '-'))}_{endDate:yyyyMMdd}";
+        var stopwatch = Stopwatch.StartNew();
 
-        foreach (var reportSchedule in config.Reports)
+        var checkpoint = await LoadCheckpointAsync(batchKey, cancellationToken) ?? new ReportBatchResult
         {
-            var startDate = CalculateStartDate(reportSchedule.Schedule, endDate);
-            
-            try
+            BatchKey = batchKey,
+            WindowEnd = endDate,
+            StartedAt = DateTime.UtcNow
+        };
+        var done = new Dictionary<string, ReportRunResult>(StringComparer.OrdinalIgnoreCase);
+        foreach (var report in checkpoint.Reports.Where(r => r.Status == ReportRunStatus.Completed))
+        {
+            done[ReportKey(report.ReportType, report.Schedule)] = report;
+        }
+
+        var result = new ReportBatchResult { BatchKey = batchKey, WindowEnd = endDate, StartedAt = checkpoint.StartedAt };
+        var checkpointLock = new SemaphoreSlim(1, 1);
+
+        using var datasets = new ReportDatasetCache(_scopeFactory, _options.MaxConcurrency, cancellationToken);
+        var runs = config.Reports
+            .Where(schedule => schedule.IsEnabled)
+            .Select(async schedule =>
             {
-                await GenerateSingleReportAsync(reportSchedule, startDate, endDate, cancellationToken);
-            }
-            catch (Exception ex)
+                if (done.TryGetValue(ReportKey(schedule.ReportType, schedule.Schedule), out var previous))
+                {
+                    _logger.LogInformation("Skipping {ReportType} report: already generated for {WindowEnd:yyyy-MM-dd}", schedule.ReportType, endDate);
+                    previous.FromCheckpoint = true;
+                    return previous;
+                }
+
+                var run = await GenerateSingleReportAsync(schedule, CalculateStartDate(schedule.Schedule, endDate), endDate, datasets, cancellationToken);
+                if (run.Status == ReportRunStatus.Completed)
+                {
+                    await checkpointLock.WaitAsync(CancellationToken.None);
+                    try
+                    {
+                        checkpoint.Reports.Add(run);
+                        await SaveCheckpointAsync(checkpoint, CancellationToken.None);
+                    }
+                    catch (Exception ex)
+                    {
+                        // The report is out; a rerun today just generates it again
+                        _logger.LogWarning(ex, "Could not checkpoint the {ReportType} report of batch {BatchKey}", schedule.ReportType, batchKey);
+                    }
+                    finally
+                    {
+                        checkpointLock.Release();
+                    }
+                }
+
+                return run;
+            })
+            .ToList();
+
+        result.Reports.AddRange(await Task.WhenAll(runs));
+        result.DatasetsComputed = datasets.Computed;
+        result.Duration = stopwatch.Elapsed;
+        result.CompletedAt = DateTime.UtcNow;
+        return result;
+    }
+
+    private async Task<ReportRunResult> GenerateSingleReportAsync(
+        ReportSchedule schedule,
+        DateTime startDate,
+        DateTime endDate,
+        ReportDatasetCache datasets,
+        CancellationToken cancellationToken)
+    {
+        var run = new ReportRunResult
+        {
+            ReportType = schedule.ReportType,
+            Schedule = schedule.Schedule,
+            StartDate = startDate,
+            EndDate = endDate
+        };
+        var timeout = schedule.Timeout ?? _options.ReportTimeout;
+        using var timeoutSource = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        timeoutSource.CancelAfter(timeout);
+        var stopwatch = Stopwatch.StartNew();
+
+        _logger.LogInformation("Generating {ReportType} report from {StartDate} to {EndDate}", schedule.ReportType, startDate, endDate);
+
+        try
+        {
+            var (report, reportName) = await BuildReportAsync(schedule.ReportType.ToLowerInvariant(), startDate, endDate, datasets, timeoutSource.Token);
+            if (report == null)
             {
-                _logger.LogError(ex, "Error generating {ReportType} report", reportSchedule.ReportType);
-                // Continue with other reports even if one fails
+                _logger.LogWarning("Unknown report type: {ReportType}", schedule.ReportType);
+                run.Status = ReportRunStatus.Failed;
+                run.Error = $"Unknown report type: {schedule.ReportType}";
+                return run;
             }
+
+            run.FilePath = await SaveAndNotifyReportAsync(schedule, report, reportName, timeoutSource.Token);
+            run.Status = ReportRunStatus.Completed;
+            run.CompletedAt = DateTime.UtcNow;
+        }
+        catch (OperationCanceledException) when (timeoutSource.IsCancellationRequested && !cancellationToken.IsCancellationRequested)
+        {
+            _logger.LogError("{ReportType} report timed out after {Timeout}", schedule.ReportType, timeout);
+            run.Status = ReportRunStatus.TimedOut;
+            run.Error = $"Timed out after {timeout}";
+        }
+        catch (Exception ex) when (!cancellationToken.IsCancellationRequested)
+        {
+            // Continue with other reports even if one fails
+            _logger.LogError(ex, "Error generating {ReportType} report", schedule.ReportType);
+            run.Status = ReportRunStatus.Failed;
+            run.Error = ex.Message;
+        }
+        finally
+        {
+            run.Duration = stopwatch.Elapsed;
         }
+
+        _logger.LogInformation("{ReportType} report {Status} in {Duration}", schedule.ReportType, run.Status, run.Duration);
+        return run;
     }
 
-    private async Task GenerateSingleReportAsync(ReportSchedule schedule, DateTime startDate, DateTime endDate, CancellationToken cancellationToken)
+    private static async Task<(object? Report, string Name)> BuildReportAsync(
+        string reportType,
+        DateTime startDate,
+        DateTime endDate,
+        ReportDatasetCache datasets,
+        CancellationToken cancellationToken)
     {
-        _logger.LogInformation("Generating {ReportType} report from {StartDate} to {EndDate}", schedule.ReportType, startDate, endDate);
-
-        switch (schedule.ReportType.ToLower())
+        switch (reportType)
         {
             case "sales":
-                await GenerateSalesReportAsync(schedule, startDate, endDate, cancellationToken);
-                break;
-            
+                return (await SalesReportAsync(datasets, startDate, endDate, cancellationToken), "Sales Report");
+
             case "inventory":
-                await GenerateInventoryReportAsync(schedule, startDate, endDate, cancellationToken);
-                break;
-            
+                return (await datasets.GetAsync("inventory", null, null,
+                    (services, ct) => services.GetRequiredService<IReportingService>().GenerateInventoryReportAsync(null, null, ct),
+                    cancellationToken), "Inventory Report");
+
             case "customer":
-                await GenerateCustomerReportAsync(schedule, startDate, endDate, cancellationToken);
-                break;
-            
+                return (await datasets.GetAsync("customer", startDate, endDate,
+                    (services, ct) => services.GetRequiredService<IReportingService>().GenerateCustomerReportAsync(startDate, endDate, ct),
+                    cancellationToken), "Customer Report");
+
             case "financial":
-                await GenerateFinancialReportAsync(schedule, startDate, endDate, cancellationToken);
-                break;
-            
+            {
+                var sales = SalesReportAsync(datasets, startDate, endDate, cancellationToken);
+                var procurement = ProcurementReportAsync(datasets, startDate, endDate, cancellationToken);
+                await Task.WhenAll(sales, procurement);
+                return (ReportingService.ComposeFinancialReport(sales.Result, procurement.Result, startDate, endDate), "Financial Report");
+            }
+
             case "procurement":
-                await GenerateProcurementReportAsync(schedule, startDate, endDate, cancellationToken);
-                break;
-            
+                return (await ProcurementReportAsync(datasets, startDate, endDate, cancellationToken), "Procurement Report");
+
             case "analytics":
-                await GenerateAnalyticsReportAsync(schedule, startDate, endDate, cancellationToken);
-                break;
-            
+                return (await AnalyticsReportAsync(datasets, startDate, endDate, cancellationToken), "Analytics Report");
+
             default:
-                _logger.LogWarning("Unknown report type: {ReportType}", schedule.ReportType);
-                break;
+                return (null, string.Empty);
         }
     }
 
-    private async Task GenerateSalesReportAsync(ReportSchedule schedule, DateTime startDate, DateTime endDate, CancellationToken cancellationToken)
-    {
-        var report = await _reportingService.GenerateSalesReportAsync(startDate, endDate, null, null, cancellationToken);
-        
-        // Save report to storage and send notifications
-        await SaveAndNotifyReportAsync(schedule, report, "Sales Report", cancellationToken);
-    }
+    private static Task<SalesReport> SalesReportAsync(ReportDatasetCache datasets, DateTime startDate, DateTime endDate, CancellationToken cancellationToken) =>
+        datasets.GetAsync("sales", startDate, endDate,
+            (services, ct) => services.GetRequiredService<IReportingService>().GenerateSalesReportAsync(startDate, endDate, null, null, ct),
+            cancellationToken);
 
-    private async Task GenerateInventoryReportAsync(ReportSchedule schedule, DateTime startDate, DateTime endDate, CancellationToken cancellationToken)
-    {
-        var report = await _reportingService.GenerateInventoryReportAsync(null, null, cancellationToken);
-        
-        await SaveAndNotifyReportAsync(schedule, report, "Inventory Report", cancellationToken);
-    }
+    private static Task<ProcurementReport> ProcurementReportAsync(ReportDatasetCache datasets, DateTime startDate, DateTime endDate, CancellationToken cancellationToken) =>
+        datasets.GetAsync("procurement", startDate, endDate,
+            (services, ct) => services.GetRequiredService<IReportingService>().GenerateProcurementReportAsync(startDate, endDate, ct),
+            cancellationToken);
 
-    private async Task GenerateCustomerReportAsync(ReportSchedule schedule, DateTime startDate, DateTime endDate, CancellationToken cancellationToken)
+    private static async Task<AnalyticsReport> AnalyticsReportAsync(ReportDatasetCache datasets, DateTime startDate, DateTime endDate, CancellationToken cancellationToken)
     {
-        var report = await _reportingService.GenerateCustomerReportAsync(startDate, endDate, cancellationToken);
-        
-        await SaveAndNotifyReportAsync(schedule, report, "Customer Report", cancellationToken);
+        var salesAnalytics = datasets.GetAsync("sales-analytics", startDate, endDate,
+            (services, ct) => services.GetRequiredService<IAnalyticsService>().GetSalesAnalyticsAsync(startDate, endDate, AnalyticsPeriod.Daily, null, null, ct),
+            cancellationToken);
+        var inventoryAnalytics = datasets.GetAsync("inventory-analytics", null, null,
+            (services, ct) => services.GetRequiredService<IAnalyticsService>().GetInventoryAnalyticsAsync(null, null, ct),
+            cancellationToken);
+        var customerAnalytics = datasets.GetAsync("customer-analytics", startDate, endDate,
+            (services, ct) => services.GetRequiredService<IAnalyticsService>().GetCustomerAnalyticsAsync(startDate, endDate, ct),
+            cancellationToken);
+        var financialAnalytics = datasets.GetAsync("financial-analytics", startDate, endDate,
+            (services, ct) => services.GetRequiredService<IAnalyticsService>().GetFinancialAnalyticsAsync(startDate, endDate, AnalyticsPeriod.Monthly, ct),
+            cancellationToken);
+        await Task.WhenAll(salesAnalytics, inventoryAnalytics, customerAnalytics, financialAnalytics);
+
+        return new AnalyticsReport
+        {
+            SalesAnalytics = salesAnalytics.Result,
+            InventoryAnalytics = inventoryAnalytics.Result,
+            CustomerAnalytics = customerAnalytics.Result,
+            FinancialAnalytics = financialAnalytics.Result,
+            GeneratedAt = DateTime.UtcNow,
+            Period = $"{startDate:yyyy-MM-dd} to {endDate:yyyy-MM-dd}"
+        };
     }
 
-    private async Task GenerateFinancialReportAsync(ReportSchedule schedule, DateTime startDate, DateTime endDate, CancellationToken cancellationToken)
-    {
-        var report = await _reportingService.GenerateFinancialReportAsync(startDate, endDate, cancellationToken);
-        
-        await SaveAndNotifyReportAsync(schedule, report, "Financial Report", cancellationToken);
-    }
+    private static string ReportKey(string reportType, string schedule) => $"{reportType}:{schedule}";
 
-    private async Task GenerateProcurementReportAsync(ReportSchedule schedule, DateTime startDate, DateTime endDate, CancellationToken cancellationToken)
+    private string CheckpointPath(string batchKey) => Path.Combine(StoragePath, "checkpoints", $"{batchKey}.json");
+
+    private async Task<ReportBatchResult?> LoadCheckpointAsync(string batchKey, CancellationToken cancellationToken)
     {
-        var report = await _reportingService.GenerateProcurementReportAsync(startDate, endDate, cancellationToken);
-        
-        await SaveAndNotifyReportAsync(schedule, report, "Procurement Report", cancellationToken);
+        var path = CheckpointPath(batchKey);
+        if (!File.Exists(path))
+        {
+            return null;
+        }
+
+        try
+        {
+            await using var file = File.OpenRead(path);
+            return await JsonSerializer.DeserializeAsync<ReportBatchResult>(file, CheckpointSerializerOptions, cancellationToken);
+        }
+        catch (JsonException ex)
+        {
+            _logger.LogWarning(ex, "Ignoring unreadable report checkpoint {Path}", path);
+            return null;
+        }
     }
 
-    private async Task GenerateAnalyticsReportAsync(ReportSchedule schedule, DateTime startDate, DateTime endDate, CancellationToken cancellationToken)
+    private async Task SaveCheckpointAsync(ReportBatchResult checkpoint, CancellationToken cancellationToken)
     {
-        var salesAnalytics = await _analyticsService.GetSalesAnalyticsAsync(startDate, endDate, AnalyticsPeriod.Daily, null, null, cancellationToken);
-        var inventoryAnalytics = await _analyticsService.GetInventoryAnalyticsAsync(null, null, cancellationToken);
-        var customerAnalytics = await _analyticsService.GetCustomerAnalyticsAsync(startDate, endDate, cancellationToken);
-        var financialAnalytics = await _analyticsService.GetFinancialAnalyticsAsync(startDate, endDate, AnalyticsPeriod.Monthly, cancellationToken);
+        var path = CheckpointPath(checkpoint.BatchKey);
+        Directory.CreateDirectory(Path.GetDirectoryName(path)!);
 
-        var analyticsReport = new AnalyticsReport
+        var partialPath = path + ".partial";
+        await using (var file = new FileStream(partialPath, FileMode.Create, FileAccess.Write, FileShare.None, 4096, FileOptions.Asynchronous))
         {
-            SalesAnalytics = salesAnalytics,
-            InventoryAnalytics = inventoryAnalytics,
-            CustomerAnalytics = customerAnalytics,
-            FinancialAnalytics = financialAnalytics,
-            GeneratedAt = DateTime.UtcNow,
-            Period = $"{startDate:yyyy-MM-dd} to {endDate:yyyy-MM-dd}"
-        };
+            await JsonSerializer.SerializeAsync(file, checkpoint, CheckpointSerializerOptions, cancellationToken);
+        }
 
-        await SaveAndNotifyReportAsync(schedule, analyticsReport, "Analytics Report", cancellationToken);
+        File.Move(partialPath, path, overwrite: true);
     }
 
-    private async Task SaveAndNotifyReportAsync(ReportSchedule schedule, object report, string reportName, CancellationToken cancellationToken)
+    private async Task<string> SaveAndNotifyReportAsync(ReportSchedule schedule, object report, string reportName, CancellationToken cancellationToken)
     {
         try
         {
@@ -224,6 +391,7 @@ public class ReportGenerationJob : IBackgroundJob
             await SendReportNotificationsAsync(schedule, filePath, reportName, cancellationToken);
             
             _logger.LogInformation("Successfully generated and distributed {ReportName}", reportName);
+            return filePath;
         }
         catch (Exception ex)
         {
@@ -238,21 +406,25 @@ public class ReportGenerationJob : IBackgroundJob
         {
             // Generate file path
             var fileName = $"{reportName}_{DateTime.UtcNow:yyyyMMdd_HHmmss}.json";
-            var storagePath = _configuration["ReportStorage:Path"] ?? "/reports";
+            var storagePath = StoragePath;
             var fullPath = Path.Combine(storagePath, fileName);
 
             // Ensure directory exists
             Directory.CreateDirectory(storagePath);
 
-            // Serialize report to JSON
-            var json = System.Text.Json.JsonSerializer.Serialize(report, new System.Text.Json.JsonSerializerOptions
+            // Serialize straight into the file rather than building the whole document as a string; a
+            // partial file keeps readers from picking up a half-written report
+            var partialPath = fullPath + ".partial";
+            await using (var file = new FileStream(partialPath, FileMode.Create, FileAccess.Write, FileShare.None, 64 * 1024, FileOptions.Asynchronous))
             {
-                WriteIndented = true,
-                PropertyNamingPolicy = System.Text.Json.JsonNamingPolicy.CamelCase
-            });
+                await System.Text.Json.JsonSerializer.SerializeAsync(file, report, report.GetType(), new System.Text.Json.JsonSerializerOptions
+                {
+                    WriteIndented = true,
+                    PropertyNamingPolicy = System.Text.Json.JsonNamingPolicy.CamelCase
+                }, cancellationToken);
+            }
 
-            // Write to file
-            await File.WriteAllTextAsync(fullPath, json, cancellationToken);
+            File.Move(partialPath, fullPath, overwrite: true);
 
             _logger.LogInformation("Report saved to {FilePath}", fullPath);
             return fullPath;
@@ -326,6 +498,89 @@ public class ReportSchedule
     public Dictionary<string, object> Parameters { get; set; } = new();
     public string Format { get; set; } = "JSON"; // JSON, PDF, Excel, CSV
     public bool IsEnabled { get; set; } = true;
+    public TimeSpan? Timeout { get; set; } // Overrides ReportGenerationOptions.ReportTimeout
+}
+
+public static class ReportRunStatus
+{
+    public const string Completed = "Completed";
+    public const string Failed = "Failed";
+    public const string TimedOut = "TimedOut";
+}
+
+/// <summary>
+/// Outcome and timing of one report in a batch
+/// </summary>
+public class ReportRunResult
+{
+    public string ReportType { get; set; } = string.Empty;
+    public string Schedule { get; set; } = string.Empty;
+    public string Status { get; set; } = string.Empty;
+    public DateTime StartDate { get; set; }
+    public DateTime EndDate { get; set; }
+    public TimeSpan Duration { get; set; }
+    public string? FilePath { get; set; }
+    public string? Error { get; set; }
+    public DateTime? CompletedAt { get; set; }
+    public bool FromCheckpoint { get; set; } // Generated by an earlier run of the same batch
+}
+
+/// <summary>
+/// Result of a report generation run; also the checkpoint a rerun of the same batch resumes from
+/// </summary>
+public class ReportBatchResult
+{
+    public string BatchKey { get; set; } = string.Empty;
+    public DateTime WindowEnd { get; set; }
+    public DateTime StartedAt { get; set; }
+    public DateTime? CompletedAt { get; set; }
+    public TimeSpan Duration { get; set; }
+    public int DatasetsComputed { get; set; }
+    public List<ReportRunResult> Reports { get; set; } = new();
+}
+
+/// <summary>
+/// Intermediate datasets shared by the reports of one batch. Each dataset and window is computed once, in its
+/// own DI scope so computations run side by side on separate connections, and at most maxConcurrency at a time.
+/// A computation outlives the report that started it, so one report timing out does not cancel it for the others;
+/// whatever is still running when the batch is disposed is cancelled.
+/// </summary>
+internal sealed class ReportDatasetCache(IServiceScopeFactory scopeFactory, int maxConcurrency, CancellationToken batchToken) : IDisposable
+{
+    private readonly ConcurrentDictionary<string, Lazy<Task<object>>> _datasets = new();
+    private readonly SemaphoreSlim _gate = new(Math.Max(1, maxConcurrency));
+    private readonly CancellationTokenSource _batch = CancellationTokenSource.CreateLinkedTokenSource(batchToken);
+
+    public int Computed => _datasets.Count;
+
+    public async Task<T> GetAsync<T>(
+        string name,
+        DateTime? startDate,
+        DateTime? endDate,
+        Func<IServiceProvider, CancellationToken, Task<T>> compute,
+        CancellationToken cancellationToken) where T : class
+    {
+        var key = $"{name}:{startDate:O}:{endDate:O}";
+        var dataset = _datasets.GetOrAdd(key, _ => new Lazy<Task<object>>(() => ComputeAsync(compute)));
+        return (T)await dataset.Value.WaitAsync(cancellationToken);
+    }
+
+    private async Task<object> ComputeAsync<T>(Func<IServiceProvider, CancellationToken, Task<T>> compute) where T : class
+    {
+        var cancellationToken = _batch.Token;
+        await _gate.WaitAsync(cancellationToken);
+        try
+        {
+            using var scope = scopeFactory.CreateScope();
+            return await compute(scope.ServiceProvider, cancellationToken);
+        }
+        finally
+        {
+            _gate.Release();
+        }
+    }
+
+    public void Dispose() => _batch.Cancel();
 }
 
 public class AnalyticsReport
@@ -0,0 +1,76 @@
+using System.Collections.Concurrent;
+
+namespace NationalClothingStore.Infrastructure.RateLimiting;
+
+/// <summary>
+/// Process-local limiter with the same semantics as <see cref="RedisRateLimiter"/>, used when no Redis
+/// connection is configured and while Redis is unreachable. Each key is one arrival time updated by
+/// compare-and-swap, so concurrent requests never lose a count and no lock is shared between keys.
+/// </summary>
+public class LocalRateLimiter(TimeProvider? timeProvider = null) : IRateLimiter
+{
+    private static readonly TimeSpan SweepInterval = TimeSpan.FromMinutes(1);
+
+    private readonly TimeProvider _time = timeProvider ?? TimeProvider.System;
+    private readonly ConcurrentDictionary<string, long> _arrivals = new();
+    private long _nextSweep;
+
+    /// <summary>
+    /// Number of keys currently tracked, for assertions in tests
+    /// </summary>
+    public int Count => _arrivals.Count;
+
+    public ValueTask<RateLimitDecision> AcquireAsync(string key, int limit, TimeSpan window, CancellationToken cancellationToken = default)
+    {
+        return ValueTask.FromResult(Acquire(key, limit, window));
+    }
+
+    public RateLimitDecision Acquire(string key, int limit, TimeSpan window)
+    {
+        ArgumentOutOfRangeException.ThrowIfLessThan(limit, 1);
+
+        var now = _time.GetUtcNow().UtcTicks;
+        var interval = Gcra.Interval(limit, window);
+        SweepIfDue(now);
+
+        while (true)
+        {
+            if (!_arrivals.TryGetValue(key, out var stored))
+            {
+                var decision = Gcra.Evaluate(now, now, interval, window, out var first);
+                if (_arrivals.TryAdd(key, first))
+                {
+                    return decision;
+                }
+
+                continue;
+            }
+
+            var result = Gcra.Evaluate(stored, now, interval, window, out var next);
+            // A rejection changes nothing; an admission must win the swap or be re-evaluated
+            if (!result.Allowed || _arrivals.TryUpdate(key, next, stored))
+            {
+                return result;
+            }
+        }
+    }
+
+    // Keys whose arrival time has passed hold a full bucket and behave exactly like absent ones
+    private void SweepIfDue(long now)
+    {
+        var due = Interlocked.Read(ref _nextSweep);
+        if (now < due || Interlocked.CompareExchange(ref _nextSweep, now + SweepInterval.Ticks, due) != due)
+        {
+            return;
+        }
+
+        foreach (var entry in _arrivals)
+        {
+            if (entry.Value <= now)
+            {
+                // Removes only if no request has moved the arrival time since it was read
+                _arrivals.TryRemove(entry);
+            }
+        }
+    }
+}
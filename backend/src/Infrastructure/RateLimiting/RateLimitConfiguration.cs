@@ -0,0 +1,33 @@
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using NationalClothingStore.Infrastructure.Caching;
+
+namespace NationalClothingStore.Infrastructure.RateLimiting;
+
+/// <summary>
+/// Rate limiting configuration extensions
+/// </summary>
+public static class RateLimitConfiguration
+{
+    /// <summary>
+    /// Registers the limiter behind <see cref="NationalClothingStore.Infrastructure.Filters.RateLimitAttribute"/>: Redis when "Redis:ConnectionString"
+    /// is set (limits shared by all replicas), otherwise process-local
+    /// </summary>
+    public static IServiceCollection AddRateLimiting(this IServiceCollection services, IConfiguration configuration)
+    {
+        services.Configure<RateLimitOptions>(configuration.GetSection("RateLimiting"));
+        services.AddSingleton<LocalRateLimiter>();
+
+        var redisConnectionString = configuration["Redis:ConnectionString"];
+        if (string.IsNullOrWhiteSpace(redisConnectionString))
+        {
+            services.AddSingleton<IRateLimiter>(serviceProvider => serviceProvider.GetRequiredService<LocalRateLimiter>());
+            return services;
+        }
+
+        services.AddRedisConnection(redisConnectionString);
+        services.AddSingleton<IRateLimiter, RedisRateLimiter>();
+
+        return services;
+    }
+}
@@ -0,0 +1,57 @@
+namespace NationalClothingStore.Infrastructure.RateLimiting;
+
+/// <summary>
+/// Admits or rejects requests against a per-key limit
+/// </summary>
+public interface IRateLimiter
+{
+    /// <summary>
+    /// Count one request for <paramref name="key"/>; at most <paramref name="limit"/> requests are admitted
+    /// in a burst, and the allowance refills evenly over <paramref name="window"/>
+    /// </summary>
+    ValueTask<RateLimitDecision> AcquireAsync(string key, int limit, TimeSpan window, CancellationToken cancellationToken = default);
+}
+
+/// <summary>
+/// Outcome of one <see cref="IRateLimiter.AcquireAsync"/> call
+/// </summary>
+/// <param name="Allowed">Whether the request was admitted</param>
+/// <param name="Remaining">Requests that would still be admitted right now</param>
+/// <param name="RetryAfter">How long until the next request would be admitted, when this one was rejected</param>
+public readonly record struct RateLimitDecision(bool Allowed, int Remaining, TimeSpan RetryAfter);
+
+/// <summary>
+/// Rate limiting settings, bound from the "RateLimiting" configuration section
+/// </summary>
+public class RateLimitOptions
+{
+    public bool Enabled { get; set; } = true;
+    public string KeyPrefix { get; set; } = "ratelimit";
+}
+
+/// <summary>
+/// The generic cell rate algorithm shared by the Redis and local limiters: a token bucket of
+/// <c>limit</c> tokens refilled at <c>limit / window</c>, stored as a single "theoretical arrival time".
+/// A key whose arrival time has passed holds a full bucket, so it can be forgotten.
+/// </summary>
+internal static class Gcra
+{
+    /// <summary>Time one request consumes, in ticks</summary>
+    public static long Interval(int limit, TimeSpan window) => Math.Max(1, window.Ticks / limit);
+
+    /// <summary>
+    /// Apply one request at <paramref name="now"/> to the stored arrival time;
+    /// <paramref name="newArrival"/> is what to store when the request is admitted
+    /// </summary>
+    public static RateLimitDecision Evaluate(long storedArrival, long now, long interval, TimeSpan window, out long newArrival)
+    {
+        newArrival = Math.Max(storedArrival, now) + interval;
+        var allowAt = newArrival - window.Ticks;
+        if (now < allowAt)
+        {
+            return new RateLimitDecision(false, 0, TimeSpan.FromTicks(allowAt - now));
+        }
+
+        return new RateLimitDecision(true, (int)((now - allowAt) / interval), TimeSpan.Zero);
+    }
+}
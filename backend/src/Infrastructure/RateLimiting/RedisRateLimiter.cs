@@ -0,0 +1,78 @@
+using System.Diagnostics.Metrics;
+using Microsoft.Extensions.Logging;
+using StackExchange.Redis;
+
+namespace NationalClothingStore.Infrastructure.RateLimiting;
+
+/// <summary>
+/// Limiter shared by every API replica: the read-evaluate-write of each request runs as one Lua script on
+/// the Redis server, timed by the server clock, so concurrent requests on any replica are counted exactly.
+/// While Redis is unreachable requests are limited per process by a <see cref="LocalRateLimiter"/>.
+/// </summary>
+public class RedisRateLimiter(
+    IConnectionMultiplexer redis,
+    LocalRateLimiter fallback,
+    ILogger<RedisRateLimiter> logger) : IRateLimiter
+{
+    public const string MeterName = "NationalClothingStore.RateLimiting";
+
+    private static readonly Meter Meter = new(MeterName);
+    private static readonly Counter<long> FallbackCounter = Meter.CreateCounter<long>("rate_limit.fallbacks");
+
+    // Same algorithm as Gcra, in microseconds; the arrival time expires once the bucket is full again
+    private const string Script = """
+        local interval = tonumber(ARGV[1])
+        local window = tonumber(ARGV[2])
+        local time = redis.call('TIME')
+        local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+        local arrival = tonumber(redis.call('GET', KEYS[1])) or now
+        if arrival < now then arrival = now end
+        local new_arrival = arrival + interval
+        local allow_at = new_arrival - window
+        if now < allow_at then
+            return {0, 0, allow_at - now}
+        end
+        redis.call('SET', KEYS[1], string.format('%.0f', new_arrival), 'PX', math.ceil((new_arrival - now) / 1000))
+        return {1, math.floor((now - allow_at) / interval), 0}
+        """;
+
+    private const long TicksPerMicrosecond = TimeSpan.TicksPerMillisecond / 1000;
+
+    private volatile bool _degraded;
+
+    public async ValueTask<RateLimitDecision> AcquireAsync(string key, int limit, TimeSpan window, CancellationToken cancellationToken = default)
+    {
+        ArgumentOutOfRangeException.ThrowIfLessThan(limit, 1);
+
+        try
+        {
+            var interval = Math.Max(1, window.Ticks / TicksPerMicrosecond / limit);
+            var result = (RedisResult[])(await redis.GetDatabase().ScriptEvaluateAsync(
+                Script,
+                new RedisKey[] { key },
+                new RedisValue[] { interval, window.Ticks / TicksPerMicrosecond }))!;
+
+            if (_degraded)
+            {
+                _degraded = false;
+                logger.LogInformation("Redis is reachable again; rate limits are shared across replicas");
+            }
+
+            return new RateLimitDecision(
+                (long)result[0] == 1,
+                (int)(long)result[1],
+                TimeSpan.FromTicks((long)result[2] * TicksPerMicrosecond));
+        }
+        catch (Exception ex) when (ex is RedisException or RedisTimeoutException)
+        {
+            FallbackCounter.Add(1);
+            if (!_degraded)
+            {
+                _degraded = true;
+                logger.LogWarning(ex, "Redis is unreachable; rate limiting per process until it returns");
+            }
+
+            return fallback.Acquire(key, limit, window);
+        }
+    }
+}
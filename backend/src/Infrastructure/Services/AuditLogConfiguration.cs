@@ -0,0 +1,28 @@
+using Microsoft.Extensions.Configuration;
+using Microsoft.Extensions.DependencyInjection;
+using NationalClothingStore.Application.Services;
+
+namespace NationalClothingStore.Infrastructure.Services;
+
+/// <summary>
+/// Audit logging configuration extensions
+/// </summary>
+public static class AuditLogConfiguration
+{
+    /// <summary>
+    /// Registers the audit service and the background writer that batches its inserts
+    /// </summary>
+    public static IServiceCollection AddAuditLog(this IServiceCollection services, IConfiguration configuration)
+    {
+        services.Configure<AuditLogOptions>(configuration.GetSection("AuditLog"));
+
+        // One writer instance is both the hosted service and the queue the audit service feeds
+        services.AddSingleton<AuditLogWriter>();
+        services.AddHostedService(serviceProvider => serviceProvider.GetRequiredService<AuditLogWriter>());
+
+        services.AddHttpContextAccessor();
+        services.AddScoped<IAuditService, AuditService>();
+
+        return services;
+    }
+}
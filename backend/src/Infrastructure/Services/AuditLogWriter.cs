@@ -0,0 +1,205 @@
+using System.Diagnostics.Metrics;
+using System.Text.Json;
+using System.Threading.Channels;
+using Microsoft.Extensions.DependencyInjection;
+using Microsoft.Extensions.Hosting;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using NationalClothingStore.Domain.Entities;
+using NationalClothingStore.Infrastructure.Data;
+using Npgsql;
+
+namespace NationalClothingStore.Infrastructure.Services;
+
+/// <summary>
+/// Audit pipeline settings, bound from the "AuditLog" configuration section
+/// </summary>
+public class AuditLogOptions
+{
+    /// <summary>Events buffered in memory before writers have to wait</summary>
+    public int Capacity { get; set; } = 10_000;
+
+    /// <summary>Most events written in one batch</summary>
+    public int BatchSize { get; set; } = 500;
+
+    /// <summary>Longest an event waits for its batch to fill up</summary>
+    public TimeSpan FlushInterval { get; set; } = TimeSpan.FromSeconds(1);
+
+    /// <summary>How long shutdown waits for the buffer to drain</summary>
+    public TimeSpan DrainTimeout { get; set; } = TimeSpan.FromSeconds(30);
+
+    /// <summary>Retries of a batch that failed for a transient reason, such as a dropped connection</summary>
+    public int MaxRetries { get; set; } = 3;
+
+    /// <summary>Wait before the first retry; doubles with each further one</summary>
+    public TimeSpan RetryDelay { get; set; } = TimeSpan.FromMilliseconds(500);
+}
+
+/// <summary>
+/// Writes audit events in the background: requests enqueue onto a bounded channel and return, and a single
+/// reader serialises and inserts them in batches. When the buffer is full, enqueuing waits (backpressure)
+/// rather than dropping events; on shutdown the buffer is drained before the host stops. A batch that fails
+/// transiently is retried with backoff; one that fails otherwise is split in halves until the events the
+/// database rejects are isolated, and only those are dropped and counted in audit_log.dropped_events.
+/// </summary>
+public class AuditLogWriter(
+    IServiceScopeFactory scopeFactory,
+    IOptions<AuditLogOptions> options,
+    ILogger<AuditLogWriter> logger) : BackgroundService
+{
+    public const string MeterName = "NationalClothingStore.AuditLog";
+
+    private static readonly Meter Meter = new(MeterName);
+    private static readonly Counter<long> DroppedCounter = Meter.CreateCounter<long>("audit_log.dropped_events");
+
+    private readonly AuditLogOptions _options = options.Value;
+
+    // Many request threads write, one background loop reads
+    private readonly Channel<AuditEvent> _channel = Channel.CreateBounded<AuditEvent>(
+        new BoundedChannelOptions(options.Value.Capacity)
+        {
+            FullMode = BoundedChannelFullMode.Wait,
+            SingleReader = true,
+            SingleWriter = false
+        });
+
+    /// <summary>
+    /// Queue an event for writing; completes immediately unless the buffer is full
+    /// </summary>
+    public ValueTask EnqueueAsync(AuditEvent auditEvent, CancellationToken cancellationToken = default)
+    {
+        return _channel.Writer.TryWrite(auditEvent)
+            ? ValueTask.CompletedTask
+            : _channel.Writer.WriteAsync(auditEvent, cancellationToken);
+    }
+
+    protected override async Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        var reader = _channel.Reader;
+        var batch = new List<AuditEvent>(_options.BatchSize);
+
+        // Not bound to stoppingToken: the loop ends once StopAsync completes the channel and it is empty
+        while (await reader.WaitToReadAsync(CancellationToken.None))
+        {
+            using (var flushWindow = new CancellationTokenSource(_options.FlushInterval))
+            {
+                try
+                {
+                    while (batch.Count < _options.BatchSize)
+                    {
+                        if (reader.TryRead(out var auditEvent))
+                        {
+                            batch.Add(auditEvent);
+                        }
+                        else if (!await reader.WaitToReadAsync(flushWindow.Token))
+                        {
+                            break;
+                        }
+                    }
+                }
+                catch (OperationCanceledException) when (flushWindow.IsCancellationRequested)
+                {
+                    // Flush interval elapsed; write what we have
+                }
+            }
+
+            await FlushAsync(batch);
+            batch.Clear();
+        }
+    }
+
+    public override async Task StopAsync(CancellationToken cancellationToken)
+    {
+        _channel.Writer.TryComplete();
+
+        using var drainTimeout = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        drainTimeout.CancelAfter(_options.DrainTimeout);
+        await base.StopAsync(drainTimeout.Token);
+
+        if (_channel.Reader.Count > 0)
+        {
+            logger.LogWarning("Audit log shut down with {Count} events not written", _channel.Reader.Count);
+        }
+    }
+
+    private async Task FlushAsync(List<AuditEvent> batch)
+    {
+        if (batch.Count == 0)
+        {
+            return;
+        }
+
+        foreach (var auditEvent in batch)
+        {
+            SerializeMetadata(auditEvent);
+        }
+
+        await WriteAsync(batch);
+    }
+
+    private async Task WriteAsync(List<AuditEvent> events)
+    {
+        for (var attempt = 0; ; attempt++)
+        {
+            try
+            {
+                // A fresh context per attempt: a failed SaveChanges leaves its context unusable
+                using var scope = scopeFactory.CreateScope();
+                var dbContext = scope.ServiceProvider.GetRequiredService<NationalClothingStoreDbContext>();
+
+                // One SaveChanges: EF sends the rows as multi-row INSERT batches
+                dbContext.AuditEvents.AddRange(events);
+                await dbContext.SaveChangesAsync(CancellationToken.None);
+
+                logger.LogDebug("Wrote {Count} audit events", events.Count);
+                return;
+            }
+            catch (Exception ex) when (IsTransient(ex) && attempt < _options.MaxRetries)
+            {
+                var delay = _options.RetryDelay * Math.Pow(2, attempt);
+                logger.LogWarning(ex, "Writing {Count} audit events failed; retrying in {Delay}", events.Count, delay);
+                await Task.Delay(delay);
+            }
+            catch (Exception ex) when (!IsTransient(ex) && events.Count > 1)
+            {
+                // Some rows are bad; halve until they are on their own so the rest still get written
+                logger.LogWarning(ex, "Writing {Count} audit events failed; writing them in halves", events.Count);
+                var half = events.Count / 2;
+                await WriteAsync(events.GetRange(0, half));
+                await WriteAsync(events.GetRange(half, events.Count - half));
+                return;
+            }
+            catch (Exception ex)
+            {
+                DroppedCounter.Add(events.Count);
+                logger.LogError(ex, "Dropped {Count} audit events that could not be written", events.Count);
+                return;
+            }
+        }
+    }
+
+    private static bool IsTransient(Exception ex) => ex switch
+    {
+        NpgsqlException npgsqlException => npgsqlException.IsTransient,
+        TimeoutException => true,
+        _ => ex.InnerException != null && IsTransient(ex.InnerException)
+    };
+
+    private void SerializeMetadata(AuditEvent auditEvent)
+    {
+        if (auditEvent.Metadata == null)
+        {
+            return;
+        }
+
+        try
+        {
+            auditEvent.Details = JsonSerializer.Serialize(auditEvent.Metadata);
+        }
+        catch (Exception ex)
+        {
+            logger.LogWarning(ex, "Could not serialize audit metadata for action {Action} on {ResourceType}",
+                auditEvent.Action, auditEvent.ResourceType);
+        }
+    }
+}
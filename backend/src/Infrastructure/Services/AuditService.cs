@@ -1,5 +1,4 @@
 using Microsoft.Extensions.Logging;
-using System.Text.Json;
 using NationalClothingStore.Application.Services;
 using NationalClothingStore.Application.Interfaces;
 using NationalClothingStore.Infrastructure.Data;
@@ -20,15 +19,21 @@ public class AuditService : IAuditService
     private readonly NationalClothingStoreDbContext _dbContext;
     private readonly ILogger<AuditService> _logger;
     private readonly IHttpContextAccessor _httpContextAccessor;
+    private readonly AuditLogWriter _auditLogWriter;
+    private readonly IDataArchivalService _dataArchivalService;
 
     public AuditService(
         NationalClothingStoreDbContext dbContext,
         ILogger<AuditService> logger,
-        IHttpContextAccessor httpContextAccessor)
+        IHttpContextAccessor httpContextAccessor,
+        AuditLogWriter auditLogWriter,
+        IDataArchivalService dataArchivalService)
     {
         _dbContext = dbContext;
         _logger = logger;
         _httpContextAccessor = httpContextAccessor;
+        _auditLogWriter = auditLogWriter;
+        _dataArchivalService = dataArchivalService;
     }
 
     public async Task LogAsync(AuditEvent auditEvent, CancellationToken cancellationToken = default)
@@ -60,17 +65,10 @@ public class AuditService : IAuditService
                 auditEvent.UserAgent = _httpContextAccessor.HttpContext.Request.Headers["User-Agent"].ToString();
             }
 
-            // Serialize metadata and details if provided
-            if (auditEvent.Metadata != null)
-            {
-                auditEvent.Details = JsonSerializer.Serialize(auditEvent.Metadata);
-            }
-
-            // Save to database
-            _dbContext.AuditEvents.Add(auditEvent);
-            await _dbContext.SaveChangesAsync(cancellationToken);
+            // Metadata is serialized and the event inserted by the background writer, off the request path
+            await _auditLogWriter.EnqueueAsync(auditEvent, cancellationToken);
 
-            _logger.LogDebug("Audit event logged: {Action} on {ResourceType} by {UserId}", 
+            _logger.LogDebug("Audit event queued: {Action} on {ResourceType} by {UserId}", 
                 auditEvent.Action, auditEvent.ResourceType, auditEvent.UserId);
         }
         catch (Exception ex)
@@ -273,24 +271,18 @@ public class AuditService : IAuditService
 
     public async Task ArchiveAuditEventsAsync(DateTime beforeDate, CancellationToken cancellationToken = default)
     {
-        var eventsToArchive = await _dbContext.AuditEvents
-            .Where(a => a.Timestamp < beforeDate)
-            .ToListAsync(cancellationToken);
+        // AuditEvents is partitioned by month: whole months ending before the date are exported to files
+        var exported = await _dataArchivalService.ExportPartitionsAsync(PartitionedTables.AuditEvents, beforeDate, cancellationToken);
 
-        // In a real implementation, you would move these to an archive table or separate database
-        _logger.LogInformation("Archived {Count} audit events before {Date}", eventsToArchive.Count, beforeDate);
+        _logger.LogInformation("Archived {Count} audit event partitions before {Date}", exported, beforeDate);
     }
 
     public async Task DeleteAuditEventsAsync(DateTime beforeDate, CancellationToken cancellationToken = default)
     {
-        var eventsToDelete = await _dbContext.AuditEvents
-            .Where(a => a.Timestamp < beforeDate)
-            .ToListAsync(cancellationToken);
-
-        _dbContext.AuditEvents.RemoveRange(eventsToDelete);
-        await _dbContext.SaveChangesAsync(cancellationToken);
+        // Dropping whole partitions is near-instant and leaves no dead rows behind for vacuum
+        var dropped = await _dataArchivalService.DropPartitionsAsync(PartitionedTables.AuditEvents, beforeDate, export: false, cancellationToken);
 
-        _logger.LogInformation("Deleted {Count} audit events before {Date}", eventsToDelete.Count, beforeDate);
+        _logger.LogInformation("Deleted {Count} audit event partitions before {Date}", dropped, beforeDate);
     }
 
     private Guid GetCurrentUserId()
@@ -308,19 +300,15 @@ public class AuditService : IAuditService
 
     private string? GetEntityId<T>(T entity) where T : class
     {
-        var idProperty = typeof(T).GetProperty("Id");
-        return idProperty?.GetValue(entity)?.ToString();
+        return AuditedProperties<T>.Id?.GetValue(entity)?.ToString();
     }
 
     private List<string> GetChangedProperties<T>(T oldEntity, T newEntity) where T : class
     {
         var changedProperties = new List<string>();
-        var properties = typeof(T).GetProperties(BindingFlags.Public | BindingFlags.Instance);
 
-        foreach (var property in properties)
+        foreach (var property in AuditedProperties<T>.Properties)
         {
-            if (property.Name == "Id") continue; // Skip ID property
-
             var oldValue = property.GetValue(oldEntity);
             var newValue = property.GetValue(newEntity);
 
@@ -332,4 +320,15 @@ public class AuditService : IAuditService
 
         return changedProperties;
     }
+
+    // Reflected once per entity type rather than on every audited change
+    private static class AuditedProperties<T>
+    {
+        public static readonly PropertyInfo? Id = typeof(T).GetProperty("Id");
+
+        public static readonly PropertyInfo[] Properties = typeof(T)
+            .GetProperties(BindingFlags.Public | BindingFlags.Instance)
+            .Where(p => p.Name != "Id" && p.GetIndexParameters().Length == 0)
+            .ToArray();
+    }
 }
@@ -14,20 +14,23 @@ namespace NationalClothingStore.Infrastructure.Services;
 /// </summary>
 public class BackgroundJobService : IBackgroundJobService
 {
-    private readonly IScheduler _scheduler;
+    private readonly ISchedulerFactory _schedulerFactory;
     private readonly ILogger<BackgroundJobService> _logger;
     private readonly IServiceProvider _serviceProvider;
     private readonly ConcurrentDictionary<string, JobInfo> _jobRegistry;
+    private readonly JobExecutionHistoryLog _history;
 
     public BackgroundJobService(
-        IScheduler scheduler,
+        ISchedulerFactory schedulerFactory,
         ILogger<BackgroundJobService> logger,
-        IServiceProvider serviceProvider)
+        IServiceProvider serviceProvider,
+        JobExecutionHistoryLog history)
     {
-        _scheduler = scheduler;
+        _schedulerFactory = schedulerFactory;
         _logger = logger;
         _serviceProvider = serviceProvider;
         _jobRegistry = new ConcurrentDictionary<string, JobInfo>();
+        _history = history;
     }
 
     public async Task ScheduleJobAsync<T>(string jobName, DateTime runAt, Dictionary<string, object>? jobData = null, CancellationToken cancellationToken = default) where T : class, IBackgroundJob
@@ -40,7 +43,8 @@ public class BackgroundJobService : IBackgroundJobService
                 .WithIdentity($"{jobName}-trigger")
                 .Build();
 
-            await _scheduler.ScheduleJob(jobDetail, trigger, cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            await scheduler.ScheduleJob(jobDetail, trigger, cancellationToken);
 
             RegisterJob(jobName, jobDetail, trigger, jobData);
             _logger.LogInformation("Scheduled job {JobName} to run at {RunAt}", jobName, runAt);
@@ -62,7 +66,8 @@ public class BackgroundJobService : IBackgroundJobService
                 .WithIdentity($"{jobName}-trigger")
                 .Build();
 
-            await _scheduler.ScheduleJob(jobDetail, trigger, cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            await scheduler.ScheduleJob(jobDetail, trigger, cancellationToken);
 
             RegisterJob(jobName, jobDetail, trigger, jobData, cronExpression);
             _logger.LogInformation("Scheduled recurring job {JobName} with cron expression {CronExpression}", jobName, cronExpression);
@@ -84,7 +89,8 @@ public class BackgroundJobService : IBackgroundJobService
                 .WithIdentity($"{jobName}-trigger")
                 .Build();
 
-            await _scheduler.ScheduleJob(jobDetail, trigger, cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            await scheduler.ScheduleJob(jobDetail, trigger, cancellationToken);
 
             RegisterJob(jobName, jobDetail, trigger, jobData);
             _logger.LogInformation("Scheduled delayed job {JobName} with delay {Delay}", jobName, delay);
@@ -106,7 +112,8 @@ public class BackgroundJobService : IBackgroundJobService
                 .WithIdentity($"{jobName}-trigger-{Guid.NewGuid()}")
                 .Build();
 
-            await _scheduler.ScheduleJob(jobDetail, trigger, cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            await scheduler.ScheduleJob(jobDetail, trigger, cancellationToken);
 
             _logger.LogInformation("Triggered job {JobName} immediately", jobName);
         }
@@ -121,7 +128,8 @@ public class BackgroundJobService : IBackgroundJobService
     {
         try
         {
-            await _scheduler.PauseJob(new JobKey(jobName), cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            await scheduler.PauseJob(new JobKey(jobName), cancellationToken);
             
             if (_jobRegistry.TryGetValue(jobName, out var jobInfo))
             {
@@ -141,7 +149,8 @@ public class BackgroundJobService : IBackgroundJobService
     {
         try
         {
-            await _scheduler.ResumeJob(new JobKey(jobName), cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            await scheduler.ResumeJob(new JobKey(jobName), cancellationToken);
             
             if (_jobRegistry.TryGetValue(jobName, out var jobInfo))
             {
@@ -161,7 +170,8 @@ public class BackgroundJobService : IBackgroundJobService
     {
         try
         {
-            await _scheduler.DeleteJob(new JobKey(jobName), cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            await scheduler.DeleteJob(new JobKey(jobName), cancellationToken);
             _jobRegistry.TryRemove(jobName, out _);
 
             _logger.LogInformation("Deleted job {JobName}", jobName);
@@ -177,14 +187,15 @@ public class BackgroundJobService : IBackgroundJobService
     {
         try
         {
-            var jobKeys = await _scheduler.GetJobKeys(GroupMatcher<JobKey>.AnyGroup(), cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            var jobKeys = await scheduler.GetJobKeys(GroupMatcher<JobKey>.AnyGroup(), cancellationToken);
             var jobs = new List<JobInfo>();
 
             foreach (var jobKey in jobKeys)
             {
-                var jobDetail = await _scheduler.GetJobDetail(jobKey, cancellationToken);
-                var triggers = await _scheduler.GetTriggersOfJob(jobKey, cancellationToken);
-                var currentlyExecuting = await _scheduler.GetCurrentlyExecutingJobs(cancellationToken);
+                var jobDetail = await scheduler.GetJobDetail(jobKey, cancellationToken);
+                var triggers = await scheduler.GetTriggersOfJob(jobKey, cancellationToken);
+                var currentlyExecuting = await scheduler.GetCurrentlyExecutingJobs(cancellationToken);
                 var isRunning = currentlyExecuting.Any(j => j.JobDetail.Key.Equals(jobKey));
 
                 var jobInfo = _jobRegistry.GetValueOrDefault(jobKey.Name, new JobInfo
@@ -212,28 +223,38 @@ public class BackgroundJobService : IBackgroundJobService
 
     public async Task<IEnumerable<JobExecutionHistory>> GetJobHistoryAsync(string jobName, int page = 1, int pageSize = 50, CancellationToken cancellationToken = default)
     {
-        // In a real implementation, this would query a job execution history table
-        // For now, return empty list as this is a placeholder
+        // Recent executions of this process, newest first
         _logger.LogInformation("Retrieved job history for {JobName}, page {Page}, size {PageSize}", jobName, page, pageSize);
-        return Enumerable.Empty<JobExecutionHistory>();
+        return _history.Get(jobName)
+            .Skip((Math.Max(page, 1) - 1) * pageSize)
+            .Take(pageSize)
+            .ToList();
     }
 
     public async Task<JobStatistics> GetJobStatisticsAsync(CancellationToken cancellationToken = default)
     {
         try
         {
-            var jobKeys = await _scheduler.GetJobKeys(GroupMatcher<JobKey>.AnyGroup(), cancellationToken);
-            var currentlyExecuting = await _scheduler.GetCurrentlyExecutingJobs(cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            var jobKeys = await scheduler.GetJobKeys(GroupMatcher<JobKey>.AnyGroup(), cancellationToken);
+            var currentlyExecuting = await scheduler.GetCurrentlyExecutingJobs(cancellationToken);
+
+            var executions = _history.GetAll();
+            var completed = executions.Count(e => e.Success);
 
             var statistics = new JobStatistics
             {
                 TotalJobs = jobKeys.Count,
                 RunningJobs = currentlyExecuting.Count,
                 PausedJobs = _jobRegistry.Values.Count(j => j.IsPaused),
-                CompletedExecutions = 0, // Would be retrieved from history table
-                FailedExecutions = 0, // Would be retrieved from history table
-                SuccessRate = 0,
-                AverageExecutionTime = TimeSpan.Zero
+                CompletedExecutions = completed,
+                FailedExecutions = executions.Count - completed,
+                SuccessRate = executions.Count > 0 ? (double)completed / executions.Count * 100 : 0,
+                AverageExecutionTime = executions.Count > 0
+                    ? TimeSpan.FromTicks((long)executions.Average(e => e.Duration.Ticks))
+                    : TimeSpan.Zero,
+                ExecutionsByJob = executions.GroupBy(e => e.JobName).ToDictionary(g => g.Key, g => g.Count()),
+                ExecutionsByDay = executions.GroupBy(e => e.ExecutionTime.Date).ToDictionary(g => g.Key, g => g.Count())
             };
 
             return statistics;
@@ -249,7 +270,8 @@ public class BackgroundJobService : IBackgroundJobService
     {
         try
         {
-            var currentlyExecuting = await _scheduler.GetCurrentlyExecutingJobs(cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            var currentlyExecuting = await scheduler.GetCurrentlyExecutingJobs(cancellationToken);
             return currentlyExecuting.Any(j => j.JobDetail.Key.Name.Equals(jobName));
         }
         catch (Exception ex)
@@ -263,7 +285,8 @@ public class BackgroundJobService : IBackgroundJobService
     {
         try
         {
-            var triggers = await _scheduler.GetTriggersOfJob(new JobKey(jobName), cancellationToken);
+            var scheduler = await _schedulerFactory.GetScheduler(cancellationToken);
+            var triggers = await scheduler.GetTriggersOfJob(new JobKey(jobName), cancellationToken);
             return triggers.FirstOrDefault()?.GetNextFireTimeUtc()?.LocalDateTime;
         }
         catch (Exception ex)
@@ -314,17 +337,22 @@ public class BackgroundJobService : IBackgroundJobService
 /// </summary>
 public class QuartzJobWrapper<T> : IJob where T : class, IBackgroundJob
 {
+    private static readonly System.Text.Json.JsonSerializerOptions ResultSerializerOptions = new(System.Text.Json.JsonSerializerDefaults.Web);
+
     private readonly ILogger<QuartzJobWrapper<T>> _logger;
     private readonly IServiceProvider _serviceProvider;
+    private readonly JobExecutionHistoryLog _history;
 
-    public QuartzJobWrapper(ILogger<QuartzJobWrapper<T>> logger, IServiceProvider serviceProvider)
+    public QuartzJobWrapper(ILogger<QuartzJobWrapper<T>> logger, IServiceProvider serviceProvider, JobExecutionHistoryLog history)
     {
         _logger = logger;
         _serviceProvider = serviceProvider;
+        _history = history;
     }
 
     public async Task Execute(IJobExecutionContext context)
     {
+        var stopwatch = System.Diagnostics.Stopwatch.StartNew();
         try
         {
             var job = _serviceProvider.GetService<T>();
@@ -352,16 +380,61 @@ public class QuartzJobWrapper<T> : IJob where T : class, IBackgroundJob
 
             _logger.LogInformation("Executing job {JobName} with ID {JobId}", jobExecutionContext.JobName, jobExecutionContext.JobId);
 
-            var stopwatch = System.Diagnostics.Stopwatch.StartNew();
             await job.ExecuteAsync(jobExecutionContext, context.CancellationToken);
             stopwatch.Stop();
 
+            context.Result = jobExecutionContext.Result;
+            Record(context, stopwatch.Elapsed, success: true, error: null, jobExecutionContext.Result);
+
             _logger.LogInformation("Completed job {JobName} in {Duration}ms", jobExecutionContext.JobName, stopwatch.ElapsedMilliseconds);
         }
         catch (Exception ex)
         {
+            Record(context, stopwatch.Elapsed, success: false, error: ex.Message, result: null);
             _logger.LogError(ex, "Failed to execute job {JobName}", context.JobDetail.Key.Name);
             throw new JobExecutionException($"Job {context.JobDetail.Key.Name} failed", ex);
         }
     }
+
+    private void Record(IJobExecutionContext context, TimeSpan duration, bool success, string? error, object? result)
+    {
+        _history.Record(new JobExecutionHistory
+        {
+            JobName = context.JobDetail.Key.Name,
+            JobId = context.FireInstanceId,
+            ExecutionTime = context.FireTimeUtc.UtcDateTime,
+            Duration = duration,
+            Success = success,
+            ErrorMessage = error,
+            Result = result == null ? null : System.Text.Json.JsonSerializer.Serialize(result, result.GetType(), ResultSerializerOptions),
+            RefireCount = context.RefireCount
+        });
+    }
+}
+
+/// <summary>
+/// Recent executions of each job in this process, for GetJobHistoryAsync and GetJobStatisticsAsync
+/// </summary>
+public class JobExecutionHistoryLog
+{
+    private const int MaxEntriesPerJob = 100;
+
+    private readonly ConcurrentDictionary<string, ConcurrentQueue<JobExecutionHistory>> _entries = new();
+
+    public void Record(JobExecutionHistory entry)
+    {
+        var entries = _entries.GetOrAdd(entry.JobName, _ => new ConcurrentQueue<JobExecutionHistory>());
+        entries.Enqueue(entry);
+        while (entries.Count > MaxEntriesPerJob && entries.TryDequeue(out _))
+        {
+        }
+    }
+
+    /// <summary>Newest first</summary>
+    public IReadOnlyList<JobExecutionHistory> Get(string jobName) =>
+        _entries.TryGetValue(jobName, out var entries)
+            ? entries.Reverse().ToList()
+            : Array.Empty<JobExecutionHistory>();
+
+    public IReadOnlyList<JobExecutionHistory> GetAll() => _entries.Values.SelectMany(entries => entries).ToList();
 }
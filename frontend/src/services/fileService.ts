@@ -106,9 +106,9 @@ export const fileService = {
   /**
    * Delete a file
    */
-  async deleteFile(filePath: string): Promise<void> {
+  async deleteFile(filePath: string, folder = 'uploads'): Promise<void> {
     try {
-      await apiClient.delete('/files', { data: { filePath } })
+      await apiClient.delete('/files', { data: { filePath, folder } })
     } catch (error: unknown) {
       handleAxiosError(error, 'Failed to delete file')
     }
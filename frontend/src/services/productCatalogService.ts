@@ -125,6 +125,7 @@ export const productApi = {
     isActive?: boolean
     brand?: string
     season?: string
+    expand?: string
   } = {}): Promise<{ products: Product[], pagination: PaginationMetadata }> {
     const response = await apiClient.get<ApiResponse<{ products: Product[], pagination: PaginationMetadata }>>('/products', {
       params
@@ -138,6 +139,7 @@ export const productApi = {
     pageNumber?: number
     pageSize?: number
     includeInactive?: boolean
+    expand?: string
   }): Promise<{ products: Product[], pagination: PaginationMetadata }> {
     const response = await apiClient.get<ApiResponse<{ products: Product[], pagination: PaginationMetadata }>>('/products/search', {
       params
@@ -290,8 +292,8 @@ export const fileUploadApi = {
   },
 
   // Delete file
-  async deleteFile(filePath: string): Promise<void> {
-    await apiClient.delete('/files', { data: { filePath } } as any)
+  async deleteFile(filePath: string, folder: string): Promise<void> {
+    await apiClient.delete('/files', { data: { filePath, folder } } as any)
   },
 
   // Get file info
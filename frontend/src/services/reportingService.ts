@@ -43,14 +43,21 @@ export interface ExportRequest {
   parameters?: Record<string, any>
 }
 
+export type ExportStatus = 'Queued' | 'Running' | 'Completed' | 'Failed'
+
 export interface ExportResult {
   fileId: string
   fileName: string
+  dataset: string
   format: string
-  status: string
+  status: ExportStatus
+  rowsWritten: number
+  bytesWritten: number
+  error?: string
+  statusUrl?: string
   downloadUrl?: string
+  startedAt?: string
   generatedAt?: string
-  estimatedCompletion?: string
 }
 
 function toIsoDate(value: string | Date): string {
@@ -58,6 +65,54 @@ function toIsoDate(value: string | Date): string {
   return value.toISOString()
 }
 
+export interface BranchDashboardTotals {
+  branchId: string
+  tradingDay: string
+  todaySales: number
+  currentHourSales: number
+  transactions: number
+  returns: number
+  refunds: number
+  itemsSold: number
+  lowStockItems: number
+  sequence: number
+  lastUpdated: string
+}
+
+export interface RealTimeMetrics {
+  locationId: string | null
+  todaySales: number
+  currentHourSales: number
+  transactions: number
+  returns: number
+  refunds: number
+  itemsSold: number
+  lowStockItems: number
+  connectedDashboards: number
+  sequence: number
+  branches: BranchDashboardTotals[]
+  lastUpdated: string
+}
+
+export interface DashboardDelta {
+  branchId: string
+  sequence: number
+  eventType: 'sale' | 'return' | 'stock'
+  salesChange: number
+  transactionsChange: number
+  itemsSoldChange: number
+  lowStockChange: number
+  totals: BranchDashboardTotals
+}
+
+export interface RealTimeStreamHandlers {
+  onSnapshot: (snapshot: RealTimeMetrics) => void
+  onDelta: (delta: DashboardDelta) => void
+  onError?: (error: unknown) => void
+}
+
+const MAX_RECONNECT_DELAY_MS = 30000
+
 function handleAxiosError(error: unknown, fallbackMessage: string): never {
   if (axios.isAxiosError(error)) {
     const msg = (error as any).response?.data?.message || (error as any).response?.data || error.message
@@ -272,14 +327,12 @@ export const reportingService = {
   },
 
   async getRealTimeMetrics(params?: {
-    branchId?: string | null
-    warehouseId?: string | null
-  }): Promise<any> {
+    locationId?: string | null
+  }): Promise<RealTimeMetrics> {
     try {
-      const response = await apiClient.get('/reporting/dashboard/realtime', {
+      const response = await apiClient.get<RealTimeMetrics>('/reporting/dashboard/realtime', {
         params: {
-          branchId: params?.branchId ?? undefined,
-          warehouseId: params?.warehouseId ?? undefined
+          locationId: params?.locationId ?? undefined
         }
       })
       return response.data
@@ -288,6 +341,77 @@ export const reportingService = {
     }
   },
 
+  /**
+   * Follow the real-time metrics Server-Sent Events stream, reconnecting with backoff when it drops.
+   * onSnapshot fires on every (re)connect and onDelta for each change after it.
+   * EventSource cannot send the bearer token, so the stream is read through fetch.
+   * Returns a function that closes the stream.
+   */
+  streamRealTimeMetrics(
+    params: { locationId?: string | null } | undefined,
+    handlers: RealTimeStreamHandlers
+  ): () => void {
+    const controller = new AbortController()
+    const query = params?.locationId ? `?locationId=${encodeURIComponent(params.locationId)}` : ''
+    let failures = 0
+
+    const dispatch = (block: string) => {
+      let event = 'message'
+      const data: string[] = []
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event:')) event = line.slice(6).trim()
+        else if (line.startsWith('data:')) data.push(line.slice(5).trimStart())
+      }
+      if (data.length === 0) return
+
+      const payload = JSON.parse(data.join('\n'))
+      if (event === 'snapshot') handlers.onSnapshot(payload)
+      else if (event === 'delta') handlers.onDelta(payload)
+    }
+
+    const connect = async () => {
+      try {
+        const token = localStorage.getItem('authToken')
+        const response = await fetch(`${API_BASE_URL}/reporting/dashboard/realtime/stream${query}`, {
+          headers: {
+            Accept: 'text/event-stream',
+            ...(token ? { Authorization: `Bearer ${token}` } : {})
+          },
+          signal: controller.signal
+        })
+        if (!response.ok || !response.body) {
+          throw new Error(`Real-time stream failed with status ${response.status}`)
+        }
+
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+        let buffer = ''
+        for (;;) {
+          const { value, done } = await reader.read()
+          if (done) break
+          failures = 0
+          buffer += value.replace(/\r\n/g, '\n')
+
+          let boundary
+          while ((boundary = buffer.indexOf('\n\n')) >= 0) {
+            dispatch(buffer.slice(0, boundary))
+            buffer = buffer.slice(boundary + 2)
+          }
+        }
+      } catch (error: unknown) {
+        if (controller.signal.aborted) return
+        handlers.onError?.(error)
+      }
+
+      if (!controller.signal.aborted) {
+        const delay = Math.min(MAX_RECONNECT_DELAY_MS, 1000 * 2 ** failures++)
+        setTimeout(connect, delay)
+      }
+    }
+
+    connect()
+    return () => controller.abort()
+  },
+
   async exportReport(request: ExportRequest): Promise<ExportResult> {
     try {
       const response = await apiClient.post<ExportResult>('/reporting/export', {
@@ -312,6 +436,15 @@ export const reportingService = {
     }
   },
 
+  async resumeExport(fileId: string): Promise<ExportResult> {
+    try {
+      const response = await apiClient.post<ExportResult>(`/reporting/export/${fileId}/resume`)
+      return response.data
+    } catch (error: unknown) {
+      handleAxiosError(error, 'Failed to resume export')
+    }
+  },
+
   async downloadExport(fileId: string): Promise<Blob> {
     try {
       const response = await apiClient.get(`/reporting/export/${fileId}/download`, {
@@ -1,6 +1,6 @@
 import { defineStore } from 'pinia'
 import { ref } from 'vue'
-import reportingService, { type ExportRequest } from '@/services/reportingService'
+import reportingService, { type ExportRequest, type RealTimeStreamHandlers } from '@/services/reportingService'
 
 export const useReportingStore = defineStore('reporting', () => {
   const isLoading = ref(false)
@@ -43,9 +43,8 @@ export const useReportingStore = defineStore('reporting', () => {
     clearError()
 
     try {
-      const mapped = mapLocationParams(params)
       return await reportingService.getRealTimeMetrics({
-        branchId: mapped.branchId ?? null
+        locationId: params?.locationId ?? null
       })
     } catch (e: any) {
       setError(e?.message || 'Failed to retrieve real-time metrics')
@@ -55,6 +54,13 @@ export const useReportingStore = defineStore('reporting', () => {
     }
   }
 
+  const streamRealTimeMetrics = (
+    params: { locationId?: string | null } | undefined,
+    handlers: RealTimeStreamHandlers
+  ) => {
+    return reportingService.streamRealTimeMetrics(params, handlers)
+  }
+
   const getSalesReport = async (params: {
     startDate: string | Date
     endDate: string | Date
@@ -225,6 +231,7 @@ export const useReportingStore = defineStore('reporting', () => {
     error,
     getDashboardSummary,
     getRealTimeMetrics,
+    streamRealTimeMetrics,
     getSalesReport,
     getSalesAnalytics,
     getInventoryAnalytics,
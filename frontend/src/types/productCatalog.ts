@@ -170,6 +170,10 @@ export interface FileUploadResult {
   fileUrl: string
   fileSize: number
   contentType: string
+  contentHash: string
+  deduplicated: boolean
+  // Derivative URLs by name and format, e.g. 'thumb.webp'; generated shortly after the upload returns
+  derivatives: Record<string, string>
   errorMessage?: string
   uploadedAt: string
 }
@@ -209,6 +213,8 @@ export interface ProductSearchRequest {
   pageNumber?: number
   pageSize?: number
   includeInactive?: boolean
+  // Related data to load, e.g. 'category' or 'variations,images'; without it the API returns lean summary rows
+  expand?: string
 }
 
 export interface ProductFilterRequest {
@@ -220,6 +226,8 @@ export interface ProductFilterRequest {
   isActive?: boolean
   pageNumber?: number
   pageSize?: number
+  // Related data to load, e.g. 'category' or 'variations,images'; without it the API returns lean summary rows
+  expand?: string
 }
 
 export interface VariationFilterRequest {
@@ -0,0 +1,51 @@
+// Uploaded images are stored by content hash, e.g. /uploads/objects/ab/ab12….jpg, and resized in the
+// background into /uploads/derivatives/ab/ab12…_thumb.webp and friends. The derivative URLs follow from
+// the original's, so any stored image URL can be turned into responsive sources.
+
+const CONTENT_ADDRESSED_IMAGE = /^(.*)\/objects\/([0-9a-f]{2})\/([0-9a-f]{64})\.(jpg|png|gif|webp|bmp)$/
+
+// Longest side of each derivative, matching FileUpload:ThumbnailSize and FileUpload:MediumSize
+export const IMAGE_DERIVATIVE_SIZES = {
+  thumb: 320,
+  medium: 960
+} as const
+
+export type ImageDerivativeName = keyof typeof IMAGE_DERIVATIVE_SIZES
+
+export interface ResponsiveImageSources {
+  src: string
+  srcset: string
+  webpSrcset: string
+}
+
+// Responsive sources for an uploaded image, or null for images that are not content-addressed uploads
+// (external URLs, legacy uploads, SVGs), which are used as they are
+export function responsiveImageSources(url: string | undefined | null): ResponsiveImageSources | null {
+  const match = url ? CONTENT_ADDRESSED_IMAGE.exec(url) : null
+  if (!match) return null
+
+  const [, base, prefix, hash] = match
+  const derivative = (name: ImageDerivativeName, extension: string) =>
+    `${base}/derivatives/${prefix}/${hash}_${name}.${extension}`
+  const srcset = (extension: string) =>
+    (Object.keys(IMAGE_DERIVATIVE_SIZES) as ImageDerivativeName[])
+      .map(name => `${derivative(name, extension)} ${IMAGE_DERIVATIVE_SIZES[name]}w`)
+      .join(', ')
+
+  return {
+    src: derivative('medium', 'jpg'),
+    srcset: srcset('jpg'),
+    webpSrcset: srcset('webp')
+  }
+}
+
+// Derivatives are generated a moment after an upload; until they exist, show the original instead
+export function fallBackToOriginalImage(event: Event, original: string): void {
+  const image = event.target as HTMLImageElement
+  if (image.getAttribute('src') === original) return
+
+  image.parentElement?.querySelectorAll('source').forEach(source => source.remove())
+  image.removeAttribute('srcset')
+  image.removeAttribute('sizes')
+  image.src = original
+}
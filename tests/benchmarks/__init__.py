@@ -0,0 +1,4 @@
+"""
+Latency benchmarks for read-heavy API endpoints, comparable across backend versions
+Run from the tests directory: python -m benchmarks --help
+"""
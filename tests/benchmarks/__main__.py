@@ -0,0 +1,94 @@
+"""
+Command-line entry point for the catalog benchmarks
+
+Reports are only comparable when both runs use the same dataset, e.g. one
+loaded with python -m seeding using the same seed and volumes.
+
+Examples:
+    cd tests && python -m benchmarks --label v1.4.0 --output bench-v1.4.0.json
+    cd tests && python -m benchmarks --label main --baseline bench-v1.4.0.json --tolerance 0.25
+    cd tests && python -m benchmarks --stub --stub-products 50000
+    cd tests && python -m benchmarks --suite search --label fts --output bench-search-fts.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from support.api_client import ApiClient, DEFAULT_BASE_URL, default_headers
+from support.perf_budget import compare_results
+from support.stub_server import StubApiServer
+from benchmarks.catalog import PAGE_DEPTHS, build_cases, format_comparison, run_benchmarks
+from benchmarks.search import RECOMMENDED_PRODUCTS, build_search_cases
+
+
+def _progress(name: str, result: Dict[str, Any]) -> None:
+    print(f"  {name:<32} p50 {result['p50Ms']:>8.1f}ms  p95 {result['p95Ms']:>8.1f}ms  "
+          f"rows {result['rows']:>4}  errors {result['errors']}", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.environ.get("NCS_API_BASE_URL", DEFAULT_BASE_URL))
+    parser.add_argument("--token", default=os.environ.get("NCS_API_TOKEN", "test-token"))
+    parser.add_argument("--suite", choices=["catalog", "search"], default="catalog",
+                        help="catalog: paging and filters; search: ranked and filtered search terms")
+    parser.add_argument("--label", help="Backend version or commit recorded in the report")
+    parser.add_argument("--repetitions", type=int, default=30, help="Timed calls per case")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed calls per case")
+    parser.add_argument("--page", type=int, action="append", dest="pages", metavar="N",
+                        help=f"Page depth to measure (repeatable, default {PAGE_DEPTHS})")
+    parser.add_argument("--stub", action="store_true", help="Benchmark an in-process stand-in server")
+    parser.add_argument("--stub-products", type=int, default=5000)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Earlier report to compare p95 latencies against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative p95 growth over the baseline before exiting non-zero")
+    args = parser.parse_args(argv)
+
+    if args.repetitions < 1:
+        parser.error("--repetitions must be at least 1")
+
+    if args.suite == "search":
+        cases_for = build_search_cases
+    else:
+        cases_for = lambda fixtures: build_cases(fixtures, args.pages)
+
+    def run(base_url: str) -> Dict[str, Any]:
+        client = ApiClient(base_url, headers=default_headers(args.token), pool_size=1)
+        try:
+            return run_benchmarks(client, args.repetitions, args.warmup, args.label, cases_for, _progress)
+        finally:
+            client.close()
+
+    if args.stub:
+        with StubApiServer(seed_products=args.stub_products) as server:
+            report = run(server.base_url)
+    else:
+        report = run(args.base_url)
+
+    report["suite"] = args.suite
+    if args.suite == "search" and report["totalProducts"] < RECOMMENDED_PRODUCTS:
+        print(f"Warning: target holds {report['totalProducts']:,} active products; search timings are only "
+              f"representative from {RECOMMENDED_PRODUCTS:,}", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        print(format_comparison(baseline, report))
+        regressions = compare_results(baseline, report, args.tolerance)
+        for name, before, after in regressions:
+            print(f"Regression {name}: p95 {before:.1f}ms -> {after:.1f}ms", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+GET /products benchmarks across page depth, search selectivity, category
+filtering and includeInactive
+
+Each case is issued sequentially on a warm pooled connection so the numbers
+reflect server-side query cost rather than client concurrency. The report keys
+cases under "endpoints" with p50Ms/p95Ms like the contract-test results file,
+so python -m support.perf_budget can diff two reports as well.
+"""
+
+import platform
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
+from support.api_client import ApiClient
+from support.perf_budget import percentile
+
+PAGE_SIZE = 20
+PAGE_DEPTHS = [1, 10, 100, 1000, 5000]
+
+
+class BenchmarkCase:
+    """One parameterised GET call, against /products unless another endpoint is given"""
+
+    def __init__(self, name: str, group: str, params: Dict[str, Any], endpoint: str = "/products"):
+        self.name = name
+        self.group = group
+        self.params = params
+        self.endpoint = endpoint
+
+    @property
+    def path(self) -> str:
+        return f"{self.endpoint}?{urlencode(self.params)}"
+
+
+class CatalogFixtures:
+    """Category ids and search terms discovered from the target's own data"""
+
+    def __init__(self, busiest_category_id: Optional[str], quietest_category_id: Optional[str],
+                 sample_sku: Optional[str], total_products: int):
+        self.busiest_category_id = busiest_category_id
+        self.quietest_category_id = quietest_category_id
+        self.sample_sku = sample_sku
+        self.total_products = total_products
+
+    @property
+    def sku_prefix(self) -> Optional[str]:
+        return self.sample_sku[:6] if self.sample_sku else None
+
+    @classmethod
+    def discover(cls, client: ApiClient, sample_pages: int = 5) -> "CatalogFixtures":
+        response = client.get("/products?pageNumber=1&pageSize=100")
+        response.raise_for_status()
+        first = response.json()
+        products = list(first["products"])
+        for page in range(2, min(sample_pages, first.get("totalPages") or 1) + 1):
+            products.extend(client.get(f"/products?pageNumber={page}&pageSize=100").json()["products"])
+
+        per_category: Dict[str, int] = {}
+        for product in products:
+            per_category[product["categoryId"]] = per_category.get(product["categoryId"], 0) + 1
+        ranked = sorted(per_category, key=per_category.get)
+        return cls(
+            busiest_category_id=ranked[-1] if ranked else None,
+            quietest_category_id=ranked[0] if ranked else None,
+            sample_sku=products[len(products) // 2]["sku"] if products else None,
+            total_products=first.get("totalCount", 0)
+        )
+
+
+def build_cases(fixtures: CatalogFixtures, page_depths: Optional[List[int]] = None) -> List[BenchmarkCase]:
+    cases = []
+    for page in page_depths or PAGE_DEPTHS:
+        cases.append(BenchmarkCase(f"page-depth/{page}", "page-depth", {"pageNumber": page, "pageSize": PAGE_SIZE}))
+
+    # From a handful of matches to most of the catalog; leading-wildcard search scans either way
+    searches = {"no-match": "zzqx-no-such-term", "broad": "Cotton", "very-broad": "e"}
+    if fixtures.sku_prefix:
+        searches["sku-prefix"] = fixtures.sku_prefix
+    for label, term in searches.items():
+        cases.append(BenchmarkCase(f"search/{label}", "search", {"search": term, "pageNumber": 1,
+                                                                 "pageSize": PAGE_SIZE}))
+    cases.append(BenchmarkCase("search/broad-deep", "search", {"search": "Cotton", "pageNumber": 50,
+                                                                "pageSize": PAGE_SIZE}))
+
+    for label, category_id in (("busiest", fixtures.busiest_category_id),
+                               ("quietest", fixtures.quietest_category_id)):
+        if category_id:
+            cases.append(BenchmarkCase(f"category/{label}", "category",
+                                       {"categoryId": category_id, "pageNumber": 1, "pageSize": PAGE_SIZE}))
+    if fixtures.busiest_category_id:
+        cases.append(BenchmarkCase("category/busiest+search", "category",
+                                   {"categoryId": fixtures.busiest_category_id, "search": "Cotton",
+                                    "pageNumber": 1, "pageSize": PAGE_SIZE}))
+
+    for include in (False, True):
+        cases.append(BenchmarkCase(f"include-inactive/{str(include).lower()}", "include-inactive",
+                                   {"includeInactive": str(include).lower(), "pageNumber": 1,
+                                    "pageSize": PAGE_SIZE}))
+        cases.append(BenchmarkCase(f"include-inactive/{str(include).lower()}-deep", "include-inactive",
+                                   {"includeInactive": str(include).lower(), "pageNumber": 1000,
+                                    "pageSize": PAGE_SIZE}))
+    return cases
+
+
+def run_case(client: ApiClient, case: BenchmarkCase, repetitions: int, warmup: int) -> Dict[str, Any]:
+    for _ in range(warmup):
+        client.get(case.path)
+
+    timings, errors, response = [], 0, None
+    for _ in range(repetitions):
+        started = time.perf_counter()
+        response = client.get(case.path)
+        timings.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            errors += 1
+
+    body = response.json() if response is not None and response.status_code == 200 else {}
+    return {
+        "group": case.group,
+        "path": case.path,
+        "count": len(timings),
+        "errors": errors,
+        "rows": len(body.get("products") or []),
+        "totalCount": body.get("totalCount"),
+        "meanMs": round(sum(timings) / len(timings), 3),
+        "p50Ms": round(percentile(timings, 50), 3),
+        "p95Ms": round(percentile(timings, 95), 3),
+        "p99Ms": round(percentile(timings, 99), 3),
+        "maxMs": round(max(timings), 3)
+    }
+
+
+def run_benchmarks(client: ApiClient, repetitions: int = 30, warmup: int = 3, label: Optional[str] = None,
+                   cases_for: Callable[[CatalogFixtures], List[BenchmarkCase]] = build_cases,
+                   progress: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    fixtures = CatalogFixtures.discover(client)
+    results = {}
+    for case in cases_for(fixtures):
+        results[case.name] = run_case(client, case, repetitions, warmup)
+        if progress:
+            progress(case.name, results[case.name])
+    return {
+        "label": label,
+        "createdAt": datetime.now(timezone.utc).isoformat(),
+        "baseUrl": client.base_url,
+        "python": platform.python_version(),
+        "repetitions": repetitions,
+        "totalProducts": fixtures.total_products,
+        "endpoints": results
+    }
+
+
+def format_comparison(baseline: Dict[str, Any], current: Dict[str, Any]) -> str:
+    lines = [f"{'case':<32} {'base p95':>10} {'new p95':>10} {'change':>8}"]
+    for name, entry in current["endpoints"].items():
+        previous = baseline.get("endpoints", {}).get(name)
+        if previous is None:
+            lines.append(f"{name:<32} {'-':>10} {entry['p95Ms']:>10.1f} {'new':>8}")
+            continue
+        change = (entry["p95Ms"] / previous["p95Ms"] - 1.0) if previous["p95Ms"] > 0 else 0.0
+        lines.append(f"{name:<32} {previous['p95Ms']:>10.1f} {entry['p95Ms']:>10.1f} {change:>+8.0%}")
+    return "\n".join(lines)
@@ -0,0 +1,39 @@
+"""
+Product search benchmarks: ranked GET /products/search and the search filter
+of GET /products, across common, rare, multi-word, partial-word and SKU terms
+
+Meaningful numbers need a production-sized catalog, e.g. 100k+ products loaded
+with python -m seeding; the CLI warns when the target holds fewer.
+"""
+
+from typing import List
+
+from benchmarks.catalog import PAGE_SIZE, BenchmarkCase, CatalogFixtures
+
+RECOMMENDED_PRODUCTS = 100_000
+
+
+def build_search_cases(fixtures: CatalogFixtures) -> List[BenchmarkCase]:
+    terms = {
+        "common-word": "Cotton",
+        "rare-word": "Cashmere",
+        "two-words": "Slim Denim",
+        "partial-word": "Hood",
+        "no-match": "zzqx"
+    }
+    if fixtures.sample_sku:
+        terms["sku-exact"] = fixtures.sample_sku
+        terms["sku-prefix"] = fixtures.sku_prefix
+
+    cases = []
+    for label, term in terms.items():
+        cases.append(BenchmarkCase(f"ranked/{label}", "ranked",
+                                   {"searchTerm": term, "pageNumber": 1, "pageSize": PAGE_SIZE},
+                                   endpoint="/products/search"))
+        cases.append(BenchmarkCase(f"filter/{label}", "filter",
+                                   {"search": term, "pageNumber": 1, "pageSize": PAGE_SIZE}))
+    # Ranking has to score every match before the first page can be returned
+    cases.append(BenchmarkCase("ranked/common-word-deep", "ranked",
+                               {"searchTerm": "Cotton", "pageNumber": 50, "pageSize": PAGE_SIZE},
+                               endpoint="/products/search"))
+    return cases
@@ -0,0 +1,211 @@
+"""
+Shared pytest fixtures for the Python API test suites
+"""
+
+import json
+import os
+import uuid
+
+import pytest
+
+from support.api_client import DEFAULT_POOL_SIZE, ApiClient, CleanupRegistry, default_headers
+from support.factories import CatalogFactory, UniqueData
+from support.perf_budget import LatencyBudget, LatencyBudgets, LatencyRecorder, check_budget
+from support.stub_server import NAMESPACE_HEADER, StubApiServer
+from support.stub_store import DEFAULT_SEED_PRODUCTS
+
+DEFAULT_BUDGETS_FILE = os.path.join(os.path.dirname(__file__), "perf_budgets.json")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ncs-api", "National Clothing Store API tests")
+    group.addoption(
+        "--api-base-url",
+        default=os.environ.get("NCS_API_BASE_URL"),
+        help="Base URL of the API under test, e.g. http://localhost:5000/api (env: NCS_API_BASE_URL); "
+             "when unset the suites run against the in-process stand-in server"
+    )
+    group.addoption(
+        "--stub-products",
+        type=int,
+        default=int(os.environ.get("NCS_STUB_PRODUCTS", DEFAULT_SEED_PRODUCTS)),
+        help="Products seeded into each stand-in server namespace"
+    )
+    group.addoption(
+        "--api-pool-size",
+        type=int,
+        default=int(os.environ.get("NCS_API_POOL_SIZE", DEFAULT_POOL_SIZE)),
+        help="Maximum keep-alive connections in the shared session pool"
+    )
+    group.addoption(
+        "--branch-id",
+        default=os.environ.get("NCS_BRANCH_ID"),
+        help="Existing branch to create inventory rows in (env: NCS_BRANCH_ID); "
+             "the stand-in server accepts any ID"
+    )
+    group.addoption(
+        "--perf-budgets",
+        default=os.environ.get("NCS_PERF_BUDGETS", DEFAULT_BUDGETS_FILE),
+        help="JSON file with per-endpoint latency budgets"
+    )
+    group.addoption(
+        "--perf-results",
+        default=os.environ.get("NCS_PERF_RESULTS", "perf-results.json"),
+        help="Where to write per-endpoint latency results; empty to disable"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "latency_budget: fail the test when any endpoint it calls exceeds its latency budget"
+    )
+    config._ncs_budgets = LatencyBudgets.load(config.getoption("--perf-budgets"))
+    config._ncs_recorder = LatencyRecorder()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    recorder = item.config._ncs_recorder
+    recorder.current_test = item.nodeid
+    try:
+        result = yield
+    finally:
+        recorder.current_test = None
+
+    if item.get_closest_marker("latency_budget") is not None:
+        budgets = item.config._ncs_budgets
+        failures = [
+            message
+            for endpoint, samples in recorder.samples_for_test(item.nodeid).items()
+            for message in [check_budget(endpoint, samples, budgets)]
+            if message
+        ]
+        if failures:
+            pytest.fail("Latency budget exceeded:\n" + "\n".join(failures), pytrace=False)
+    return result
+
+
+def pytest_sessionfinish(session):
+    path = session.config.getoption("--perf-results")
+    recorder = getattr(session.config, "_ncs_recorder", None)
+    if not path or recorder is None or not recorder.samples:
+        return
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        # One file per xdist worker, e.g. perf-results.gw0.json
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{worker}{ext}"
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(recorder.results(session.config._ncs_budgets), handle, indent=2)
+
+
+@pytest.fixture(scope="session")
+def api_namespace() -> str:
+    """Data namespace of this test process, one per pytest-xdist worker"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "default")
+
+
+@pytest.fixture(scope="session")
+def api_base_url(request, api_namespace):
+    """Base URL of the API under test, starting the stand-in server when none is configured"""
+    base_url = request.config.getoption("--api-base-url")
+    if base_url:
+        yield base_url
+        return
+
+    with StubApiServer(seed_products=request.config.getoption("--stub-products")) as server:
+        # Seed up front so the first test does not pay for it
+        server.store(api_namespace)
+        yield server.base_url
+
+
+@pytest.fixture(scope="session")
+def api_client(request, api_base_url, api_namespace):
+    """One pooled keep-alive client shared by the whole pytest session"""
+    headers = default_headers()
+    headers[NAMESPACE_HEADER] = api_namespace
+    client = ApiClient(
+        api_base_url,
+        headers=headers,
+        pool_size=request.config.getoption("--api-pool-size"),
+        recorder=request.config._ncs_recorder
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def cleanup(api_client):
+    """Registry of created records, deleted in concurrent batches after the test"""
+    registry = CleanupRegistry(api_client)
+    yield registry
+    registry.flush()
+
+
+@pytest.fixture
+def latency_budget(request, api_client):
+    """Repeat idempotent calls N times and assert their p95 against perf_budgets.json"""
+    return LatencyBudget(api_client, request.config._ncs_budgets, request.config._ncs_recorder)
+
+
+@pytest.fixture
+def unique(api_namespace):
+    """Per-test unique SKUs, category codes and names"""
+    return UniqueData(api_namespace)
+
+
+@pytest.fixture(scope="session")
+def branch_id(request):
+    """Branch that inventory created by the suites is stocked at"""
+    return request.config.getoption("--branch-id") or str(uuid.uuid4())
+
+
+@pytest.fixture
+def catalog(api_client, cleanup, unique):
+    """Creates categories, products and variations with cleanup registered centrally"""
+    return CatalogFactory(api_client, cleanup, unique)
+
+
+@pytest.fixture
+def stocked_inventory(catalog, unique, branch_id):
+    """Creates a product stocked at the test branch; call with the quantity and a short label
+
+    Returns a dict with the inventory "id", the product "sku" and the "userId" that created the stock.
+    Skips the test when the branch cannot be stocked (pass --branch-id against a real backend).
+    """
+    def create(quantity: int, label: str) -> dict:
+        code = label.upper().replace(" ", "-")
+        category = catalog.create_category({
+            "name": unique.name(label),
+            "code": unique.code(code),
+            "description": f"{label} test category",
+            "isActive": True,
+            "parentId": None
+        })
+        assert category.status_code == 201
+        product = catalog.create_product({
+            "name": f"{label} Tee",
+            "description": f"Stocked for the {label.lower()} tests",
+            "sku": unique.sku(f"{code}-TEE"),
+            "categoryId": category.json()["id"],
+            "isActive": True,
+            "basePrice": 19.99,
+            "costPrice": 7.5
+        })
+        assert product.status_code == 201
+
+        user_id = str(uuid.uuid4())
+        inventory = catalog.create_inventory({
+            "productId": product.json()["id"],
+            "branchId": branch_id,
+            "quantity": quantity,
+            "unitCost": 7.5,
+            "reason": f"{label} test stock",
+            "createdByUserId": user_id
+        })
+        if inventory.status_code != 201:
+            pytest.skip(f"Cannot stock inventory at branch {branch_id} (pass --branch-id): {inventory.text}")
+        return {"id": inventory.json()["id"], "sku": product.json()["sku"], "userId": user_id}
+
+    return create
@@ -4,43 +4,36 @@ Tests the API contracts and business rules for product catalog management
 """
 
 import pytest
-import requests
 import json
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 
+@pytest.mark.latency_budget
 class TestProductCatalogContract:
     """Contract tests for product catalog management endpoints"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_client(self, api_client, catalog, unique):
         """Setup test environment"""
-        self.base_url = "http://localhost:5000/api"
-        self.auth_headers = self._get_auth_headers()
-        
-    def _get_auth_headers(self) -> Dict[str, str]:
-        """Get authentication headers for testing"""
-        # This would typically use a test user with appropriate permissions
-        return {
-            "Authorization": "Bearer test_token",
-            "Content-Type": "application/json"
-        }
+        # Shared keep-alive session; auth headers are set on the session
+        self.client = api_client
+        # Records created here are cleaned up centrally after each test
+        self.catalog = catalog
+        self.unique = unique
     
     def test_create_category_contract(self):
         """Test contract for creating a product category"""
         # Arrange
         category_data = {
-            "name": "Test Category",
+            "name": self.unique.name("Test Category"),
             "description": "Test category description",
+            "code": self.unique.code("TESTCAT"),
             "isActive": True,
             "parentId": None
         }
         
         # Act
-        response = requests.post(
-            f"{self.base_url}/categories",
-            json=category_data,
-            headers=self.auth_headers
-        )
+        response = self.catalog.create_category(category_data)
         
         # Assert - Contract validation
         assert response.status_code in [201, 400, 401, 403]  # Expected status codes
@@ -64,12 +57,12 @@ class TestProductCatalogContract:
             assert data["description"] == category_data["description"]
             assert data["isActive"] == category_data["isActive"]
     
-    def test_get_categories_contract(self):
+    def test_get_categories_contract(self, latency_budget):
         """Test contract for retrieving product categories"""
-        # Act
-        response = requests.get(
-            f"{self.base_url}/categories",
-            headers=self.auth_headers
+        # Act - repeated so the p95 can be checked against its latency budget
+        response = latency_budget.repeat(
+            "GET",
+            "/categories"
         )
         
         # Assert - Contract validation
@@ -97,13 +90,52 @@ class TestProductCatalogContract:
                 assert "description" in category
                 assert "isActive" in category
     
+    def test_category_tree_contract(self):
+        """Test contract for retrieving the category hierarchy as a nested tree"""
+        # Arrange - root > child > grandchild
+        parent_id = None
+        created = []
+        for label in ["Tree Root", "Tree Child", "Tree Leaf"]:
+            response = self.catalog.create_category({
+                "name": self.unique.name(label),
+                "code": self.unique.code(label),
+                "parentId": parent_id,
+                "isActive": True
+            })
+            if response.status_code != 201:
+                pytest.skip("Category creation not available")
+            created.append(response.json())
+            parent_id = created[-1]["id"]
+        
+        # Act
+        response = self.client.get(f"/categories/tree?rootId={created[0]['id']}")
+        
+        # Assert - Contract validation
+        assert response.status_code in [200, 401, 403]
+        
+        if response.status_code == 200:
+            data = response.json()
+            assert isinstance(data, list)
+            assert len(data) == 1
+            
+            node = data[0]
+            for depth, category in enumerate(created):
+                assert node["id"] == category["id"]
+                assert node["parentId"] == (created[depth - 1]["id"] if depth else None)
+                assert node["depth"] == depth
+                assert isinstance(node["children"], list)
+                if depth < len(created) - 1:
+                    assert len(node["children"]) == 1
+                    node = node["children"][0]
+            assert node["children"] == []
+    
     def test_create_product_contract(self):
         """Test contract for creating a product"""
         # Arrange
         product_data = {
             "name": "Test Product",
             "description": "Test product description",
-            "sku": "TEST-SKU-001",
+            "sku": self.unique.sku("TEST-SKU-001"),
             "categoryId": "test-category-id",
             "isActive": True,
             "basePrice": 29.99,
@@ -111,11 +143,7 @@ class TestProductCatalogContract:
         }
         
         # Act
-        response = requests.post(
-            f"{self.base_url}/products",
-            json=product_data,
-            headers=self.auth_headers
-        )
+        response = self.catalog.create_product(product_data)
         
         # Assert - Contract validation
         assert response.status_code in [201, 400, 401, 403, 404]
@@ -149,12 +177,12 @@ class TestProductCatalogContract:
             assert data["sku"] == product_data["sku"]
             assert data["basePrice"] == product_data["basePrice"]
     
-    def test_get_products_contract(self):
+    def test_get_products_contract(self, latency_budget):
         """Test contract for retrieving products"""
         # Act
-        response = requests.get(
-            f"{self.base_url}/products",
-            headers=self.auth_headers
+        response = latency_budget.repeat(
+            "GET",
+            "/products"
         )
         
         # Assert - Contract validation
@@ -191,18 +219,14 @@ class TestProductCatalogContract:
             "productId": "test-product-id",
             "size": "M",
             "color": "Blue",
-            "sku": "TEST-SKU-001-M-BLUE",
+            "sku": self.unique.sku("TEST-SKU-001-M-BLUE"),
             "isActive": True,
             "additionalPrice": 0.00,
             "stockQuantity": 100
         }
         
         # Act
-        response = requests.post(
-            f"{self.base_url}/products/variations",
-            json=variation_data,
-            headers=self.auth_headers
-        )
+        response = self.catalog.create_variation(variation_data)
         
         # Assert - Contract validation
         assert response.status_code in [201, 400, 401, 403, 404]
@@ -231,15 +255,15 @@ class TestProductCatalogContract:
             assert isinstance(data["additionalPrice"], (int, float))
             assert isinstance(data["stockQuantity"], int)
     
-    def test_get_product_variations_contract(self):
+    def test_get_product_variations_contract(self, latency_budget):
         """Test contract for retrieving product variations"""
         # Arrange
         product_id = "test-product-id"
         
         # Act
-        response = requests.get(
-            f"{self.base_url}/products/{product_id}/variations",
-            headers=self.auth_headers
+        response = latency_budget.repeat(
+            "GET",
+            f"/products/{product_id}/variations"
         )
         
         # Assert - Contract validation
@@ -277,10 +301,9 @@ class TestProductCatalogContract:
         }
         
         # Act
-        response = requests.put(
-            f"{self.base_url}/products/{product_id}",
-            json=update_data,
-            headers=self.auth_headers
+        response = self.client.put(
+            f"/products/{product_id}",
+            json=update_data
         )
         
         # Assert - Contract validation
@@ -306,9 +329,8 @@ class TestProductCatalogContract:
         product_id = "test-product-id"
         
         # Act
-        response = requests.delete(
-            f"{self.base_url}/products/{product_id}",
-            headers=self.auth_headers
+        response = self.client.delete(
+            f"/products/{product_id}"
         )
         
         # Assert - Contract validation
@@ -321,10 +343,9 @@ class TestProductCatalogContract:
     def test_error_response_contract(self):
         """Test contract for error responses"""
         # Test invalid request
-        response = requests.post(
-            f"{self.base_url}/products",
-            json={"invalid": "data"},
-            headers=self.auth_headers
+        response = self.client.post(
+            "/products",
+            json={"invalid": "data"}
         )
         
         # Assert error response structure
@@ -335,12 +356,12 @@ class TestProductCatalogContract:
             assert "errors" in data or "message" in data
             assert isinstance(data.get("errors", []), list)
     
-    def test_pagination_contract(self):
+    def test_pagination_contract(self, latency_budget):
         """Test contract for paginated responses"""
         # Act
-        response = requests.get(
-            f"{self.base_url}/products?pageNumber=1&pageSize=10",
-            headers=self.auth_headers
+        response = latency_budget.repeat(
+            "GET",
+            "/products?pageNumber=1&pageSize=10"
         )
         
         # Assert - Contract validation
@@ -362,6 +383,254 @@ class TestProductCatalogContract:
             assert isinstance(data["totalPages"], int)
             assert isinstance(data["hasNextPage"], bool)
             assert isinstance(data["hasPreviousPage"], bool)
+    
+    def test_cursor_pagination_contract(self, latency_budget):
+        """Test contract for keyset (cursor) pagination of products"""
+        # Act - the first page hands out the cursor for the next one
+        first = self.client.get("/products?pageSize=10")
+        
+        assert first.status_code in [200, 401, 403]
+        if first.status_code != 200:
+            return
+        first_page = first.json()
+        assert "nextCursor" in first_page
+        if not first_page["hasNextPage"]:
+            assert first_page["nextCursor"] is None
+            return
+        assert isinstance(first_page["nextCursor"], str)
+        
+        response = latency_budget.repeat(
+            "GET",
+            f"/products?pageSize=10&cursor={first_page['nextCursor']}"
+        )
+        
+        # Assert - Contract validation
+        assert response.status_code == 200
+        data = response.json()
+        assert data["pageSize"] == 10
+        assert data["hasPreviousPage"] is True
+        assert isinstance(data["hasNextPage"], bool)
+        assert 0 < len(data["products"]) <= 10
+        
+        # Pages must not overlap
+        first_ids = {product["id"] for product in first_page["products"]}
+        assert first_ids.isdisjoint(product["id"] for product in data["products"])
+        if data["hasNextPage"]:
+            assert isinstance(data["nextCursor"], str)
+            assert data["nextCursor"] != first_page["nextCursor"]
+    
+    def test_cursor_pagination_without_total_count_contract(self):
+        """Test contract for skipping the total count"""
+        # Act
+        response = self.client.get("/products?pageSize=10&includeTotalCount=false")
+        
+        # Assert - Contract validation
+        assert response.status_code in [200, 401, 403]
+        
+        if response.status_code == 200:
+            data = response.json()
+            assert data["totalCount"] is None
+            assert data["totalPages"] is None
+            assert isinstance(data["hasNextPage"], bool)
+            assert len(data["products"]) <= 10
+            assert (data["nextCursor"] is not None) == data["hasNextPage"]
+    
+    def test_invalid_cursor_contract(self):
+        """Test contract for malformed pagination cursors"""
+        # Act
+        response = self.client.get("/products?pageSize=10&cursor=not-a-cursor")
+        
+        # Assert - Contract validation
+        assert response.status_code in [400, 401, 403]
+        
+        if response.status_code == 400:
+            data = response.json()
+            assert "message" in data
+    
+    def test_product_summary_and_expand_contract(self):
+        """Test contract for lean rows by default and with expand=none, and the graph only when expand= asks for it"""
+        # Arrange
+        category = self.catalog.create_category({
+            "name": self.unique.name("Summary Category"),
+            "code": self.unique.code("SUMMARY"),
+            "isActive": True
+        })
+        if category.status_code != 201:
+            pytest.skip("Category creation not available")
+        category_id = category.json()["id"]
+        product = self.catalog.create_product({
+            "name": self.unique.name("Summary Product"),
+            "sku": self.unique.sku("SUMMARY"),
+            "categoryId": category_id,
+            "isActive": True,
+            "basePrice": 24.99,
+            "costPrice": 12.00
+        })
+        if product.status_code != 201:
+            pytest.skip("Product creation not available")
+        product_id = product.json()["id"]
+        for size in ["S", "M"]:
+            variation = self.catalog.create_variation({
+                "productId": product_id,
+                "size": size,
+                "color": "Olive",
+                "sku": self.unique.sku(f"SUMMARY-{size}"),
+                "isActive": True,
+                "stockQuantity": 3
+            })
+            assert variation.status_code == 201
+        
+        # Act
+        default_response = self.client.get(f"/products?categoryId={category_id}")
+        summary_response = self.client.get(f"/products?categoryId={category_id}&expand=none")
+        full_response = self.client.get(f"/products?categoryId={category_id}&expand=all")
+        expanded_response = self.client.get(f"/products?categoryId={category_id}&expand=variations")
+        invalid_response = self.client.get("/products?expand=warehouses")
+        
+        # Assert - Contract validation
+        assert summary_response.status_code in [200, 401, 403]
+        
+        if summary_response.status_code == 200:
+            summary = summary_response.json()["products"][0]
+            assert summary["id"] == product_id
+            assert summary["variationCount"] == 2
+            assert "primaryImageUrl" in summary
+            assert "variations" not in summary
+            
+            assert default_response.json()["products"] == summary_response.json()["products"]
+            
+            full = full_response.json()["products"][0]
+            assert full["id"] == product_id
+            assert full["basePrice"] == 24.99
+            assert len(full["variations"]) == 2
+            
+            expanded = expanded_response.json()["products"][0]
+            assert expanded["id"] == product_id
+            assert len(expanded["variations"]) == 2
+            assert "images" not in expanded
+            
+            assert invalid_response.status_code == 400
+    
+    def test_variation_cursor_pagination_contract(self):
+        """Test contract for walking a product's variations with cursors"""
+        # Arrange
+        category = self.catalog.create_category({
+            "name": self.unique.name("Cursor Category"),
+            "code": self.unique.code("CURSOR"),
+            "isActive": True
+        })
+        if category.status_code != 201:
+            pytest.skip("Category creation not available")
+        product = self.catalog.create_product({
+            "name": self.unique.name("Cursor Product"),
+            "sku": self.unique.sku("CURSOR"),
+            "categoryId": category.json()["id"],
+            "isActive": True,
+            "basePrice": 19.99,
+            "costPrice": 9.50
+        })
+        if product.status_code != 201:
+            pytest.skip("Product creation not available")
+        product_id = product.json()["id"]
+        created = set()
+        for size in ["S", "M", "L", "XL", "XXL"]:
+            variation = self.catalog.create_variation({
+                "productId": product_id,
+                "size": size,
+                "color": "Navy",
+                "sku": self.unique.sku(f"CURSOR-{size}"),
+                "isActive": True,
+                "stockQuantity": 5
+            })
+            assert variation.status_code == 201
+            created.add(variation.json()["id"])
+        
+        # Act - follow nextCursor until the last page
+        seen: List[str] = []
+        path = f"/products/{product_id}/variations?pageSize=2"
+        while path:
+            response = self.client.get(path)
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["variations"]) <= 2
+            seen.extend(variation["id"] for variation in data["variations"])
+            cursor = data["nextCursor"]
+            path = f"/products/{product_id}/variations?pageSize=2&cursor={cursor}" if cursor else None
+        
+        # Assert - every variation exactly once
+        assert len(seen) == len(created)
+        assert set(seen) == created
+    
+    def test_search_ranking_contract(self, latency_budget):
+        """Test contract for ranked product search and SKU prefix lookup"""
+        # Arrange
+        category = self.catalog.create_category({
+            "name": self.unique.name("Search Category"),
+            "code": self.unique.code("SEARCH"),
+            "isActive": True
+        })
+        if category.status_code != 201:
+            pytest.skip("Category creation not available")
+        sku = self.unique.sku("SRCH-001")
+        product = self.catalog.create_product({
+            "name": self.unique.name("Searchable Linen Shirt"),
+            "sku": sku,
+            "categoryId": category.json()["id"],
+            "isActive": True,
+            "basePrice": 24.99,
+            "costPrice": 11.00
+        })
+        if product.status_code != 201:
+            pytest.skip("Product creation not available")
+        
+        # Act - exact SKU, SKU prefix typed in lower case
+        exact = latency_budget.repeat("GET", f"/products/search?searchTerm={sku}&pageSize=5")
+        prefix = self.client.get(f"/products/search?searchTerm={sku[:-2].lower()}&pageSize=5")
+        
+        # Assert - the matching SKU ranks first in both
+        for response in (exact, prefix):
+            assert response.status_code == 200
+            data = response.json()
+            assert data["products"]
+            assert data["products"][0]["sku"] == sku
+    
+    def test_search_season_and_material_contract(self):
+        """Test contract for product search matching the season and material columns"""
+        # Arrange
+        category = self.catalog.create_category({
+            "name": self.unique.name("Fabric Category"),
+            "code": self.unique.code("FABRIC"),
+            "isActive": True
+        })
+        if category.status_code != 201:
+            pytest.skip("Category creation not available")
+        season, material = f"Monsoon{self.unique.tag}", f"Khadi{self.unique.tag}"
+        product = self.catalog.create_product({
+            "name": self.unique.name("Plain Kurta"),
+            "sku": self.unique.sku("FABRIC-001"),
+            "categoryId": category.json()["id"],
+            "season": season,
+            "material": material,
+            "isActive": True,
+            "basePrice": 34.99,
+            "costPrice": 15.00
+        })
+        if product.status_code != 201:
+            pytest.skip("Product creation not available")
+        product_id = product.json()["id"]
+        
+        # Act - ranked search and the list filter, by each column
+        responses = [
+            self.client.get(path, params=params)
+            for term in (season, material.lower())
+            for path, params in (("/products/search", {"searchTerm": term}),
+                                 ("/products", {"search": term}))
+        ]
+        
+        # Assert
+        for response in responses:
+            assert response.status_code == 200
+            assert [p["id"] for p in response.json()["products"]] == [product_id]
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,86 @@
+"""
+Real-time dashboard stream tests
+Opens the Server-Sent Events stream for a branch and checks that a stock
+movement crossing the low-stock threshold reaches it as a delta
+
+Against the default stand-in server these tests exercise its Python (support/stub_*)
+reimplementation of the stream, not the backend's SSE endpoint; pass
+--api-base-url to run them against a real deployment
+"""
+
+import json
+from typing import Any, Dict, Iterator, Tuple
+
+import pytest
+
+LOW_STOCK_THRESHOLD = 10
+STREAM_TIMEOUT_S = 10.0
+
+
+def _events(response) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (event, data) pairs from an open stream, skipping keep-alive comments"""
+    event = None
+    for line in response.iter_lines(chunk_size=1, decode_unicode=True):
+        if line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            yield event, json.loads(line[5:])
+
+
+class TestRealTimeDashboardStream:
+    """Snapshot and delta delivery over /reporting/dashboard/realtime/stream"""
+
+    @pytest.fixture(autouse=True)
+    def setup_inventory(self, api_client, stocked_inventory, branch_id):
+        """Create a product stocked one unit above the low-stock threshold"""
+        self.client = api_client
+        self.branch_id = branch_id
+        inventory = stocked_inventory(LOW_STOCK_THRESHOLD + 1, "Dashboard")
+        self.inventory_id = inventory["id"]
+        self.user_id = inventory["userId"]
+
+    def _open_stream(self):
+        response = self.client.get(
+            "/reporting/dashboard/realtime/stream",
+            params={"locationId": self.branch_id},
+            headers={"Accept": "text/event-stream"},
+            stream=True,
+            timeout=STREAM_TIMEOUT_S
+        )
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/event-stream")
+        return response
+
+    def test_stream_starts_with_snapshot(self):
+        """The first event describes the subscribed branch"""
+        with self._open_stream() as response:
+            event, data = next(_events(response))
+
+        assert event == "snapshot"
+        assert data["locationId"] == self.branch_id
+        assert data["connectedDashboards"] >= 1
+
+    def test_low_stock_change_is_pushed(self):
+        """Reserving the unit that takes the row to the threshold pushes a stock delta, releasing it another"""
+        with self._open_stream() as response:
+            events = _events(response)
+            event, snapshot = next(events)
+            assert event == "snapshot"
+
+            body = {"quantity": 1, "reason": "Dashboard stream test", "reservedByUserId": self.user_id}
+            assert self.client.post(f"/inventory/{self.inventory_id}/reserve", json=body).status_code == 200
+            event, delta = next(events)
+            assert event == "delta"
+            assert delta["eventType"] == "stock"
+            assert delta["branchId"] == self.branch_id
+            assert delta["lowStockChange"] == 1
+            assert delta["sequence"] > snapshot["sequence"]
+            assert delta["totals"]["lowStockItems"] == snapshot["lowStockItems"] + 1
+
+            body = {"quantity": 1, "reason": "Dashboard stream test", "releasedByUserId": self.user_id}
+            assert self.client.post(f"/inventory/{self.inventory_id}/release", json=body).status_code == 200
+            event, released = next(events)
+            assert event == "delta"
+            assert released["lowStockChange"] == -1
+            assert released["sequence"] > delta["sequence"]
+            assert released["totals"]["lowStockItems"] == snapshot["lowStockItems"]
@@ -0,0 +1,95 @@
+"""
+Concurrency stress tests for stock reservation
+Hammers a single SKU from many clients at once and checks that the final
+counts add up: no overselling, no lost updates, no double releases
+
+Against the default stand-in server these tests exercise its Python (support/stub_*)
+reimplementation of reserve/release, not the backend's atomic SQL; pass
+--api-base-url to run them against a real deployment
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+STOCK = 50
+CLIENTS = 16
+# More attempts than stock, so the last units are contended
+ATTEMPTS = STOCK * 3
+USER_FIELDS = {"reserve": "reservedByUserId", "release": "releasedByUserId"}
+
+
+class TestInventoryReservationConcurrency:
+    """Concurrent reserve/release against one inventory row"""
+
+    @pytest.fixture(autouse=True)
+    def setup_inventory(self, api_client, stocked_inventory):
+        """Create a product stocked with STOCK units at the test branch"""
+        self.client = api_client
+        inventory = stocked_inventory(STOCK, "Stress")
+        self.inventory_id = inventory["id"]
+        self.user_id = inventory["userId"]
+
+    def _hammer(self, action: str, attempts: int) -> List[int]:
+        """POST one-unit reserve/release requests from CLIENTS threads; returns the status codes"""
+        def call(_: int) -> int:
+            return self._post(action).status_code
+
+        with ThreadPoolExecutor(max_workers=CLIENTS) as executor:
+            return list(executor.map(call, range(attempts)))
+
+    def _post(self, action: str):
+        body = {"quantity": 1, "reason": "Stress test", USER_FIELDS[action]: self.user_id}
+        return self.client.post(f"/inventory/{self.inventory_id}/{action}", json=body)
+
+    def _inventory(self) -> Dict[str, Any]:
+        response = self.client.get(f"/inventory/{self.inventory_id}")
+        assert response.status_code == 200
+        return response.json()
+
+    def test_concurrent_reservations_never_oversell(self):
+        """Exactly STOCK reservations succeed however many clients race for the last units"""
+        statuses = self._hammer("reserve", ATTEMPTS)
+
+        assert statuses.count(200) == STOCK
+        # Every loser is told the stock ran out; none fail with a server error
+        assert statuses.count(400) == ATTEMPTS - STOCK
+
+        inventory = self._inventory()
+        assert inventory["quantity"] == STOCK
+        assert inventory["reservedQuantity"] == STOCK
+        assert inventory["availableQuantity"] == 0
+
+    def test_concurrent_releases_never_go_negative(self):
+        """Releasing more than was reserved stops at zero and restores every unit"""
+        reserved = self._hammer("reserve", STOCK)
+        assert reserved.count(200) == STOCK
+
+        statuses = self._hammer("release", ATTEMPTS)
+
+        assert statuses.count(200) == STOCK
+        assert statuses.count(400) == ATTEMPTS - STOCK
+
+        inventory = self._inventory()
+        assert inventory["quantity"] == STOCK
+        assert inventory["reservedQuantity"] == 0
+        assert inventory["availableQuantity"] == STOCK
+
+    def test_interleaved_reserve_and_release_keep_counts_consistent(self):
+        """Mixed traffic never loses an update: the final counts match the successful calls"""
+        def call(index: int) -> Tuple[str, int]:
+            action = "reserve" if index % 3 else "release"
+            return action, self._post(action).status_code
+
+        with ThreadPoolExecutor(max_workers=CLIENTS) as executor:
+            results = list(executor.map(call, range(ATTEMPTS)))
+
+        assert all(status in (200, 400) for _, status in results)
+        reserved = sum(1 for action, status in results if action == "reserve" and status == 200)
+        released = sum(1 for action, status in results if action == "release" and status == 200)
+
+        inventory = self._inventory()
+        assert inventory["reservedQuantity"] == reserved - released
+        assert 0 <= inventory["reservedQuantity"] <= STOCK
+        assert inventory["availableQuantity"] == STOCK - inventory["reservedQuantity"]
@@ -4,7 +4,6 @@ Tests the complete product catalog management business workflow
 """
 
 import pytest
-import requests
 import json
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
@@ -12,96 +11,61 @@ from datetime import datetime, timedelta
 class TestProductManagementWorkflow:
     """Integration tests for complete product management workflow"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_client(self, api_client, catalog, unique):
         """Setup test environment"""
-        self.base_url = "http://localhost:5000/api"
-        self.auth_headers = self._get_auth_headers()
-        self.cleanup_data = []
-        
-    def teardown_method(self):
-        """Cleanup test data"""
-        # Clean up created test data
-        for item in self.cleanup_data:
-            try:
-                if item["type"] == "product":
-                    requests.delete(
-                        f"{self.base_url}/products/{item['id']}",
-                        headers=self.auth_headers
-                    )
-                elif item["type"] == "category":
-                    requests.delete(
-                        f"{self.base_url}/categories/{item['id']}",
-                        headers=self.auth_headers
-                    )
-            except:
-                pass  # Ignore cleanup errors
-        
-    def _get_auth_headers(self) -> Dict[str, str]:
-        """Get authentication headers for testing"""
-        return {
-            "Authorization": "Bearer test_token",
-            "Content-Type": "application/json"
-        }
+        self.client = api_client
+        # Created records are registered for batched cleanup by the factory
+        self.catalog = catalog
+        # Per-test SKUs, codes and names keep parallel workers from colliding
+        self.unique = unique
     
     def test_complete_product_catalog_workflow(self):
         """Test complete product catalog creation and management workflow"""
         
         # Step 1: Create a parent category
         parent_category_data = {
-            "name": "Clothing",
+            "name": self.unique.name("Clothing"),
+            "code": self.unique.code("CLOTHING"),
             "description": "Main clothing category",
             "isActive": True,
             "parentId": None
         }
         
-        parent_response = requests.post(
-            f"{self.base_url}/categories",
-            json=parent_category_data,
-            headers=self.auth_headers
-        )
+        parent_response = self.catalog.create_category(parent_category_data)
         
         assert parent_response.status_code == 201
         parent_category = parent_response.json()
-        self.cleanup_data.append({"type": "category", "id": parent_category["id"]})
         
         # Step 2: Create a subcategory
         subcategory_data = {
-            "name": "Men's Shirts",
+            "name": self.unique.name("Men's Shirts"),
+            "code": self.unique.code("MENSHIRTS"),
             "description": "Men's casual and formal shirts",
             "isActive": True,
             "parentId": parent_category["id"]
         }
         
-        subcategory_response = requests.post(
-            f"{self.base_url}/categories",
-            json=subcategory_data,
-            headers=self.auth_headers
-        )
+        subcategory_response = self.catalog.create_category(subcategory_data)
         
         assert subcategory_response.status_code == 201
         subcategory = subcategory_response.json()
-        self.cleanup_data.append({"type": "category", "id": subcategory["id"]})
         
         # Step 3: Create a product
         product_data = {
             "name": "Classic Cotton Shirt",
             "description": "Comfortable cotton shirt for everyday wear",
-            "sku": "SHIRT-001",
+            "sku": self.unique.sku("SHIRT-001"),
             "categoryId": subcategory["id"],
             "isActive": True,
             "basePrice": 49.99,
             "costPrice": 25.00
         }
         
-        product_response = requests.post(
-            f"{self.base_url}/products",
-            json=product_data,
-            headers=self.auth_headers
-        )
+        product_response = self.catalog.create_product(product_data)
         
         assert product_response.status_code == 201
         product = product_response.json()
-        self.cleanup_data.append({"type": "product", "id": product["id"]})
         
         # Step 4: Create product variations (different sizes and colors)
         variations = [
@@ -109,7 +73,7 @@ class TestProductManagementWorkflow:
                 "productId": product["id"],
                 "size": "S",
                 "color": "White",
-                "sku": "SHIRT-001-S-WHITE",
+                "sku": self.unique.sku("SHIRT-001-S-WHITE"),
                 "isActive": True,
                 "additionalPrice": 0.00,
                 "stockQuantity": 50
@@ -118,7 +82,7 @@ class TestProductManagementWorkflow:
                 "productId": product["id"],
                 "size": "M",
                 "color": "White",
-                "sku": "SHIRT-001-M-WHITE",
+                "sku": self.unique.sku("SHIRT-001-M-WHITE"),
                 "isActive": True,
                 "additionalPrice": 0.00,
                 "stockQuantity": 75
@@ -127,7 +91,7 @@ class TestProductManagementWorkflow:
                 "productId": product["id"],
                 "size": "L",
                 "color": "Blue",
-                "sku": "SHIRT-001-L-BLUE",
+                "sku": self.unique.sku("SHIRT-001-L-BLUE"),
                 "isActive": True,
                 "additionalPrice": 5.00,
                 "stockQuantity": 30
@@ -136,20 +100,15 @@ class TestProductManagementWorkflow:
         
         created_variations = []
         for variation_data in variations:
-            variation_response = requests.post(
-                f"{self.base_url}/products/variations",
-                json=variation_data,
-                headers=self.auth_headers
-            )
+            variation_response = self.catalog.create_variation(variation_data)
             
             assert variation_response.status_code == 201
             variation = variation_response.json()
             created_variations.append(variation)
         
         # Step 5: Verify product with variations
-        product_with_variations_response = requests.get(
-            f"{self.base_url}/products/{product['id']}",
-            headers=self.auth_headers
+        product_with_variations_response = self.client.get(
+            f"/products/{product['id']}"
         )
         
         assert product_with_variations_response.status_code == 200
@@ -169,10 +128,9 @@ class TestProductManagementWorkflow:
             "isActive": True
         }
         
-        update_response = requests.put(
-            f"{self.base_url}/products/{product['id']}",
-            json=update_data,
-            headers=self.auth_headers
+        update_response = self.client.put(
+            f"/products/{product['id']}",
+            json=update_data
         )
         
         assert update_response.status_code == 200
@@ -184,9 +142,8 @@ class TestProductManagementWorkflow:
         assert updated_product["basePrice"] == update_data["basePrice"]
         
         # Step 7: Verify variations are still intact after product update
-        variations_response = requests.get(
-            f"{self.base_url}/products/{product['id']}/variations",
-            headers=self.auth_headers
+        variations_response = self.client.get(
+            f"/products/{product['id']}/variations"
         )
         
         assert variations_response.status_code == 200
@@ -196,9 +153,8 @@ class TestProductManagementWorkflow:
         assert variations_data["totalCount"] == len(variations)
         
         # Step 8: Test category hierarchy retrieval
-        categories_response = requests.get(
-            f"{self.base_url}/categories",
-            headers=self.auth_headers
+        categories_response = self.client.get(
+            "/categories"
         )
         
         assert categories_response.status_code == 200
@@ -218,9 +174,8 @@ class TestProductManagementWorkflow:
         assert parent_found and child_found
         
         # Step 9: Test product search and filtering
-        search_response = requests.get(
-            f"{self.base_url}/products?search=Cotton&categoryId={subcategory['id']}",
-            headers=self.auth_headers
+        search_response = self.client.get(
+            f"/products?search=Cotton&categoryId={subcategory['id']}"
         )
         
         assert search_response.status_code == 200
@@ -240,10 +195,9 @@ class TestProductManagementWorkflow:
         # This would test stock updates, low stock alerts, etc.
         
         # Step 11: Test product deactivation (soft delete)
-        deactivate_response = requests.put(
-            f"{self.base_url}/products/{product['id']}",
-            json={"isActive": False},
-            headers=self.auth_headers
+        deactivate_response = self.client.put(
+            f"/products/{product['id']}",
+            json={"isActive": False}
         )
         
         assert deactivate_response.status_code == 200
@@ -252,9 +206,8 @@ class TestProductManagementWorkflow:
         assert deactivated_product["isActive"] == False
         
         # Step 12: Verify deactivated product doesn't appear in active searches
-        active_search_response = requests.get(
-            f"{self.base_url}/products?isActive=true",
-            headers=self.auth_headers
+        active_search_response = self.client.get(
+            "/products?isActive=true"
         )
         
         assert active_search_response.status_code == 200
@@ -270,9 +223,8 @@ class TestProductManagementWorkflow:
         assert product_not_found
         
         # Step 13: Verify product still appears in all products search
-        all_products_response = requests.get(
-            f"{self.base_url}/products?includeInactive=true",
-            headers=self.auth_headers
+        all_products_response = self.client.get(
+            "/products?includeInactive=true"
         )
         
         assert all_products_response.status_code == 200
@@ -293,52 +245,41 @@ class TestProductManagementWorkflow:
         
         # Create nested category structure
         categories = [
-            {"name": "Apparel", "description": "All clothing items", "parentId": None},
-            {"name": "Tops", "description": "Upper body clothing", "parentId": None},
-            {"name": "Bottoms", "description": "Lower body clothing", "parentId": None}
+            {"name": self.unique.name("Apparel"), "code": self.unique.code("APPAREL"), "description": "All clothing items", "parentId": None},
+            {"name": self.unique.name("Tops"), "code": self.unique.code("TOPS"), "description": "Upper body clothing", "parentId": None},
+            {"name": self.unique.name("Bottoms"), "code": self.unique.code("BOTTOMS"), "description": "Lower body clothing", "parentId": None}
         ]
         
         created_categories = []
         
         # Create parent categories
         for category_data in categories:
-            response = requests.post(
-                f"{self.base_url}/categories",
-                json=category_data,
-                headers=self.auth_headers
-            )
+            response = self.catalog.create_category(category_data)
             
             assert response.status_code == 201
             category = response.json()
             created_categories.append(category)
-            self.cleanup_data.append({"type": "category", "id": category["id"]})
         
         # Create subcategories
         subcategories = [
-            {"name": "T-Shirts", "description": "Casual t-shirts", "parentId": created_categories[1]["id"]},
-            {"name": "Dress Shirts", "description": "Formal shirts", "parentId": created_categories[1]["id"]},
-            {"name": "Jeans", "description": "Denim jeans", "parentId": created_categories[2]["id"]},
-            {"name": "Shorts", "description": "Casual shorts", "parentId": created_categories[2]["id"]}
+            {"name": self.unique.name("T-Shirts"), "code": self.unique.code("TSHIRTS"), "description": "Casual t-shirts", "parentId": created_categories[1]["id"]},
+            {"name": self.unique.name("Dress Shirts"), "code": self.unique.code("DRESSSHIRTS"), "description": "Formal shirts", "parentId": created_categories[1]["id"]},
+            {"name": self.unique.name("Jeans"), "code": self.unique.code("JEANS"), "description": "Denim jeans", "parentId": created_categories[2]["id"]},
+            {"name": self.unique.name("Shorts"), "code": self.unique.code("SHORTS"), "description": "Casual shorts", "parentId": created_categories[2]["id"]}
         ]
         
         created_subcategories = []
         
         for subcategory_data in subcategories:
-            response = requests.post(
-                f"{self.base_url}/categories",
-                json=subcategory_data,
-                headers=self.auth_headers
-            )
+            response = self.catalog.create_category(subcategory_data)
             
             assert response.status_code == 201
             subcategory = response.json()
             created_subcategories.append(subcategory)
-            self.cleanup_data.append({"type": "category", "id": subcategory["id"]})
         
         # Verify hierarchy structure
-        hierarchy_response = requests.get(
-            f"{self.base_url}/categories?includeHierarchy=true",
-            headers=self.auth_headers
+        hierarchy_response = self.client.get(
+            "/categories?includeHierarchy=true"
         )
         
         assert hierarchy_response.status_code == 200
@@ -358,34 +299,29 @@ class TestProductManagementWorkflow:
         """Test product variation management workflow"""
         
         # Create a test category first
-        category_response = requests.post(
-            f"{self.base_url}/categories",
-            json={"name": "Test Category", "description": "Test", "isActive": True},
-            headers=self.auth_headers
-        )
+        category_response = self.catalog.create_category({
+            "name": self.unique.name("Test Category"),
+            "code": self.unique.code("TESTCAT"),
+            "description": "Test",
+            "isActive": True
+        })
         
         assert category_response.status_code == 201
         category = category_response.json()
-        self.cleanup_data.append({"type": "category", "id": category["id"]})
         
         # Create a test product
-        product_response = requests.post(
-            f"{self.base_url}/products",
-            json={
-                "name": "Test Product",
-                "description": "Test product",
-                "sku": "TEST-001",
-                "categoryId": category["id"],
-                "isActive": True,
-                "basePrice": 29.99,
-                "costPrice": 15.00
-            },
-            headers=self.auth_headers
-        )
+        product_response = self.catalog.create_product({
+            "name": "Test Product",
+            "description": "Test product",
+            "sku": self.unique.sku("TEST-001"),
+            "categoryId": category["id"],
+            "isActive": True,
+            "basePrice": 29.99,
+            "costPrice": 15.00
+        })
         
         assert product_response.status_code == 201
         product = product_response.json()
-        self.cleanup_data.append({"type": "product", "id": product["id"]})
         
         # Create multiple variations
         sizes = ["XS", "S", "M", "L", "XL"]
@@ -399,26 +335,21 @@ class TestProductManagementWorkflow:
                     "productId": product["id"],
                     "size": size,
                     "color": color,
-                    "sku": f"TEST-001-{size}-{color}",
+                    "sku": self.unique.sku(f"TEST-001-{size}-{color}"),
                     "isActive": True,
                     "additionalPrice": 0.00,
                     "stockQuantity": 100
                 }
                 
-                response = requests.post(
-                    f"{self.base_url}/products/variations",
-                    json=variation_data,
-                    headers=self.auth_headers
-                )
+                response = self.catalog.create_variation(variation_data)
                 
                 assert response.status_code == 201
                 variation = response.json()
                 created_variations.append(variation)
         
         # Verify all variations were created
-        variations_response = requests.get(
-            f"{self.base_url}/products/{product['id']}/variations",
-            headers=self.auth_headers
+        variations_response = self.client.get(
+            f"/products/{product['id']}/variations"
         )
         
         assert variations_response.status_code == 200
@@ -428,9 +359,8 @@ class TestProductManagementWorkflow:
         assert len(variations_data["variations"]) == len(created_variations)
         
         # Test variation filtering
-        filtered_response = requests.get(
-            f"{self.base_url}/products/{product['id']}/variations?size=M&color=Blue",
-            headers=self.auth_headers
+        filtered_response = self.client.get(
+            f"/products/{product['id']}/variations?size=M&color=Blue"
         )
         
         assert filtered_response.status_code == 200
@@ -448,10 +378,9 @@ class TestProductManagementWorkflow:
             "isActive": True
         }
         
-        update_response = requests.put(
-            f"{self.base_url}/products/variations/{update_variation['id']}",
-            json=update_data,
-            headers=self.auth_headers
+        update_response = self.client.put(
+            f"/products/variations/{update_variation['id']}",
+            json=update_data
         )
         
         assert update_response.status_code == 200
@@ -464,43 +393,34 @@ class TestProductManagementWorkflow:
         """Test error handling and validation in product management workflow"""
         
         # Test duplicate SKU creation
-        category_response = requests.post(
-            f"{self.base_url}/categories",
-            json={"name": "Test Category", "description": "Test", "isActive": True},
-            headers=self.auth_headers
-        )
+        category_response = self.catalog.create_category({
+            "name": self.unique.name("Test Category"),
+            "code": self.unique.code("TESTCAT"),
+            "description": "Test",
+            "isActive": True
+        })
         
         assert category_response.status_code == 201
         category = category_response.json()
-        self.cleanup_data.append({"type": "category", "id": category["id"]})
         
         # Create first product
         product_data = {
             "name": "Test Product",
             "description": "Test product",
-            "sku": "DUPLICATE-SKU-TEST",
+            "sku": self.unique.sku("DUPLICATE-SKU-TEST"),
             "categoryId": category["id"],
             "isActive": True,
             "basePrice": 29.99,
             "costPrice": 15.00
         }
         
-        first_response = requests.post(
-            f"{self.base_url}/products",
-            json=product_data,
-            headers=self.auth_headers
-        )
+        first_response = self.catalog.create_product(product_data)
         
         assert first_response.status_code == 201
         first_product = first_response.json()
-        self.cleanup_data.append({"type": "product", "id": first_product["id"]})
         
         # Try to create second product with same SKU
-        second_response = requests.post(
-            f"{self.base_url}/products",
-            json=product_data,
-            headers=self.auth_headers
-        )
+        second_response = self.catalog.create_product(product_data)
         
         assert second_response.status_code == 400
         error_data = second_response.json()
@@ -510,18 +430,14 @@ class TestProductManagementWorkflow:
         invalid_product_data = {
             "name": "Invalid Product",
             "description": "Invalid product",
-            "sku": "INVALID-SKU",
+            "sku": self.unique.sku("INVALID-SKU"),
             "categoryId": "invalid-category-id",
             "isActive": True,
             "basePrice": 29.99,
             "costPrice": 15.00
         }
         
-        invalid_response = requests.post(
-            f"{self.base_url}/products",
-            json=invalid_product_data,
-            headers=self.auth_headers
-        )
+        invalid_response = self.catalog.create_product(invalid_product_data)
         
         assert invalid_response.status_code == 400 or invalid_response.status_code == 404
         
@@ -534,11 +450,7 @@ class TestProductManagementWorkflow:
             "costPrice": -5.00    # Negative cost
         }
         
-        validation_response = requests.post(
-            f"{self.base_url}/products",
-            json=validation_errors_data,
-            headers=self.auth_headers
-        )
+        validation_response = self.catalog.create_product(validation_errors_data)
         
         assert validation_response.status_code == 400
 
@@ -0,0 +1,55 @@
+"""
+Burst tests for the rate-limited endpoints
+Fires many more concurrent requests than a limit allows from one client and
+checks the limit is exact: every allowed request is admitted, no more, and
+rejected requests do not push the next admission further out
+
+Against the default stand-in server these tests exercise its Python (support/stub_*)
+reimplementation of the limit, not the backend's GCRA limiter; pass
+--api-base-url to run them against a real deployment
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+SEND_ALERTS_PATH = "/inventory/alerts/low-stock/send"
+# SensitiveOperationRateLimit: 10 requests per 60 seconds
+LIMIT = 10
+WINDOW_S = 60
+CLIENTS = 16
+ATTEMPTS = LIMIT * 5
+
+
+class TestSensitiveOperationRateLimit:
+    """Concurrent bursts against POST /inventory/alerts/low-stock/send"""
+
+    @pytest.fixture(autouse=True)
+    def setup_client(self, api_client):
+        self.client = api_client
+
+    def _burst(self, attempts: int) -> List:
+        with ThreadPoolExecutor(max_workers=CLIENTS) as executor:
+            return list(executor.map(lambda _: self.client.post(SEND_ALERTS_PATH), range(attempts)))
+
+    def test_burst_admits_exactly_the_limit(self):
+        """Of a concurrent burst, exactly LIMIT requests get through and the rest are told when to retry"""
+        responses = self._burst(ATTEMPTS)
+        admitted = [r for r in responses if r.status_code != 429]
+        rejected = [r for r in responses if r.status_code == 429]
+        if not admitted:
+            pytest.skip("The allowance is still spent by an earlier run; retry after the window")
+
+        assert len(admitted) == LIMIT, f"{len(admitted)} of {ATTEMPTS} requests admitted, expected {LIMIT}"
+        assert all(r.status_code == 200 for r in admitted)
+        assert len(rejected) == ATTEMPTS - LIMIT
+        assert sorted(int(r.headers["X-RateLimit-Remaining"]) for r in admitted) == list(range(LIMIT))
+
+        # The allowance refills one request per WINDOW_S / LIMIT however many rejections came in,
+        # so no client is locked out for longer than that by hammering
+        refill_s = math.ceil(WINDOW_S / LIMIT)
+        for response in rejected:
+            assert response.headers["X-RateLimit-Remaining"] == "0"
+            assert 1 <= int(response.headers["Retry-After"]) <= refill_s
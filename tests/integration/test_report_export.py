@@ -0,0 +1,103 @@
+"""
+Report export tests
+Runs an inventory export job through queued -> completed, downloads the
+file, and streams the same dataset as gzip'd JSON Lines, checking the rows
+match the stock created for the test
+
+Against the default stand-in server these tests exercise its Python (support/stub_*)
+reimplementation of the exports, not the backend's export engine; pass
+--api-base-url to run them against a real deployment
+"""
+
+import csv
+import gzip
+import io
+import json
+import time
+import uuid
+
+import pytest
+
+EXPORT_TIMEOUT_S = 120.0
+POLL_INTERVAL_S = 0.5
+INVENTORY_COLUMNS = ["InventoryId", "BranchCode", "WarehouseCode", "ProductSku", "ProductName", "Quantity",
+                     "ReservedQuantity", "AvailableQuantity", "UnitCost", "LastUpdated"]
+
+
+class TestReportExport:
+    """Export jobs and streamed exports over /reporting/export"""
+
+    @pytest.fixture(autouse=True)
+    def setup_inventory(self, api_client, stocked_inventory, branch_id):
+        """Stock one product at the branch so the branch's inventory export has a known row"""
+        self.client = api_client
+        self.branch_id = branch_id
+        inventory = stocked_inventory(42, "Export")
+        self.inventory_id = inventory["id"]
+        self.sku = inventory["sku"]
+
+    def _wait_for(self, file_id: str) -> dict:
+        deadline = time.monotonic() + EXPORT_TIMEOUT_S
+        while True:
+            response = self.client.get(f"/reporting/export/{file_id}/status")
+            assert response.status_code == 200
+            status = response.json()
+            if status["status"] in ("Completed", "Failed") or time.monotonic() > deadline:
+                return status
+            time.sleep(POLL_INTERVAL_S)
+
+    def test_csv_export_job_completes_and_downloads(self):
+        """A queued CSV export finishes, reports its row count and downloads as that many rows"""
+        response = self.client.post("/reporting/export", json={
+            "reportType": "Inventory",
+            "format": "csv",
+            "branchId": self.branch_id
+        })
+        assert response.status_code == 202, response.text
+        job = response.json()
+        assert job["status"] in ("Queued", "Running", "Completed")
+
+        status = self._wait_for(job["fileId"])
+        assert status["status"] == "Completed", status.get("error")
+        assert status["fileName"].endswith(".csv")
+
+        download = self.client.get(f"/reporting/export/{job['fileId']}/download")
+        assert download.status_code == 200
+        assert download.headers["Content-Type"].startswith("text/csv")
+        assert len(download.content) == status["bytesWritten"]
+
+        rows = list(csv.reader(io.StringIO(download.content.decode("utf-8"))))
+        assert rows[0] == INVENTORY_COLUMNS
+        assert len(rows) - 1 == status["rowsWritten"]
+        ours = [row for row in rows[1:] if row[0] == self.inventory_id]
+        assert len(ours) == 1
+        assert ours[0][3] == self.sku
+        assert int(ours[0][5]) == 42
+
+    def test_jsonl_stream_matches_inventory(self):
+        """The streamed export is gzip'd JSON Lines, one object per inventory row"""
+        response = self.client.get("/reporting/export/stream", params={
+            "reportType": "inventory",
+            "format": "jsonl",
+            "branchId": self.branch_id
+        })
+        assert response.status_code == 200, response.text
+        assert response.headers["Content-Type"].startswith("application/gzip")
+
+        records = [json.loads(line) for line in gzip.decompress(response.content).decode("utf-8").splitlines()]
+        assert records and all(record["branchCode"] is not None for record in records)
+        ours = [record for record in records if record["inventoryId"] == self.inventory_id]
+        assert len(ours) == 1
+        assert ours[0]["productSku"] == self.sku
+        assert ours[0]["availableQuantity"] == 42
+
+    def test_unsupported_exports_are_rejected(self):
+        """Unknown formats and streamed Parquet are validation errors, and unknown jobs are not found"""
+        response = self.client.post("/reporting/export", json={"reportType": "Inventory", "format": "pdf"})
+        assert response.status_code == 400
+
+        response = self.client.get("/reporting/export/stream", params={"reportType": "inventory", "format": "parquet"})
+        assert response.status_code == 400
+
+        response = self.client.get(f"/reporting/export/{uuid.uuid4()}/status")
+        assert response.status_code == 404
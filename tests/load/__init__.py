@@ -0,0 +1,5 @@
+"""
+Load-generation harness replaying the product management workflows
+Run from the tests directory: python -m load --users 500 --duration 60
+Real-time dashboard subscribers: python -m load.dashboard --subscribers 2000 --stub
+"""
@@ -0,0 +1,82 @@
+"""
+Command-line entry point for the load harness
+
+Example (SC-005, 500 concurrent users for five minutes):
+    cd tests && python -m load --users 500 --duration 300 --output load-report.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+from support.api_client import DEFAULT_BASE_URL
+from support.stub_server import StubApiServer
+from load.runner import LoadConfig, LoadRunner
+from load.stats import format_report
+
+
+def _parse_weights(values: List[str]) -> Dict[str, int]:
+    weights = {}
+    for value in values:
+        name, _, weight = value.partition("=")
+        if not weight.isdigit():
+            raise argparse.ArgumentTypeError(f"Expected NAME=WEIGHT, got {value!r}")
+        weights[name] = int(weight)
+    return weights
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m load", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.environ.get("NCS_API_BASE_URL", DEFAULT_BASE_URL))
+    parser.add_argument("--users", type=int, default=50, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=60.0, help="Run time in seconds")
+    parser.add_argument("--spawn-rate", type=float, default=50.0, help="Users started per second")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Mean pause between scenarios in seconds")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible scenario selection")
+    parser.add_argument("--weight", action="append", default=[], metavar="NAME=WEIGHT",
+                        help="Override a scenario weight (browse, search, workflow); 0 disables it")
+    parser.add_argument("--stub", action="store_true",
+                        help="Run against an in-process stand-in server instead of --base-url")
+    parser.add_argument("--stub-products", type=int, default=5000, help="Products seeded into the stand-in server")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="Exit non-zero when the overall error rate exceeds this fraction")
+    args = parser.parse_args(argv)
+
+    try:
+        config = LoadConfig(
+            base_url=args.base_url,
+            users=args.users,
+            duration_s=args.duration,
+            spawn_rate=args.spawn_rate,
+            think_time_s=args.think_time,
+            seed=args.seed,
+            weights=_parse_weights(args.weight)
+        )
+        runner = LoadRunner(config)
+    except (ValueError, argparse.ArgumentTypeError) as ex:
+        parser.error(str(ex))
+
+    if args.stub:
+        with StubApiServer(seed_products=args.stub_products) as server:
+            config.base_url = server.base_url
+            report = runner.run()
+    else:
+        report = runner.run()
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.max_error_rate is not None and report["total"]["errorRate"] > args.max_error_rate:
+        print(f"Error rate {report['total']['errorRate']:.2%} exceeds {args.max_error_rate:.2%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Subscriber load test for the real-time dashboard stream
+Holds many Server-Sent Events subscriptions open on /reporting/dashboard/realtime/stream,
+drives low-stock changes on one inventory row by alternately reserving and releasing a
+unit across the threshold, and measures how long each change takes to reach every
+subscriber. A run should show delivery latency staying flat as subscribers grow.
+
+Example (2,000 dashboards against the stand-in server):
+    cd tests && python -m load.dashboard --subscribers 2000 --events 100 --stub
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from support.api_client import DEFAULT_BASE_URL, AsyncApiClient
+from support.perf_budget import percentile
+from support.stub_server import StubApiServer
+
+STREAM_PATH = "/reporting/dashboard/realtime/stream"
+LOW_STOCK_THRESHOLD = 10
+
+
+class DashboardLoadConfig:
+    """Settings for one subscriber load run"""
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        subscribers: int = 500,
+        events: int = 50,
+        event_interval_s: float = 0.1,
+        connect_rate: float = 200.0,
+        branch_id: Optional[str] = None,
+        low_stock_threshold: int = LOW_STOCK_THRESHOLD,
+        settle_s: float = 5.0
+    ):
+        if subscribers < 1:
+            raise ValueError("subscribers must be at least 1")
+        if events < 1:
+            raise ValueError("events must be at least 1")
+        if connect_rate <= 0:
+            raise ValueError("connect_rate must be positive")
+
+        self.base_url = base_url
+        self.subscribers = subscribers
+        self.events = events
+        self.event_interval_s = event_interval_s
+        self.connect_rate = connect_rate
+        # The stand-in accepts any branch; the real API needs an existing one
+        self.branch_id = branch_id or str(uuid.uuid4())
+        self.low_stock_threshold = low_stock_threshold
+        self.settle_s = settle_s
+
+
+class Subscriber:
+    """One dashboard connection: when it got its snapshot and when each stock delta arrived"""
+
+    def __init__(self):
+        self.connect_ms: Optional[float] = None
+        self.arrivals: List[float] = []
+        self.error: Optional[str] = None
+        self.connected = asyncio.Event()
+
+
+async def _follow(client: AsyncApiClient, config: DashboardLoadConfig, subscriber: Subscriber) -> None:
+    started = time.perf_counter()
+    event = None
+    try:
+        async with client.client.stream("GET", STREAM_PATH.lstrip("/"), params={"locationId": config.branch_id},
+                                        headers={"Accept": "text/event-stream"}, timeout=None) as response:
+            if response.status_code != 200:
+                subscriber.error = f"HTTP {response.status_code}"
+                return
+            async for line in response.aiter_lines():
+                if line.startswith("event:"):
+                    event = line[6:].strip()
+                elif line.startswith("data:") and event == "snapshot":
+                    subscriber.connect_ms = (time.perf_counter() - started) * 1000.0
+                    subscriber.connected.set()
+                elif line.startswith("data:") and event == "delta":
+                    delta = json.loads(line[5:])
+                    if delta.get("eventType") == "stock" and delta.get("branchId") == config.branch_id:
+                        subscriber.arrivals.append(time.perf_counter())
+    except asyncio.CancelledError:
+        raise
+    except Exception as ex:
+        subscriber.error = type(ex).__name__
+    finally:
+        subscriber.connected.set()
+
+
+class DashboardLoadRunner:
+    """Connects the subscribers, produces the events and collects delivery statistics"""
+
+    def __init__(self, config: DashboardLoadConfig):
+        self.config = config
+
+    async def _create_inventory(self, client: AsyncApiClient) -> Dict[str, str]:
+        tag = uuid.uuid4().hex[:8].upper()
+        category = await client.post("/categories", json={
+            "name": f"Dashboard Load {tag}", "code": f"DASH-{tag}", "description": "Dashboard load test",
+            "isActive": True, "parentId": None
+        })
+        category.raise_for_status()
+        product = await client.post("/products", json={
+            "name": "Dashboard Load Tee", "description": "Stock toggled across the low-stock threshold",
+            "sku": f"DASH-TEE-{tag}", "categoryId": category.json()["id"], "isActive": True,
+            "basePrice": 19.99, "costPrice": 7.5
+        })
+        product.raise_for_status()
+        # One unit above the threshold, so each reservation makes it low and each release clears it
+        inventory = await client.post("/inventory", json={
+            "productId": product.json()["id"], "branchId": self.config.branch_id,
+            "quantity": self.config.low_stock_threshold + 1, "unitCost": 7.5,
+            "reason": "Dashboard load test stock", "createdByUserId": str(uuid.uuid4())
+        })
+        inventory.raise_for_status()
+        return {"category": category.json()["id"], "product": product.json()["id"], "inventory": inventory.json()["id"]}
+
+    async def _produce(self, client: AsyncApiClient, inventory_id: str) -> List[float]:
+        """Toggle the row across the threshold; returns when each change was sent"""
+        user_id = str(uuid.uuid4())
+        sent = []
+        for index in range(self.config.events):
+            action, user_field = ("reserve", "reservedByUserId") if index % 2 == 0 else ("release", "releasedByUserId")
+            started = time.perf_counter()
+            response = await client.post(f"/inventory/{inventory_id}/{action}",
+                                         json={"quantity": 1, "reason": "Dashboard load test", user_field: user_id})
+            response.raise_for_status()
+            sent.append(started)
+            await asyncio.sleep(self.config.event_interval_s)
+        return sent
+
+    async def run_async(self) -> Dict[str, Any]:
+        config = self.config
+        subscribers = [Subscriber() for _ in range(config.subscribers)]
+
+        async with AsyncApiClient(config.base_url, pool_size=config.subscribers + 4) as client:
+            created = await self._create_inventory(client)
+            tasks = []
+            try:
+                for subscriber in subscribers:
+                    tasks.append(asyncio.create_task(_follow(client, config, subscriber)))
+                    await asyncio.sleep(1.0 / config.connect_rate)
+                await asyncio.gather(*(subscriber.connected.wait() for subscriber in subscribers))
+
+                started = time.monotonic()
+                sent = await self._produce(client, created["inventory"])
+                await asyncio.sleep(config.settle_s)
+                elapsed = time.monotonic() - started
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await client.delete_many([f"/inventory/{created['inventory']}"])
+                await client.delete_many([f"/products/{created['product']}"])
+                await client.delete_many([f"/categories/{created['category']}"])
+
+        return self._report(subscribers, sent, elapsed)
+
+    def _report(self, subscribers: List[Subscriber], sent: List[float], elapsed_s: float) -> Dict[str, Any]:
+        connected = [s for s in subscribers if s.connect_ms is not None and s.error is None]
+        # The k-th delta a subscriber sees is the k-th change produced: one producer, sent in order
+        latencies = [
+            (arrival - sent[index]) * 1000.0
+            for subscriber in connected
+            for index, arrival in enumerate(subscriber.arrivals[:len(sent)])
+        ]
+        expected = len(connected) * len(sent)
+        connect_ms = [s.connect_ms for s in connected]
+        errors: Dict[str, int] = {}
+        for subscriber in subscribers:
+            if subscriber.error:
+                errors[subscriber.error] = errors.get(subscriber.error, 0) + 1
+
+        return {
+            "subscribers": len(subscribers),
+            "connected": len(connected),
+            "errors": errors,
+            "connectP50Ms": percentile(connect_ms, 50),
+            "connectP95Ms": percentile(connect_ms, 95),
+            "events": len(sent),
+            "deliveriesExpected": expected,
+            "deliveriesReceived": len(latencies),
+            "deliveryRate": len(latencies) / expected if expected else 0.0,
+            "deliveriesPerSecond": len(latencies) / elapsed_s if elapsed_s > 0 else 0.0,
+            "latencyP50Ms": percentile(latencies, 50),
+            "latencyP95Ms": percentile(latencies, 95),
+            "latencyP99Ms": percentile(latencies, 99),
+            "latencyMaxMs": max(latencies, default=0.0)
+        }
+
+    def run(self) -> Dict[str, Any]:
+        return asyncio.run(self.run_async())
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a report as aligned lines"""
+    return "\n".join([
+        f"Subscribers        {report['connected']}/{report['subscribers']} connected"
+        + (f" (errors: {report['errors']})" if report["errors"] else ""),
+        f"Connect            p50 {report['connectP50Ms']:.1f}ms  p95 {report['connectP95Ms']:.1f}ms",
+        f"Deliveries         {report['deliveriesReceived']}/{report['deliveriesExpected']} "
+        f"({report['deliveryRate']:.2%}, {report['deliveriesPerSecond']:.0f}/s) for {report['events']} events",
+        f"Delivery latency   p50 {report['latencyP50Ms']:.1f}ms  p95 {report['latencyP95Ms']:.1f}ms  "
+        f"p99 {report['latencyP99Ms']:.1f}ms  max {report['latencyMaxMs']:.1f}ms"
+    ])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m load.dashboard", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.environ.get("NCS_API_BASE_URL", DEFAULT_BASE_URL))
+    parser.add_argument("--subscribers", type=int, default=500, help="Concurrent dashboard streams")
+    parser.add_argument("--events", type=int, default=50, help="Low-stock changes to produce")
+    parser.add_argument("--event-interval", type=float, default=0.1, help="Pause between changes in seconds")
+    parser.add_argument("--connect-rate", type=float, default=200.0, help="Streams opened per second")
+    parser.add_argument("--branch-id", default=os.environ.get("NCS_BRANCH_ID"),
+                        help="Existing branch to stock the test row at (required against the real API)")
+    parser.add_argument("--low-stock-threshold", type=int, default=LOW_STOCK_THRESHOLD,
+                        help="The server's RealTimeDashboard:LowStockThreshold")
+    parser.add_argument("--settle", type=float, default=5.0, help="Seconds to wait for late deliveries")
+    parser.add_argument("--stub", action="store_true",
+                        help="Run against an in-process stand-in server instead of --base-url")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--min-delivery-rate", type=float, default=None,
+                        help="Exit non-zero when fewer than this fraction of deliveries arrive")
+    args = parser.parse_args(argv)
+
+    try:
+        config = DashboardLoadConfig(
+            base_url=args.base_url,
+            subscribers=args.subscribers,
+            events=args.events,
+            event_interval_s=args.event_interval,
+            connect_rate=args.connect_rate,
+            branch_id=args.branch_id,
+            low_stock_threshold=args.low_stock_threshold,
+            settle_s=args.settle
+        )
+    except ValueError as ex:
+        parser.error(str(ex))
+
+    runner = DashboardLoadRunner(config)
+    if args.stub:
+        with StubApiServer(seed_products=0) as server:
+            config.base_url = server.base_url
+            report = runner.run()
+    else:
+        report = runner.run()
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.min_delivery_rate is not None and report["deliveryRate"] < args.min_delivery_rate:
+        print(f"Delivery rate {report['deliveryRate']:.2%} is below {args.min_delivery_rate:.2%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Asyncio load runner: spawns virtual users that loop over weighted scenarios
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from support.api_client import AsyncApiClient, DEFAULT_BASE_URL
+from load.scenarios import LoadSession, Scenario, select_scenarios
+from load.stats import LoadStats
+
+
+class LoadConfig:
+    """Settings for one load run"""
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        users: int = 50,
+        duration_s: float = 60.0,
+        spawn_rate: float = 50.0,
+        think_time_s: float = 1.0,
+        seed: Optional[int] = None,
+        weights: Optional[Dict[str, int]] = None
+    ):
+        if users < 1:
+            raise ValueError("users must be at least 1")
+        if spawn_rate <= 0:
+            raise ValueError("spawn_rate must be positive")
+
+        self.base_url = base_url
+        self.users = users
+        self.duration_s = duration_s
+        self.spawn_rate = spawn_rate
+        self.think_time_s = think_time_s
+        self.seed = seed
+        self.weights = weights
+
+
+class LoadRunner:
+    """Runs weighted scenarios at a fixed concurrency for a fixed duration"""
+
+    def __init__(self, config: LoadConfig, scenarios: Optional[List[Scenario]] = None):
+        self.config = config
+        self.scenarios = scenarios or select_scenarios(config.weights)
+        self.stats = LoadStats()
+        self.iterations: Dict[str, int] = {scenario.name: 0 for scenario in self.scenarios}
+
+    async def _user(self, client: AsyncApiClient, user_index: int, deadline: float) -> None:
+        seed = None if self.config.seed is None else self.config.seed + user_index
+        rng = random.Random(seed)
+        session = LoadSession(client, self.stats, rng)
+        weights = [scenario.weight for scenario in self.scenarios]
+
+        while time.monotonic() < deadline:
+            scenario = rng.choices(self.scenarios, weights=weights)[0]
+            await scenario.run(session)
+            self.iterations[scenario.name] += 1
+            if self.config.think_time_s > 0:
+                # Exponential think time keeps arrivals from synchronising
+                await asyncio.sleep(min(rng.expovariate(1.0 / self.config.think_time_s),
+                                        max(0.0, deadline - time.monotonic())))
+
+    async def run_async(self) -> Dict[str, Any]:
+        started = time.monotonic()
+        deadline = started + self.config.duration_s
+
+        async with AsyncApiClient(self.config.base_url, pool_size=self.config.users) as client:
+            tasks = []
+            for index in range(self.config.users):
+                tasks.append(asyncio.create_task(self._user(client, index, deadline)))
+                await asyncio.sleep(1.0 / self.config.spawn_rate)
+            await asyncio.gather(*tasks)
+
+        report = self.stats.report(time.monotonic() - started)
+        report["users"] = self.config.users
+        report["scenarioIterations"] = dict(self.iterations)
+        return report
+
+    def run(self) -> Dict[str, Any]:
+        return asyncio.run(self.run_async())
@@ -0,0 +1,161 @@
+"""
+Weighted user scenarios replaying the product management workflows
+Each scenario is a coroutine taking a LoadSession
+"""
+
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from support.api_client import AsyncApiClient
+from load.stats import LoadStats
+
+SEARCH_TERMS = ["Cotton", "Shirt", "Denim", "Jacket", "Dress", "Wool", "Linen", "Sport"]
+
+
+class LoadSession:
+    """One virtual user: times every call under a templated endpoint name"""
+
+    def __init__(self, client: AsyncApiClient, stats: LoadStats, rng: random.Random):
+        self.client = client
+        self.stats = stats
+        self.rng = rng
+        self.suffix = uuid.uuid4().hex[:10].upper()
+
+    async def call(self, method: str, path: str, name: Optional[str] = None, expected=(200, 201, 204), **kwargs: Any):
+        """Issue a request and record it; returns the response or None on transport errors"""
+        start = time.perf_counter()
+        response = None
+        try:
+            response = await self.client.request(method, path, **kwargs)
+        except Exception:
+            pass
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        status_code = response.status_code if response is not None else None
+        self.stats.record(f"{method} {name or path}", elapsed_ms, status_code, status_code in expected)
+        return response
+
+    def unique(self, prefix: str) -> str:
+        return f"{prefix}-{self.suffix}-{uuid.uuid4().hex[:6].upper()}"
+
+
+def _json(response) -> Dict[str, Any]:
+    if response is None or response.status_code not in (200, 201):
+        return {}
+    try:
+        return response.json()
+    except ValueError:
+        return {}
+
+
+async def catalog_workflow(session: LoadSession) -> None:
+    """Merchandiser flow from test_complete_product_catalog_workflow"""
+    parent = _json(await session.call("POST", "/categories", json={
+        "name": session.unique("Clothing"),
+        "description": "Main clothing category",
+        "isActive": True,
+        "parentId": None
+    }))
+    if "id" not in parent:
+        return
+
+    subcategory = _json(await session.call("POST", "/categories", json={
+        "name": session.unique("Shirts"),
+        "description": "Casual and formal shirts",
+        "isActive": True,
+        "parentId": parent["id"]
+    }))
+    category_ids = [c["id"] for c in (subcategory, parent) if "id" in c]
+
+    product_sku = session.unique("SHIRT")
+    product = _json(await session.call("POST", "/products", json={
+        "name": "Classic Cotton Shirt",
+        "description": "Comfortable cotton shirt for everyday wear",
+        "sku": product_sku,
+        "categoryId": category_ids[0],
+        "isActive": True,
+        "basePrice": 49.99,
+        "costPrice": 25.00
+    }))
+
+    if "id" in product:
+        product_path = f"/products/{product['id']}"
+        for size, color in (("S", "White"), ("M", "White"), ("L", "Blue")):
+            await session.call("POST", "/products/variations", json={
+                "productId": product["id"],
+                "size": size,
+                "color": color,
+                "sku": f"{product_sku}-{size}-{color.upper()}",
+                "isActive": True,
+                "additionalPrice": 0.00,
+                "stockQuantity": 50
+            })
+
+        await session.call("GET", product_path, name="/products/{id}")
+        await session.call("PUT", product_path, name="/products/{id}", json={
+            "name": "Premium Cotton Shirt",
+            "description": "Premium quality cotton shirt with enhanced comfort",
+            "basePrice": 59.99,
+            "isActive": True
+        })
+        await session.call("GET", f"{product_path}/variations", name="/products/{id}/variations")
+        await session.call("GET", "/products", name="/products?search&categoryId",
+                           params={"search": "Cotton", "categoryId": category_ids[0]})
+        await session.call("PUT", product_path, name="/products/{id}", json={"isActive": False})
+        await session.call("GET", "/products", name="/products?isActive", params={"isActive": "true"})
+        await session.call("DELETE", product_path, name="/products/{id}")
+
+    for category_id in category_ids:
+        await session.call("DELETE", f"/categories/{category_id}", name="/categories/{id}")
+
+
+async def browse_catalog(session: LoadSession) -> None:
+    """POS catalog browsing: categories, a product page, then a product detail"""
+    await session.call("GET", "/categories")
+    page = session.rng.randint(1, 5)
+    listing = _json(await session.call("GET", "/products", name="/products?page",
+                                       params={"pageNumber": page, "pageSize": 20}))
+    products = listing.get("products") or []
+    if products:
+        product = session.rng.choice(products)
+        await session.call("GET", f"/products/{product['id']}", name="/products/{id}")
+        await session.call("GET", f"/products/{product['id']}/variations", name="/products/{id}/variations")
+
+
+async def search_products(session: LoadSession) -> None:
+    """Shop-floor product lookups by free-text search"""
+    term = session.rng.choice(SEARCH_TERMS)
+    await session.call("GET", "/products", name="/products?search", params={"search": term})
+
+
+class Scenario(NamedTuple):
+    name: str
+    weight: int
+    run: Callable[[LoadSession], Awaitable[None]]
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("browse", 6, browse_catalog),
+    Scenario("search", 3, search_products),
+    Scenario("workflow", 1, catalog_workflow)
+]
+
+
+def select_scenarios(weights: Optional[Dict[str, int]] = None) -> List[Scenario]:
+    """Default scenarios, with weights overridden by name (weight 0 disables one)"""
+    if not weights:
+        return list(SCENARIOS)
+
+    unknown = set(weights) - {scenario.name for scenario in SCENARIOS}
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    selected = [
+        scenario._replace(weight=weights.get(scenario.name, scenario.weight))
+        for scenario in SCENARIOS
+    ]
+    enabled = [scenario for scenario in selected if scenario.weight > 0]
+    if not enabled:
+        raise ValueError("At least one scenario needs a positive weight")
+    return enabled
@@ -0,0 +1,82 @@
+"""
+Per-endpoint latency, throughput and error-rate statistics for load runs
+"""
+
+from typing import Any, Dict, List, Optional
+
+from support.perf_budget import percentile
+
+
+class EndpointStats:
+    """Latency samples and failures recorded for one endpoint"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies_ms: List[float] = []
+        self.errors = 0
+        self.status_codes: Dict[int, int] = {}
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_ms)
+
+    def record(self, latency_ms: float, status_code: Optional[int], ok: bool) -> None:
+        self.latencies_ms.append(latency_ms)
+        if status_code is not None:
+            self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+        if not ok:
+            self.errors += 1
+
+    def summary(self, elapsed_s: float) -> Dict[str, Any]:
+        return {
+            "endpoint": self.name,
+            "requests": self.requests,
+            "errors": self.errors,
+            "errorRate": self.errors / self.requests if self.requests else 0.0,
+            "throughput": self.requests / elapsed_s if elapsed_s > 0 else 0.0,
+            "p50Ms": percentile(self.latencies_ms, 50),
+            "p95Ms": percentile(self.latencies_ms, 95),
+            "p99Ms": percentile(self.latencies_ms, 99),
+            "maxMs": max(self.latencies_ms, default=0.0),
+            "statusCodes": {str(code): count for code, count in sorted(self.status_codes.items())}
+        }
+
+
+class LoadStats:
+    """Collects endpoint statistics for a whole load run"""
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointStats] = {}
+
+    def record(self, name: str, latency_ms: float, status_code: Optional[int], ok: bool) -> None:
+        if name not in self.endpoints:
+            self.endpoints[name] = EndpointStats(name)
+        self.endpoints[name].record(latency_ms, status_code, ok)
+
+    def total(self) -> EndpointStats:
+        total = EndpointStats("TOTAL")
+        for stats in self.endpoints.values():
+            total.latencies_ms.extend(stats.latencies_ms)
+            total.errors += stats.errors
+            for code, count in stats.status_codes.items():
+                total.status_codes[code] = total.status_codes.get(code, 0) + count
+        return total
+
+    def report(self, elapsed_s: float) -> Dict[str, Any]:
+        return {
+            "elapsedSeconds": elapsed_s,
+            "endpoints": [self.endpoints[name].summary(elapsed_s) for name in sorted(self.endpoints)],
+            "total": self.total().summary(elapsed_s)
+        }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a report as a fixed-width table"""
+    header = f"{'Endpoint':<40} {'Reqs':>8} {'Err%':>7} {'Req/s':>9} {'p50':>9} {'p95':>9} {'p99':>9}"
+    lines = [header, "-" * len(header)]
+    for row in report["endpoints"] + [report["total"]]:
+        lines.append(
+            f"{row['endpoint']:<40} {row['requests']:>8} {row['errorRate'] * 100:>6.2f}% "
+            f"{row['throughput']:>9.1f} {row['p50Ms']:>7.1f}ms {row['p95Ms']:>7.1f}ms {row['p99Ms']:>7.1f}ms"
+        )
+    return "\n".join(lines)
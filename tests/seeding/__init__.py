@@ -0,0 +1,4 @@
+"""
+Deterministic bulk seeding of production-scale catalog, inventory and sales data
+Run from the tests directory: python -m seeding --help
+"""
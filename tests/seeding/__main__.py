@@ -0,0 +1,91 @@
+"""
+Command-line entry point for the bulk seeding tool
+
+Examples:
+    cd tests && python -m seeding --target postgres --dsn postgresql://ncs@localhost/ncs --truncate
+    cd tests && python -m seeding --target csv --out seed-data --products 1000000 --sales 5000000
+    cd tests && python -m seeding --target api --stub --products 500 --table Categories --table Products
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from support.api_client import DEFAULT_BASE_URL
+from support.stub_server import StubApiServer
+from seeding.generator import CatalogGenerator, SeedSpec
+from seeding.sinks import ApiSink, CsvSink, PostgresCopySink, select_tables
+
+
+def _progress(table: str, rows: int, elapsed: float) -> None:
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"  {table:<24} {rows:>12,} rows  {rate:>12,.0f} rows/s", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m seeding", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=["postgres", "csv", "api"], default="csv")
+    parser.add_argument("--dsn", default=os.environ.get("NCS_DATABASE_URL"), help="PostgreSQL connection string")
+    parser.add_argument("--truncate", action="store_true", help="Truncate the selected tables before COPY")
+    parser.add_argument("--out", default="seed-data", help="Output directory for the csv target")
+    parser.add_argument("--base-url", default=os.environ.get("NCS_API_BASE_URL", DEFAULT_BASE_URL))
+    parser.add_argument("--stub", action="store_true", help="Load into an in-process stand-in server (api target)")
+    parser.add_argument("--concurrency", type=int, default=32, help="In-flight requests for the api target")
+    parser.add_argument("--table", action="append", dest="tables", metavar="NAME",
+                        help="Only load this table (repeatable); parents are not added automatically")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--category-depth", type=int, default=4)
+    parser.add_argument("--category-fanout", type=int, default=6)
+    parser.add_argument("--branches", type=int, default=20)
+    parser.add_argument("--inventory-branches", type=int, default=5, help="Branches stocking each product")
+    parser.add_argument("--sales", type=int, default=200_000)
+    parser.add_argument("--sales-days", type=int, default=365)
+    args = parser.parse_args(argv)
+
+    try:
+        spec = SeedSpec(
+            seed=args.seed,
+            products=args.products,
+            category_depth=args.category_depth,
+            category_fanout=args.category_fanout,
+            branches=args.branches,
+            inventory_branches=args.inventory_branches,
+            sales=args.sales,
+            sales_days=args.sales_days
+        )
+        tables = select_tables(args.tables)
+        if args.target == "postgres":
+            if not args.dsn:
+                raise ValueError("--dsn (or NCS_DATABASE_URL) is required for the postgres target")
+            sink = PostgresCopySink(args.dsn, truncate=args.truncate)
+        elif args.target == "csv":
+            sink = CsvSink(args.out)
+        else:
+            sink = ApiSink(args.base_url, concurrency=args.concurrency)
+    except (ValueError, RuntimeError) as ex:
+        parser.error(str(ex))
+
+    generator = CatalogGenerator(spec)
+    print(f"Seed {spec.seed}: {spec.total_categories:,} categories, {spec.products:,} products, "
+          f"{spec.sales:,} sales -> {args.target}", file=sys.stderr)
+
+    try:
+        if args.stub and isinstance(sink, ApiSink):
+            with StubApiServer(seed_products=0) as server:
+                sink.base_url = server.base_url
+                counts = sink.load(generator, tables, _progress)
+        else:
+            counts = sink.load(generator, tables, _progress)
+    except ValueError as ex:
+        parser.error(str(ex))
+
+    for table, count in counts.items():
+        print(f"{table}: {count:,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
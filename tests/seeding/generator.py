@@ -0,0 +1,299 @@
+"""
+Streaming row generators for synthetic catalog, inventory and sales data
+Rows are produced lazily in the column order of the EF Core tables, and every
+id and value is derived from the seed so two runs produce identical data
+"""
+
+import functools
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+ADJECTIVES = ["Classic", "Slim", "Relaxed", "Premium", "Everyday", "Tailored", "Vintage", "Lightweight",
+              "Oversized", "Cropped", "Organic", "Stretch"]
+MATERIALS = ["Cotton", "Linen", "Denim", "Wool", "Silk", "Fleece", "Jersey", "Corduroy", "Cashmere", "Twill"]
+GARMENTS = ["Shirt", "T-Shirt", "Jeans", "Chinos", "Jacket", "Dress", "Skirt", "Hoodie", "Sweater", "Shorts",
+            "Blazer", "Coat", "Polo", "Cardigan", "Trousers"]
+BRANDS = ["Northwind", "Fabrikam", "Contoso", "Tailspin", "Litware", "Adatum", "Proseware", "Wingtip"]
+SEASONS = ["Spring", "Summer", "Autumn", "Winter", "All Season"]
+SIZES = ["XS", "S", "M", "L", "XL", "XXL"]
+COLORS = ["White", "Black", "Blue", "Red", "Green", "Grey", "Navy", "Beige", "Olive", "Burgundy"]
+CITIES = ["Kabul", "Herat", "Mazar-i-Sharif", "Kandahar", "Jalalabad", "Kunduz", "Bamyan", "Ghazni"]
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class Table(NamedTuple):
+    name: str
+    columns: Tuple[str, ...]
+
+
+USERS = Table("Users", ("Id", "UserName", "Email", "FirstName", "LastName", "PasswordHash", "IsActive",
+                        "EmailConfirmed", "PhoneNumberConfirmed", "TwoFactorEnabled", "LockoutEnabled",
+                        "AccessFailedCount", "CreatedAt", "UpdatedAt"))
+BRANCHES = Table("Branches", ("Id", "Name", "Code", "Address", "City", "Country", "IsActive",
+                              "CreatedAt", "UpdatedAt"))
+CATEGORIES = Table("Categories", ("Id", "Name", "Description", "Code", "ParentCategoryId", "SortOrder",
+                                  "IsActive", "CreatedAt", "UpdatedAt"))
+PRODUCTS = Table("Products", ("Id", "Name", "Description", "SKU", "Barcode", "BasePrice", "CostPrice", "Brand",
+                              "Season", "Material", "Color", "CategoryId", "IsActive", "CreatedAt", "UpdatedAt"))
+VARIATIONS = Table("ProductVariations", ("Id", "ProductId", "Size", "Color", "SKU", "AdditionalPrice",
+                                         "CostPrice", "StockQuantity", "IsActive", "CreatedAt", "UpdatedAt"))
+INVENTORIES = Table("Inventories", ("Id", "ProductId", "ProductVariationId", "BranchId", "Quantity",
+                                    "ReservedQuantity", "AvailableQuantity", "UnitCost", "LastUpdated",
+                                    "CreatedAt"))
+SALES = Table("SalesTransactions", ("Id", "TransactionNumber", "BranchId", "UserId", "TransactionType", "Status",
+                                    "Subtotal", "TaxAmount", "DiscountAmount", "TotalAmount", "AmountPaid",
+                                    "ChangeGiven", "LoyaltyPointsEarned", "LoyaltyPointsRedeemed", "CreatedAt",
+                                    "UpdatedAt", "CompletedAt"))
+SALE_ITEMS = Table("SalesTransactionItems", ("Id", "SalesTransactionId", "ProductId", "ProductVariationId",
+                                             "InventoryId", "Quantity", "UnitPrice", "DiscountAmount", "TaxAmount",
+                                             "TotalPrice", "CreatedAt"))
+
+# Parents before children so foreign keys hold while loading
+TABLES: List[Table] = [USERS, BRANCHES, CATEGORIES, PRODUCTS, VARIATIONS, INVENTORIES, SALES, SALE_ITEMS]
+
+
+class SeedSpec:
+    """Volumes and seed for one synthetic dataset"""
+
+    def __init__(
+        self,
+        seed: int = 1,
+        products: int = 100_000,
+        category_depth: int = 4,
+        category_fanout: int = 6,
+        branches: int = 20,
+        inventory_branches: int = 5,
+        sales: int = 200_000,
+        sales_days: int = 365,
+        tax_rate: float = 0.10
+    ):
+        if category_depth < 1 or category_fanout < 1:
+            raise ValueError("category_depth and category_fanout must be at least 1")
+        if not 1 <= inventory_branches <= branches <= 1024:
+            raise ValueError("Expected 1 <= inventory_branches <= branches <= 1024")
+
+        self.seed = seed
+        self.products = products
+        self.category_depth = category_depth
+        self.category_fanout = category_fanout
+        self.branches = branches
+        self.inventory_branches = inventory_branches
+        self.sales = sales
+        self.sales_days = sales_days
+        self.tax_rate = tax_rate
+        self.namespace = uuid.uuid5(uuid.NAMESPACE_DNS, f"seed-{seed}.nationalclothingstore.local")
+
+    @property
+    def leaf_categories(self) -> int:
+        return self.category_fanout ** self.category_depth
+
+    @property
+    def total_categories(self) -> int:
+        return sum(self.category_fanout ** level for level in range(1, self.category_depth + 1))
+
+
+class ProductLayout(NamedTuple):
+    """Everything derivable about one product from its index alone"""
+    index: int
+    row: tuple
+    combos: List[Tuple[str, str]]
+    base_price: float
+    cost_price: float
+
+
+class CatalogGenerator:
+    """Generates the rows of every seeded table for a SeedSpec"""
+
+    def __init__(self, spec: SeedSpec):
+        self.spec = spec
+        self._prefixes: Dict[str, str] = {}
+        # Sales revisit best sellers constantly; bounded so memory stays flat at any volume
+        self.product_layout = functools.lru_cache(maxsize=16_384)(self.product_layout)
+        self.inventory_branches = functools.lru_cache(maxsize=16_384)(self.inventory_branches)
+        self.user_id = self.id("user", 0)
+
+    def id(self, kind: str, number: int) -> str:
+        """
+        Seed- and kind-specific uuid prefix plus a 48-bit sequence; as unique as uuid5
+        per key but an order of magnitude cheaper, which matters at tens of millions of rows
+        """
+        prefix = self._prefixes.get(kind)
+        if prefix is None:
+            prefix = self._prefixes[kind] = str(uuid.uuid5(self.spec.namespace, kind))[:23]
+        return f"{prefix}-{number:012x}"
+
+    def _rng(self, stream: int, index: int) -> random.Random:
+        return random.Random((self.spec.seed * 1_000_003 + stream) * 10_000_019 + index)
+
+    def row_counts(self) -> Dict[str, Optional[int]]:
+        """Exact counts where cheap to know, None where they depend on generated data"""
+        return {
+            USERS.name: 1,
+            BRANCHES.name: self.spec.branches,
+            CATEGORIES.name: self.spec.total_categories,
+            PRODUCTS.name: self.spec.products,
+            VARIATIONS.name: None,
+            INVENTORIES.name: None,
+            SALES.name: self.spec.sales,
+            SALE_ITEMS.name: None
+        }
+
+    def rows(self, table: Table) -> Iterator[tuple]:
+        generators = {
+            USERS.name: self.users,
+            BRANCHES.name: self.branches,
+            CATEGORIES.name: self.categories,
+            PRODUCTS.name: self.products,
+            VARIATIONS.name: self.variations,
+            INVENTORIES.name: self.inventories,
+            SALES.name: self.sales,
+            SALE_ITEMS.name: self.sale_items
+        }
+        return generators[table.name]()
+
+    # Reference data
+
+    def users(self) -> Iterator[tuple]:
+        yield (self.user_id, "seed.loader", "seed.loader@nationalclothingstore.local", "Seed", "Loader",
+               "!", True, True, False, False, False, 0, BASE_TIME, BASE_TIME)
+
+    def branch_id(self, index: int) -> str:
+        return self.id("branch", index)
+
+    def branches(self) -> Iterator[tuple]:
+        for index in range(self.spec.branches):
+            city = CITIES[index % len(CITIES)]
+            yield (self.branch_id(index), f"{city} Branch {index + 1}", f"SEED-BR-{index + 1:03d}",
+                   f"{index + 1} Main Road", city, "Afghanistan", True, BASE_TIME, BASE_TIME)
+
+    # Catalog
+
+    def category_id(self, path: Sequence[int]) -> str:
+        number = 0
+        for position in path:
+            number = number * (self.spec.category_fanout + 1) + position + 1
+        return self.id("category", number)
+
+    def leaf_category_id(self, leaf_index: int) -> str:
+        fanout, path = self.spec.category_fanout, []
+        for _ in range(self.spec.category_depth):
+            path.append(leaf_index % fanout)
+            leaf_index //= fanout
+        return self.category_id(list(reversed(path)))
+
+    def categories(self) -> Iterator[tuple]:
+        """Breadth-first, so every parent row precedes its children"""
+        level: List[List[int]] = [[]]
+        for depth in range(1, self.spec.category_depth + 1):
+            next_level = []
+            for parent_path in level:
+                parent_id = self.category_id(parent_path) if parent_path else None
+                for position in range(self.spec.category_fanout):
+                    path = parent_path + [position]
+                    label = ".".join(str(p + 1) for p in path)
+                    name = f"{GARMENTS[path[-1] % len(GARMENTS)]} L{depth} {label}"
+                    yield (self.category_id(path), name, f"Seeded category {label}", f"SC{label}"[:20],
+                           parent_id, position, True, BASE_TIME, BASE_TIME)
+                    next_level.append(path)
+            level = next_level
+
+    def product_id(self, index: int) -> str:
+        return self.id("product", index)
+
+    def product_layout(self, index: int) -> ProductLayout:
+        rng = self._rng(1, index)
+        adjective, material, garment = rng.choice(ADJECTIVES), rng.choice(MATERIALS), rng.choice(GARMENTS)
+        brand, color = rng.choice(BRANDS), rng.choice(COLORS)
+        base_price = round(rng.uniform(9.99, 249.99), 2)
+        cost_price = round(base_price * rng.uniform(0.35, 0.6), 2)
+        created_at = BASE_TIME + timedelta(seconds=index * 37)
+        combos = [(size, variation_color)
+                  for size in rng.sample(SIZES, rng.randint(2, 5))
+                  for variation_color in rng.sample(COLORS, rng.randint(1, 3))]
+        row = (self.product_id(index), f"{adjective} {material} {garment}",
+               f"{adjective} {garment.lower()} in {color.lower()} {material.lower()} by {brand}",
+               f"P{index:08d}", f"20{index:011d}", base_price, cost_price, brand, rng.choice(SEASONS), material,
+               color, self.leaf_category_id(rng.randrange(self.spec.leaf_categories)), rng.random() > 0.03,
+               created_at, created_at)
+        return ProductLayout(index, row, combos, base_price, cost_price)
+
+    def products(self) -> Iterator[tuple]:
+        for index in range(self.spec.products):
+            yield self.product_layout(index).row
+
+    def variation_id(self, product_index: int, slot: int) -> str:
+        return self.id("variation", product_index << 4 | slot)
+
+    def variations(self) -> Iterator[tuple]:
+        for index in range(self.spec.products):
+            layout = self.product_layout(index)
+            created_at = layout.row[13]
+            for slot, (size, color) in enumerate(layout.combos):
+                yield (self.variation_id(index, slot), layout.row[0], size, color,
+                       f"P{index:08d}-{size}-{color.upper()}", 0.0, layout.cost_price,
+                       0, True, created_at, created_at)
+
+    # Inventory
+
+    def inventory_branches(self, product_index: int) -> List[int]:
+        """Branches stocking a product; stable per product so sales can find the rows"""
+        rng = self._rng(2, product_index)
+        return sorted(rng.sample(range(self.spec.branches), self.spec.inventory_branches))
+
+    def inventory_id(self, product_index: int, slot: int, branch_index: int) -> str:
+        return self.id("inventory", (product_index << 4 | slot) << 10 | branch_index)
+
+    def inventories(self) -> Iterator[tuple]:
+        for index in range(self.spec.products):
+            layout = self.product_layout(index)
+            rng = self._rng(3, index)
+            for slot in range(len(layout.combos)):
+                for branch_index in self.inventory_branches(index):
+                    quantity = rng.randint(0, 120)
+                    reserved = rng.randint(0, min(quantity, 5))
+                    yield (self.inventory_id(index, slot, branch_index), layout.row[0],
+                           self.variation_id(index, slot), self.branch_id(branch_index), quantity, reserved,
+                           quantity - reserved, layout.cost_price, BASE_TIME, BASE_TIME)
+
+    # Sales
+
+    def _sale(self, index: int) -> Tuple[tuple, List[tuple]]:
+        rng = self._rng(4, index)
+        sale_id = self.id("sale", index)
+        created_at = BASE_TIME + timedelta(seconds=rng.randrange(self.spec.sales_days * 86400))
+        items, subtotal, tax_total, branch_index = [], 0.0, 0.0, None
+
+        for line in range(rng.randint(1, 5)):
+            # Skewed towards a best-selling head of the catalog, like real sales
+            product_index = int(self.spec.products * rng.random() ** 3)
+            layout = self.product_layout(product_index)
+            slot = rng.randrange(len(layout.combos))
+            stocking = self.inventory_branches(product_index)
+            if branch_index is None or branch_index not in stocking:
+                branch_index = rng.choice(stocking)
+            quantity = rng.randint(1, 3)
+            line_subtotal = round(layout.base_price * quantity, 2)
+            tax = round(line_subtotal * self.spec.tax_rate, 2)
+            subtotal += line_subtotal
+            tax_total += tax
+            items.append((self.id("sale-item", index << 3 | line), sale_id, layout.row[0],
+                          self.variation_id(product_index, slot),
+                          self.inventory_id(product_index, slot, branch_index), quantity, layout.base_price,
+                          0.0, tax, round(line_subtotal + tax, 2), created_at))
+
+        total = round(subtotal + tax_total, 2)
+        sale = (sale_id, f"SEED-{index:010d}", self.branch_id(branch_index), self.user_id, "SALE", "COMPLETED",
+                round(subtotal, 2), round(tax_total, 2), 0.0, total, total, 0.0, int(total), 0,
+                created_at, created_at, created_at)
+        return sale, items
+
+    def sales(self) -> Iterator[tuple]:
+        for index in range(self.spec.sales):
+            yield self._sale(index)[0]
+
+    def sale_items(self) -> Iterator[tuple]:
+        for index in range(self.spec.sales):
+            yield from self._sale(index)[1]
@@ -0,0 +1,226 @@
+"""
+Destinations for generated rows: PostgreSQL COPY, gzip CSV files or the public API
+All sinks consume row iterators and never hold a whole table in memory
+"""
+
+import asyncio
+import csv
+import gzip
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from support.api_client import AsyncApiClient, default_headers
+from seeding.generator import CATEGORIES, PRODUCTS, TABLES, VARIATIONS, CatalogGenerator, Table
+
+try:
+    import psycopg
+except ImportError:  # pragma: no cover - only needed for the postgres target
+    psycopg = None
+
+ProgressCallback = Callable[[str, int, float], None]
+
+
+def _tick(rows: Iterable[tuple], table: Table, progress: Optional[ProgressCallback],
+          every: int = 100_000) -> Iterator[tuple]:
+    started = time.perf_counter()
+    count = 0
+    for count, row in enumerate(rows, 1):
+        yield row
+        if progress and count % every == 0:
+            progress(table.name, count, time.perf_counter() - started)
+    if progress:
+        progress(table.name, count, time.perf_counter() - started)
+
+
+class PostgresCopySink:
+    """Streams rows straight into PostgreSQL with COPY FROM STDIN"""
+
+    def __init__(self, dsn: str, truncate: bool = False):
+        if psycopg is None:
+            raise RuntimeError("The postgres target requires psycopg: pip install 'psycopg[binary]'")
+        self.dsn = dsn
+        self.truncate = truncate
+
+    def load(self, generator: CatalogGenerator, tables: List[Table],
+             progress: Optional[ProgressCallback] = None) -> Dict[str, int]:
+        counts = {}
+        with psycopg.connect(self.dsn) as connection:
+            if self.truncate:
+                names = ", ".join(f'"{table.name}"' for table in tables)
+                connection.execute(f"TRUNCATE {names} CASCADE")
+            for table in tables:
+                columns = ", ".join(f'"{column}"' for column in table.columns)
+                with connection.cursor() as cursor:
+                    with cursor.copy(f'COPY "{table.name}" ({columns}) FROM STDIN') as copy:
+                        for row in _tick(generator.rows(table), table, progress):
+                            copy.write_row(row)
+                    counts[table.name] = cursor.rowcount
+                # One transaction per table keeps a failed load resumable from that table
+                connection.commit()
+        return counts
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class CsvSink:
+    """
+    Writes one gzip CSV per table, loadable later with
+    \\copy "Products" FROM PROGRAM 'gzip -dc Products.csv.gz' WITH (FORMAT csv, HEADER true)
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def load(self, generator: CatalogGenerator, tables: List[Table],
+             progress: Optional[ProgressCallback] = None) -> Dict[str, int]:
+        os.makedirs(self.directory, exist_ok=True)
+        counts = {}
+        for table in tables:
+            path = os.path.join(self.directory, f"{table.name}.csv.gz")
+            count = 0
+            # compresslevel 1: the files are throwaway and gzip dominates run time at higher levels
+            with gzip.open(path, "wt", encoding="utf-8", newline="", compresslevel=1) as handle:
+                writer = csv.writer(handle)
+                writer.writerow(table.columns)
+                for count, row in enumerate(_tick(generator.rows(table), table, progress), 1):
+                    writer.writerow([_csv_value(value) for value in row])
+            counts[table.name] = count
+        return counts
+
+
+class ApiSink:
+    """
+    Creates categories, products and variations through the public API
+
+    The backend has no bulk endpoints, so this issues single POSTs with bounded
+    concurrency; it is meant for modest volumes against a deployed environment.
+    The API assigns its own ids, which are mapped back as records are created.
+    """
+
+    SUPPORTED = (CATEGORIES, PRODUCTS, VARIATIONS)
+
+    def __init__(self, base_url: str, token: str = "test-token", concurrency: int = 32):
+        self.base_url = base_url
+        self.token = token
+        self.concurrency = concurrency
+        self.ids: Dict[Any, str] = {}
+
+    def load(self, generator: CatalogGenerator, tables: List[Table],
+             progress: Optional[ProgressCallback] = None) -> Dict[str, int]:
+        unsupported = [table.name for table in tables if table not in self.SUPPORTED]
+        if unsupported:
+            raise ValueError(f"The api target cannot load {', '.join(unsupported)}; use --target postgres or csv")
+        return asyncio.run(self._load(generator, tables, progress))
+
+    async def _load(self, generator: CatalogGenerator, tables: List[Table],
+                    progress: Optional[ProgressCallback]) -> Dict[str, int]:
+        counts = {}
+        async with AsyncApiClient(self.base_url, headers=default_headers(self.token),
+                                  pool_size=self.concurrency) as client:
+            for table in tables:
+                rows = _tick(generator.rows(table), table, progress, every=1000)
+                if table is CATEGORIES:
+                    counts[table.name] = await self._load_categories(client, rows)
+                elif table is PRODUCTS:
+                    counts[table.name] = await self._post_all(client, "/products", rows, self._product_payload)
+                else:
+                    counts[table.name] = await self._post_all(client, "/products/variations", rows,
+                                                              self._variation_payload, remember=False)
+        return counts
+
+    async def _post_all(self, client: AsyncApiClient, path: str, rows: Iterator[tuple],
+                        payload: Callable[[tuple], Dict[str, Any]], remember: bool = True) -> int:
+        created = 0
+        pending = set()
+
+        async def post(row: tuple) -> None:
+            nonlocal created
+            response = await client.post(path, json=payload(row))
+            if response.status_code != 201:
+                raise RuntimeError(f"POST {path} failed with {response.status_code}: {response.text[:200]}")
+            if remember:
+                self.ids[row[0]] = response.json()["id"]
+            created += 1
+
+        for row in rows:
+            if len(pending) >= self.concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            pending.add(asyncio.ensure_future(post(row)))
+        if pending:
+            for task in (await asyncio.wait(pending))[0]:
+                task.result()
+        return created
+
+    async def _load_categories(self, client: AsyncApiClient, rows: Iterator[tuple]) -> int:
+        # Rows arrive breadth-first; finish each level before its children reference it
+        created, level, depth = 0, [], None
+        for row in rows:
+            row_depth = row[3].count(".")
+            if depth is not None and row_depth != depth:
+                created += await self._post_all(client, "/categories", iter(level), self._category_payload)
+                level = []
+            depth = row_depth
+            level.append(row)
+        created += await self._post_all(client, "/categories", iter(level), self._category_payload)
+        return created
+
+    def _category_payload(self, row: tuple) -> Dict[str, Any]:
+        parent_id = row[4]
+        return {
+            "name": row[1],
+            "description": row[2],
+            "code": row[3],
+            "parentCategoryId": self.ids[parent_id] if parent_id else None,
+            "sortOrder": row[5],
+            "isActive": row[6]
+        }
+
+    def _product_payload(self, row: tuple) -> Dict[str, Any]:
+        return {
+            "name": row[1],
+            "description": row[2],
+            "sku": row[3],
+            "barcode": row[4],
+            "basePrice": row[5],
+            "costPrice": row[6],
+            "brand": row[7],
+            "season": row[8],
+            "material": row[9],
+            "color": row[10],
+            "categoryId": self.ids[row[11]],
+            "isActive": row[12]
+        }
+
+    def _variation_payload(self, row: tuple) -> Dict[str, Any]:
+        return {
+            "productId": self.ids[row[1]],
+            "size": row[2],
+            "color": row[3],
+            "sku": row[4],
+            "additionalPrice": row[5],
+            "stockQuantity": row[7],
+            "isActive": row[8]
+        }
+
+
+def select_tables(names: Optional[List[str]]) -> List[Table]:
+    if not names:
+        return list(TABLES)
+    by_name = {table.name.lower(): table for table in TABLES}
+    unknown = [name for name in names if name.lower() not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown tables: {', '.join(unknown)}; choose from {', '.join(t.name for t in TABLES)}")
+    wanted = {name.lower() for name in names}
+    return [table for table in TABLES if table.name.lower() in wanted]
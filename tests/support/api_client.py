@@ -0,0 +1,233 @@
+"""
+Pooled HTTP clients for the Python API test suites
+Provides one keep-alive session shared by every test, an optional asyncio
+client built on httpx, and batched concurrent cleanup of created records
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:  # httpx is only needed for the async mode
+    httpx = None
+
+DEFAULT_BASE_URL = "http://localhost:5000/api"
+DEFAULT_POOL_SIZE = 32
+DEFAULT_TIMEOUT = 30.0
+
+
+def default_headers(token: str = "test_token") -> Dict[str, str]:
+    """Authentication headers used by every test request"""
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json"
+    }
+
+
+class ApiClient:
+    """Synchronous client backed by a single pooled keep-alive session"""
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        recorder: Optional[Any] = None
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        # Receives record(method, path, elapsed_ms) for every completed call
+        self.recorder = recorder
+        self.session = requests.Session()
+        self.session.headers.update(headers or default_headers())
+
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, path: str) -> str:
+        """Resolve a path such as "/products" against the base URL"""
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        response = self.session.request(method, self.url(path), **kwargs)
+        if self.recorder is not None:
+            self.recorder.record(method, path, (time.perf_counter() - start) * 1000.0)
+        return response
+
+    def get(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def delete_many(self, paths: Iterable[str], max_workers: Optional[int] = None) -> List[Optional[int]]:
+        """Delete several resources concurrently over the shared pool.
+
+        Returns the status code per path, or None when the request failed.
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+
+        def _delete(path: str) -> Optional[int]:
+            try:
+                return self.delete(path).status_code
+            except requests.RequestException:
+                return None
+
+        workers = min(len(paths), max_workers or self.pool_size)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_delete, paths))
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "ApiClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncApiClient:
+    """Asyncio client backed by a pooled httpx.AsyncClient"""
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT
+    ):
+        if httpx is None:
+            raise RuntimeError("The async API client requires httpx (pip install httpx)")
+
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url + "/",
+            headers=headers or default_headers(),
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> "httpx.Response":
+        return await self.client.request(method, path.lstrip("/"), **kwargs)
+
+    async def get(self, path: str, **kwargs: Any) -> "httpx.Response":
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> "httpx.Response":
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs: Any) -> "httpx.Response":
+        return await self.request("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs: Any) -> "httpx.Response":
+        return await self.request("DELETE", path, **kwargs)
+
+    async def delete_many(self, paths: Iterable[str], max_concurrency: Optional[int] = None) -> List[Optional[int]]:
+        """Delete several resources concurrently, bounded by a semaphore"""
+        semaphore = asyncio.Semaphore(max_concurrency or self.pool_size)
+
+        async def _delete(path: str) -> Optional[int]:
+            async with semaphore:
+                try:
+                    return (await self.delete(path)).status_code
+                except httpx.HTTPError:
+                    return None
+
+        return list(await asyncio.gather(*(_delete(path) for path in paths)))
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+class CleanupRegistry:
+    """Collects records created by a test and deletes them in concurrent batches.
+
+    Inventory rows go first, then products, then categories from the deepest
+    level up, because the API refuses to delete a category that still has children.
+    """
+
+    def __init__(self, client: ApiClient):
+        self.client = client
+        self.inventories: List[str] = []
+        self.products: List[str] = []
+        self.categories: Dict[str, Optional[str]] = {}
+
+    def add_inventory(self, inventory_id: str) -> None:
+        self.inventories.append(inventory_id)
+
+    def add_product(self, product_id: str) -> None:
+        self.products.append(product_id)
+
+    def add_category(self, category_id: str, parent_id: Optional[str] = None) -> None:
+        self.categories[category_id] = parent_id
+
+    def add(self, item_type: str, item_id: str, parent_id: Optional[str] = None) -> None:
+        if item_type == "inventory":
+            self.add_inventory(item_id)
+        elif item_type == "product":
+            self.add_product(item_id)
+        elif item_type == "category":
+            self.add_category(item_id, parent_id)
+        else:
+            raise ValueError(f"Unknown cleanup type: {item_type}")
+
+    def _category_depth(self, category_id: str) -> int:
+        depth = 0
+        parent_id = self.categories.get(category_id)
+        while parent_id in self.categories and depth <= len(self.categories):
+            depth += 1
+            parent_id = self.categories[parent_id]
+        return depth
+
+    def batches(self) -> List[List[str]]:
+        """Paths to delete, grouped into batches that can run concurrently"""
+        batches = []
+        if self.inventories:
+            batches.append([f"/inventory/{inventory_id}" for inventory_id in self.inventories])
+        if self.products:
+            batches.append([f"/products/{product_id}" for product_id in self.products])
+
+        by_depth: Dict[int, List[str]] = {}
+        for category_id in self.categories:
+            by_depth.setdefault(self._category_depth(category_id), []).append(f"/categories/{category_id}")
+        for depth in sorted(by_depth, reverse=True):
+            batches.append(by_depth[depth])
+
+        return batches
+
+    def flush(self) -> None:
+        """Delete everything registered so far, ignoring individual failures"""
+        for batch in self.batches():
+            self.client.delete_many(batch)
+        self.inventories.clear()
+        self.products.clear()
+        self.categories.clear()
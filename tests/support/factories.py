@@ -0,0 +1,67 @@
+"""
+Per-test unique test data and centrally registered record creation
+Lets the suites run under pytest-xdist against one shared backend without
+SKU, code or name collisions between workers
+"""
+
+import itertools
+import secrets
+from typing import Any, Dict
+
+import requests
+
+from support.api_client import ApiClient, CleanupRegistry
+
+_sequence = itertools.count(1)
+
+
+class UniqueData:
+    """Generates SKUs, category codes and names that are unique to one test"""
+
+    def __init__(self, namespace: str = "default"):
+        worker = namespace if namespace.startswith("gw") else "m"
+        # Worker id keeps workers apart; the random part keeps separate runs apart
+        self.tag = f"{worker}{next(_sequence):x}{secrets.token_hex(3)}".upper()
+
+    def sku(self, base: str) -> str:
+        """e.g. SHIRT-001 -> SHIRT-001-GW03A1B2C3 (contract limit 50 characters)"""
+        return f"{base[:49 - len(self.tag)]}-{self.tag}"
+
+    def code(self, base: str) -> str:
+        """Category code; the contract limits codes to 20 characters"""
+        return f"{base.upper().replace(' ', '')[:19 - len(self.tag)]}-{self.tag}"
+
+    def name(self, base: str) -> str:
+        return f"{base} {self.tag}"
+
+
+class CatalogFactory:
+    """Creates catalog and inventory records through the API and registers them for cleanup"""
+
+    def __init__(self, client: ApiClient, cleanup: CleanupRegistry, unique: UniqueData):
+        self.client = client
+        self.cleanup = cleanup
+        self.unique = unique
+
+    def create_category(self, data: Dict[str, Any]) -> requests.Response:
+        response = self.client.post("/categories", json=data)
+        if response.status_code == 201:
+            category = response.json()
+            self.cleanup.add_category(category["id"], category.get("parentId"))
+        return response
+
+    def create_product(self, data: Dict[str, Any]) -> requests.Response:
+        response = self.client.post("/products", json=data)
+        if response.status_code == 201:
+            self.cleanup.add_product(response.json()["id"])
+        return response
+
+    def create_variation(self, data: Dict[str, Any]) -> requests.Response:
+        # Variations are removed together with their product
+        return self.client.post("/products/variations", json=data)
+
+    def create_inventory(self, data: Dict[str, Any]) -> requests.Response:
+        response = self.client.post("/inventory", json=data)
+        if response.status_code == 201:
+            self.cleanup.add_inventory(response.json()["id"])
+        return response
@@ -0,0 +1,183 @@
+"""
+Latency budgets for API calls made by the test suites
+Every call through ApiClient is timed; budgets are read from perf_budgets.json
+and results are written as JSON so runs can be compared
+
+Compare two results files:
+    cd tests && python -m support.perf_budget old.json new.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import math
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+
+# Path segments that are part of a route rather than a resource identifier
+STATIC_SEGMENTS = {
+    "api", "v1", "categories", "products", "variations", "root", "children",
+    "validate-deletion", "search", "hierarchy", "sku", "barcode"
+}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def endpoint_name(method: str, path: str) -> str:
+    """Template a concrete call, e.g. GET /products/3f2a.../variations -> GET /products/{id}/variations"""
+    route = urlsplit(path).path
+    segments = [segment for segment in route.split("/") if segment]
+    while segments and segments[0] in ("api", "v1"):
+        segments.pop(0)
+    templated = [segment if segment in STATIC_SEGMENTS else "{id}" for segment in segments]
+    return f"{method.upper()} /{'/'.join(templated)}"
+
+
+class LatencyBudgets:
+    """Per-endpoint latency budgets loaded from a JSON config file"""
+
+    def __init__(self, endpoints: Dict[str, float], default_ms: Optional[float] = None,
+                 repetitions: int = 20, pct: float = 95):
+        self.endpoints = endpoints
+        self.default_ms = default_ms
+        self.repetitions = repetitions
+        self.percentile = pct
+
+    @classmethod
+    def load(cls, path: str) -> "LatencyBudgets":
+        with open(path, encoding="utf-8") as handle:
+            config = json.load(handle)
+        return cls(
+            endpoints={name: float(ms) for name, ms in config.get("endpoints", {}).items()},
+            default_ms=config.get("defaultBudgetMs"),
+            repetitions=int(config.get("repetitions", 20)),
+            pct=float(config.get("percentile", 95))
+        )
+
+    def budget_for(self, endpoint: str) -> Optional[float]:
+        return self.endpoints.get(endpoint, self.default_ms)
+
+
+class LatencyRecorder:
+    """Thread-safe store of call latencies, grouped by endpoint and by test"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = {}
+        self.current_test: Optional[str] = None
+        self.test_samples: Dict[str, Dict[str, List[float]]] = {}
+
+    def record(self, method: str, path: str, elapsed_ms: float) -> None:
+        endpoint = endpoint_name(method, path)
+        with self._lock:
+            self.samples.setdefault(endpoint, []).append(elapsed_ms)
+            if self.current_test is not None:
+                per_test = self.test_samples.setdefault(self.current_test, {})
+                per_test.setdefault(endpoint, []).append(elapsed_ms)
+
+    def samples_for_test(self, test_id: str) -> Dict[str, List[float]]:
+        with self._lock:
+            return {name: list(values) for name, values in self.test_samples.get(test_id, {}).items()}
+
+    def results(self, budgets: LatencyBudgets) -> Dict[str, Any]:
+        """Summary of every endpoint seen during the run, with budget status"""
+        endpoints = {}
+        with self._lock:
+            for name in sorted(self.samples):
+                values = self.samples[name]
+                observed = percentile(values, budgets.percentile)
+                budget = budgets.budget_for(name)
+                endpoints[name] = {
+                    "count": len(values),
+                    "p50Ms": round(percentile(values, 50), 3),
+                    "p95Ms": round(percentile(values, 95), 3),
+                    "p99Ms": round(percentile(values, 99), 3),
+                    "maxMs": round(max(values), 3),
+                    "budgetMs": budget,
+                    "withinBudget": budget is None or observed <= budget
+                }
+        return {"percentile": budgets.percentile, "endpoints": endpoints}
+
+
+def check_budget(endpoint: str, samples: List[float], budgets: LatencyBudgets) -> Optional[str]:
+    """Return a failure message when the endpoint's percentile exceeds its budget"""
+    budget = budgets.budget_for(endpoint)
+    if budget is None or not samples:
+        return None
+    observed = percentile(samples, budgets.percentile)
+    if observed <= budget:
+        return None
+    return (f"{endpoint}: p{budgets.percentile:g} {observed:.1f}ms over {len(samples)} calls "
+            f"exceeds budget {budget:.1f}ms")
+
+
+class LatencyBudget:
+    """Repeats a call and fails the test when its percentile exceeds the budget"""
+
+    def __init__(self, client: Any, budgets: LatencyBudgets, recorder: LatencyRecorder):
+        self.client = client
+        self.budgets = budgets
+        self.recorder = recorder
+
+    def repeat(self, method: str, path: str, repetitions: Optional[int] = None, **kwargs):
+        """Issue the same request N times and check its latency; returns the last response"""
+        repetitions = repetitions or self.budgets.repetitions
+        endpoint = endpoint_name(method, path)
+        before = len(self.recorder.samples.get(endpoint, []))
+
+        response = None
+        for _ in range(repetitions):
+            response = self.client.request(method, path, **kwargs)
+
+        samples = self.recorder.samples.get(endpoint, [])[before:]
+        failure = check_budget(endpoint, samples, self.budgets)
+        if failure:
+            pytest.fail(f"Latency budget exceeded: {failure}", pytrace=False)
+        return response
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    tolerance: float = 0.2) -> List[Tuple[str, float, float]]:
+    """Endpoints whose p95 grew by more than `tolerance` relative to the baseline"""
+    regressions = []
+    for name, entry in current.get("endpoints", {}).items():
+        previous = baseline.get("endpoints", {}).get(name)
+        if previous is None or previous["p95Ms"] <= 0:
+            continue
+        if entry["p95Ms"] > previous["p95Ms"] * (1.0 + tolerance):
+            regressions.append((name, previous["p95Ms"], entry["p95Ms"]))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m support.perf_budget",
+                                     description="Compare two latency results files")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative p95 growth before an endpoint counts as regressed")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    with open(args.current, encoding="utf-8") as handle:
+        current = json.load(handle)
+
+    regressions = compare_results(baseline, current, args.tolerance)
+    for name, before, after in regressions:
+        print(f"{name}: p95 {before:.1f}ms -> {after:.1f}ms")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
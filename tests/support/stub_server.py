@@ -0,0 +1,286 @@
+"""
+In-process stand-in for the product catalog and inventory API
+Serves the routes used by the Python suites from an in-memory CatalogStore so
+contract, workflow and load runs do not need the ASP.NET stack or PostgreSQL.
+Requests carrying an X-Test-Namespace header get their own isolated store.
+
+Run standalone (e.g. as a load-test target):
+    cd tests && python -m support.stub_server --port 5000 --products 20000
+"""
+
+import argparse
+import json
+import math
+import queue
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from support.stub_store import DEFAULT_SEED, DEFAULT_SEED_PRODUCTS, CatalogStore, Result
+
+NAMESPACE_HEADER = "X-Test-Namespace"
+DEFAULT_NAMESPACE = "default"
+DASHBOARD_STREAM_PATH = re.compile(r"^/api(/v1)?/reporting/dashboard/realtime/stream/?$")
+EXPORT_FILE_PATH = re.compile(r"^/api(/v1)?/reporting/export/(?:(?P<stream>stream)|(?P<id>[^/]+)/download)/?$")
+HEARTBEAT_INTERVAL_S = 15.0
+# (method, route, requests, window seconds, identifier), as the backend's rate limit attributes
+RATE_LIMITS = [
+    ("POST", re.compile(r"^/inventory/alerts/low-stock/send/?$"), 10, 60.0, "sensitive")
+]
+
+Handler = Callable[..., Result]
+
+
+class StubApiServer:
+    """Threaded HTTP server holding one CatalogStore per namespace"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, seed: int = DEFAULT_SEED,
+                 seed_products: int = DEFAULT_SEED_PRODUCTS):
+        self.seed = seed
+        self.seed_products = seed_products
+        self._stores: Dict[str, CatalogStore] = {}
+        self._stores_lock = threading.Lock()
+        self._routes = self._build_routes()
+        self._thread: Optional[threading.Thread] = None
+
+        server = self
+
+        class RequestHandler(_RequestHandler):
+            stub = server
+
+        self.httpd = ThreadingHTTPServer((host, port), RequestHandler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def store(self, namespace: str) -> CatalogStore:
+        """Return the namespace's store, seeding it on first use"""
+        with self._stores_lock:
+            store = self._stores.get(namespace)
+            if store is None:
+                store = CatalogStore(seed=self.seed, seed_products=self.seed_products)
+                self._stores[namespace] = store
+            return store
+
+    def _build_routes(self) -> List[Tuple[str, Pattern[str], Callable[[CatalogStore], Handler]]]:
+        routes = [
+            ("GET", r"/categories", lambda s: s.list_categories),
+            ("POST", r"/categories", lambda s: s.create_category),
+            ("GET", r"/categories/tree", lambda s: s.list_category_tree),
+            ("GET", r"/categories/(?P<id>[^/]+)", lambda s: s.get_category),
+            ("PUT", r"/categories/(?P<id>[^/]+)", lambda s: s.update_category),
+            ("DELETE", r"/categories/(?P<id>[^/]+)", lambda s: s.delete_category),
+            ("GET", r"/products", lambda s: s.list_products),
+            ("POST", r"/products", lambda s: s.create_product),
+            ("GET", r"/products/search", lambda s: s.list_product_search),
+            ("POST", r"/products/variations", lambda s: s.create_variation),
+            ("PUT", r"/products/variations/(?P<id>[^/]+)", lambda s: s.update_variation),
+            ("GET", r"/products/(?P<id>[^/]+)/variations", lambda s: s.list_variations),
+            ("GET", r"/products/(?P<id>[^/]+)", lambda s: s.get_product),
+            ("PUT", r"/products/(?P<id>[^/]+)", lambda s: s.update_product),
+            ("DELETE", r"/products/(?P<id>[^/]+)", lambda s: s.delete_product),
+            ("POST", r"/inventory", lambda s: s.create_inventory),
+            ("POST", r"/inventory/alerts/low-stock/send", lambda s: s.send_low_stock_alerts),
+            ("POST", r"/inventory/(?P<id>[^/]+)/reserve", lambda s: s.reserve_inventory),
+            ("POST", r"/inventory/(?P<id>[^/]+)/release", lambda s: s.release_inventory),
+            ("GET", r"/inventory/(?P<id>[^/]+)", lambda s: s.get_inventory),
+            ("DELETE", r"/inventory/(?P<id>[^/]+)", lambda s: s.delete_inventory),
+            ("GET", r"/reporting/dashboard/realtime", lambda s: s.list_realtime_metrics),
+            ("POST", r"/reporting/export", lambda s: s.start_report_export),
+            ("GET", r"/reporting/export/(?P<id>[^/]+)/status", lambda s: s.get_report_export)
+        ]
+        return [(method, re.compile(pattern + r"/?$"), handler) for method, pattern, handler in routes]
+
+    def dispatch(self, method: str, path: str, query: Dict[str, str], body: Any, namespace: str) -> Result:
+        route = re.sub(r"^/api(/v1)?", "", path)
+        path_matched = False
+        for route_method, pattern, handler_for in self._routes:
+            match = pattern.match(route)
+            if match is None:
+                continue
+            path_matched = True
+            if route_method != method:
+                continue
+
+            handler = handler_for(self.store(namespace))
+            args: List[Any] = list(match.groupdict().values())
+            if method in ("POST", "PUT") and not handler.__name__.startswith("send_"):
+                if not isinstance(body, dict):
+                    return 400, {"success": False, "message": "Request body must be a JSON object", "errors": []}
+                args.append(body)
+            elif method == "GET" and handler.__name__.startswith("list_"):
+                args.append(query)
+            return handler(*args)
+
+        if path_matched:
+            return 405, {"success": False, "message": f"Method {method} not allowed"}
+        return 404, {"success": False, "message": f"No route for {path}"}
+
+    def start(self) -> "StubApiServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="stub-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        # Open dashboard streams would otherwise keep their handler threads waiting
+        with self._stores_lock:
+            for store in self._stores.values():
+                store.dashboard.close()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubApiServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this Nagle delays keep-alive responses
+    disable_nagle_algorithm = True
+    stub: StubApiServer
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+
+        if not (self.headers.get("Authorization") or "").startswith("Bearer "):
+            self._send(401, {"success": False, "message": "Unauthorized"})
+            return
+
+        body = None
+        if raw:
+            try:
+                body = json.loads(raw)
+            except ValueError:
+                self._send(400, {"success": False, "message": "Malformed JSON body", "errors": []})
+                return
+
+        url = urlsplit(self.path)
+        namespace = self.headers.get(NAMESPACE_HEADER) or DEFAULT_NAMESPACE
+        if self.command == "GET" and DASHBOARD_STREAM_PATH.match(url.path):
+            self._stream_dashboard(namespace, dict(parse_qsl(url.query)))
+            return
+        export_match = EXPORT_FILE_PATH.match(url.path) if self.command == "GET" else None
+        if export_match:
+            store = self.stub.store(namespace)
+            if export_match.group("stream"):
+                self._send_file(*store.stream_export(dict(parse_qsl(url.query))))
+            else:
+                self._send_file(*store.export_file(export_match.group("id")))
+            return
+
+        headers = self._rate_limit(namespace, url.path)
+        if headers.get("Retry-After"):
+            self._send(429, {"success": False, "message": "Rate limit exceeded"}, headers)
+            return
+
+        status, payload = self.stub.dispatch(self.command, url.path, dict(parse_qsl(url.query)), body, namespace)
+        self._send(status, payload, headers)
+
+    def _rate_limit(self, namespace: str, path: str) -> Dict[str, str]:
+        """Count the request against its route's limit; returns the rate limit headers, if any"""
+        route = re.sub(r"^/api(/v1)?", "", path)
+        for method, pattern, limit, window_s, identifier in RATE_LIMITS:
+            if method == self.command and pattern.match(route):
+                key = f"{identifier}:ip_{self.client_address[0]}"
+                allowed, remaining, retry_after_s = self.stub.store(namespace).rate_limiter.acquire(key, limit, window_s)
+                headers = {"X-RateLimit-Limit": str(limit), "X-RateLimit-Remaining": str(remaining)}
+                if not allowed:
+                    headers["Retry-After"] = str(math.ceil(retry_after_s))
+                return headers
+        return {}
+
+    def _send(self, status: int, payload: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]] = None) -> None:
+        data = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def _send_file(self, status: int, content: Any, content_type: str) -> None:
+        if status != 200:
+            self._send(status, content)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _stream_dashboard(self, namespace: str, query: Dict[str, str]) -> None:
+        """Server-Sent Events: a snapshot, then every delta for the location until the client goes away"""
+        feed = self.stub.store(namespace).dashboard
+        branch_id = query.get("locationId")
+        # Subscribe before the snapshot so no delta falls between them
+        events = feed.subscribe(branch_id)
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            # Neither a length nor chunking: the stream ends when the connection closes
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            snapshot = feed.snapshot(branch_id)
+            self._send_event("snapshot", snapshot["sequence"], snapshot)
+            while True:
+                try:
+                    delta = events.get(timeout=HEARTBEAT_INTERVAL_S)
+                except queue.Empty:
+                    self.wfile.write(b": keep-alive\n\n")
+                    continue
+                if delta is None:
+                    break
+                self._send_event("delta", delta["sequence"], delta)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            feed.unsubscribe(events)
+
+    def _send_event(self, event: str, event_id: int, payload: Dict[str, Any]) -> None:
+        self.wfile.write(f"id: {event_id}\nevent: {event}\ndata: {json.dumps(payload)}\n\n".encode("utf-8"))
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m support.stub_server", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--products", type=int, default=DEFAULT_SEED_PRODUCTS, help="Seeded products per namespace")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args(argv)
+
+    server = StubApiServer(args.host, args.port, seed=args.seed, seed_products=args.products)
+    server.store(DEFAULT_NAMESPACE)
+    print(f"Stand-in API listening on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,969 @@
+"""
+In-memory product catalog used by the local stand-in API server
+Mirrors the behaviour the Python suites expect from the .NET backend:
+validation errors, duplicate SKU rejection, category deletion rules,
+filtering, search, page-number and cursor pagination, atomic
+stock reservation, the real-time dashboard's low-stock deltas,
+rate-limited endpoints and report exports
+"""
+
+import base64
+import csv
+import gzip
+import io
+import itertools
+import json
+import queue
+import random
+import re
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+Result = Tuple[int, Optional[Dict[str, Any]]]
+
+ROOT_CATEGORIES = ["Men", "Women", "Kids", "Accessories", "Footwear", "Sportswear"]
+SUB_CATEGORIES = ["Tops", "Bottoms", "Outerwear", "Sleepwear", "Essentials"]
+LEAF_CATEGORIES = ["Casual", "Formal", "Seasonal"]
+ADJECTIVES = ["Classic", "Slim", "Relaxed", "Premium", "Everyday", "Tailored", "Vintage", "Lightweight"]
+MATERIALS = ["Cotton", "Linen", "Denim", "Wool", "Silk", "Fleece", "Jersey", "Corduroy"]
+GARMENTS = ["Shirt", "T-Shirt", "Jeans", "Chinos", "Jacket", "Dress", "Skirt", "Hoodie", "Sweater", "Shorts"]
+BRANDS = ["Northwind", "Fabrikam", "Contoso", "Tailspin", "Litware", "Adatum"]
+SIZES = ["XS", "S", "M", "L", "XL", "XXL"]
+COLORS = ["White", "Black", "Blue", "Red", "Green", "Grey", "Navy", "Beige"]
+
+DEFAULT_SEED = 20240101
+DEFAULT_SEED_PRODUCTS = 5000
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+LOW_STOCK_THRESHOLD = 10
+SUBSCRIBER_BUFFER_SIZE = 256
+# Export format aliases and content types, as the backend's ReportExportFormats
+EXPORT_FORMATS = {"csv": "csv", "jsonl": "jsonl.gz", "jsonl.gz": "jsonl.gz", "ndjson": "jsonl.gz", "json": "jsonl.gz",
+                  "parquet": "parquet"}
+EXPORT_CONTENT_TYPES = {"csv": "text/csv", "jsonl.gz": "application/gzip"}
+EXPORT_DATASETS = {"sales": "sales", "inventory": "inventory", "customer": "customers", "customers": "customers",
+                   "procurement": "procurement", "purchasing": "procurement"}
+INVENTORY_EXPORT_COLUMNS = ["InventoryId", "BranchCode", "WarehouseCode", "ProductSku", "ProductName", "Quantity",
+                            "ReservedQuantity", "AvailableQuantity", "UnitCost", "LastUpdated"]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _error(status: int, message: str, errors: Optional[List[Dict[str, str]]] = None) -> Result:
+    body: Dict[str, Any] = {"success": False, "message": message}
+    if errors is not None:
+        body["errors"] = errors
+    return status, body
+
+
+def _field_error(field: str, message: str) -> Dict[str, str]:
+    return {"field": field, "message": message}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _parse_bool(value: Optional[str]) -> Optional[bool]:
+    if value is None:
+        return None
+    return value.strip().lower() in ("1", "true", "yes")
+
+
+def _encode_cursor(position: int, item_id: str) -> str:
+    payload = json.dumps({"v": 1, "p": position, "i": item_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Optional[int]:
+    """Position encoded in a cursor, or None when it is not one of ours"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        return None
+    if not isinstance(payload, dict) or payload.get("v") != 1 or not isinstance(payload.get("p"), int):
+        return None
+    return payload["p"]
+
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _words(text: Optional[str]) -> List[str]:
+    return _WORD.findall((text or "").lower())
+
+
+INVALID_CURSOR = "The pagination cursor is invalid or has expired."
+
+
+EXPANSIONS = ("category", "variations", "images")
+SUMMARY_FIELDS = ("id", "name", "sku", "brand", "season", "basePrice", "categoryId", "isActive", "createdAt", "updatedAt")
+
+
+def _parse_expand(value: Optional[str]) -> Optional[set]:
+    """Navigations named by an expand query value, none of them when there is none; None when a name is unknown"""
+    names = {name.strip().lower() for name in (value or "").split(",") if name.strip()} - {"none"}
+    if "all" in names:
+        names = (names - {"all"}) | set(EXPANSIONS)
+    return names if names <= set(EXPANSIONS) else None
+
+
+def _parse_int(value: Optional[str], default: int) -> int:
+    try:
+        return int(value) if value is not None else default
+    except ValueError:
+        return default
+
+
+class DashboardFeed:
+    """Per-branch dashboard totals and their subscribers, like the backend's RealTimeDashboardService.
+
+    The stand-in has no sales, so only low-stock changes from reservations produce deltas.
+    """
+
+    def __init__(self, low_stock_threshold: int = LOW_STOCK_THRESHOLD):
+        self.low_stock_threshold = low_stock_threshold
+        self.lock = threading.Lock()
+        self.branches: Dict[str, Dict[str, Any]] = {}
+        self.low_stock: Dict[str, set] = defaultdict(set)
+        self.subscribers: List[Tuple[Optional[str], "queue.Queue[Optional[Dict[str, Any]]]"]] = []
+        self.sequence = 0
+
+    def _totals(self, branch_id: str) -> Dict[str, Any]:
+        totals = self.branches.get(branch_id)
+        if totals is None:
+            now = _now()
+            totals = {
+                "branchId": branch_id, "tradingDay": now[:10] + "T00:00:00Z", "todaySales": 0, "currentHourSales": 0,
+                "transactions": 0, "returns": 0, "refunds": 0, "itemsSold": 0, "lowStockItems": 0,
+                "sequence": 0, "lastUpdated": now
+            }
+            self.branches[branch_id] = totals
+        return totals
+
+    def record_stock_level(self, inventory: Dict[str, Any]) -> None:
+        branch_id = inventory["branchId"]
+        is_low = inventory["availableQuantity"] <= self.low_stock_threshold
+        with self.lock:
+            low_stock = self.low_stock[branch_id]
+            if is_low == (inventory["id"] in low_stock):
+                return
+            if is_low:
+                low_stock.add(inventory["id"])
+            else:
+                low_stock.discard(inventory["id"])
+
+            self.sequence += 1
+            totals = self._totals(branch_id)
+            totals.update(lowStockItems=len(low_stock), sequence=self.sequence, lastUpdated=_now())
+            delta = {
+                "branchId": branch_id, "sequence": self.sequence, "eventType": "stock", "salesChange": 0,
+                "transactionsChange": 0, "itemsSoldChange": 0, "lowStockChange": 1 if is_low else -1,
+                "totals": dict(totals)
+            }
+            for subscribed_branch, events in self.subscribers:
+                if subscribed_branch is None or subscribed_branch == branch_id:
+                    if events.full():
+                        # Drop the oldest, as the backend's bounded subscriber channels do
+                        try:
+                            events.get_nowait()
+                        except queue.Empty:
+                            pass
+                    events.put_nowait(delta)
+
+    def snapshot(self, branch_id: Optional[str] = None) -> Dict[str, Any]:
+        with self.lock:
+            branches = [dict(t) for b, t in self.branches.items() if branch_id is None or b == branch_id]
+            totals = {key: sum(b[key] for b in branches) for key in (
+                "todaySales", "currentHourSales", "transactions", "returns", "refunds", "itemsSold", "lowStockItems")}
+            return dict(
+                totals, locationId=branch_id, connectedDashboards=len(self.subscribers),
+                sequence=max((b["sequence"] for b in branches), default=0), branches=branches, lastUpdated=_now())
+
+    def subscribe(self, branch_id: Optional[str] = None) -> "queue.Queue[Optional[Dict[str, Any]]]":
+        events: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(SUBSCRIBER_BUFFER_SIZE)
+        with self.lock:
+            self.subscribers.append((branch_id, events))
+        return events
+
+    def unsubscribe(self, events: "queue.Queue[Optional[Dict[str, Any]]]") -> None:
+        with self.lock:
+            self.subscribers = [(b, q) for b, q in self.subscribers if q is not events]
+
+    def close(self) -> None:
+        """End every open stream"""
+        with self.lock:
+            subscribers, self.subscribers = self.subscribers, []
+        for _, events in subscribers:
+            try:
+                events.put_nowait(None)
+            except queue.Full:
+                events.get_nowait()
+                events.put_nowait(None)
+
+
+class RateLimiter:
+    """Token-bucket limits by key, the same algorithm (GCRA) as the backend's rate limiters.
+
+    A key admits up to limit requests at once and regains one every window / limit seconds;
+    rejected requests do not consume anything.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.arrivals: Dict[str, float] = {}
+
+    def acquire(self, key: str, limit: int, window_s: float) -> Tuple[bool, int, float]:
+        """Count one request; returns (allowed, remaining, retry_after_s)"""
+        interval = window_s / limit
+        now = time.monotonic()
+        with self.lock:
+            arrival = max(self.arrivals.get(key, now), now) + interval
+            allow_at = arrival - window_s
+            if now < allow_at:
+                return False, 0, allow_at - now
+            self.arrivals[key] = arrival
+            return True, int((now - allow_at) / interval), 0.0
+
+
+class CatalogStore:
+    """One isolated data namespace: categories, products, variations and inventory"""
+
+    def __init__(self, seed: int = DEFAULT_SEED, seed_products: int = DEFAULT_SEED_PRODUCTS):
+        self.lock = threading.RLock()
+        self.categories: Dict[str, Dict[str, Any]] = {}
+        self.category_codes: Dict[str, str] = {}
+        self.products: Dict[str, Dict[str, Any]] = {}
+        self.variations: Dict[str, Dict[str, Any]] = {}
+        self.variations_by_product: Dict[str, List[str]] = {}
+        self.product_skus: Dict[str, str] = {}
+        self.variation_skus: Dict[str, str] = {}
+        # Insertion sequence of products and variations; the stand-in's keyset sort key
+        self.positions: Dict[str, int] = {}
+        self._next_position = itertools.count()
+        self.search_words: Dict[str, Tuple[str, Dict[str, List[str]]]] = {}
+        self.inventories: Dict[str, Dict[str, Any]] = {}
+        self.dashboard = DashboardFeed()
+        self.rate_limiter = RateLimiter()
+        self.exports: Dict[str, Dict[str, Any]] = {}
+        if seed_products > 0:
+            self._seed(random.Random(seed), seed_products)
+
+    # Seeding
+
+    def _seed(self, rng: random.Random, product_count: int) -> None:
+        base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        stamp = lambda offset: (base_time + timedelta(minutes=offset)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Sequential ids keep seeding cheap and identical across runs and workers
+        counter = iter(range(1, 1 << 40))
+        next_id = lambda: f"00000000-0000-4000-8000-{next(counter):012x}"
+
+        leaves = []
+        for root_name in ROOT_CATEGORIES:
+            root = self._new_category(root_name, f"{root_name} clothing", None, True, stamp(0), next_id(),
+                                      f"SEED-{len(self.categories):04d}")
+            for sub_name in SUB_CATEGORIES:
+                sub = self._new_category(f"{root_name} {sub_name}", f"{root_name} {sub_name.lower()}", root["id"], True,
+                                         stamp(0), next_id(), f"SEED-{len(self.categories):04d}")
+                for leaf_name in LEAF_CATEGORIES:
+                    leaf = self._new_category(f"{root_name} {sub_name} {leaf_name}", f"{leaf_name} {sub_name.lower()}",
+                                              sub["id"], True, stamp(0), next_id(), f"SEED-{len(self.categories):04d}")
+                    leaves.append(leaf["id"])
+
+        for index in range(product_count):
+            adjective, material, garment = rng.choice(ADJECTIVES), rng.choice(MATERIALS), rng.choice(GARMENTS)
+            sku = f"SEED-{index:07d}"
+            base_price = round(rng.uniform(9.99, 199.99), 2)
+            created_at = stamp(index)
+            product = self._new_product({
+                "name": f"{adjective} {material} {garment}",
+                "description": f"{adjective} {garment.lower()} made from {material.lower()}",
+                "sku": sku,
+                "categoryId": rng.choice(leaves),
+                "brand": rng.choice(BRANDS),
+                "isActive": rng.random() > 0.05,
+                "basePrice": base_price,
+                "costPrice": round(base_price * rng.uniform(0.35, 0.6), 2)
+            }, created_at, next_id())
+            for size in rng.sample(SIZES, rng.randint(2, 4)):
+                for color in rng.sample(COLORS, rng.randint(1, 2)):
+                    self._new_variation({
+                        "productId": product["id"],
+                        "size": size,
+                        "color": color,
+                        "sku": f"{sku}-{size}-{color.upper()}",
+                        "isActive": True,
+                        "additionalPrice": 0.0,
+                        "stockQuantity": rng.randint(0, 200)
+                    }, created_at, next_id())
+
+    def _new_category(self, name: str, description: str, parent_id: Optional[str], is_active: bool,
+                      created_at: str, category_id: Optional[str] = None, code: Optional[str] = None) -> Dict[str, Any]:
+        category = {
+            "id": category_id or str(uuid.uuid4()),
+            "name": name,
+            "description": description,
+            "code": code,
+            "parentId": parent_id,
+            "sortOrder": 0,
+            "isActive": is_active,
+            "createdAt": created_at,
+            "updatedAt": created_at
+        }
+        self.categories[category["id"]] = category
+        if code is not None:
+            self.category_codes[code] = category["id"]
+        return category
+
+    def _new_product(self, data: Dict[str, Any], created_at: str, product_id: Optional[str] = None) -> Dict[str, Any]:
+        product = {
+            "id": product_id or str(uuid.uuid4()),
+            "name": data["name"],
+            "description": data.get("description") or "",
+            "sku": data["sku"],
+            "barcode": data.get("barcode"),
+            "brand": data.get("brand"),
+            "season": data.get("season"),
+            "material": data.get("material"),
+            "collection": data.get("collection"),
+            "categoryId": data["categoryId"],
+            "isActive": data.get("isActive", True),
+            "basePrice": data["basePrice"],
+            "costPrice": data["costPrice"],
+            "createdAt": created_at,
+            "updatedAt": created_at
+        }
+        self.products[product["id"]] = product
+        self.positions[product["id"]] = next(self._next_position)
+        self.product_skus[product["sku"]] = product["id"]
+        self.variations_by_product[product["id"]] = []
+        return product
+
+    def _new_variation(self, data: Dict[str, Any], created_at: str,
+                       variation_id: Optional[str] = None) -> Dict[str, Any]:
+        variation = {
+            "id": variation_id or str(uuid.uuid4()),
+            "productId": data["productId"],
+            "size": data["size"],
+            "color": data["color"],
+            "sku": data["sku"],
+            "isActive": data.get("isActive", True),
+            "additionalPrice": data.get("additionalPrice", 0.0),
+            "stockQuantity": data.get("stockQuantity", 0),
+            "createdAt": created_at,
+            "updatedAt": created_at
+        }
+        self.variations[variation["id"]] = variation
+        self.positions[variation["id"]] = next(self._next_position)
+        self.variation_skus[variation["sku"]] = variation["id"]
+        self.variations_by_product[variation["productId"]].append(variation["id"])
+        return variation
+
+    # Categories
+
+    def list_categories(self, query: Dict[str, str]) -> Result:
+        include_inactive = _parse_bool(query.get("includeInactive")) or False
+        parent_id = query.get("parentId")
+        with self.lock:
+            if _parse_bool(query.get("includeHierarchy")):
+                categories = [dict(category) for category, _ in self._hierarchy(None)]
+            else:
+                categories = [
+                    dict(category) for category in self.categories.values()
+                    if (include_inactive or category["isActive"])
+                    and (parent_id is None or category["parentId"] == parent_id)
+                ]
+        return 200, {
+            "categories": categories,
+            "totalCount": len(categories),
+            "pageNumber": 1,
+            "pageSize": len(categories)
+        }
+
+    def list_category_tree(self, query: Dict[str, str]) -> Result:
+        root_id = query.get("rootId")
+        roots: List[Dict[str, Any]] = []
+        nodes: Dict[str, Dict[str, Any]] = {}
+        with self.lock:
+            for category, depth in self._hierarchy(root_id):
+                node = {field: category[field] for field in
+                        ("id", "name", "description", "code", "parentId", "sortOrder", "isActive")}
+                node["depth"] = depth
+                node["children"] = []
+                nodes[node["id"]] = node
+                parent = nodes.get(category["parentId"]) if depth else None
+                (parent["children"] if parent else roots).append(node)
+        return 200, roots
+
+    def _hierarchy(self, root_id: Optional[str]) -> List[Tuple[Dict[str, Any], int]]:
+        """Active categories depth-first from the roots (or one root), siblings by sortOrder then name"""
+        children: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+        for category in self.categories.values():
+            if category["isActive"]:
+                children[category["parentId"]].append(category)
+        if root_id is None:
+            pending = [(category, 0) for category in children[None]]
+        else:
+            pending = [(self.categories[root_id], 0)] if root_id in self.categories else []
+        order: List[Tuple[Dict[str, Any], int]] = []
+        pending.sort(key=lambda item: (item[0]["sortOrder"], item[0]["name"]), reverse=True)
+        while pending:
+            category, depth = pending.pop()
+            order.append((category, depth))
+            pending.extend((child, depth + 1) for child in sorted(
+                children[category["id"]], key=lambda c: (c["sortOrder"], c["name"]), reverse=True))
+        return order
+
+    def get_category(self, category_id: str) -> Result:
+        with self.lock:
+            category = self.categories.get(category_id)
+            if category is None:
+                return _error(404, f"Category with ID {category_id} not found")
+            return 200, dict(category)
+
+    def _validate_category(self, data: Dict[str, Any], partial: bool) -> List[Dict[str, str]]:
+        errors = []
+        if not partial or "name" in data:
+            name = data.get("name")
+            if not isinstance(name, str) or not name.strip():
+                errors.append(_field_error("name", "Name is required"))
+            elif len(name) > 100:
+                errors.append(_field_error("name", "Name cannot exceed 100 characters"))
+        if len(data.get("description") or "") > 500:
+            errors.append(_field_error("description", "Description cannot exceed 500 characters"))
+        if len(data.get("code") or "") > 20:
+            errors.append(_field_error("code", "Code cannot exceed 20 characters"))
+        return errors
+
+    def create_category(self, data: Dict[str, Any]) -> Result:
+        errors = self._validate_category(data, partial=False)
+        if errors:
+            return _error(400, "Validation failed", errors)
+
+        parent_id = data.get("parentId") or data.get("parentCategoryId")
+        with self.lock:
+            if parent_id is not None and parent_id not in self.categories:
+                return _error(400, f"Parent category with ID {parent_id} not found")
+            code = data.get("code")
+            if code is not None and code in self.category_codes:
+                return _error(400, f"Category with code '{code}' already exists.")
+            category = self._new_category(data["name"], data.get("description") or "", parent_id,
+                                          data.get("isActive", True), _now(), code=code)
+            return 201, dict(category)
+
+    def update_category(self, category_id: str, data: Dict[str, Any]) -> Result:
+        errors = self._validate_category(data, partial=True)
+        if errors:
+            return _error(400, "Validation failed", errors)
+
+        with self.lock:
+            category = self.categories.get(category_id)
+            if category is None:
+                return _error(404, f"Category with ID {category_id} not found")
+            parent_id = data.get("parentId", category["parentId"])
+            ancestor = parent_id
+            while ancestor is not None:
+                if ancestor == category_id:
+                    return _error(400, "Category cannot be its own ancestor")
+                ancestor = self.categories.get(ancestor, {}).get("parentId")
+            for field in ("name", "description", "isActive", "sortOrder"):
+                if field in data:
+                    category[field] = data[field]
+            category["parentId"] = parent_id
+            category["updatedAt"] = _now()
+            return 200, dict(category)
+
+    def delete_category(self, category_id: str) -> Result:
+        with self.lock:
+            if category_id not in self.categories:
+                return _error(404, f"Category with ID {category_id} not found")
+            has_children = any(c["parentId"] == category_id for c in self.categories.values())
+            has_products = any(p["categoryId"] == category_id for p in self.products.values())
+            if has_children or has_products:
+                return _error(400, "Cannot delete category with child categories or products.")
+            category = self.categories.pop(category_id)
+            self.category_codes.pop(category["code"], None)
+            return 204, None
+
+    # Products
+
+    def list_products(self, query: Dict[str, str]) -> Result:
+        page_number = max(1, _parse_int(query.get("pageNumber") or query.get("page"), 1))
+        page_size = min(MAX_PAGE_SIZE, max(1, _parse_int(query.get("pageSize"), DEFAULT_PAGE_SIZE)))
+        is_active = _parse_bool(query.get("isActive"))
+        include_inactive = _parse_bool(query.get("includeInactive")) or False
+        include_total = _parse_bool(query.get("includeTotalCount")) is not False
+        category_id = query.get("categoryId")
+        brand = query.get("brand")
+        search = (query.get("search") or "").strip().lower()
+        cursor = query.get("cursor")
+        expand = _parse_expand(query.get("expand"))
+        if expand is None:
+            return _error(400, f"Unknown expand value '{query.get('expand')}'")
+
+        def matches(product: Dict[str, Any]) -> bool:
+            if is_active is not None:
+                if product["isActive"] != is_active:
+                    return False
+            elif not include_inactive and not product["isActive"]:
+                return False
+            if category_id and product["categoryId"] != category_id:
+                return False
+            if brand and product.get("brand") != brand:
+                return False
+            if search:
+                haystack = (product["name"], product["description"], product["sku"], product.get("brand") or "",
+                            product.get("season") or "", product.get("material") or "")
+                return any(search in field.lower() for field in haystack)
+            return True
+
+        with self.lock:
+            # Newest first, matching the contract's default createdAt desc ordering
+            ordered = reversed(self.products.values())
+            start = (page_number - 1) * page_size
+            if cursor:
+                after = _decode_cursor(cursor)
+                if after is None:
+                    return _error(400, INVALID_CURSOR)
+                ordered = itertools.dropwhile(lambda product: self.positions[product["id"]] >= after, ordered)
+                start = 0
+
+            total_count = sum(1 for product in self.products.values() if matches(product)) if include_total else None
+            # One extra row tells whether another page exists without counting
+            page = [self._product_row(product, expand) for product in
+                    itertools.islice((p for p in ordered if matches(p)), start, start + page_size + 1)]
+            has_next_page = len(page) > page_size
+            del page[page_size:]
+            next_cursor = _encode_cursor(self.positions[page[-1]["id"]], page[-1]["id"]) if has_next_page else None
+
+        return 200, {
+            "products": page,
+            "totalCount": total_count,
+            "pageNumber": page_number,
+            "pageSize": page_size,
+            "totalPages": (total_count + page_size - 1) // page_size if total_count is not None else None,
+            "hasNextPage": has_next_page,
+            "hasPreviousPage": bool(cursor) or page_number > 1,
+            "nextCursor": next_cursor
+        }
+
+    def _product_row(self, product: Dict[str, Any], expand: set) -> Dict[str, Any]:
+        """Listing row: a lean summary by default or for expand=none, the expanded graph when asked for"""
+        variation_ids = self.variations_by_product[product["id"]]
+        category = self.categories.get(product["categoryId"])
+        if not expand:
+            row = {field: product.get(field) for field in SUMMARY_FIELDS}
+            row["categoryName"] = category["name"] if category else None
+            row["variationCount"] = sum(1 for v in variation_ids if self.variations[v]["isActive"])
+            row["primaryImageUrl"] = None
+            return row
+        row = dict(product)
+        if "category" in expand:
+            row["category"] = dict(category) if category else None
+        if "variations" in expand:
+            row["variations"] = [dict(self.variations[v]) for v in variation_ids]
+        if "images" in expand:
+            row["images"] = []
+        return row
+
+    def _search_words(self, product: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Tokenised name/brand/description/season/material, cached until the product is updated"""
+        cached = self.search_words.get(product["id"])
+        if cached is None or cached[0] != product["updatedAt"]:
+            words = {field: _words(product.get(field))
+                     for field in ("name", "brand", "description", "season", "material")}
+            cached = self.search_words[product["id"]] = (product["updatedAt"], words)
+        return cached[1]
+
+    def list_product_search(self, query: Dict[str, str]) -> Result:
+        """Ranked search like the backend's full-text path: every word must prefix-match a word
+        of the name, brand, description, season or material, or the term must prefix the SKU"""
+        term = (query.get("searchTerm") or "").strip()
+        page_number = max(1, _parse_int(query.get("pageNumber"), 1))
+        page_size = min(MAX_PAGE_SIZE, max(1, _parse_int(query.get("pageSize"), DEFAULT_PAGE_SIZE)))
+        expand = _parse_expand(query.get("expand"))
+        if expand is None:
+            return _error(400, f"Unknown expand value '{query.get('expand')}'")
+        if not term:
+            return self.list_products({"pageNumber": str(page_number), "pageSize": str(page_size),
+                                       "expand": query.get("expand") or ""})
+        terms, sku_prefix = _words(term), term.lower()
+        weights = (("name", 1.0), ("brand", 0.4), ("description", 0.2), ("season", 0.1), ("material", 0.1))
+
+        def score(product: Dict[str, Any]) -> Optional[Tuple]:
+            sku = product["sku"].lower()
+            fields = self._search_words(product)
+            rank, matched = 0.0, bool(terms)
+            for word in terms:
+                best = max((weight for field, weight in weights
+                            if any(w.startswith(word) for w in fields[field])), default=0.0)
+                matched = matched and best > 0
+                rank += best
+            if not matched and not sku.startswith(sku_prefix):
+                return None
+            return (-(sku == sku_prefix), -sku.startswith(sku_prefix), -rank, product["name"], product["id"])
+
+        with self.lock:
+            ranked = sorted((key, product) for product in self.products.values()
+                            if product["isActive"] and (key := score(product)) is not None)
+            start = (page_number - 1) * page_size
+            page = [self._product_row(product, expand) for _, product in ranked[start:start + page_size]]
+        total_count = len(ranked)
+        total_pages = (total_count + page_size - 1) // page_size
+        return 200, {
+            "products": page,
+            "totalCount": total_count,
+            "pageNumber": page_number,
+            "pageSize": page_size,
+            "totalPages": total_pages,
+            "hasNextPage": page_number < total_pages,
+            "hasPreviousPage": page_number > 1
+        }
+
+    def get_product(self, product_id: str) -> Result:
+        with self.lock:
+            product = self.products.get(product_id)
+            if product is None:
+                return _error(404, f"Product with ID {product_id} not found")
+            body = dict(product)
+            body["variations"] = [dict(self.variations[v]) for v in self.variations_by_product[product_id]]
+            return 200, body
+
+    def _validate_product(self, data: Dict[str, Any], partial: bool) -> List[Dict[str, str]]:
+        errors = []
+        for field, limit in (("name", 200), ("sku", 50)):
+            if partial and field not in data:
+                continue
+            value = data.get(field)
+            if not isinstance(value, str) or not value.strip():
+                errors.append(_field_error(field, f"{field.capitalize()} is required"))
+            elif len(value) > limit:
+                errors.append(_field_error(field, f"{field.capitalize()} cannot exceed {limit} characters"))
+        for field in ("basePrice", "costPrice"):
+            if partial and field not in data:
+                continue
+            value = data.get(field)
+            if not _is_number(value):
+                errors.append(_field_error(field, f"{field} is required"))
+            elif value < 0:
+                errors.append(_field_error(field, f"{field} cannot be negative"))
+        if not partial and not data.get("categoryId"):
+            errors.append(_field_error("categoryId", "CategoryId is required"))
+        return errors
+
+    def create_product(self, data: Dict[str, Any]) -> Result:
+        errors = self._validate_product(data, partial=False)
+        if errors:
+            return _error(400, "Validation failed", errors)
+
+        with self.lock:
+            if data["categoryId"] not in self.categories:
+                return _error(404, f"Category with ID {data['categoryId']} not found")
+            if data["sku"] in self.product_skus:
+                return _error(400, f"Product with SKU '{data['sku']}' already exists.")
+            return 201, dict(self._new_product(data, _now()))
+
+    def update_product(self, product_id: str, data: Dict[str, Any]) -> Result:
+        errors = self._validate_product(data, partial=True)
+        if errors:
+            return _error(400, "Validation failed", errors)
+
+        with self.lock:
+            product = self.products.get(product_id)
+            if product is None:
+                return _error(404, f"Product with ID {product_id} not found")
+            if "categoryId" in data and data["categoryId"] not in self.categories:
+                return _error(404, f"Category with ID {data['categoryId']} not found")
+            if "sku" in data and data["sku"] != product["sku"]:
+                if data["sku"] in self.product_skus:
+                    return _error(400, f"Product with SKU '{data['sku']}' already exists.")
+                del self.product_skus[product["sku"]]
+                self.product_skus[data["sku"]] = product_id
+            for field in ("name", "description", "sku", "barcode", "brand", "season", "collection",
+                          "categoryId", "isActive", "basePrice", "costPrice"):
+                if field in data:
+                    product[field] = data[field]
+            product["updatedAt"] = _now()
+            return 200, dict(product)
+
+    def delete_product(self, product_id: str) -> Result:
+        with self.lock:
+            product = self.products.pop(product_id, None)
+            if product is None:
+                return _error(404, f"Product with ID {product_id} not found")
+            del self.product_skus[product["sku"]]
+            del self.positions[product_id]
+            self.search_words.pop(product_id, None)
+            for variation_id in self.variations_by_product.pop(product_id, []):
+                variation = self.variations.pop(variation_id)
+                del self.positions[variation_id]
+                self.variation_skus.pop(variation["sku"], None)
+            # Stock rows cascade with their product, as in the database
+            for inventory_id in [i for i, row in self.inventories.items() if row["productId"] == product_id]:
+                del self.inventories[inventory_id]
+            return 204, None
+
+    # Variations
+
+    def list_variations(self, product_id: str, query: Dict[str, str]) -> Result:
+        size, color = query.get("size"), query.get("color")
+        page_number = max(1, _parse_int(query.get("pageNumber"), 1))
+        page_size = min(MAX_PAGE_SIZE, max(1, _parse_int(query.get("pageSize"), DEFAULT_PAGE_SIZE)))
+        include_total = _parse_bool(query.get("includeTotalCount")) is not False
+        cursor = query.get("cursor")
+
+        with self.lock:
+            if product_id not in self.products:
+                return _error(404, f"Product with ID {product_id} not found")
+            variations = [
+                self.variations[variation_id]
+                for variation_id in self.variations_by_product[product_id]
+                if (size is None or self.variations[variation_id]["size"] == size)
+                and (color is None or self.variations[variation_id]["color"] == color)
+            ]
+            total_count = len(variations)
+            start = (page_number - 1) * page_size
+            if cursor:
+                after = _decode_cursor(cursor)
+                if after is None:
+                    return _error(400, INVALID_CURSOR)
+                variations = [v for v in variations if self.positions[v["id"]] > after]
+                start = 0
+            page = [dict(variation) for variation in variations[start:start + page_size]]
+            has_next_page = start + page_size < len(variations)
+            next_cursor = _encode_cursor(self.positions[page[-1]["id"]], page[-1]["id"]) if has_next_page else None
+
+        return 200, {
+            "variations": page,
+            "totalCount": total_count if include_total else None,
+            "pageNumber": page_number,
+            "pageSize": page_size,
+            "hasNextPage": has_next_page,
+            "nextCursor": next_cursor
+        }
+
+    def create_variation(self, data: Dict[str, Any]) -> Result:
+        errors = []
+        for field in ("productId", "size", "color", "sku"):
+            if not isinstance(data.get(field), str) or not data[field].strip():
+                errors.append(_field_error(field, f"{field} is required"))
+        if "additionalPrice" in data and (not _is_number(data["additionalPrice"]) or data["additionalPrice"] < 0):
+            errors.append(_field_error("additionalPrice", "additionalPrice cannot be negative"))
+        if "stockQuantity" in data and (not isinstance(data["stockQuantity"], int) or data["stockQuantity"] < 0):
+            errors.append(_field_error("stockQuantity", "stockQuantity cannot be negative"))
+        if errors:
+            return _error(400, "Validation failed", errors)
+
+        with self.lock:
+            if data["productId"] not in self.products:
+                return _error(404, f"Product with ID {data['productId']} not found")
+            if data["sku"] in self.variation_skus:
+                return _error(400, f"Variation with SKU '{data['sku']}' already exists.")
+            return 201, dict(self._new_variation(data, _now()))
+
+    def update_variation(self, variation_id: str, data: Dict[str, Any]) -> Result:
+        with self.lock:
+            variation = self.variations.get(variation_id)
+            if variation is None:
+                return _error(404, f"Variation with ID {variation_id} not found")
+            for field in ("size", "color", "isActive", "additionalPrice", "stockQuantity"):
+                if field in data:
+                    variation[field] = data[field]
+            variation["updatedAt"] = _now()
+            return 200, dict(variation)
+
+    # Inventory
+
+    def get_inventory(self, inventory_id: str) -> Result:
+        with self.lock:
+            inventory = self.inventories.get(inventory_id)
+            if inventory is None:
+                return _error(404, f"Inventory with ID {inventory_id} not found")
+            return 200, dict(inventory)
+
+    def create_inventory(self, data: Dict[str, Any]) -> Result:
+        errors = []
+        for field in ("productId", "branchId"):
+            if not isinstance(data.get(field), str) or not data[field].strip():
+                errors.append(_field_error(field, f"{field} is required"))
+        if not isinstance(data.get("quantity"), int) or data["quantity"] < 0:
+            errors.append(_field_error("quantity", "Quantity must be greater than or equal to 0"))
+        if not _is_number(data.get("unitCost", 0)) or data.get("unitCost", 0) < 0:
+            errors.append(_field_error("unitCost", "Unit cost must be greater than or equal to 0"))
+        if not isinstance(data.get("reason"), str) or not data["reason"].strip():
+            errors.append(_field_error("reason", "Reason is required"))
+        if errors:
+            return _error(400, "Validation failed", errors)
+
+        with self.lock:
+            if data["productId"] not in self.products:
+                return _error(400, "Product not found")
+            now = _now()
+            inventory = {
+                "id": str(uuid.uuid4()),
+                "productId": data["productId"],
+                "productVariationId": data.get("productVariationId"),
+                "branchId": data["branchId"],
+                "warehouseId": data.get("warehouseId"),
+                "quantity": data["quantity"],
+                "reservedQuantity": 0,
+                "availableQuantity": data["quantity"],
+                "unitCost": data.get("unitCost", 0),
+                "lastUpdated": now,
+                "createdAt": now
+            }
+            self.inventories[inventory["id"]] = inventory
+            return 201, dict(inventory)
+
+    def delete_inventory(self, inventory_id: str) -> Result:
+        with self.lock:
+            if self.inventories.pop(inventory_id, None) is None:
+                return _error(404, f"Inventory with ID {inventory_id} not found")
+            return 204, None
+
+    def reserve_inventory(self, inventory_id: str, data: Dict[str, Any]) -> Result:
+        return self._change_reservation(inventory_id, data, reserve=True)
+
+    def release_inventory(self, inventory_id: str, data: Dict[str, Any]) -> Result:
+        return self._change_reservation(inventory_id, data, reserve=False)
+
+    def _change_reservation(self, inventory_id: str, data: Dict[str, Any], reserve: bool) -> Result:
+        quantity = data.get("quantity")
+        if not isinstance(quantity, int) or isinstance(quantity, bool) or quantity <= 0:
+            return _error(400, "Quantity must be greater than 0")
+
+        # Check and update under one lock, like the backend's single conditional UPDATE
+        with self.lock:
+            inventory = self.inventories.get(inventory_id)
+            if inventory is None:
+                return _error(404, f"Inventory with ID {inventory_id} not found")
+            if reserve and inventory["availableQuantity"] < quantity:
+                return _error(400, f"Insufficient available quantity. Available: "
+                                   f"{inventory['availableQuantity']}, Requested: {quantity}")
+            if not reserve and inventory["reservedQuantity"] < quantity:
+                return _error(400, f"Cannot release more than reserved quantity. Reserved: "
+                                   f"{inventory['reservedQuantity']}, Requested: {quantity}")
+            inventory["reservedQuantity"] += quantity if reserve else -quantity
+            inventory["availableQuantity"] = inventory["quantity"] - inventory["reservedQuantity"]
+            inventory["lastUpdated"] = _now()
+            self.dashboard.record_stock_level(inventory)
+            return 200, None
+
+    def send_low_stock_alerts(self) -> Result:
+        # Nothing to notify in the stand-in; the endpoint exists for its rate limit
+        return 200, None
+
+    # Reporting
+
+    def list_realtime_metrics(self, query: Dict[str, str]) -> Result:
+        return 200, self.dashboard.snapshot(query.get("locationId"))
+
+    # Report exports
+
+    def _export_query(self, report_type: Optional[str], fmt: Optional[str], query: Dict[str, Any]
+                      ) -> Tuple[Optional[Dict[str, Any]], Optional[Result]]:
+        extension = EXPORT_FORMATS.get((fmt or "").strip().lower())
+        if extension is None:
+            return None, _error(400, f"Unsupported export format '{fmt}'. Expected one of: csv, jsonl, parquet")
+        name = (report_type or "").strip().lower()
+        dataset = EXPORT_DATASETS.get(name[len("analytics:"):] if name.startswith("analytics:") else name)
+        if dataset is None:
+            return None, _error(400, f"Report '{report_type}' cannot be exported")
+        if dataset in ("sales", "procurement") and not (query.get("startDate") and query.get("endDate")):
+            return None, _error(400, f"StartDate and EndDate are required for {dataset} exports")
+        return {"dataset": dataset, "extension": extension, "branchId": query.get("branchId"),
+                "warehouseId": query.get("warehouseId")}, None
+
+    def _export_rows(self, export: Dict[str, Any]) -> Tuple[List[str], List[List[Any]]]:
+        # The stand-in only holds inventory; the other datasets export empty
+        if export["dataset"] != "inventory":
+            return [], []
+        with self.lock:
+            rows = []
+            for inventory in sorted(self.inventories.values(), key=lambda item: item["id"]):
+                if export["branchId"] and inventory["branchId"] != export["branchId"]:
+                    continue
+                if export["warehouseId"] and inventory.get("warehouseId") != export["warehouseId"]:
+                    continue
+                product = self.products.get(inventory["productId"], {})
+                rows.append([inventory["id"], inventory["branchId"], inventory.get("warehouseId"), product.get("sku"),
+                             product.get("name"), inventory["quantity"], inventory["reservedQuantity"],
+                             inventory["availableQuantity"], inventory["unitCost"], inventory["lastUpdated"]])
+        return INVENTORY_EXPORT_COLUMNS, rows
+
+    def _render_export(self, export: Dict[str, Any]) -> Tuple[bytes, int]:
+        columns, rows = self._export_rows(export)
+        if export["extension"] == "csv":
+            text = io.StringIO()
+            writer = csv.writer(text, lineterminator="\r\n")
+            if columns:
+                writer.writerow(columns)
+            writer.writerows(["" if value is None else value for value in row] for row in rows)
+            return text.getvalue().encode("utf-8"), len(rows)
+        names = [column[0].lower() + column[1:] for column in columns]
+        lines = "".join(json.dumps(dict(zip(names, row))) + "\n" for row in rows)
+        return gzip.compress(lines.encode("utf-8")), len(rows)
+
+    def _export_result(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in job.items() if not key.startswith("_")}
+
+    def start_report_export(self, data: Dict[str, Any]) -> Result:
+        export, error = self._export_query(data.get("reportType"), data.get("format"), data)
+        if error is not None:
+            return error
+        if export["extension"] not in EXPORT_CONTENT_TYPES:
+            return _error(400, "Parquet exports are not produced by the stand-in")
+
+        # Exports run to completion before the response: there is no worker to hand them to
+        content, rows = self._render_export(export)
+        job_id = str(uuid.uuid4())
+        now = _now()
+        job = {
+            "fileId": job_id,
+            "fileName": f"{export['dataset']}_{datetime.now(timezone.utc):%Y%m%d%H%M%S}.{export['extension']}",
+            "dataset": export["dataset"],
+            "format": export["extension"],
+            "status": "Completed",
+            "rowsWritten": rows,
+            "bytesWritten": len(content),
+            "error": None,
+            "statusUrl": f"/api/reporting/export/{job_id}/status",
+            "downloadUrl": f"/api/reporting/export/{job_id}/download",
+            "startedAt": now,
+            "generatedAt": now,
+            "_content": content
+        }
+        with self.lock:
+            self.exports[job_id] = job
+        return 202, self._export_result(job)
+
+    def get_report_export(self, job_id: str) -> Result:
+        with self.lock:
+            job = self.exports.get(job_id)
+        if job is None:
+            return _error(404, f"Export {job_id} not found")
+        return 200, self._export_result(job)
+
+    def export_file(self, job_id: str) -> Tuple[int, Any, str]:
+        """A completed export's (status, content, content type); an error payload when there is none"""
+        with self.lock:
+            job = self.exports.get(job_id)
+        if job is None:
+            return 404, {"error": f"Export {job_id} not found", "code": "not_found"}, ""
+        return 200, job["_content"], EXPORT_CONTENT_TYPES[job["format"]]
+
+    def stream_export(self, query: Dict[str, str]) -> Tuple[int, Any, str]:
+        """A streamed export's (status, content, content type); an error payload when it is rejected"""
+        export, error = self._export_query(query.get("reportType"), query.get("format", "csv"), query)
+        if error is not None:
+            return error[0], error[1], ""
+        if export["extension"] not in EXPORT_CONTENT_TYPES:
+            return 400, {"error": "Parquet exports are only available through POST export",
+                         "code": "validation_error"}, ""
+        return 200, self._render_export(export)[0], EXPORT_CONTENT_TYPES[export["extension"]]